@@ -24,6 +24,14 @@ MEMORY="512MB"
 GCS_BUCKET_NAME="${GCS_BUCKET_NAME:-naver-webtoon-raw}"
 BIGQUERY_PROJECT_ID="${BIGQUERY_PROJECT_ID:-$PROJECT_ID}"
 BIGQUERY_DATASET_ID="${BIGQUERY_DATASET_ID:-naver_webtoon}"
+ENV_VARS="GCS_BUCKET_NAME=$GCS_BUCKET_NAME,BIGQUERY_PROJECT_ID=$BIGQUERY_PROJECT_ID,BIGQUERY_DATASET_ID=$BIGQUERY_DATASET_ID,DATA_FORMAT=jsonl,CHECKPOINT_BACKEND=gcs"
+
+# 샤딩용 worker 함수 (coordinator 모드)
+# coordinator 함수는 max-instances=1이라 자기 자신을 worker로 호출하면 요청이 coordinator 뒤에 대기하므로,
+# worker는 인스턴스 수 제한이 따로 있는 별도 함수로 배포하고 coordinator의 SHARD_WORKER_URL로 연결
+DEPLOY_SHARD_WORKER="${DEPLOY_SHARD_WORKER:-false}"
+WORKER_FUNCTION_NAME="${FUNCTION_NAME}_worker"
+SHARD_WORKER_MAX_INSTANCES="${SHARD_WORKER_MAX_INSTANCES:-4}"
 
 echo "=== Cloud Functions 배포 ==="
 echo "프로젝트: $PROJECT_ID"
@@ -48,6 +56,28 @@ if [ -d "$PROJECT_ROOT/src" ]; then
     }
 fi
 
+# worker 함수 배포 (DEPLOY_SHARD_WORKER=true)
+if [ "$DEPLOY_SHARD_WORKER" = "true" ]; then
+    echo "샤드 worker 함수 배포 중... ($WORKER_FUNCTION_NAME, max-instances=$SHARD_WORKER_MAX_INSTANCES)"
+    gcloud functions deploy "$WORKER_FUNCTION_NAME" \
+        --gen2 \
+        --runtime="$RUNTIME" \
+        --region="$REGION" \
+        --source=. \
+        --entry-point="$ENTRY_POINT" \
+        --trigger-http \
+        --allow-unauthenticated \
+        --timeout="$TIMEOUT" \
+        --memory="$MEMORY" \
+        --set-env-vars "$ENV_VARS" \
+        --service-account="webtoon-collector@${PROJECT_ID}.iam.gserviceaccount.com" \
+        --max-instances="$SHARD_WORKER_MAX_INSTANCES"
+    
+    WORKER_URL=$(gcloud functions describe "$WORKER_FUNCTION_NAME" --gen2 --region="$REGION" --format="value(serviceConfig.uri)")
+    ENV_VARS="$ENV_VARS,SHARD_QUEUE=http,SHARD_WORKER_URL=$WORKER_URL"
+    echo "✅ worker 함수 배포 완료: $WORKER_URL"
+fi
+
 # Cloud Functions 배포
 echo "Cloud Functions 배포 중..."
 gcloud functions deploy "$FUNCTION_NAME" \
@@ -60,7 +90,7 @@ gcloud functions deploy "$FUNCTION_NAME" \
     --allow-unauthenticated \
     --timeout="$TIMEOUT" \
     --memory="$MEMORY" \
-    --set-env-vars "GCS_BUCKET_NAME=$GCS_BUCKET_NAME,BIGQUERY_PROJECT_ID=$BIGQUERY_PROJECT_ID,BIGQUERY_DATASET_ID=$BIGQUERY_DATASET_ID,DATA_FORMAT=jsonl" \
+    --set-env-vars "$ENV_VARS" \
     --service-account="webtoon-collector@${PROJECT_ID}.iam.gserviceaccount.com" \
     --max-instances=1
 
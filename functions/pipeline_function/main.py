@@ -11,7 +11,9 @@ Cloud Functions 진입점: 네이버 웹툰 주간 차트 수집 파이프라인
 import json
 import logging
 import os
+import tempfile
 from datetime import date
+from functools import partial
 from typing import Optional
 
 import functions_framework
@@ -35,17 +37,27 @@ else:
     if src_path.exists():
         sys.path.insert(0, str(src_path))
 
-from src.extract import extract_webtoon_chart, try_api_endpoints
+from src.extract import extract_webtoon_chart, get_connection_stats, iter_api_chart_data
 from src.parse import parse_html_file
 from src.parse_api import parse_api_response
 from src.transform import transform_and_save, load_dim_webtoon
-from src.extract_webtoon_detail import extract_webtoon_detail
-from src.transform_webtoon_stats import transform_and_save_webtoon_stats
-from src.upload_gcs import upload_chart_data_to_gcs, upload_webtoon_detail_to_gcs
+from src.dim_webtoon_store import DimWebtoonStore
+from src.checkpoint import DetailCrawlCheckpoint
+from src.extract_webtoon_detail_async import collect_webtoon_details, get_aiohttp_connection_stats
+from src.http_cache import get_http_cache
+from src.rate_control import get_naver_rate_controller
+from src.shard_queue import get_shard_queue, iter_webtoon_details_sharded, run_detail_worker
+from src.rate_limiter import configure_naver_rate_limiter
+from src.refresh_planner import select_webtoons_to_refresh
+from src.transform_webtoon_stats import compact_fact_webtoon_stats, transform_and_save_webtoon_stats
+from src.upload_gcs import upload_webtoon_detail_to_gcs
 from src.upload_bigquery import (
-    upload_dim_webtoon,
-    upload_fact_weekly_chart,
-    upload_fact_webtoon_stats,
+    BIGQUERY_STAGING_MODE,
+    StagingSession,
+    plan_dim_webtoon_upload,
+    plan_fact_weekly_chart_upload,
+    plan_fact_webtoon_stats_upload,
+    run_table_uploads,
     get_bigquery_client,
 )
 from src.utils import setup_logging
@@ -54,12 +66,238 @@ from src.utils import setup_logging
 GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'naver-webtoon-raw')
 BIGQUERY_PROJECT_ID = os.getenv('BIGQUERY_PROJECT_ID', 'naver-webtoon-collector')
 BIGQUERY_DATASET_ID = os.getenv('BIGQUERY_DATASET_ID', 'naver_webtoon')
+# 차트 API 응답 원본 보관 위치 ('gcs', 'local', 'none', src/raw_archive.py)
+RAW_ARCHIVE_TARGET = os.getenv('RAW_ARCHIVE_TARGET', 'gcs')
+# session 방식: 상세 정보 배치 N개마다 모아 둔 업로드를 반영하고 체크포인트 기록 (0이면 실행 마지막에 한 번)
+STAGING_COMMIT_BATCHES = int(os.getenv('STAGING_COMMIT_BATCHES', '0'))
+# 로컬 파일 저장 경로 (Cloud Functions에서 쓸 수 있는 /tmp)
+PIPELINE_DATA_DIR = Path(tempfile.gettempdir()) / 'webtoon_pipeline'
 
 # 로깅 설정
 setup_logging()
 logger = logging.getLogger(__name__)
 
 
+def upload_tables_to_bigquery(planners: dict, staging: Optional[StagingSession] = None) -> dict:
+    """
+    여러 테이블을 BigQuery에 함께 업로드합니다.
+    load job을 한꺼번에 제출하고, 테이블마다 자기 load가 끝나면 MERGE를 실행합니다.
+    staging이 있으면 바로 업로드하지 않고 등록만 합니다 (commit_staging에서 한 번에 반영).
+    
+    Args:
+        planners: {작업 키(테이블 이름 등): 업로드 작업(TableUpload)을 만드는 함수}
+        staging: session 방식의 StagingSession (None이면 바로 업로드)
+    
+    Returns:
+        {테이블 이름: 성공 여부} (업로드할 레코드가 없으면 성공, staging에 등록만 했으면 True)
+    """
+    if staging is not None:
+        for key, planner in planners.items():
+            staging.add(key, planner)
+        return {key.split('/')[0]: True for key in planners}
+    
+    results = {}
+    uploads = []
+    for table_name, planner in planners.items():
+        try:
+            upload = planner()
+        except Exception as e:
+            logger.error(f"{table_name} BigQuery 업로드 준비 중 오류 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            results[table_name] = False
+            continue
+        if upload is None:
+            results[table_name] = True
+        else:
+            uploads.append(upload)
+    
+    if uploads:
+        logger.info(f"BigQuery 업로드 시작: {', '.join(upload.table_name for upload in uploads)}")
+        for table_name, result in run_table_uploads(uploads).items():
+            results[table_name] = result['success']
+            if result['success']:
+                logger.info(f"✅ {table_name} BigQuery 업로드 성공 ({result['rows']}개, {result['total_seconds']}초)")
+            else:
+                logger.error(f"{table_name} BigQuery 업로드 실패: {result['error']}")
+    return results
+
+
+def commit_staging(staging: StagingSession) -> bool:
+    """
+    session 방식에서 모아 둔 업로드를 BigQuery 세션 하나에서 반영합니다 (MERGE 트랜잭션 1개).
+    
+    Args:
+        staging: StagingSession
+    
+    Returns:
+        모든 테이블 반영 성공 여부 (모아 둔 작업이 없으면 True)
+    """
+    if staging.pending == 0:
+        return True
+    logger.info(f"BigQuery 세션 업로드 시작: {staging.pending}개 작업")
+    report = staging.commit()
+    for table_name, result in report.items():
+        if result['success']:
+            logger.info(f"✅ {table_name} BigQuery 업로드 성공 ({result['rows']}개, {result['total_seconds']}초)")
+        else:
+            logger.error(f"{table_name} BigQuery 업로드 실패: {result['error']}")
+    return all(result['success'] for result in report.values())
+
+
+def commit_staged_batches(
+    staging: StagingSession,
+    checkpoint: Optional[DetailCrawlCheckpoint],
+    staged_batches: list
+) -> bool:
+    """
+    session 방식에서 모아 둔 업로드를 반영하고, 성공하면 반영된 배치를 체크포인트에 기록합니다.
+    
+    Args:
+        staging: StagingSession
+        checkpoint: 상세 정보 수집 체크포인트 (None이면 기록 생략)
+        staged_batches: 반영 후 기록할 (webtoon_id 리스트, cursor) 목록
+    
+    Returns:
+        반영 성공 여부 (실패한 배치는 체크포인트에 기록하지 않아 재실행 시 다시 수집)
+    """
+    if not commit_staging(staging):
+        return False
+    if checkpoint is not None:
+        for completed_ids, cursor in staged_batches:
+            checkpoint.mark_completed(completed_ids, cursor=cursor)
+    return True
+
+
+def iter_detail_batches(
+    webtoon_ids: list,
+    save_batch_size: int,
+    shard_results=None,
+    detail_concurrency: Optional[int] = None
+):
+    """
+    저장 배치 단위로 웹툰 상세 정보를 수집해 돌려줍니다.
+    
+    Args:
+        webtoon_ids: 수집할 웹툰 ID 리스트
+        save_batch_size: 저장 배치 크기
+        shard_results: coordinator 모드의 샤드 결과 iterator (iter_webtoon_details_sharded,
+            None이면 이 인스턴스에서 배치마다 비동기 수집)
+        detail_concurrency: 상세 정보 동시 요청 수 상한
+    
+    Returns:
+        (배치 webtoon_id 리스트, 수집된 상세 정보 리스트) iterator
+        (샤드 결과는 도착한 샤드를 save_batch_size 단위로 나눔)
+    """
+    if shard_results is None:
+        for batch_start in range(0, len(webtoon_ids), save_batch_size):
+            batch_ids = webtoon_ids[batch_start:batch_start + save_batch_size]
+            # 배치 단위 비동기 수집 (동시 요청 수 제한 + 초당 요청 수 예산)
+            yield batch_ids, collect_webtoon_details(
+                batch_ids,
+                use_html_fallback=True,
+                max_concurrency=detail_concurrency,
+            )
+        return
+    
+    for shard_ids, details in shard_results:
+        details_by_id = {str(detail['webtoon_id']): detail for detail in details}
+        for batch_start in range(0, len(shard_ids), save_batch_size):
+            batch_ids = shard_ids[batch_start:batch_start + save_batch_size]
+            yield batch_ids, [details_by_id[webtoon_id] for webtoon_id in batch_ids if webtoon_id in details_by_id]
+
+
+def plan_dim_webtoon_changes_upload(dim_store: DimWebtoonStore):
+    """
+    dim_webtoon store에서 마지막 업로드 이후 바뀐 행만 업로드하는 작업을 만듭니다.
+    (session 방식은 commit 때 호출되므로 그때까지 바뀐 행을 모두 포함)
+    
+    Args:
+        dim_store: 상세 정보 배치로 갱신 중인 dim_webtoon store
+    
+    Returns:
+        TableUpload (바뀐 행이 없으면 None, 업로드 성공 시 store에 업로드 완료 기록)
+    """
+    records, mark_uploaded = dim_store.upload_records()
+    return plan_dim_webtoon_upload(records=records, on_success=mark_uploaded)
+
+
+def save_detail_batch(
+    batch_data: list,
+    dim_store: DimWebtoonStore,
+    dim_webtoon_ids: set,
+    staging: Optional[StagingSession] = None,
+    stats_start_date: Optional[date] = None
+):
+    """
+    상세 정보 배치를 저장하고 BigQuery에 업로드합니다.
+    - fact_webtoon_stats 저장
+    - dim_webtoon 업데이트 (genre, tags 정보 추가, 메모리 store만 갱신하고 파일 저장은 수집이 끝난 뒤 한 번)
+    - fact_webtoon_stats와 (마지막 업로드 이후 바뀐) dim_webtoon 행만 함께 업로드
+    
+    Args:
+        batch_data: 웹툰 상세 정보 리스트
+        dim_store: 현재 dim_webtoon (webtoon_id로 색인, 배치마다 바뀐 행만 upsert/업로드)
+        dim_webtoon_ids: dim_webtoon에 존재하는 webtoon_id 집합
+        staging: session 방식이면 업로드를 등록만 함 (None이면 바로 업로드)
+        stats_start_date: fact_webtoon_stats 업로드를 시작할 collected_date
+            (session 방식은 아직 반영하지 않은 첫 배치의 날짜, None이면 이번 배치 날짜)
+    
+    Returns:
+        fact_webtoon_stats 저장 및 BigQuery 업로드 성공 여부 (session 방식은 저장 성공 여부)
+    """
+    logger.info(f"\n{'='*60}")
+    logger.info(f"배치 저장 시작: {len(batch_data)}개 데이터 저장 및 업로드")
+    logger.info(f"{'='*60}")
+    
+    from src.utils import list_webtoon_stats_partitions
+    planners = {}
+    stats_success = False
+    
+    # fact_webtoon_stats 저장
+    # 이번 배치 레코드가 들어가는 collected_date 파티션부터만 업로드 (이전 날짜 파티션은 읽지 않음)
+    # 저장 전에 날짜를 정하므로 배치 중 자정이 지나도 앞 날짜 파티션이 포함됨
+    # session 방식은 같은 키의 작업이 교체되므로, 반영 전 배치 중 가장 이른 날짜부터 업로드
+    batch_date = min(date.today(), stats_start_date) if stats_start_date else date.today()
+    try:
+        stats_success = transform_and_save_webtoon_stats(batch_data, dim_webtoon_ids)
+        if stats_success:
+            logger.info(f"✅ fact_webtoon_stats 배치 저장 완료: {len(batch_data)}개")
+            
+            # 마지막 업로드 이후 파티션에 추가된 행만 전송
+            if list_webtoon_stats_partitions(start_date=batch_date, data_format='jsonl'):
+                planners['fact_webtoon_stats'] = lambda: plan_fact_webtoon_stats_upload(start_date=batch_date)
+        else:
+            logger.error("fact_webtoon_stats 배치 저장 실패")
+    except Exception as e:
+        logger.error(f"fact_webtoon_stats 배치 저장 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+    
+    # dim_webtoon 업데이트 (genre, tags 정보 추가)
+    logger.info("dim_webtoon 배치 업데이트 중 (genre, tags 정보 추가)...")
+    # webtoon_id 색인으로 기존 행과 조인하고 tags는 기존 값과 합침
+    update_records = dim_store.enrichment_records(batch_data, merge_tags=True)
+    
+    changed_count = dim_store.upsert(update_records)
+    if changed_count > 0:
+        logger.info(f"✅ dim_webtoon 배치 업데이트 완료: {changed_count}개 레코드 업데이트됨")
+    elif len(update_records) > 0:
+        logger.info(f"dim_webtoon 변경 없음: {len(update_records)}개 레코드의 genre/tags가 기존과 같습니다.")
+    else:
+        logger.warning(f"dim_webtoon 업데이트할 레코드가 없습니다. (genre/tags가 있는 detail_data: {sum(1 for d in batch_data if d.get('genre') or d.get('tags'))}개)")
+    
+    # 마지막 업로드 이후 바뀐 dim_webtoon 행만 함께 업로드 (이전 배치에서 업로드에 실패한 행 포함)
+    # session 방식은 차트 단계의 전체 dim_webtoon 작업을 교체하지 않도록 키를 따로 사용
+    if dim_store.unuploaded_ids:
+        planners['dim_webtoon/detail'] = partial(plan_dim_webtoon_changes_upload, dim_store)
+    
+    upload_results = upload_tables_to_bigquery(planners, staging)
+    if staging is not None:
+        return bool(stats_success)
+    return upload_results.get('fact_webtoon_stats', False)
+
+
 @functions_framework.http
 def main(request):
     """
@@ -72,6 +310,11 @@ def main(request):
         HTTP 응답 (JSON)
     """
     try:
+        # 로컬 파일 경로를 첫 네이버 요청 전에 정함
+        # (HTTP 캐시는 공용 세션을 만들 때 {DATA_DIR}/cache/http로 위치가 고정됨, worker 모드 포함)
+        PIPELINE_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        os.environ['DATA_DIR'] = str(PIPELINE_DATA_DIR)
+        
         # 요청 본문 파싱
         request_json = request.get_json(silent=True)
         if request_json is None:
@@ -90,7 +333,24 @@ def main(request):
         
         sort_types = request_json.get('sort_types', ['popular', 'view'])
         limit = request_json.get('limit')  # 테스트용 제한
+        detail_concurrency = request_json.get('detail_concurrency')  # 상세 정보 동시 요청 수 상한
+        request_rps = request_json.get('requests_per_second')  # 네이버 요청 공용 예산 (초당 요청 수)
+        request_burst = request_json.get('request_burst')  # 네이버 요청 공용 예산 (burst)
+        full_refresh = request_json.get('full_refresh', False)  # True이면 갱신 계획 없이 전체 상세 정보 수집
+        resume = request_json.get('resume', True)  # 체크포인트에서 이어서 수집할지 여부
+        save_batch_size = int(request_json.get('save_batch_size', 100))  # 저장 배치 크기 (배치마다 저장, 업로드, 체크포인트 기록)
+        staging_commit_batches = int(request_json.get('staging_commit_batches', STAGING_COMMIT_BATCHES))  # session 방식 중간 반영 배치 수 (0이면 마지막에 한 번)
         delete_existing = request_json.get('delete_existing', False)  # 기존 데이터 삭제 여부
+        mode = request_json.get('mode', 'standalone')  # standalone | coordinator | worker
+        num_shards = int(request_json.get('num_shards', 4 if mode == 'coordinator' else 1))  # 상세 정보 샤드 수
+        shard_queue_type = request_json.get('shard_queue')  # inprocess | http (없으면 SHARD_QUEUE 환경 변수)
+        worker_url = request_json.get('worker_url')  # http 큐 worker URL (없으면 SHARD_WORKER_URL 환경 변수)
+        
+        # worker 모드: 전달받은 샤드의 상세 정보만 수집하여 반환 (저장/업로드는 coordinator가 담당)
+        if mode == 'worker':
+            result = run_detail_worker(request_json)
+            result['rate_control'] = get_naver_rate_controller().get_metrics()
+            return result, 200
         
         # 기존 데이터 삭제 (요청 시)
         if delete_existing:
@@ -137,50 +397,33 @@ def main(request):
                 traceback.print_exc()
                 # 삭제 실패해도 계속 진행
         
+        # 모든 네이버 요청이 공유하는 토큰 버킷 설정 (지정하지 않으면 환경 변수 기본값)
+        rate_limiter = configure_naver_rate_limiter(rate=request_rps, burst=request_burst)
+        
         logger.info(f"파이프라인 실행 시작: date={chart_date}, sort_types={sort_types}")
         
         all_success = True
+        # session 방식: 이번 실행의 업로드를 모았다가 마지막에 MERGE 트랜잭션 한 번으로 반영
+        staging = StagingSession() if BIGQUERY_STAGING_MODE == 'session' else None
         
-        # 각 정렬 타입별로 수집
-        for sort_type in sort_types:
+        # 모든 정렬 타입을 하나의 세션으로 동시에 요청하고, 응답이 도착한 순서대로 처리
+        # (파싱/저장/업로드는 dim_webtoon 파일을 공유하므로 순서대로 실행)
+        # 응답 원본은 요청 스레드에서 받은 바이트 그대로 gzip 압축해 GCS에 바로 보관 (임시 파일 없음)
+        for sort_type, api_data in iter_api_chart_data(sort_types, chart_date=chart_date, archive_target=RAW_ARCHIVE_TARGET):
             sort_name = sort_type if sort_type else "default"
             logger.info(f"\n{'='*60}")
             logger.info(f"정렬 타입: {sort_name}")
             logger.info(f"{'='*60}")
             
             try:
-                # Step 1: Extract (API에서 데이터 수집)
-                logger.info(f"데이터 수집 시작... (정렬: {sort_name})")
-                api_data = try_api_endpoints(sort_type=sort_type)
-                
+                # Step 1: Extract (API에서 데이터 수집, 위에서 동시에 요청한 결과)
                 if api_data is None:
                     logger.error(f"데이터 수집 실패 (정렬: {sort_name})")
                     all_success = False
                     continue
                 
                 # Step 2: Load Raw (GCS에 JSON 원본 저장)
-                logger.info("GCS에 원본 데이터 저장 중...")
-                # 임시 파일에 저장 후 GCS 업로드
-                from tempfile import NamedTemporaryFile
-                import json as json_module
-                
-                with NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as tmp_file:
-                    json_module.dump(api_data, tmp_file, ensure_ascii=False, indent=2)
-                    tmp_path = Path(tmp_file.name)
-                
-                try:
-                    gcs_success = upload_chart_data_to_gcs(
-                        chart_date,
-                        sort_type=sort_type,
-                        json_file_path=tmp_path,
-                        dry_run=False
-                    )
-                    if not gcs_success:
-                        logger.warning(f"GCS 업로드 실패 (정렬: {sort_name}), 계속 진행...")
-                finally:
-                    # 임시 파일 삭제
-                    if tmp_path.exists():
-                        tmp_path.unlink()
+                # iter_api_chart_data가 응답을 받으면서 보관 (실패해도 경고만 남기고 계속 진행)
                 
                 # Step 3: Parse (데이터 파싱)
                 logger.info("데이터 파싱 시작...")
@@ -197,59 +440,35 @@ def main(request):
                 # transform_and_save를 사용하여 로컬 파일에 저장 후 BigQuery 업로드
                 logger.info("데이터 변환 및 저장 시작...")
                 
-                # 임시 디렉토리 사용 (Cloud Functions의 /tmp 사용)
-                import tempfile
-                temp_dir = Path(tempfile.gettempdir()) / 'webtoon_pipeline'
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                
-                # 환경 변수 설정 (로컬 파일 저장 경로)
-                os.environ['DATA_DIR'] = str(temp_dir)
-                
-                # transform_and_save 실행 (로컬 파일에 저장)
+                # transform_and_save 실행 (로컬 파일에 저장, DATA_DIR은 main 시작 시 /tmp로 설정)
                 success = transform_and_save(parsed_data, chart_date, sort_type=sort_type)
                 
                 if success:
-                    # 저장된 JSONL 파일을 BigQuery에 업로드
+                    # 저장된 JSONL 파일을 BigQuery에 업로드 (dim_webtoon, fact_weekly_chart 함께)
                     from src.utils import get_dim_webtoon_jsonl_path, get_chart_jsonl_path
+                    planners = {}
                     
-                    # dim_webtoon 업로드
                     dim_jsonl_path = get_dim_webtoon_jsonl_path()
                     if dim_jsonl_path.exists():
-                        logger.info(f"dim_webtoon.jsonl 파일 발견, BigQuery 업로드 시작: {dim_jsonl_path}")
-                        try:
-                            upload_success = upload_dim_webtoon(jsonl_path=dim_jsonl_path, dry_run=False)
-                            if upload_success:
-                                logger.info("dim_webtoon BigQuery 업로드 성공")
-                            else:
-                                logger.error("dim_webtoon BigQuery 업로드 실패")
-                        except Exception as e:
-                            logger.error(f"dim_webtoon BigQuery 업로드 중 오류 발생: {e}")
-                            import traceback
-                            traceback.print_exc()
+                        logger.info(f"dim_webtoon.jsonl 파일 발견: {dim_jsonl_path}")
+                        planners['dim_webtoon'] = partial(plan_dim_webtoon_upload, jsonl_path=dim_jsonl_path)
                     else:
                         logger.warning(f"dim_webtoon.jsonl 파일이 존재하지 않습니다: {dim_jsonl_path}")
                     
-                    # fact_weekly_chart 업로드
                     fact_jsonl_path = get_chart_jsonl_path(chart_date, sort_type)
                     if fact_jsonl_path.exists():
-                        logger.info(f"fact_weekly_chart.jsonl 파일 발견, BigQuery 업로드 시작: {fact_jsonl_path}")
-                        try:
-                            upload_success = upload_fact_weekly_chart(
-                                chart_date=chart_date,
-                                sort_type=sort_type,
-                                jsonl_path=fact_jsonl_path,
-                                dry_run=False
-                            )
-                            if upload_success:
-                                logger.info("fact_weekly_chart BigQuery 업로드 성공")
-                            else:
-                                logger.error("fact_weekly_chart BigQuery 업로드 실패")
-                        except Exception as e:
-                            logger.error(f"fact_weekly_chart BigQuery 업로드 중 오류 발생: {e}")
-                            import traceback
-                            traceback.print_exc()
+                        logger.info(f"fact_weekly_chart.jsonl 파일 발견: {fact_jsonl_path}")
+                        # session 방식은 정렬 타입마다 따로 등록 (commit 때 한 테이블로 합침)
+                        planners[f'fact_weekly_chart/{sort_name}'] = partial(
+                            plan_fact_weekly_chart_upload,
+                            chart_date=chart_date,
+                            sort_type=sort_type,
+                            jsonl_path=fact_jsonl_path
+                        )
                     else:
                         logger.warning(f"fact_weekly_chart.jsonl 파일이 존재하지 않습니다: {fact_jsonl_path}")
+                    
+                    upload_tables_to_bigquery(planners, staging)
                 else:
                     logger.error(f"데이터 변환 및 저장 실패 (정렬: {sort_name})")
                     all_success = False
@@ -270,7 +489,6 @@ def main(request):
         
         try:
             # dim_webtoon에서 모든 웹툰 ID 가져오기
-            from src.transform import load_dim_webtoon
             dim_df = load_dim_webtoon()
             
             if len(dim_df) == 0:
@@ -278,269 +496,132 @@ def main(request):
             else:
                 webtoon_ids = dim_df['webtoon_id'].astype(str).unique().tolist()
                 
+                # 증분 갱신: 변화가 적은 웹툰은 갱신 주기가 돌아온 경우에만 수집
+                # (로컬 이력이 없는 인스턴스는 BigQuery에서 최근 레코드 조회)
+                if full_refresh:
+                    logger.info("전체 갱신 모드: 모든 웹툰의 상세 정보를 수집합니다.")
+                else:
+                    webtoon_ids = select_webtoons_to_refresh(
+                        webtoon_ids, chart_date, sort_types=sort_types, use_bigquery=True
+                    )
+                
                 # limit 파라미터 적용 (테스트용)
                 if limit is not None and limit > 0:
                     webtoon_ids = webtoon_ids[:limit]
                     logger.info(f"제한 모드: {limit}개 웹툰만 상세 정보 수집합니다.")
                 
                 logger.info(f"총 {len(webtoon_ids)}개 웹툰의 상세 정보 수집 시작...")
-                logger.info(f"예상 소요 시간: 약 {len(webtoon_ids) * 2 / 60:.1f}분 (각 웹툰당 약 2초)")
-                
-                detail_data_list = []
-                batch_size = 10  # Rate limiting 배치 크기
-                batch_delay = 5  # Rate limiting 배치 간 대기 시간 (초)
-                save_batch_size = 100  # 저장 배치 크기 (100개마다 저장 및 업로드)
+                logger.info(f"예상 소요 시간: 최대 약 {len(webtoon_ids) * 2 / rate_limiter.rate / 60:.1f}분 (웹툰당 요청 2건, 시작 속도 초당 {rate_limiter.rate}건, 응답 상태에 따라 자동 조정)")
                 
-                from src.transform import merge_dim_webtoon, save_dim_webtoon, load_dim_webtoon
-                from src.models import create_dim_webtoon_record
+                # 체크포인트: 이전 실행에서 저장/업로드까지 끝난 웹툰은 건너뜀
+                checkpoint = None
+                resumed_count = 0
+                if resume:
+                    checkpoint = DetailCrawlCheckpoint(chart_date)
+                    if checkpoint.load():
+                        pending_ids = checkpoint.pending(webtoon_ids)
+                        resumed_count = len(webtoon_ids) - len(pending_ids)
+                        logger.info(f"체크포인트에서 재시작: {resumed_count}개 완료됨, 남은 {len(pending_ids)}개 수집")
+                        webtoon_ids = pending_ids
                 
-                # dim_webtoon 로드 (배치 저장 시 사용)
-                dim_df = load_dim_webtoon()
-                dim_df['webtoon_id'] = dim_df['webtoon_id'].astype(str)
-                dim_webtoon_ids = set(dim_df['webtoon_id'])
+                # dim_webtoon 로드 (배치 저장 시 사용, webtoon_id로 색인해 바뀐 행만 갱신)
+                dim_store = DimWebtoonStore.load()
+                dim_webtoon_ids = dim_store.ids()
                 
-                for i, webtoon_id in enumerate(webtoon_ids, 1):
-                    try:
-                        # 웹툰 상세 정보 수집
-                        detail_data = extract_webtoon_detail(webtoon_id, use_html_fallback=True)
-                        
-                        if detail_data:
-                            detail_data_list.append(detail_data)
-                            if i % 10 == 0:
-                                logger.info(f"[{i}/{len(webtoon_ids)}] 웹툰 상세 정보 수집 진행 중... (성공: {len(detail_data_list)}개)")
-                        else:
-                            logger.warning(f"[{i}/{len(webtoon_ids)}] 웹툰 상세 정보 수집 실패: {webtoon_id}")
-                        
-                        # Rate limiting: 각 요청 간 1.5초 대기
-                        import time
-                        time.sleep(1.5)
-                        
-                        # Rate limiting 배치 처리: 10개마다 긴 대기
-                        if i % batch_size == 0 and i < len(webtoon_ids):
-                            logger.info(f"Rate limiting 배치 완료: {i}/{len(webtoon_ids)}개 처리됨. {batch_delay}초 대기...")
-                            time.sleep(batch_delay)
-                        
-                        # 저장 배치 처리: 100개마다 저장 및 BigQuery 업로드
-                        if len(detail_data_list) >= save_batch_size and i % save_batch_size == 0:
-                            logger.info(f"\n{'='*60}")
-                            logger.info(f"배치 저장 시작: {len(detail_data_list)}개 데이터 저장 및 업로드")
-                            logger.info(f"{'='*60}")
-                            
-                            # 현재 배치 데이터 추출
-                            batch_data = detail_data_list[:save_batch_size]
-                            detail_data_list = detail_data_list[save_batch_size:]  # 남은 데이터는 다음 배치에서 처리
-                            
-                            # fact_webtoon_stats 저장
-                            try:
-                                stats_success = transform_and_save_webtoon_stats(batch_data, dim_webtoon_ids)
-                                if stats_success:
-                                    logger.info(f"✅ fact_webtoon_stats 배치 저장 완료: {len(batch_data)}개")
-                                    
-                                    # fact_webtoon_stats를 BigQuery에 업로드
-                                    from src.utils import get_webtoon_stats_jsonl_path
-                                    stats_jsonl_path = get_webtoon_stats_jsonl_path()
-                                    if stats_jsonl_path.exists():
-                                        logger.info("fact_webtoon_stats를 BigQuery에 업로드 중...")
-                                        try:
-                                            upload_success = upload_fact_webtoon_stats(jsonl_path=stats_jsonl_path, dry_run=False)
-                                            if upload_success:
-                                                logger.info(f"✅ fact_webtoon_stats BigQuery 업로드 성공 ({len(batch_data)}개)")
-                                            else:
-                                                logger.error("fact_webtoon_stats BigQuery 업로드 실패")
-                                        except Exception as e:
-                                            logger.error(f"fact_webtoon_stats BigQuery 업로드 중 오류 발생: {e}")
-                                            import traceback
-                                            traceback.print_exc()
-                                else:
-                                    logger.error("fact_webtoon_stats 배치 저장 실패")
-                            except Exception as e:
-                                logger.error(f"fact_webtoon_stats 배치 저장 중 오류 발생: {e}")
-                                import traceback
-                                traceback.print_exc()
-                            
-                            # dim_webtoon 업데이트 (genre, tags 정보 추가)
-                            logger.info("dim_webtoon 배치 업데이트 중 (genre, tags 정보 추가)...")
-                            update_records = []
-                            
-                            for detail_data in batch_data:
-                                webtoon_id = str(detail_data.get('webtoon_id')) if detail_data.get('webtoon_id') else None
-                                genre = detail_data.get('genre')
-                                tags = detail_data.get('tags')
-                                
-                                if webtoon_id and webtoon_id in dim_webtoon_ids:
-                                    # 기존 레코드 찾기
-                                    existing = dim_df[dim_df['webtoon_id'] == webtoon_id]
-                                    if len(existing) > 0:
-                                        # genre나 tags가 있으면 업데이트
-                                        if genre or tags:
-                                            existing_record = existing.iloc[0].to_dict()
-                                            
-                                            # 기존 tags 처리
-                                            existing_tags = existing_record.get('tags')
-                                            if isinstance(existing_tags, str):
-                                                existing_tags = [t.strip() for t in existing_tags.split('|') if t.strip()] if existing_tags else []
-                                            elif not isinstance(existing_tags, list):
-                                                existing_tags = []
-                                            
-                                            # 새 tags와 병합 (중복 제거)
-                                            new_tags = tags if tags else []
-                                            if isinstance(new_tags, list):
-                                                combined_tags = list(set(existing_tags + new_tags))
-                                            else:
-                                                combined_tags = existing_tags
-                                            
-                                            # 업데이트 레코드 생성
-                                            update_record = create_dim_webtoon_record(
-                                                webtoon_id=webtoon_id,
-                                                title=existing_record.get('title', ''),
-                                                author=existing_record.get('author'),
-                                                genre=genre if genre else existing_record.get('genre'),
-                                                tags=combined_tags if combined_tags else None,
-                                            )
-                                            update_records.append(update_record)
-                            
-                            if len(update_records) > 0:
-                                dim_df = merge_dim_webtoon(dim_df, update_records)
-                                save_dim_webtoon(dim_df)
-                                logger.info(f"✅ dim_webtoon 배치 업데이트 완료: {len(update_records)}개 레코드 업데이트됨")
-                                
-                                # 업데이트된 dim_webtoon을 BigQuery에 업로드
-                                from src.utils import get_dim_webtoon_jsonl_path
-                                dim_jsonl_path = get_dim_webtoon_jsonl_path()
-                                if dim_jsonl_path.exists():
-                                    logger.info("업데이트된 dim_webtoon을 BigQuery에 업로드 중...")
-                                    try:
-                                        upload_success = upload_dim_webtoon(jsonl_path=dim_jsonl_path, dry_run=False)
-                                        if upload_success:
-                                            logger.info(f"✅ dim_webtoon BigQuery 업로드 성공 ({len(update_records)}개 업데이트)")
-                                        else:
-                                            logger.error("dim_webtoon BigQuery 업로드 실패")
-                                    except Exception as e:
-                                        logger.error(f"dim_webtoon BigQuery 업로드 중 오류 발생: {e}")
-                                        import traceback
-                                        traceback.print_exc()
-                            
-                            logger.info(f"✅ 배치 저장 완료: {i}/{len(webtoon_ids)}개 처리됨")
-                            logger.info(f"{'='*60}\n")
-                            
-                    except Exception as e:
-                        logger.error(f"웹툰 상세 정보 수집 실패 (webtoon_id={webtoon_id}): {e}")
-                        continue
+                # coordinator 모드: 샤드를 worker에 분배하고, 샤드가 끝나는 순서대로 아래 배치 루프에서 저장
+                # (coordinator가 시간 초과로 중단돼도 먼저 끝난 샤드는 저장/체크포인트까지 끝남)
+                shard_results = None
+                if num_shards > 1 and len(webtoon_ids) > 0:
+                    shard_results = iter_webtoon_details_sharded(
+                        webtoon_ids,
+                        num_shards,
+                        queue=get_shard_queue(shard_queue_type, worker_url),
+                        detail_concurrency=detail_concurrency,
+                        # 현재 속도가 아니라 요청 예산(제어기 속도 상한)을 worker 수로 나눔
+                        requests_per_second=get_naver_rate_controller().max_rate,
+                    )
                 
-                # 남은 데이터 처리 (마지막 배치)
-                if len(detail_data_list) > 0:
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"마지막 배치 저장 시작: {len(detail_data_list)}개 데이터 저장 및 업로드")
-                    logger.info(f"{'='*60}")
+                collected_count = 0
+                processed = 0
+                staged_batches = []  # session 방식: commit 후 체크포인트에 기록할 (webtoon_id 리스트, cursor)
+                staged_stats_date = None  # session 방식: 아직 반영하지 않은 첫 배치의 날짜 (fact_webtoon_stats 업로드 시작 날짜)
+                for batch_ids, batch_data in iter_detail_batches(webtoon_ids, save_batch_size, shard_results, detail_concurrency):
+                    processed += len(batch_ids)
+                    collected_count += len(batch_data)
+                    logger.info(f"[{processed}/{len(webtoon_ids)}] 웹툰 상세 정보 수집 진행 중... (성공: {collected_count}개)")
                     
-                    # fact_webtoon_stats 저장
-                    try:
-                        stats_success = transform_and_save_webtoon_stats(detail_data_list, dim_webtoon_ids)
-                        if stats_success:
-                            logger.info(f"✅ fact_webtoon_stats 마지막 배치 저장 완료: {len(detail_data_list)}개")
-                            
-                            # fact_webtoon_stats를 BigQuery에 업로드
-                            from src.utils import get_webtoon_stats_jsonl_path
-                            stats_jsonl_path = get_webtoon_stats_jsonl_path()
-                            if stats_jsonl_path.exists():
-                                logger.info("fact_webtoon_stats를 BigQuery에 업로드 중...")
-                                try:
-                                    upload_success = upload_fact_webtoon_stats(jsonl_path=stats_jsonl_path, dry_run=False)
-                                    if upload_success:
-                                        logger.info(f"✅ fact_webtoon_stats BigQuery 업로드 성공 ({len(detail_data_list)}개)")
-                                    else:
-                                        logger.error("fact_webtoon_stats BigQuery 업로드 실패")
-                                except Exception as e:
-                                    logger.error(f"fact_webtoon_stats BigQuery 업로드 중 오류 발생: {e}")
-                                    import traceback
-                                    traceback.print_exc()
-                        else:
-                            logger.error("fact_webtoon_stats 마지막 배치 저장 실패")
-                    except Exception as e:
-                        logger.error(f"fact_webtoon_stats 마지막 배치 저장 중 오류 발생: {e}")
-                        import traceback
-                        traceback.print_exc()
-                    
-                    # dim_webtoon 업데이트 (genre, tags 정보 추가)
-                    logger.info("dim_webtoon 마지막 배치 업데이트 중 (genre, tags 정보 추가)...")
-                    update_records = []
+                    if len(batch_data) == 0:
+                        logger.warning(f"배치에서 수집된 웹툰 상세 정보가 없습니다: {processed - len(batch_ids) + 1}~{processed}")
+                        continue
                     
-                    for detail_data in detail_data_list:
-                        webtoon_id = str(detail_data.get('webtoon_id')) if detail_data.get('webtoon_id') else None
-                        genre = detail_data.get('genre')
-                        tags = detail_data.get('tags')
-                        
-                        if webtoon_id and webtoon_id in dim_webtoon_ids:
-                            # 기존 레코드 찾기
-                            existing = dim_df[dim_df['webtoon_id'] == webtoon_id]
-                            if len(existing) > 0:
-                                # genre나 tags가 있으면 업데이트
-                                if genre or tags:
-                                    existing_record = existing.iloc[0].to_dict()
-                                    
-                                    # 기존 tags 처리
-                                    existing_tags = existing_record.get('tags')
-                                    if isinstance(existing_tags, str):
-                                        existing_tags = [t.strip() for t in existing_tags.split('|') if t.strip()] if existing_tags else []
-                                    elif not isinstance(existing_tags, list):
-                                        existing_tags = []
-                                    
-                                    # 새 tags와 병합 (중복 제거)
-                                    new_tags = tags if tags else []
-                                    if isinstance(new_tags, list):
-                                        combined_tags = list(set(existing_tags + new_tags))
-                                    else:
-                                        combined_tags = existing_tags
-                                    
-                                    # 업데이트 레코드 생성
-                                    update_record = create_dim_webtoon_record(
-                                        webtoon_id=webtoon_id,
-                                        title=existing_record.get('title', ''),
-                                        author=existing_record.get('author'),
-                                        genre=genre if genre else existing_record.get('genre'),
-                                        tags=combined_tags if combined_tags else None,
-                                    )
-                                    update_records.append(update_record)
+                    if staging is not None and staged_stats_date is None:
+                        staged_stats_date = date.today()
+                    stats_saved = save_detail_batch(batch_data, dim_store, dim_webtoon_ids, staging, staged_stats_date)
+                    logger.info(f"✅ 배치 저장 완료: {processed}/{len(webtoon_ids)}개 처리됨")
+                    logger.info(f"{'='*60}\n")
                     
-                    if len(update_records) > 0:
-                        dim_df = merge_dim_webtoon(dim_df, update_records)
-                        save_dim_webtoon(dim_df)
-                        logger.info(f"✅ dim_webtoon 마지막 배치 업데이트 완료: {len(update_records)}개 레코드 업데이트됨")
-                        
-                        # 업데이트된 dim_webtoon을 BigQuery에 업로드
-                        from src.utils import get_dim_webtoon_jsonl_path
-                        dim_jsonl_path = get_dim_webtoon_jsonl_path()
-                        if dim_jsonl_path.exists():
-                            logger.info("업데이트된 dim_webtoon을 BigQuery에 업로드 중...")
-                            try:
-                                upload_success = upload_dim_webtoon(jsonl_path=dim_jsonl_path, dry_run=False)
-                                if upload_success:
-                                    logger.info(f"✅ dim_webtoon BigQuery 업로드 성공 ({len(update_records)}개 업데이트)")
-                                else:
-                                    logger.error("dim_webtoon BigQuery 업로드 실패")
-                            except Exception as e:
-                                logger.error(f"dim_webtoon BigQuery 업로드 중 오류 발생: {e}")
-                                import traceback
-                                traceback.print_exc()
-                    else:
-                        logger.warning(f"dim_webtoon 업데이트할 레코드가 없습니다. (genre/tags가 있는 detail_data: {sum(1 for d in detail_data_list if d.get('genre') or d.get('tags'))}개)")
+                    # 저장/업로드까지 끝난 웹툰만 완료로 기록 (수집 실패한 웹툰은 재실행 시 다시 수집)
+                    if checkpoint is not None and stats_saved:
+                        completed = ([detail_data['webtoon_id'] for detail_data in batch_data], resumed_count + processed)
+                        if staging is not None:
+                            staged_batches.append(completed)
+                        else:
+                            checkpoint.mark_completed(completed[0], cursor=completed[1])
                     
-                    logger.info(f"✅ 마지막 배치 저장 완료")
-                    logger.info(f"{'='*60}\n")
-                else:
+                    # session 방식: 배치 N개마다 중간 반영 (시간 초과로 중단돼도 반영한 배치는 재실행 시 건너뜀)
+                    if staging is not None and staging_commit_batches > 0 and len(staged_batches) >= staging_commit_batches:
+                        if commit_staged_batches(staging, checkpoint, staged_batches):
+                            staged_stats_date = None
+                        else:
+                            # 반영하지 못한 fact_webtoon_stats 행은 업로드 위치가 그대로라 다음 반영에 포함
+                            all_success = False
+                        staged_batches = []
+                
+                # 배치마다 메모리 store만 갱신했으므로 dim_webtoon 파일은 여기서 한 번 저장
+                dim_store.flush()
+                
+                # session 방식: 모아 둔 업로드를 반영한 뒤 체크포인트 기록 (compaction 전에 업로드 위치 기록)
+                if staging is not None and not commit_staged_batches(staging, checkpoint, staged_batches):
+                    all_success = False
+                
+                if collected_count == 0 and len(webtoon_ids) > 0:
                     logger.warning("수집된 웹툰 상세 정보가 없습니다.")
+                else:
+                    # 배치마다 추가 저장한 fact_webtoon_stats의 중복 정리 (실행당 한 번)
+                    compact_fact_webtoon_stats()
+                
+                if checkpoint is not None:
+                    remaining_ids = checkpoint.pending(webtoon_ids)
+                    if remaining_ids:
+                        logger.warning(f"수집되지 않은 웹툰 {len(remaining_ids)}개는 체크포인트에 남겨 재실행 시 다시 수집합니다.")
+                    else:
+                        checkpoint.clear()
         except Exception as e:
             logger.error(f"웹툰 상세 정보 수집 중 오류 발생: {e}")
             import traceback
             traceback.print_exc()
             all_success = False
         
+        # session 방식: 상세 정보 단계를 건너뛰었거나 실패해 남은 업로드(차트 등) 반영
+        if staging is not None and not commit_staging(staging):
+            all_success = False
+        
+        # 요청 제어 metrics (현재 속도, 진행 중인 요청 수, 감속 이벤트)
+        rate_metrics = get_naver_rate_controller().get_metrics()
+        logger.info(f"네이버 요청 제어 metrics: {rate_metrics}")
+        http_cache = get_http_cache()
+        cache_stats = http_cache.get_stats() if http_cache is not None else {}
+        logger.info(f"HTTP 캐시 통계: {cache_stats}")
+        # 연결 재사용 통계 (warm 인스턴스에서는 이전 호출의 연결도 재사용)
+        connection_stats = {'requests': get_connection_stats(), 'aiohttp': get_aiohttp_connection_stats()}
+        logger.info(f"HTTP 연결 재사용 통계: {connection_stats}")
+        
         if all_success:
             logger.info("🎉 파이프라인 실행 완료!")
-            return {'status': 'success', 'date': str(chart_date)}, 200
+            return {'status': 'success', 'date': str(chart_date), 'rate_control': rate_metrics, 'http_cache': cache_stats, 'connection_reuse': connection_stats}, 200
         else:
             logger.error("❌ 파이프라인 실행 중 일부 오류 발생")
-            return {'status': 'partial_failure', 'date': str(chart_date)}, 500
+            return {'status': 'partial_failure', 'date': str(chart_date), 'rate_control': rate_metrics, 'http_cache': cache_stats, 'connection_reuse': connection_stats}, 500
             
     except Exception as e:
         logger.error(f"파이프라인 실행 중 오류 발생: {e}")
@@ -20,8 +20,8 @@ sys.path.insert(0, str(project_root))
 from src.utils import (
     get_dim_webtoon_csv_path,
     get_chart_csv_path,
-    get_webtoon_stats_csv_path,
 )
+from src.transform_webtoon_stats import load_fact_webtoon_stats_csv
 
 
 def verify_dim_webtoon() -> dict:
@@ -143,10 +143,9 @@ def verify_foreign_keys(chart_date: date = None) -> dict:
                         f'fact_weekly_chart ({sort_type})에 있지만 dim_webtoon에 없는 webtoon_id: {len(missing)}개'
                     )
         
-        # fact_webtoon_stats 확인
-        stats_path = get_webtoon_stats_csv_path()
-        if stats_path.exists():
-            stats_df = pd.read_csv(stats_path)
+        # fact_webtoon_stats 확인 (chart_date 파티션만 읽음)
+        stats_df = load_fact_webtoon_stats_csv(start_date=chart_date, end_date=chart_date)
+        if len(stats_df) > 0:
             stats_ids = set(stats_df['webtoon_id'].astype(str))
             missing = stats_ids - dim_ids
             
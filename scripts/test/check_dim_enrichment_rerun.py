@@ -0,0 +1,104 @@
+"""
+dim_webtoon 보강(genre/tags) 유지 확인 (같은 날짜 재실행)
+
+가짜 네이버 서버(synthetic 모드)로 run_pipeline을 같은 날짜에 두 번 실행합니다.
+- 1회차: 모든 웹툰의 상세 정보를 수집해 dim_webtoon에 genre/tags를 채움
+- 2회차: 갱신 계획이 최근에 수집한 웹툰을 모두 건너뜀
+2회차 뒤에도 genre/tags가 그대로 남아 있고, 차트 단계가 dim_webtoon을 다시 저장하지 않는지
+(바뀐 행이 없어 저장 생략) 확인합니다.
+
+사용 예:
+    python scripts/test/check_dim_enrichment_rerun.py
+    python scripts/test/check_dim_enrichment_rerun.py --catalog-size 300 --port 8095
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _wait_for_server(url: str, timeout: float = 10.0) -> bool:
+    """가짜 서버가 응답할 때까지 기다립니다."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1)
+            return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def _enriched_counts(env: dict) -> tuple:
+    """(전체 행 수, genre가 있는 행 수, tags가 있는 행 수)"""
+    code = (
+        "from src.transform import load_dim_webtoon\n"
+        "df = load_dim_webtoon()\n"
+        "print(len(df), int(df['genre'].notna().sum()), "
+        "int(df['tags'].map(lambda tags: tags is not None and len(tags) > 0).sum()))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], env=env, cwd=project_root, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return tuple(int(value) for value in output[-3:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='같은 날짜 재실행 후 dim_webtoon genre/tags 유지 확인')
+    parser.add_argument('--catalog-size', type=int, default=120, help='합성 카탈로그 웹툰 수')
+    parser.add_argument('--port', type=int, default=8096, help='가짜 서버 포트')
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    env = dict(
+        os.environ,
+        DATA_DIR=tempfile.mkdtemp(prefix='dim_rerun_'),
+        NAVER_COMIC_BASE_URL=base_url,
+        NAVER_COMIC_MOBILE_BASE_URL=base_url,
+        UPLOAD_TO_GCS='false',
+    )
+    server = subprocess.Popen(
+        [sys.executable, 'scripts/test/fake_naver_server.py', '--mode', 'synthetic',
+         '--port', str(args.port), '--catalog-size', str(args.catalog_size)],
+        cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not _wait_for_server(f"{base_url}/api/webtoon/titlelist/weekday?order=user"):
+            print("❌ 가짜 서버가 시작되지 않았습니다.")
+            sys.exit(1)
+
+        run_date = date.today().isoformat()
+        outputs = []
+        for run in (1, 2):
+            result = subprocess.run(
+                [sys.executable, 'src/run_pipeline.py', '--date', run_date, '--sort', 'popular'],
+                env=env, cwd=project_root, capture_output=True, text=True,
+            )
+            outputs.append(result.stdout + result.stderr)
+            rows, genres, tags = _enriched_counts(env)
+            print(f"{'✅' if result.returncode == 0 else '❌'} {run}회차: dim_webtoon {rows}행, genre {genres}행, tags {tags}행")
+            if run == 1:
+                first = (rows, genres, tags)
+    finally:
+        server.terminate()
+        server.wait()
+
+    kept = first[1] > 0 and (rows, genres, tags) == first
+    skipped_save = 'dim_webtoon 변경 없음, 저장 생략' in outputs[1]
+    print(f"{'✅' if kept else '❌'} 2회차 뒤에도 genre/tags 유지")
+    print(f"{'✅' if skipped_save else '❌'} 2회차 차트 단계는 dim_webtoon을 다시 저장하지 않음 (바뀐 행 없음)")
+    sys.exit(0 if kept and skipped_save else 1)
+
+
+if __name__ == "__main__":
+    main()
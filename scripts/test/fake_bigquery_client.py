@@ -0,0 +1,415 @@
+"""
+가짜 BigQuery 클라이언트 (로컬 적재 검증용)
+
+실제 BigQuery에 연결하지 않고 src/upload_bigquery.py의 업로드 경로를 확인하기 위한 대역입니다.
+- load_table_from_file / load_table_from_uri / load_table_from_json: 적재 파일을 읽어
+  job_config.schema로 검증한 뒤 메모리 테이블에 저장 (REQUIRED null, INTEGER에 float,
+  TIMESTAMP/DATE 형식 오류, REPEATED에 list 아님 → 작업 실패)
+- query: SQL만 기록 (MERGE는 실행하지 않음)
+- delete_table: 메모리 테이블 삭제
+- 세션: create_session으로 만든 세션의 _SESSION 임시 테이블은 세션별로 보관,
+  세션 밖에서 _SESSION 테이블을 쓰면 작업 실패, CALL BQ.ABORT_SESSION()으로 세션 종료
+- job_latency: 작업마다 완료까지 걸리는 시간 (done()은 그 시간이 지나야 True, result()는 대기)
+
+직접 실행하면 임시 DATA_DIR에 합성 데이터를 저장하고, 세 테이블 업로드를
+JSONL / Parquet 적재 파일로 각각 실행해 테이블마다 load job 한 번으로 모든 행이
+스키마에 맞게 적재되는지 확인합니다. fact_webtoon_stats는 증분 업로드
+(업로드 위치 이후 추가된 행만 전송)도 확인하고, 작업 지연을 넣어 세 테이블을 하나씩
+업로드할 때와 run_table_uploads로 함께 업로드할 때의 시간을 비교합니다.
+마지막으로 상세 정보 배치 여러 개를 흉내 내어 BIGQUERY_STAGING_MODE=table(배치마다 업로드)과
+session(StagingSession으로 모아 commit 한 번)의 작업 수와 남은 임시 테이블을 비교합니다.
+
+사용 예:
+    python scripts/test/fake_bigquery_client.py
+    python scripts/test/fake_bigquery_client.py --webtoons 5000 --formats jsonl
+    python scripts/test/fake_bigquery_client.py --job-latency 1.0
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+class FakeLoadJob:
+    """load job / query job 대역 (latency초 뒤 완료, result()에서 검증 오류를 다시 발생)"""
+
+    def __init__(self, kind: str, destination: Optional[str] = None, rows: int = 0,
+                 error: Optional[Exception] = None, query: Optional[str] = None, latency: float = 0.0):
+        self.kind = kind
+        self.destination = destination
+        self.output_rows = rows
+        self.error = error
+        self.query = query
+        self.num_dml_affected_rows = 0
+        self.done_at = time.monotonic() + latency
+        self.session_info = None
+
+    def done(self) -> bool:
+        return time.monotonic() >= self.done_at
+
+    def result(self):
+        remaining = self.done_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        if self.error is not None:
+            raise self.error
+        return []
+
+
+class FakeBigQueryClient:
+    """google.cloud.bigquery.Client 중 업로드 경로가 사용하는 메서드만 흉내냅니다."""
+
+    def __init__(self, blobs: Optional[Dict[str, bytes]] = None, job_latency: float = 0.0):
+        self.job_latency = job_latency
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        # 세션 ID -> {_SESSION 테이블 이름: 행}
+        self.sessions: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self.jobs: List[FakeLoadJob] = []
+        self.queries: List[str] = []
+        # load_table_from_uri가 읽을 GCS 객체 (gs://bucket/name -> bytes)
+        self.blobs = blobs if blobs is not None else {}
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def load_table_from_file(self, file_obj, destination: str, job_config=None) -> FakeLoadJob:
+        return self._load(file_obj.read(), destination, job_config)
+
+    def load_table_from_uri(self, source_uri: str, destination: str, job_config=None) -> FakeLoadJob:
+        if source_uri not in self.blobs:
+            return self._record(FakeLoadJob('load', destination, error=FileNotFoundError(source_uri)))
+        return self._load(self.blobs[source_uri], destination, job_config)
+
+    def load_table_from_json(self, rows: List[Dict], destination: str, job_config=None) -> FakeLoadJob:
+        data = '\n'.join(json.dumps(row, ensure_ascii=False, default=str) for row in rows).encode('utf-8')
+        return self._load(data, destination, job_config, source_format='NEWLINE_DELIMITED_JSON')
+
+    def _load(self, data: bytes, destination: str, job_config, source_format: Optional[str] = None) -> FakeLoadJob:
+        try:
+            session_id = self._session_of(job_config)
+        except KeyError as e:
+            return self._record(FakeLoadJob('load', destination, error=e))
+        if destination.startswith('_SESSION.') and session_id is None:
+            return self._record(FakeLoadJob('load', destination, error=ValueError(f"세션 없이 {destination}에 적재")))
+        source_format = source_format or getattr(job_config, 'source_format', None) or 'NEWLINE_DELIMITED_JSON'
+        try:
+            if source_format == 'PARQUET':
+                import pyarrow.parquet as pq
+                rows = pq.read_table(io.BytesIO(data)).to_pylist()
+            else:
+                rows = [json.loads(line) for line in data.splitlines() if line.strip()]
+            schema = getattr(job_config, 'schema', None)
+            if schema:
+                for index, row in enumerate(rows):
+                    _validate_row(row, schema, index)
+        except Exception as e:
+            return self._record(FakeLoadJob('load', destination, error=e))
+
+        tables = self.sessions[session_id] if destination.startswith('_SESSION.') else self.tables
+        disposition = getattr(job_config, 'write_disposition', None)
+        if disposition == 'WRITE_APPEND':
+            tables.setdefault(destination, []).extend(rows)
+        else:
+            tables[destination] = rows
+        job = FakeLoadJob('load', destination, rows=len(rows))
+        if session_id is not None:
+            job.session_info = SimpleNamespace(session_id=session_id)
+        return self._record(job)
+
+    def _session_of(self, job_config) -> Optional[str]:
+        """작업이 실행될 세션 ID (create_session이면 새로 만들고, 없는 세션이면 KeyError)"""
+        if getattr(job_config, 'create_session', None):
+            session_id = f"session-{len(self.sessions) + 1}"
+            self.sessions[session_id] = {}
+            return session_id
+        for prop in getattr(job_config, 'connection_properties', None) or []:
+            if prop.key == 'session_id':
+                if prop.value not in self.sessions:
+                    raise KeyError(f"종료되었거나 없는 세션: {prop.value}")
+                return prop.value
+        return None
+
+    # ------------------------------------------------------------------
+    # 쿼리 / 테이블
+    # ------------------------------------------------------------------
+
+    def query(self, sql: str, job_config=None) -> FakeLoadJob:
+        self.queries.append(sql)
+        try:
+            session_id = self._session_of(job_config)
+        except KeyError as e:
+            return self._record(FakeLoadJob('query', query=sql, error=e))
+        if '_SESSION.' in sql:
+            if session_id is None:
+                return self._record(FakeLoadJob('query', query=sql, error=ValueError("세션 밖에서 _SESSION 테이블 참조")))
+            missing = [name for name in set(re.findall(r'_SESSION\.\w+', sql)) if name not in self.sessions[session_id]]
+            if missing:
+                return self._record(FakeLoadJob('query', query=sql, error=KeyError(f"세션 임시 테이블 없음: {missing}")))
+        if 'BQ.ABORT_SESSION' in sql and session_id is not None:
+            del self.sessions[session_id]
+        return self._record(FakeLoadJob('query', query=sql))
+
+    def delete_table(self, table_id: str, not_found_ok: bool = False) -> None:
+        if table_id not in self.tables and not not_found_ok:
+            raise KeyError(table_id)
+        self.tables.pop(table_id, None)
+
+    def _record(self, job: FakeLoadJob) -> FakeLoadJob:
+        job.done_at = time.monotonic() + self.job_latency
+        self.jobs.append(job)
+        return job
+
+    def temp_tables(self) -> List[str]:
+        """데이터셋에 남아 있는 임시 테이블 (cleanup_temp_tables.sh가 정리할 대상)"""
+        return [table_id for table_id in self.tables if '_temp' in table_id]
+
+    def load_jobs(self, table_prefix: str = '') -> List[FakeLoadJob]:
+        """적재 작업 목록 (destination이 table_prefix로 시작하는 것만)"""
+        return [job for job in self.jobs if job.kind == 'load' and (job.destination or '').startswith(table_prefix)]
+
+
+def _validate_row(row: Dict[str, Any], schema, index: int) -> None:
+    """BigQuery 적재 시 거부되는 값을 ValueError로 알립니다."""
+    names = {field.name for field in schema}
+    unknown = set(row) - names
+    if unknown:
+        raise ValueError(f"행 {index}: 스키마에 없는 컬럼 {sorted(unknown)}")
+    for field in schema:
+        value = row.get(field.name)
+        if field.mode == 'REPEATED':
+            if value is not None and not isinstance(value, list):
+                raise ValueError(f"행 {index}: {field.name}은 배열이어야 합니다: {value!r}")
+            continue
+        if value is None:
+            if field.mode == 'REQUIRED':
+                raise ValueError(f"행 {index}: REQUIRED 컬럼 {field.name}이 null입니다")
+            continue
+        field_type = field.field_type
+        if field_type == 'INTEGER' and (isinstance(value, bool) or not isinstance(value, int)):
+            raise ValueError(f"행 {index}: {field.name}은 정수여야 합니다: {value!r}")
+        if field_type == 'BOOLEAN' and not isinstance(value, bool):
+            raise ValueError(f"행 {index}: {field.name}은 BOOLEAN이어야 합니다: {value!r}")
+        if field_type == 'STRING' and not isinstance(value, str):
+            raise ValueError(f"행 {index}: {field.name}은 문자열이어야 합니다: {value!r}")
+        if field_type == 'TIMESTAMP' and not isinstance(value, datetime):
+            datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        if field_type == 'DATE' and not isinstance(value, date):
+            date.fromisoformat(str(value))
+
+
+def _write_sample_data(webtoons: int, chart_date: date) -> None:
+    """합성 차트/상세 정보를 DATA_DIR에 JSONL로 저장합니다."""
+    from src.transform import transform_and_save
+    from src.transform_webtoon_stats import transform_and_save_webtoon_stats
+
+    parsed = [
+        {'rank': rank, 'title': f'웹툰 {rank}', 'webtoon_id': str(700000 + rank),
+         'author': f'작가{rank % 50}', 'weekday': ['MONDAY', 'FRIDAY', None][rank % 3],
+         'view_count': None if rank % 4 == 0 else rank * 10}
+        for rank in range(1, webtoons + 1)
+    ]
+    transform_and_save(parsed, chart_date, sort_type='popular')
+    details = [
+        {'webtoon_id': str(700000 + rank), 'favorite_count': None if rank % 9 == 0 else rank * 100,
+         'favorite_count_source': 'api', 'finished': rank % 5 == 0, 'rest': False,
+         'total_episode_count': None if rank % 7 == 0 else float(rank % 300 + 1),
+         'genre': 'DRAMA', 'tags': ['로맨스', '일상'][: rank % 3]}
+        for rank in range(1, webtoons + 1)
+    ]
+    transform_and_save_webtoon_stats(details, {d['webtoon_id'] for d in details})
+
+
+def _check_stats_delta_upload(upload_bigquery, chart_date: date) -> bool:
+    """fact_webtoon_stats 증분 업로드: 다시 업로드하면 그 사이 추가된 행만 보내는지 확인 (실패 시 True)"""
+    from src.models import FactWebtoonStatsRecord
+    from src.transform_webtoon_stats import append_fact_webtoon_stats
+
+    upload_bigquery.BIGQUERY_LOAD_FORMAT = 'jsonl'
+    client = FakeBigQueryClient()
+    upload_bigquery.get_bigquery_client = lambda: client
+    temp_prefix = f"{upload_bigquery.BIGQUERY_PROJECT_ID}.{upload_bigquery.BIGQUERY_DATASET_ID}.fact_webtoon_stats_temp"
+
+    def upload_rows() -> int:
+        jobs_before = len(client.load_jobs(temp_prefix))
+        upload_bigquery.upload_fact_webtoon_stats(start_date=chart_date)
+        return sum(job.output_rows for job in client.load_jobs(temp_prefix)[jobs_before:])
+
+    print("\n=== fact_webtoon_stats 증분 업로드 ===")
+    first_rows = upload_rows()
+    unchanged_rows = upload_rows()
+    collected_at = datetime.combine(chart_date, datetime.min.time()).replace(hour=23, minute=59)
+    added = append_fact_webtoon_stats([
+        FactWebtoonStatsRecord(webtoon_id=str(900000 + i), collected_at=collected_at, favorite_count=i)
+        for i in range(37)
+    ])
+    delta_rows = upload_rows()
+    merge_ok = all('BETWEEN TIMESTAMP(' in sql for sql in client.queries)
+
+    ok = first_rows > 0 and unchanged_rows == 0 and delta_rows == added and merge_ok
+    print(f"   처음 업로드 {first_rows}행, 변경 없이 다시 업로드 {unchanged_rows}행, {added}개 추가 후 업로드 {delta_rows}행")
+    print(f"{'✅' if ok else '❌'} 추가된 행만 업로드, MERGE collected_at 범위 조건: {merge_ok}")
+    return not ok
+
+
+def _check_concurrent_uploads(upload_bigquery, chart_date: date, job_latency: float) -> bool:
+    """작업 지연이 있을 때 세 테이블 동시 업로드가 하나씩 업로드보다 빠른지 확인 (실패 시 True)"""
+    upload_bigquery.BIGQUERY_LOAD_FORMAT = 'jsonl'
+    upload_bigquery.BIGQUERY_JOB_POLL_SECONDS = min(0.05, job_latency / 10)
+
+    def plans():
+        return [
+            upload_bigquery.plan_dim_webtoon_upload(),
+            upload_bigquery.plan_fact_weekly_chart_upload(chart_date, sort_type='popular'),
+            upload_bigquery.plan_fact_webtoon_stats_upload(start_date=chart_date, incremental=False),
+        ]
+
+    print(f"\n=== 동시 업로드 (작업당 지연 {job_latency:.2f}초) ===")
+    client = FakeBigQueryClient(job_latency=job_latency)
+    start = time.perf_counter()
+    sequential = [upload_bigquery.run_table_uploads([plan], client=client) for plan in plans()]
+    sequential_seconds = time.perf_counter() - start
+
+    client = FakeBigQueryClient(job_latency=job_latency)
+    start = time.perf_counter()
+    report = upload_bigquery.run_table_uploads(plans(), client=client)
+    concurrent_seconds = time.perf_counter() - start
+
+    for name, result in report.items():
+        print(f"   {name}: 성공={result['success']}, {result['rows']}행, "
+              f"적재 {result['load_seconds']}초, MERGE {result['merge_seconds']}초, 전체 {result['total_seconds']}초")
+    ok = (all(result['success'] for result in report.values())
+          and all(r['success'] for part in sequential for r in part.values())
+          and len(client.queries) == 3
+          and concurrent_seconds < sequential_seconds * 0.6)
+    print(f"{'✅' if ok else '❌'} 하나씩 {sequential_seconds:.2f}초, 함께 {concurrent_seconds:.2f}초 "
+          f"({sequential_seconds / max(concurrent_seconds, 1e-9):.1f}x)")
+    return not ok
+
+
+def _check_staging_modes(upload_bigquery, chart_date: date, batches: int) -> bool:
+    """배치 여러 개를 업로드할 때 table / session 방식의 작업 수 비교 (실패 시 True)"""
+    from src.models import FactWebtoonStatsRecord
+    from src.transform_webtoon_stats import append_fact_webtoon_stats
+
+    upload_bigquery.BIGQUERY_LOAD_FORMAT = 'jsonl'
+    upload_bigquery.BIGQUERY_JOB_POLL_SECONDS = 0.0
+    collected_at = datetime.combine(chart_date, datetime.min.time()).replace(hour=23)
+
+    def append_batch(index: int) -> None:
+        append_fact_webtoon_stats([
+            FactWebtoonStatsRecord(webtoon_id=str(800000 + index * 10 + i),
+                                   collected_at=collected_at.replace(minute=index % 60, second=i), favorite_count=i)
+            for i in range(10)
+        ])
+
+    def planners() -> Dict[str, Any]:
+        return {
+            'dim_webtoon': upload_bigquery.plan_dim_webtoon_upload,
+            'fact_webtoon_stats': lambda: upload_bigquery.plan_fact_webtoon_stats_upload(start_date=chart_date),
+        }
+
+    print(f"\n=== 임시 테이블 방식 (상세 정보 배치 {batches}개) ===")
+    results = {}
+    for mode in ('table', 'session'):
+        client = FakeBigQueryClient()
+        # 이전 확인에서 올린 행까지 업로드 위치를 맞춰 두고 시작
+        upload_bigquery.run_table_uploads(
+            [upload for upload in [upload_bigquery.plan_fact_webtoon_stats_upload(start_date=chart_date)] if upload],
+            client=client
+        )
+        client = FakeBigQueryClient()
+        staging = upload_bigquery.StagingSession() if mode == 'session' else None
+        ok = True
+        for index in range(batches):
+            append_batch(len(results) * batches + index)
+            if staging is None:
+                uploads = [planner() for planner in planners().values()]
+                report = upload_bigquery.run_table_uploads([u for u in uploads if u is not None], client=client)
+                ok = ok and all(result['success'] for result in report.values())
+            else:
+                for key, planner in planners().items():
+                    staging.add(key, planner)
+        if staging is not None:
+            report = staging.commit(client=client)
+            ok = ok and all(result['success'] for result in report.values())
+            stats_rows = report.get('fact_webtoon_stats', {}).get('rows')
+            ok = ok and stats_rows == batches * 10
+            script_ok = sum('BEGIN TRANSACTION' in sql for sql in client.queries) == 1 and not client.sessions
+            ok = ok and script_ok
+        results[mode] = (len(client.load_jobs()), sum(job.kind == 'query' for job in client.jobs), client.temp_tables(), ok)
+
+    for mode, (loads, queries, leftovers, ok) in results.items():
+        print(f"{'✅' if ok else '❌'} {mode}: load job {loads}개, 쿼리 job {queries}개, 남은 데이터셋 임시 테이블 {len(leftovers)}개")
+    failed = not all(ok for *_, ok in results.values())
+    table_jobs = results['table'][0] + results['table'][1]
+    session_jobs = results['session'][0] + results['session'][1]
+    failed = failed or session_jobs >= table_jobs or results['session'][2]
+    print(f"{'❌' if failed else '✅'} 작업 수: table {table_jobs}개 → session {session_jobs}개")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 BigQuery 클라이언트로 업로드 경로 확인')
+    parser.add_argument('--webtoons', type=int, default=2500, help='합성 웹툰 수 (1000행 배치 여러 개가 되도록)')
+    parser.add_argument('--formats', default='jsonl,parquet', help='확인할 BIGQUERY_LOAD_FORMAT 목록 (쉼표 구분)')
+    parser.add_argument('--job-latency', type=float, default=0.3, help='동시 업로드 확인에서 작업당 지연 (초)')
+    parser.add_argument('--batches', type=int, default=5, help='임시 테이블 방식 비교에서 상세 정보 배치 수')
+    args = parser.parse_args()
+
+    os.environ['DATA_DIR'] = tempfile.mkdtemp(prefix='fake_bigquery_')
+    os.environ['DATA_FORMAT'] = 'jsonl'
+
+    from src import upload_bigquery
+    from src.utils import setup_logging
+
+    setup_logging()
+    chart_date = date.today()
+    _write_sample_data(args.webtoons, chart_date)
+
+    failed = False
+    for load_format in [value.strip() for value in args.formats.split(',') if value.strip()]:
+        upload_bigquery.BIGQUERY_LOAD_FORMAT = load_format
+        client = FakeBigQueryClient()
+        upload_bigquery.get_bigquery_client = lambda: client
+
+        uploads = [
+            ('dim_webtoon', lambda: upload_bigquery.upload_dim_webtoon()),
+            ('fact_weekly_chart', lambda: upload_bigquery.upload_fact_weekly_chart(chart_date, sort_type='popular')),
+            ('fact_webtoon_stats', lambda: upload_bigquery.upload_fact_webtoon_stats(start_date=chart_date, incremental=False)),
+        ]
+        print(f"\n=== BIGQUERY_LOAD_FORMAT={load_format} ===")
+        for table_name, upload in uploads:
+            start = time.perf_counter()
+            success = upload()
+            seconds = time.perf_counter() - start
+            jobs = client.load_jobs(f"{upload_bigquery.BIGQUERY_PROJECT_ID}.{upload_bigquery.BIGQUERY_DATASET_ID}.{table_name}_temp")
+            rows = sum(job.output_rows for job in jobs)
+            ok = success and len(jobs) == 1 and rows == args.webtoons
+            failed = failed or not ok
+            print(f"{'✅' if ok else '❌'} {table_name}: 성공={success}, load job {len(jobs)}개, {rows}행, {seconds * 1000:.0f}ms")
+            for job in jobs:
+                if job.error is not None:
+                    print(f"   오류: {job.error}")
+
+    failed = _check_stats_delta_upload(upload_bigquery, chart_date) or failed
+    failed = _check_concurrent_uploads(upload_bigquery, chart_date, args.job_latency) or failed
+    failed = _check_staging_modes(upload_bigquery, chart_date, args.batches) or failed
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
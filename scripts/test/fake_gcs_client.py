@@ -0,0 +1,204 @@
+"""
+가짜 GCS 클라이언트 (원본 파일 일괄 업로드 확인용)
+
+실제 GCS에 연결하지 않고 src/upload_gcs.py의 업로드 경로를 확인하기 위한 대역입니다.
+- bucket().blob().upload_from_string: 내용을 저장하고 GCS처럼 md5_hash / crc32c(base64) 계산,
+  요청 지연(latency) + 전송 시간(bytes / bandwidth)만큼 대기
+- bucket().list_blobs(prefix): 저장된 객체 메타데이터 나열
+
+직접 실행하면 임시 DATA_DIR에 합성 차트/상세 정보 원본 JSON을 저장하고
+1. 기존 방식 (압축 없이 한 파일씩)
+2. upload_raw_data_for_date (gzip + 동시 업로드)
+3. 같은 날짜 재실행 (내용이 같아 모두 건너뜀)
+4. 파일 하나 변경 후 재실행 (그 파일만 업로드)
+의 시간과 전송량을 비교하고,
+5. 응답 원본 보관 (src/raw_archive.py, 응답 바이트를 임시 파일 없이 gzip으로 바로 업로드)
+결과가 받은 바이트와 같은지 확인합니다.
+
+사용 예:
+    python scripts/test/fake_gcs_client.py
+    python scripts/test/fake_gcs_client.py --details 2000 --latency 0.05 --bandwidth-mb 5
+"""
+
+import argparse
+import base64
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'scripts' / 'test'))
+
+
+class FakeBlob:
+    """google.cloud.storage.Blob 중 업로드 경로가 사용하는 속성/메서드만 흉내냅니다."""
+
+    def __init__(self, bucket: 'FakeBucket', name: str):
+        self.bucket = bucket
+        self.name = name
+        self.content_encoding: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.md5_hash: Optional[str] = None
+        self.crc32c: Optional[str] = None
+        self.data = b''
+
+    def upload_from_string(self, data: bytes, content_type: str = 'text/plain', checksum: Optional[str] = None, **kwargs) -> None:
+        self.bucket.client.wait(len(data))
+        import google_crc32c
+
+        self.data = data
+        self.content_type = content_type
+        self.md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+        self.crc32c = base64.b64encode(google_crc32c.value(data).to_bytes(4, 'big')).decode('ascii')
+        self.bucket.store(self)
+
+    def upload_from_filename(self, filename: str, content_type: Optional[str] = None, **kwargs) -> None:
+        self.upload_from_string(Path(filename).read_bytes(), content_type=content_type or 'application/octet-stream')
+
+
+class FakeBucket:
+    def __init__(self, client: 'FakeGcsClient', name: str):
+        self.client = client
+        self.name = name
+        self.blobs: Dict[str, FakeBlob] = {}
+        self._lock = threading.Lock()
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+    def store(self, blob: FakeBlob) -> None:
+        with self._lock:
+            self.blobs[blob.name] = blob
+            self.client.uploads += 1
+            self.client.bytes_sent += len(blob.data)
+
+    def list_blobs(self, prefix: str = '') -> List[FakeBlob]:
+        self.client.wait(0)
+        self.client.list_calls += 1
+        return [blob for name, blob in sorted(self.blobs.items()) if name.startswith(prefix)]
+
+
+class FakeGcsClient:
+    """google.cloud.storage.Client 대역 (요청마다 latency초 + 전송량 / bandwidth)"""
+
+    def __init__(self, latency: float = 0.0, bandwidth_mb: float = 0.0):
+        self.latency = latency
+        self.bandwidth = bandwidth_mb * 1024 * 1024
+        self.buckets: Dict[str, FakeBucket] = {}
+        self.uploads = 0
+        self.list_calls = 0
+        self.bytes_sent = 0
+
+    def bucket(self, name: str) -> FakeBucket:
+        return self.buckets.setdefault(name, FakeBucket(self, name))
+
+    def wait(self, size: int) -> None:
+        seconds = self.latency + (size / self.bandwidth if self.bandwidth else 0.0)
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+def _write_raw_files(chart_date: date, details: int) -> Path:
+    """합성 차트 / 상세 정보 원본 JSON을 DATA_DIR/raw/{날짜}에 저장합니다 (extract.py와 같은 형식)."""
+    from fake_naver_server import SyntheticCatalog
+    from src.json_codec import dumps_bytes
+    from src.utils import get_raw_html_dir
+
+    catalog = SyntheticCatalog(details)
+    raw_dir = get_raw_html_dir(chart_date)
+    for order in ('popular', 'view'):
+        (raw_dir / f"webtoon_chart_{order}.json").write_bytes(dumps_bytes(catalog.chart(order), indent=True))
+    detail_dir = raw_dir / 'webtoon_detail'
+    detail_dir.mkdir(exist_ok=True)
+    for title_id in catalog.title_ids():
+        (detail_dir / f"{title_id}.json").write_bytes(dumps_bytes(catalog.detail(title_id), indent=True))
+    return raw_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 GCS 클라이언트로 원본 파일 일괄 업로드 확인')
+    parser.add_argument('--details', type=int, default=500, help='합성 웹툰 상세 정보 파일 수')
+    parser.add_argument('--latency', type=float, default=0.02, help='요청당 지연 (초)')
+    parser.add_argument('--bandwidth-mb', type=float, default=10.0, help='업로드 대역폭 (MB/s, 0이면 무제한)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 업로드 수')
+    args = parser.parse_args()
+
+    os.environ['DATA_DIR'] = tempfile.mkdtemp(prefix='fake_gcs_')
+
+    from src import upload_gcs
+    from src.utils import setup_logging
+
+    setup_logging()
+    chart_date = date.today()
+    raw_dir = _write_raw_files(chart_date, args.details)
+    files = [
+        (path, upload_gcs.get_raw_gcs_path(chart_date, path.relative_to(raw_dir).as_posix()))
+        for path in sorted(raw_dir.rglob('*.json'))
+    ]
+    raw_bytes = sum(path.stat().st_size for path, _ in files)
+    print(f"원본 파일 {len(files)}개, {raw_bytes / 1024 / 1024:.1f}MB "
+          f"(요청당 지연 {args.latency}초, 대역폭 {args.bandwidth_mb}MB/s)")
+
+    def run(label: str, client: FakeGcsClient, upload) -> bool:
+        upload_gcs.get_gcs_client = lambda: client
+        uploads_before, bytes_before = client.uploads, client.bytes_sent
+        start = time.perf_counter()
+        success = upload()
+        seconds = time.perf_counter() - start
+        print(f"{'✅' if success else '❌'} {label}: {seconds:.2f}초, 업로드 {client.uploads - uploads_before}개, "
+              f"전송 {(client.bytes_sent - bytes_before) / 1024 / 1024:.2f}MB")
+        return success
+
+    baseline = FakeGcsClient(args.latency, args.bandwidth_mb)
+    run('기존 방식 (압축 없이 한 파일씩)', baseline,
+        lambda: all(status != 'failed' for status in upload_gcs.upload_files_to_gcs(files, compress=False, max_workers=1).values()))
+
+    client = FakeGcsClient(args.latency, args.bandwidth_mb)
+    upload_gcs.GCS_UPLOAD_WORKERS = args.workers
+    failed = not run(f'gzip + 동시 업로드 ({args.workers}개)', client, lambda: upload_gcs.upload_raw_data_for_date(chart_date))
+
+    uploads_before = client.uploads
+    failed = not run('같은 날짜 재실행', client, lambda: upload_gcs.upload_raw_data_for_date(chart_date)) or failed
+    failed = failed or client.uploads != uploads_before
+
+    changed_path, changed_gcs_path = files[-1]
+    changed_path.write_bytes(changed_path.read_bytes().replace(b'}', b', "changed": true}', 1))
+    uploads_before = client.uploads
+    failed = not run('파일 하나 변경 후 재실행', client, lambda: upload_gcs.upload_raw_data_for_date(chart_date)) or failed
+    failed = failed or client.uploads != uploads_before + 1
+
+    # 저장된 객체는 gzip 압축 + Content-Encoding으로 원본과 같은 내용
+    import gzip
+    blob = client.bucket(upload_gcs.GCS_BUCKET_NAME).blobs[changed_gcs_path]
+    same = blob.content_encoding == 'gzip' and gzip.decompress(blob.data) == changed_path.read_bytes()
+    print(f"{'✅' if same else '❌'} 저장된 객체 압축 해제 결과가 원본과 같음 (Content-Encoding: {blob.content_encoding})")
+    failed = failed or not same
+
+    # 차트 응답 원본 보관: 응답 바이트를 그대로 압축해 GCS 객체 하나로 업로드
+    from fake_naver_server import SyntheticCatalog
+    from src.json_codec import dumps_bytes
+    from src.raw_archive import archive_raw_bytes
+
+    body = dumps_bytes(SyntheticCatalog(args.details).chart('view'))
+    uploads_before = client.uploads
+    location = archive_raw_bytes(chart_date, 'webtoon_chart_view.json', body, target='gcs')
+    blob = client.bucket(upload_gcs.GCS_BUCKET_NAME).blobs.get(upload_gcs.get_raw_gcs_path(chart_date, 'webtoon_chart_view.json'))
+    archived = (
+        location is not None and blob is not None and client.uploads == uploads_before + 1
+        and blob.content_encoding == 'gzip' and gzip.decompress(blob.data) == body
+    )
+    print(f"{'✅' if archived else '❌'} 응답 원본 보관: {location} "
+          f"({len(body) / 1024:.1f}KB → {len(blob.data) / 1024 if blob else 0:.1f}KB, 받은 바이트와 같음: {archived})")
+    sys.exit(1 if failed or not archived else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""
+가짜 네이버 웹툰 서버 (녹화/재생)
+
+comic.naver.com에 요청하지 않고 수집기를 부하 테스트하기 위한 로컬 대역입니다.
+파이프라인이 사용하는 엔드포인트를 흉내냅니다.
+- /api/webtoon/titlelist/weekday (주간 차트 API)
+- /api/article/list/info (상세 정보 API)
+- /api/article/list (에피소드 목록 API)
+- /webtoon/list, /webtoon, /webtoon/weekday (HTML)
+
+모드
+- record: 요청을 실제 서버(--upstream)로 전달하고 200 응답을 fixture로 저장
+- replay: 저장된 fixture로 응답 (fixture가 없으면 합성 응답, --strict면 404)
+- synthetic: fixture 없이 합성 응답만 사용
+
+재생/합성 응답에는 지연(--latency-ms, --jitter-ms), 오류(--error-rate),
+429 버스트(--burst-429-every, --burst-429-length)를 주입할 수 있고,
+--scale N이면 주간 차트의 웹툰을 N배로 복제하여 실제보다 큰 카탈로그를 만듭니다.
+(복제된 웹툰 ID = 원래 ID + k * SCALE_ID_OFFSET, 상세 요청은 원래 ID의 fixture로 응답)
+
+사용 예:
+    # 1) 실제 응답 한 번 녹화
+    python scripts/test/fake_naver_server.py --mode record --port 8090
+    NAVER_COMIC_BASE_URL=http://127.0.0.1:8090 python src/run_pipeline.py --full-refresh
+
+    # 2) 녹화한 응답을 10배 카탈로그로 재생하며 부하 테스트
+    python scripts/test/fake_naver_server.py --mode replay --port 8090 --scale 10 \\
+        --latency-ms 150 --jitter-ms 100 --error-rate 0.01 --burst-429-every 1000 --burst-429-length 30
+    NAVER_COMIC_BASE_URL=http://127.0.0.1:8090 NAVER_COMIC_MOBILE_BASE_URL=http://127.0.0.1:8090 \\
+        NAVER_REQUESTS_PER_SECOND=200 NAVER_MAX_CONCURRENCY=64 \\
+        HTTP_CACHE_ENABLED=false python src/run_pipeline.py --full-refresh
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import random
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import get_data_dir
+
+DEFAULT_UPSTREAM = 'https://comic.naver.com'
+DEFAULT_FIXTURES_DIR = get_data_dir() / 'fixtures' / 'naver'
+
+# 카탈로그 복제 시 웹툰 ID에 더하는 값 (실제 titleId보다 충분히 큼)
+SCALE_ID_OFFSET = 10_000_000
+
+CHART_API_PATH = '/api/webtoon/titlelist/weekday'
+DETAIL_API_PATH = '/api/article/list/info'
+EPISODE_API_PATH = '/api/article/list'
+DETAIL_PAGE_PATH = '/webtoon/list'
+
+WEEKDAYS = ['MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY']
+GENRES = ['DAILY', 'COMIC', 'FANTASY', 'ACTION', 'DRAMA', 'PURE', 'SENSIBILITY', 'THRILL', 'HISTORICAL', 'SPORTS']
+
+# 녹화 시 실제 서버로 전달할 요청 헤더
+FORWARD_HEADERS = ['User-Agent', 'Accept', 'Accept-Language', 'Referer']
+
+
+def _stable_int(value: str) -> int:
+    """문자열에서 실행마다 같은 정수를 만듭니다 (합성 응답용)."""
+    return int(hashlib.sha1(value.encode('utf-8')).hexdigest()[:12], 16)
+
+
+class FixtureStore:
+    """요청 경로 + 정렬된 쿼리 기준으로 응답을 파일에 저장/조회"""
+
+    def __init__(self, fixtures_dir: Path):
+        self.fixtures_dir = Path(fixtures_dir)
+
+    @staticmethod
+    def make_key(path: str, query: Dict[str, str]) -> str:
+        return f"{path}?{urlencode(sorted(query.items()))}"
+
+    def _path(self, key: str) -> Path:
+        return self.fixtures_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, path: str, query: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        fixture_path = self._path(self.make_key(path, query))
+        if not fixture_path.exists():
+            return None
+        return json.loads(fixture_path.read_text(encoding='utf-8'))
+
+    def save(self, path: str, query: Dict[str, str], content_type: str, body: str) -> None:
+        key = self.make_key(path, query)
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+        fixture = {'key': key, 'content_type': content_type, 'body': body}
+        self._path(key).write_text(json.dumps(fixture, ensure_ascii=False), encoding='utf-8')
+
+    def count(self) -> int:
+        return len(list(self.fixtures_dir.glob('*.json'))) if self.fixtures_dir.exists() else 0
+
+
+class SyntheticCatalog:
+    """fixture가 없을 때 사용하는 합성 응답 (파서가 읽는 필드만 채움)"""
+
+    def __init__(self, catalog_size: int):
+        self.catalog_size = catalog_size
+
+    def title_ids(self) -> list:
+        return [str(700000 + index) for index in range(self.catalog_size)]
+
+    def chart(self, order: str) -> Dict[str, Any]:
+        title_list_map = {weekday: [] for weekday in WEEKDAYS}
+        for index, title_id in enumerate(self.title_ids()):
+            seed = _stable_int(title_id)
+            title_list_map[WEEKDAYS[index % len(WEEKDAYS)]].append({
+                'titleId': int(title_id),
+                'titleName': f"합성 웹툰 {title_id}",
+                'author': f"작가 {seed % 500}",
+                'viewCount': seed % 10_000_000,
+                'starScore': round(7 + (seed % 300) / 100, 2),
+            })
+        sort_field = 'viewCount' if order == 'view' else 'starScore'
+        for weekday in WEEKDAYS:
+            title_list_map[weekday].sort(key=lambda item: item[sort_field], reverse=True)
+        return {'titleListMap': title_list_map}
+
+    @staticmethod
+    def detail(title_id: str) -> Dict[str, Any]:
+        seed = _stable_int(title_id)
+        return {
+            'titleId': int(title_id),
+            'titleName': f"합성 웹툰 {title_id}",
+            'favoriteCount': 100_000 + seed % 900_000,
+            'finished': seed % 10 == 0,
+            'rest': seed % 13 == 0,
+            'gfpAdCustomParam': {'genreTypes': [GENRES[seed % len(GENRES)]]},
+            'curationTagList': [{'tagName': f"태그{seed % 50}"}, {'tagName': f"태그{seed % 37}"}],
+        }
+
+    @staticmethod
+    def episodes(title_id: str) -> Dict[str, Any]:
+        return {'titleId': int(title_id), 'totalCount': 10 + _stable_int(title_id) % 300, 'articleList': []}
+
+    @staticmethod
+    def detail_page(title_id: str) -> str:
+        favorite_count = SyntheticCatalog.detail(title_id)['favoriteCount']
+        return f"<html><body><h2>합성 웹툰 {title_id}</h2><span>관심</span><span>{favorite_count:,}</span></body></html>"
+
+
+class FakeNaverState:
+    """서버 설정, fixture, 장애 주입 상태, 요청 통계"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.mode = args.mode
+        self.upstream = args.upstream.rstrip('/')
+        self.store = FixtureStore(args.fixtures)
+        self.synthetic = SyntheticCatalog(args.catalog_size)
+        self.strict = args.strict
+        self.scale = max(1, args.scale)
+        self.latency = args.latency_ms / 1000
+        self.jitter = args.jitter_ms / 1000
+        self.error_rate = args.error_rate
+        self.burst_429_every = args.burst_429_every
+        self.burst_429_length = args.burst_429_length
+        self.random = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.stats = Counter()
+
+    def next_request(self) -> Tuple[int, float, bool]:
+        """요청 번호, 주입할 지연, 오류 주입 여부를 정합니다."""
+        with self.lock:
+            self.request_count += 1
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            inject_error = self.random.random() < self.error_rate
+            return self.request_count, delay, inject_error
+
+    def in_429_burst(self, request_number: int) -> bool:
+        if not self.burst_429_every:
+            return False
+        return (request_number - 1) % self.burst_429_every >= self.burst_429_every - self.burst_429_length
+
+    def record(self, key: str) -> None:
+        with self.lock:
+            self.stats[key] += 1
+
+
+def scale_chart(data: Dict[str, Any], scale: int) -> Dict[str, Any]:
+    """
+    주간 차트 응답의 웹툰을 scale배로 복제합니다.
+
+    Args:
+        data: 주간 차트 API 응답
+        scale: 복제 배수 (1이면 그대로)
+
+    Returns:
+        복제된 응답 (원본은 변경하지 않음)
+    """
+    if scale <= 1 or not isinstance(data.get('titleListMap'), dict):
+        return data
+    scaled = copy.deepcopy(data)
+    for weekday, items in scaled['titleListMap'].items():
+        if not isinstance(items, list):
+            continue
+        copies = []
+        for k in range(1, scale):
+            for item in items:
+                clone = dict(item)
+                clone['titleId'] = int(item['titleId']) + k * SCALE_ID_OFFSET
+                clone['titleName'] = f"{item.get('titleName', '')} #{k}"
+                copies.append(clone)
+        items.extend(copies)
+    return scaled
+
+
+class FakeNaverHandler(BaseHTTPRequestHandler):
+    """네이버 웹툰 엔드포인트를 흉내내는 핸들러 (keep-alive 지원)"""
+
+    protocol_version = 'HTTP/1.1'
+    state: FakeNaverState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str, extra_headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_content(self, content_type: str, body_text: str) -> None:
+        body = body_text.encode('utf-8')
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.state.record('304')
+            self._send(304, b'', content_type, {'ETag': etag})
+            return
+        self.state.record('200')
+        self._send(200, body, content_type, {'ETag': etag})
+
+    def do_GET(self):
+        state = self.state
+        split = urlsplit(self.path)
+        path = split.path.rstrip('/') or '/'
+        query = dict(parse_qsl(split.query))
+        state.record(f"path:{path}")
+
+        if state.mode == 'record':
+            self._proxy(path, query, split.query)
+            return
+
+        request_number, delay, inject_error = state.next_request()
+        if delay:
+            time.sleep(delay)
+        if state.in_429_burst(request_number):
+            state.record('429')
+            self._send(429, b'{"message": "Too Many Requests"}', 'application/json', {'Retry-After': '1'})
+            return
+        if inject_error:
+            state.record('503')
+            self._send(503, b'{"message": "Service Unavailable"}', 'application/json')
+            return
+
+        response = self._replay(path, query)
+        if response is None:
+            state.record('404')
+            self._send(404, b'{"message": "Not Found"}', 'application/json')
+            return
+        self._send_content(*response)
+
+    def _proxy(self, path: str, query: Dict[str, str], raw_query: str) -> None:
+        """실제 서버로 전달하고 200 응답을 fixture로 저장합니다."""
+        state = self.state
+        url = f"{state.upstream}{path}" + (f"?{raw_query}" if raw_query else '')
+        headers = {name: self.headers[name] for name in FORWARD_HEADERS if self.headers.get(name)}
+        try:
+            upstream_response = requests.get(url, headers=headers, timeout=15)
+        except Exception as e:
+            state.record('upstream_error')
+            self._send(502, json.dumps({'message': str(e)}).encode('utf-8'), 'application/json')
+            return
+
+        content_type = upstream_response.headers.get('Content-Type', 'application/json')
+        if upstream_response.status_code == 200:
+            state.store.save(path, query, content_type, upstream_response.text)
+            state.record('recorded')
+        self._send(upstream_response.status_code, upstream_response.text.encode('utf-8'), content_type)
+
+    def _replay(self, path: str, query: Dict[str, str]) -> Optional[Tuple[str, str]]:
+        """fixture(없으면 합성 응답)로 (content_type, body)를 만듭니다."""
+        state = self.state
+        title_id = query.get('titleId')
+        base_query = dict(query)
+        if title_id and title_id.isdigit():
+            base_query['titleId'] = str(int(title_id) % SCALE_ID_OFFSET)
+
+        fixture = state.store.load(path, base_query)
+        if fixture is not None:
+            state.record('fixture')
+            content_type, body = fixture['content_type'], fixture['body']
+        elif state.strict and state.mode == 'replay':
+            return None
+        else:
+            synthetic = self._synthesize(path, base_query)
+            if synthetic is None:
+                return None
+            state.record('synthetic')
+            content_type, body = synthetic
+
+        if path == CHART_API_PATH and state.scale > 1:
+            body = json.dumps(scale_chart(json.loads(body), state.scale), ensure_ascii=False)
+        elif title_id and title_id != base_query.get('titleId') and 'json' in content_type:
+            data = json.loads(body)
+            if isinstance(data, dict) and 'titleId' in data:
+                data['titleId'] = int(title_id)
+                body = json.dumps(data, ensure_ascii=False)
+        return content_type, body
+
+    def _synthesize(self, path: str, query: Dict[str, str]) -> Optional[Tuple[str, str]]:
+        catalog = self.state.synthetic
+        title_id = query.get('titleId', '0')
+        if path == CHART_API_PATH:
+            return 'application/json', json.dumps(catalog.chart(query.get('order', 'user')), ensure_ascii=False)
+        if path == DETAIL_API_PATH:
+            return 'application/json', json.dumps(catalog.detail(title_id), ensure_ascii=False)
+        if path == EPISODE_API_PATH:
+            return 'application/json', json.dumps(catalog.episodes(title_id), ensure_ascii=False)
+        if path == DETAIL_PAGE_PATH:
+            return 'text/html; charset=utf-8', catalog.detail_page(title_id)
+        if path in ('/webtoon', '/webtoon/weekday'):
+            return 'text/html; charset=utf-8', '<html><body><h1>합성 주간 웹툰</h1></body></html>'
+        return None
+
+
+class FakeNaverServer(ThreadingHTTPServer):
+    """클라이언트가 keep-alive 연결을 끊을 때 나는 오류는 무시하는 서버"""
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def create_server(args: argparse.Namespace) -> ThreadingHTTPServer:
+    """
+    설정으로 가짜 서버를 생성합니다. (serve_forever는 호출하지 않음)
+
+    Args:
+        args: 명령줄 인자 (parse_args 결과)
+
+    Returns:
+        ThreadingHTTPServer 객체
+    """
+    handler = type('ConfiguredFakeNaverHandler', (FakeNaverHandler,), {'state': FakeNaverState(args)})
+    return FakeNaverServer((args.host, args.port), handler)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='가짜 네이버 웹툰 서버 (녹화/재생)')
+    parser.add_argument('--mode', choices=['record', 'replay', 'synthetic'], default='replay', help='동작 모드 (기본값: replay)')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인딩 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8090, help='포트 (기본값: 8090)')
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES_DIR, help=f'fixture 디렉토리 (기본값: {DEFAULT_FIXTURES_DIR})')
+    parser.add_argument('--upstream', type=str, default=DEFAULT_UPSTREAM, help=f'녹화 시 실제 서버 주소 (기본값: {DEFAULT_UPSTREAM})')
+    parser.add_argument('--strict', action='store_true', help='replay 모드에서 fixture가 없으면 합성 응답 대신 404')
+    parser.add_argument('--scale', type=int, default=1, help='주간 차트 웹툰 복제 배수 (기본값: 1)')
+    parser.add_argument('--catalog-size', type=int, default=700, help='합성 카탈로그 웹툰 수 (기본값: 700)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='응답 지연 (밀리초)')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='응답 지연 편차 (밀리초, ±)')
+    parser.add_argument('--error-rate', type=float, default=0, help='503 오류 비율 (0~1)')
+    parser.add_argument('--burst-429-every', type=int, default=0, help='요청 N건마다 429 버스트 (0이면 사용 안 함)')
+    parser.add_argument('--burst-429-length', type=int, default=20, help='429 버스트 길이 (요청 수, 기본값: 20)')
+    parser.add_argument('--seed', type=int, default=42, help='지연/오류 난수 시드 (기본값: 42)')
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = create_server(args)
+    state = server.RequestHandlerClass.state
+    print(f"가짜 네이버 서버 ({args.mode}) 대기 중: http://{args.host}:{args.port} (fixture {state.store.count()}개, scale={state.scale})")
+    print(f"  NAVER_COMIC_BASE_URL=http://{args.host}:{args.port} NAVER_COMIC_MOBILE_BASE_URL=http://{args.host}:{args.port}")
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+        print(f"요청 통계: {dict(state.stats)}")
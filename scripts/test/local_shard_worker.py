@@ -0,0 +1,61 @@
+"""
+로컬 샤드 worker 서버
+
+coordinator 모드의 HTTP 샤드 큐를 로컬에서 테스트하기 위한 worker 대역입니다.
+POST 요청 본문(JSON)의 샤드를 run_detail_worker로 수집하여 결과를 JSON으로 돌려줍니다.
+
+사용 예:
+    python scripts/test/local_shard_worker.py --port 8081
+    SHARD_QUEUE=http SHARD_WORKER_URL=http://localhost:8081 \\
+        functions-framework --target=main --source=functions/pipeline_function/main.py
+    curl -X POST localhost:8080 -H 'Content-Type: application/json' -d '{"mode": "coordinator", "num_shards": 4, "limit": 40}'
+"""
+
+import argparse
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.shard_queue import run_detail_worker
+from src.utils import setup_logging
+
+
+class ShardWorkerHandler(BaseHTTPRequestHandler):
+    """샤드 요청을 받아 상세 정보를 수집하는 핸들러"""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            result = run_detail_worker(payload)
+            status = 200
+        except Exception as e:
+            result = {'status': 'error', 'error': str(e)}
+            status = 500
+
+        body = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='로컬 샤드 worker 서버')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인딩 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8081, help='포트 (기본값: 8081)')
+    args = parser.parse_args()
+
+    setup_logging()
+    server = ThreadingHTTPServer((args.host, args.port), ShardWorkerHandler)
+    print(f"샤드 worker 대기 중: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,125 @@
+"""
+dim_webtoon genre/tags 보강 마이크로벤치마크
+
+기존 방식(상세 정보마다 dim_df[dim_df['webtoon_id'] == webtoon_id]로 전체 컬럼 검색)과
+webtoon_id 색인 조인(DimWebtoonStore.enrichment_records)의 처리 시간을 비교하고,
+두 방식이 같은 레코드(webtoon_id, title, author, genre, tags 집합)를 만드는지 확인합니다.
+
+사용법:
+    python scripts/utils/benchmark_dim_enrichment.py
+    python scripts/utils/benchmark_dim_enrichment.py --rows 20000 --batch 100
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.dim_webtoon_store import DimWebtoonStore
+from src.models import DIM_WEBTOON_COLUMNS, create_dim_webtoon_record
+
+TAG_POOL = ['로맨스', '판타지', '액션', '일상', '개그', '드라마', '스릴러']
+
+
+def make_dim_frame(rows: int) -> pd.DataFrame:
+    """dim_webtoon 형태의 합성 DataFrame (일부는 기존 tags 보유)"""
+    now = datetime(2025, 1, 1)
+    return pd.DataFrame({
+        'webtoon_id': [str(100000 + i) for i in range(rows)],
+        'title': [f'웹툰 제목 {i}' for i in range(rows)],
+        'author': [f'작가{i % 500}' for i in range(rows)],
+        'genre': [None] * rows,
+        'tags': [TAG_POOL[: i % 3] or None for i in range(rows)],
+        'created_at': [now] * rows,
+        'updated_at': [now] * rows,
+    })[DIM_WEBTOON_COLUMNS]
+
+
+def make_details(rows: int, count: int) -> list:
+    """상세 정보 수집 결과 형태의 합성 데이터 (dim_webtoon 전체에 고르게 분포)"""
+    step = max(1, rows // count)
+    return [
+        {
+            'webtoon_id': str(100000 + i),
+            'genre': 'DRAMA' if i % 5 else None,
+            'tags': TAG_POOL[i % 4: i % 4 + 2],
+        }
+        for i in range(0, rows, step)
+    ][:count]
+
+
+def legacy_enrichment_records(dim_df: pd.DataFrame, detail_data_list: list) -> list:
+    """변경 전 functions/pipeline_function/main.py의 save_detail_batch와 같은 방식"""
+    dim_webtoon_ids = set(dim_df['webtoon_id'])
+    update_records = []
+    for detail_data in detail_data_list:
+        webtoon_id = str(detail_data.get('webtoon_id')) if detail_data.get('webtoon_id') else None
+        genre = detail_data.get('genre')
+        tags = detail_data.get('tags')
+        if webtoon_id and webtoon_id in dim_webtoon_ids:
+            existing = dim_df[dim_df['webtoon_id'] == webtoon_id]
+            if len(existing) > 0 and (genre or tags):
+                existing_record = existing.iloc[0].to_dict()
+                existing_tags = existing_record.get('tags')
+                if isinstance(existing_tags, str):
+                    existing_tags = [t.strip() for t in existing_tags.split('|') if t.strip()] if existing_tags else []
+                elif not isinstance(existing_tags, list):
+                    existing_tags = []
+                new_tags = tags if tags else []
+                combined_tags = list(set(existing_tags + new_tags)) if isinstance(new_tags, list) else existing_tags
+                update_records.append(create_dim_webtoon_record(
+                    webtoon_id=webtoon_id,
+                    title=existing_record.get('title', ''),
+                    author=existing_record.get('author'),
+                    genre=genre if genre else existing_record.get('genre'),
+                    tags=combined_tags if combined_tags else None,
+                ))
+    return update_records
+
+
+def comparable(records: list) -> list:
+    """tags 순서를 무시하고 비교할 수 있는 형태 (기존 방식은 set으로 합쳐 순서가 없음)"""
+    return [
+        (r['webtoon_id'], r['title'], r['author'], r['genre'], frozenset(r['tags'] or []))
+        for r in records
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='dim_webtoon genre/tags 보강 처리 시간 비교')
+    parser.add_argument('--rows', type=int, default=5000, help='dim_webtoon 행 수')
+    parser.add_argument('--batch', type=int, default=100, help='상세 정보 배치 크기')
+    parser.add_argument('--batches', type=int, default=10, help='배치 수 (Cloud Function 배치 루프 흉내)')
+    args = parser.parse_args()
+
+    dim_df = make_dim_frame(args.rows)
+    details = make_details(args.rows, args.batch * args.batches)
+    batches = [details[i:i + args.batch] for i in range(0, len(details), args.batch)]
+
+    start = time.perf_counter()
+    legacy_records = [record for batch in batches for record in legacy_enrichment_records(dim_df, batch)]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store = DimWebtoonStore(dim_df)
+    index_seconds_build = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed_records = [record for batch in batches for record in store.enrichment_records(batch)]
+    indexed_seconds = time.perf_counter() - start
+
+    same = comparable(legacy_records) == comparable(indexed_records)
+    print(f"dim_webtoon {args.rows:,}행, 상세 정보 {len(details):,}개 ({len(batches)}개 배치)")
+    print(f"기존 방식 (컬럼 검색): {legacy_seconds * 1000:>10.1f} ms")
+    print(f"색인 조인:             {indexed_seconds * 1000:>10.1f} ms (색인 생성 {index_seconds_build * 1000:.1f} ms, 실행당 한 번)")
+    print(f"속도 향상: {legacy_seconds / max(indexed_seconds, 1e-9):.1f}x, 결과 동일: {same}")
+
+
+if __name__ == "__main__":
+    main()
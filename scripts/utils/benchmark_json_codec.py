@@ -0,0 +1,137 @@
+"""
+JSON codec 벤치마크
+
+설치된 JSON 라이브러리(json, orjson, msgspec)의 인코딩/디코딩 속도를
+실제 수집 파일로 비교합니다.
+- 차트 원본 응답: {DATA_DIR}/raw/*/webtoon_chart*.json(.gz) (파일 전체를 한 번에)
+- fact_webtoon_stats 파티션 / dim_webtoon JSONL (줄 단위)
+
+파일이 없으면 가짜 서버(scripts/test/fake_naver_server.py)의 합성 차트와
+합성 상세 정보 레코드로 측정합니다.
+
+사용법:
+    python scripts/utils/benchmark_json_codec.py
+    python scripts/utils/benchmark_json_codec.py --repeat 20 --synthetic-size 5000
+"""
+
+import argparse
+import gzip
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Tuple
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'scripts' / 'test'))
+
+from src.json_codec import load_codec
+from src.utils import get_data_dir, get_dim_webtoon_jsonl_path, list_webtoon_stats_partitions
+
+CODEC_NAMES = ['json', 'orjson', 'msgspec']
+
+
+def find_chart_payloads() -> List[bytes]:
+    """저장된 차트 원본 응답 파일 (gzip으로 보관된 .json.gz는 압축 해제)"""
+    raw_dir = get_data_dir() / 'raw'
+    payloads = [path.read_bytes() for path in sorted(raw_dir.glob('*/webtoon_chart*.json'))]
+    payloads += [gzip.decompress(path.read_bytes()) for path in sorted(raw_dir.glob('*/webtoon_chart*.json.gz'))]
+    return payloads
+
+
+def find_jsonl_lines() -> List[bytes]:
+    """저장된 fact_webtoon_stats 파티션과 dim_webtoon JSONL의 줄"""
+    paths = [path for _, path in list_webtoon_stats_partitions(data_format='jsonl')]
+    dim_path = get_dim_webtoon_jsonl_path()
+    if dim_path.exists():
+        paths.append(dim_path)
+    lines = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            lines.extend(line for line in f if line.strip())
+    return lines
+
+
+def synthetic_samples(size: int) -> Tuple[List[bytes], List[bytes]]:
+    """합성 차트 응답과 합성 fact_webtoon_stats JSONL 줄"""
+    from fake_naver_server import SyntheticCatalog
+
+    _, dumps, _, _ = load_codec('json')
+    catalog = SyntheticCatalog(size)
+    charts = [dumps(catalog.chart(order)) for order in ('popular', 'view')]
+
+    base = datetime(2025, 1, 15, 10)
+    lines = []
+    for index, title_id in enumerate(catalog.title_ids()):
+        detail = catalog.detail(title_id)
+        collected_at = base + timedelta(seconds=index, microseconds=index % 1000)
+        lines.append(dumps({
+            'webtoon_id': title_id,
+            'collected_at': collected_at.isoformat(),
+            'favorite_count': detail['favoriteCount'],
+            'favorite_count_source': 'api',
+            'finished': detail['finished'],
+            'rest': detail['rest'],
+            'total_episode_count': catalog.episodes(title_id)['totalCount'],
+            'year': collected_at.year,
+            'month': collected_at.month,
+            'week': (collected_at.day - 1) // 7 + 1,
+        }))
+    return charts, lines
+
+
+def best_of(repeat: int, func) -> float:
+    """repeat번 실행한 것 중 가장 빠른 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON codec 인코딩/디코딩 속도 비교')
+    parser.add_argument('--repeat', type=int, default=10, help='반복 횟수 (가장 빠른 값 사용)')
+    parser.add_argument('--synthetic-size', type=int, default=2000, help='실제 파일이 없을 때 합성 웹툰 수')
+    args = parser.parse_args()
+
+    charts = find_chart_payloads()
+    lines = find_jsonl_lines()
+    source = '실제 파일'
+    if not charts or not lines:
+        synthetic_charts, synthetic_lines = synthetic_samples(args.synthetic_size)
+        charts = charts or synthetic_charts
+        lines = lines or synthetic_lines
+        source = '합성 데이터 포함'
+
+    chart_mb = sum(len(payload) for payload in charts) / 1024 / 1024
+    lines_mb = sum(len(line) for line in lines) / 1024 / 1024
+    print(f"데이터: {source} (차트 {len(charts)}개 {chart_mb:.1f}MB, JSONL {len(lines):,}줄 {lines_mb:.1f}MB)")
+
+    codecs = []
+    for name in CODEC_NAMES:
+        codec = load_codec(name)
+        if codec[0] != name:
+            print(f"{name}: 설치되어 있지 않아 건너뜀")
+            continue
+        codecs.append(codec)
+
+    print(f"{'codec':>8} {'chart decode MB/s':>18} {'chart encode MB/s':>18} {'jsonl decode rows/s':>20} {'jsonl encode rows/s':>20}")
+    for name, dumps, _, loads in codecs:
+        chart_objects = [loads(payload) for payload in charts]
+        records = [loads(line) for line in lines]
+
+        chart_decode = best_of(args.repeat, lambda: [loads(payload) for payload in charts])
+        chart_encode = best_of(args.repeat, lambda: [dumps(obj) for obj in chart_objects])
+        line_decode = best_of(args.repeat, lambda: [loads(line) for line in lines])
+        line_encode = best_of(args.repeat, lambda: [dumps(record) for record in records])
+
+        print(f"{name:>8} {chart_mb / chart_decode:>18,.1f} {chart_mb / chart_encode:>18,.1f} "
+              f"{len(lines) / line_decode:>20,.0f} {len(lines) / line_encode:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+JSONL 저장 마이크로벤치마크
+
+기존 방식(iterrows + row.to_dict + 행마다 pd.isna/json.dumps)과
+공용 컬럼 단위 직렬화(src/jsonl_writer.py)의 처리량을 비교합니다.
+
+사용법:
+    python scripts/utils/benchmark_jsonl_writer.py
+    python scripts/utils/benchmark_jsonl_writer.py --rows 10000,100000 --table dim_webtoon
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.jsonl_writer import write_jsonl
+from src.models import DIM_WEBTOON_COLUMNS, FACT_WEBTOON_STATS_COLUMNS
+
+
+def make_stats_frame(rows: int) -> pd.DataFrame:
+    """fact_webtoon_stats 형태의 합성 DataFrame (관심 수/에피소드 수 일부 결측)"""
+    rng = np.random.default_rng(0)
+    collected_at = pd.Timestamp('2025-01-15 10:00:00') + pd.to_timedelta(rng.integers(0, 86400, rows), unit='s')
+    favorite_count = rng.integers(0, 5_000_000, rows).astype(float)
+    favorite_count[rng.random(rows) < 0.1] = np.nan
+    episodes = rng.integers(1, 500, rows).astype(float)
+    episodes[rng.random(rows) < 0.2] = np.nan
+    return pd.DataFrame({
+        'webtoon_id': (rng.integers(100000, 999999, rows)).astype(str),
+        'collected_at': collected_at,
+        'favorite_count': favorite_count,
+        'favorite_count_source': np.where(rng.random(rows) < 0.9, 'api', None),
+        'finished': rng.random(rows) < 0.3,
+        'rest': rng.random(rows) < 0.05,
+        'total_episode_count': episodes,
+        'year': collected_at.year,
+        'month': collected_at.month,
+        'week': (collected_at.day - 1) // 7 + 1,
+    })[FACT_WEBTOON_STATS_COLUMNS]
+
+
+def make_dim_frame(rows: int) -> pd.DataFrame:
+    """dim_webtoon 형태의 합성 DataFrame (tags는 list, 일부 결측)"""
+    rng = np.random.default_rng(0)
+    base = datetime(2025, 1, 1)
+    tag_pool = ['로맨스', '판타지', '액션', '일상', '개그', '드라마', '스릴러']
+    tags = [None if i % 7 == 0 else tag_pool[: 1 + i % 4] for i in range(rows)]
+    return pd.DataFrame({
+        'webtoon_id': [str(100000 + i) for i in range(rows)],
+        'title': [f'웹툰 제목 {i}' for i in range(rows)],
+        'author': [None if i % 11 == 0 else f'작가{i % 500}' for i in range(rows)],
+        'genre': np.where(rng.random(rows) < 0.8, 'DRAMA', None),
+        'tags': tags,
+        'created_at': pd.to_datetime([base + timedelta(seconds=i) for i in range(rows)]),
+        'updated_at': pd.to_datetime([base + timedelta(seconds=i, microseconds=i % 1000) for i in range(rows)]),
+    })[DIM_WEBTOON_COLUMNS]
+
+
+def legacy_write_jsonl(file_path: Path, df: pd.DataFrame) -> None:
+    """변경 전 save_dim_webtoon_jsonl / save_fact_webtoon_stats_jsonl과 같은 방식"""
+    def serialize_for_json(obj):
+        if isinstance(obj, (datetime, pd.Timestamp)):
+            return obj.isoformat()
+        raise TypeError(f"Type {type(obj)} not serializable")
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for _, row in df.iterrows():
+            record = row.to_dict()
+            for key in ('collected_at', 'created_at', 'updated_at'):
+                if key in record and pd.notna(record[key]) and isinstance(record[key], pd.Timestamp):
+                    record[key] = record[key].isoformat()
+
+            def convert_value(val):
+                if isinstance(val, list):
+                    return val
+                if pd.isna(val):
+                    return None
+                return val
+            record = {k: convert_value(v) for k, v in record.items()}
+            f.write(json.dumps(record, ensure_ascii=False, default=serialize_for_json) + '\n')
+
+
+def measure(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSONL 저장 처리량 비교 (iterrows vs 컬럼 단위)')
+    parser.add_argument('--rows', default='10000,100000,1000000', help='행 수 목록 (쉼표 구분)')
+    parser.add_argument('--table', choices=['fact_webtoon_stats', 'dim_webtoon'], default='fact_webtoon_stats')
+    parser.add_argument('--legacy-max-rows', type=int, default=1000000,
+                        help='이 행 수보다 크면 기존 방식 측정 생략 (느림)')
+    args = parser.parse_args()
+
+    make_frame = make_stats_frame if args.table == 'fact_webtoon_stats' else make_dim_frame
+    print(f"table={args.table}")
+    print(f"{'rows':>10} {'legacy rows/s':>15} {'vectorized rows/s':>18} {'speedup':>8} {'MB':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in [int(value) for value in args.rows.split(',') if value.strip()]:
+            df = make_frame(rows)
+            new_path = Path(tmp_dir) / 'vectorized.jsonl'
+            new_seconds = measure(write_jsonl, new_path, df, args.table)
+            size_mb = new_path.stat().st_size / 1024 / 1024
+
+            if rows <= args.legacy_max_rows:
+                legacy_seconds = measure(legacy_write_jsonl, Path(tmp_dir) / 'legacy.jsonl', df)
+                legacy_rate = f"{rows / legacy_seconds:>15,.0f}"
+                speedup = f"{legacy_seconds / new_seconds:>7.1f}x"
+            else:
+                legacy_rate = f"{'-':>15}"
+                speedup = f"{'-':>8}"
+            print(f"{rows:>10,} {legacy_rate} {rows / new_seconds:>18,.0f} {speedup} {size_mb:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Checkpoint 모듈: 상세 정보 수집 체크포인트 (재시작 지원)
+
+Cloud Function이 상세 정보 수집 도중 시간 초과로 종료되어도,
+다시 실행하면 이미 저장/업로드가 끝난 웹툰은 건너뛰고 남은 웹툰만 수집합니다.
+- 저장 위치: 로컬 파일 ({DATA_DIR}/checkpoints/) 또는 GCS 객체 (checkpoints/)
+- chart_date별로 완료된 webtoon_id와 진행 위치(cursor)를 기록
+- 모든 웹툰 수집이 끝나면 삭제
+
+CHECKPOINT_BACKEND 환경 변수: 'local' (기본값) 또는 'gcs'
+(Cloud Functions의 /tmp는 인스턴스가 바뀌면 사라지므로 배포 환경에서는 'gcs' 사용)
+"""
+
+import json
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from src.utils import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_BACKEND = os.getenv('CHECKPOINT_BACKEND', 'local').lower()
+CHECKPOINT_GCS_PREFIX = 'checkpoints/detail_crawl'
+
+
+class DetailCrawlCheckpoint:
+    """
+    chart_date 하나의 상세 정보 수집 진행 상황.
+
+    저장/업로드까지 끝난 webtoon_id만 완료로 기록하므로,
+    수집에 실패했거나 저장 전에 중단된 웹툰은 다음 실행에서 다시 수집됩니다.
+    """
+
+    def __init__(self, chart_date: date, backend: Optional[str] = None):
+        self.chart_date = chart_date
+        self.backend = (backend or CHECKPOINT_BACKEND).lower()
+        if self.backend not in ('local', 'gcs'):
+            raise ValueError(f"지원하지 않는 체크포인트 저장소: {self.backend} (local 또는 gcs)")
+        self.completed_ids = set()
+        self.cursor = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.chart_date.isoformat()}.json"
+
+    def _local_path(self) -> Path:
+        return get_data_dir() / 'checkpoints' / 'detail_crawl' / self.name
+
+    def _gcs_blob(self):
+        from src.upload_gcs import GCS_BUCKET_NAME, get_gcs_client
+        return get_gcs_client().bucket(GCS_BUCKET_NAME).blob(f"{CHECKPOINT_GCS_PREFIX}/{self.name}")
+
+    def location(self) -> str:
+        """체크포인트 저장 위치 (로그용)"""
+        if self.backend == 'gcs':
+            from src.upload_gcs import GCS_BUCKET_NAME
+            return f"gs://{GCS_BUCKET_NAME}/{CHECKPOINT_GCS_PREFIX}/{self.name}"
+        return str(self._local_path())
+
+    # ------------------------------------------------------------------
+    # 읽기 / 쓰기
+    # ------------------------------------------------------------------
+
+    def load(self) -> bool:
+        """
+        저장된 체크포인트를 읽습니다.
+
+        Returns:
+            체크포인트가 있었으면 True, 없거나 읽기 실패 시 False (빈 상태로 시작)
+        """
+        try:
+            if self.backend == 'gcs':
+                blob = self._gcs_blob()
+                if not blob.exists():
+                    return False
+                content = blob.download_as_text(encoding='utf-8')
+            else:
+                path = self._local_path()
+                if not path.exists():
+                    return False
+                content = path.read_text(encoding='utf-8')
+
+            state = json.loads(content)
+            self.completed_ids = set(str(webtoon_id) for webtoon_id in state.get('completed_ids', []))
+            self.cursor = int(state.get('cursor', 0))
+            logger.info(f"체크포인트 로드: {len(self.completed_ids)}개 완료, cursor={self.cursor} ({self.location()})")
+            return True
+        except Exception as e:
+            logger.warning(f"체크포인트 로드 실패, 처음부터 수집합니다: {e}")
+            self.completed_ids = set()
+            self.cursor = 0
+            return False
+
+    def save(self) -> bool:
+        """
+        현재 상태를 저장합니다.
+
+        Returns:
+            성공 여부
+        """
+        state = {
+            'chart_date': self.chart_date.isoformat(),
+            'cursor': self.cursor,
+            'completed_ids': sorted(self.completed_ids),
+            'updated_at': datetime.now().isoformat(),
+        }
+        content = json.dumps(state, ensure_ascii=False)
+        try:
+            if self.backend == 'gcs':
+                self._gcs_blob().upload_from_string(content, content_type='application/json')
+            else:
+                path = self._local_path()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix('.json.tmp')
+                tmp_path.write_text(content, encoding='utf-8')
+                os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.error(f"❌ 체크포인트 저장 실패: {e}")
+            return False
+
+    def clear(self) -> None:
+        """수집이 끝난 체크포인트를 삭제합니다."""
+        try:
+            if self.backend == 'gcs':
+                blob = self._gcs_blob()
+                if blob.exists():
+                    blob.delete()
+            else:
+                self._local_path().unlink(missing_ok=True)
+            logger.info(f"체크포인트 삭제: {self.location()}")
+        except Exception as e:
+            logger.warning(f"체크포인트 삭제 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 진행 상황
+    # ------------------------------------------------------------------
+
+    def pending(self, webtoon_ids: Iterable[str]) -> List[str]:
+        """
+        아직 완료되지 않은 webtoon_id를 입력 순서대로 반환합니다.
+
+        Args:
+            webtoon_ids: 이번 실행의 수집 대상 웹툰 ID
+
+        Returns:
+            남은 웹툰 ID 리스트
+        """
+        return [str(webtoon_id) for webtoon_id in webtoon_ids if str(webtoon_id) not in self.completed_ids]
+
+    def mark_completed(self, webtoon_ids: Iterable[str], cursor: int) -> bool:
+        """
+        저장/업로드가 끝난 웹툰을 완료로 기록하고 체크포인트를 저장합니다.
+
+        Args:
+            webtoon_ids: 완료된 웹툰 ID
+            cursor: 이번 실행 수집 대상 중 처리한 개수
+
+        Returns:
+            저장 성공 여부
+        """
+        self.completed_ids.update(str(webtoon_id) for webtoon_id in webtoon_ids)
+        self.cursor = cursor
+        return self.save()
@@ -0,0 +1,336 @@
+"""
+DimWebtoonStore 모듈: webtoon_id로 색인한 메모리 dim_webtoon 테이블
+
+dim_webtoon을 한 번 읽어 webtoon_id -> 행 딕셔너리로 들고 있으면서 갱신합니다.
+- upsert: 바뀐 k개 행만 처리 (기존 테이블 전체 concat / 정렬 / drop_duplicates 없음)
+- 값이 실제로 바뀐 행만 dirty로 표시하고 updated_at 갱신 (created_at은 기존 값 유지)
+- flush: dirty 행이 있을 때만 파일에 저장 (DATA_FORMAT에 따라 JSONL, CSV 또는 Parquet)
+- upload_records: 마지막 업로드 이후 바뀐 행만 꺼냄 (BigQuery MERGE는 webtoon_id 기준이라 일부 행만 올려도 됨)
+- enrich: 상세 정보 배치의 genre/tags를 webtoon_id 색인으로 조인해 반영
+
+Cloud Function의 상세 정보 배치 루프처럼 같은 테이블을 여러 번 갱신하는 곳에서 사용합니다.
+"""
+
+import logging
+import math
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import pandas as pd
+
+from src.models import DIM_WEBTOON_COLUMNS, DimWebtoonRecord
+from src.transform import load_dim_webtoon, save_dim_webtoon
+
+logger = logging.getLogger(__name__)
+
+# 변경 여부 비교에서 제외하는 컬럼 (값이 바뀌었을 때만 updated_at 갱신)
+_TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+# 상세 정보로만 채워지는 컬럼: 들어온 값이 비어 있으면 저장된 값 유지
+# (차트 레코드는 genre/tags 없이 오므로 덮어쓰면 상세 정보를 건너뛴 웹툰의 보강이 사라짐)
+_ENRICHED_COLUMNS = ('genre', 'tags')
+
+
+def _is_missing(value: Any) -> bool:
+    """None / NaN / NaT 여부 (list 값은 결측이 아님)"""
+    if value is None or value is pd.NaT:
+        return True
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _as_tag_list(tags: Any) -> List[str]:
+    """저장된 tags 값을 리스트로 변환합니다 (CSV의 파이프 구분 문자열, Parquet 배열 포함)."""
+    if isinstance(tags, str):
+        return [tag.strip() for tag in tags.split('|') if tag.strip()]
+    if isinstance(tags, (list, tuple)):
+        return list(tags)
+    if hasattr(tags, 'tolist'):
+        return list(tags.tolist())
+    return []
+
+
+def _same_value(left: Any, right: Any) -> bool:
+    """두 컬럼 값이 같은지 비교합니다 (None과 NaN은 같은 결측으로 취급)."""
+    if _is_missing(left) or _is_missing(right):
+        return _is_missing(left) and _is_missing(right)
+    left_is_list = isinstance(left, (list, tuple))
+    right_is_list = isinstance(right, (list, tuple))
+    if left_is_list or right_is_list:
+        return left_is_list and right_is_list and list(left) == list(right)
+    return left == right
+
+
+class DimWebtoonStore:
+    """
+    webtoon_id로 색인한 dim_webtoon 테이블.
+
+    행은 {컬럼: 값} 딕셔너리로 보관하고, 마지막 flush 이후 바뀐 webtoon_id를 dirty 집합에,
+    마지막 업로드 이후 바뀐 webtoon_id를 변경 번호와 함께 따로 기록합니다.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None):
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        # webtoon_id -> 변경 번호 (업로드 중에 다시 바뀐 행은 업로드 완료로 지우지 않도록)
+        self._unuploaded: Dict[str, int] = {}
+        self._change_seq = 0
+        if df is not None and len(df) > 0:
+            columns = [column for column in DIM_WEBTOON_COLUMNS if column in df.columns]
+            ids = df['webtoon_id'].astype(str).tolist()
+            values = zip(*(df[column].tolist() for column in columns))
+            for webtoon_id, row_values in zip(ids, values):
+                row = dict(zip(columns, row_values))
+                row['webtoon_id'] = webtoon_id
+                self._rows[webtoon_id] = row
+
+    @classmethod
+    def load(cls) -> 'DimWebtoonStore':
+        """
+        저장된 dim_webtoon 파일을 읽어 store를 만듭니다 (파일이 없으면 빈 store).
+
+        Returns:
+            DimWebtoonStore
+        """
+        return cls(load_dim_webtoon())
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, webtoon_id: object) -> bool:
+        return str(webtoon_id) in self._rows
+
+    def get(self, webtoon_id: str) -> Optional[Dict[str, Any]]:
+        """
+        webtoon_id의 행을 반환합니다 (O(1)).
+
+        Args:
+            webtoon_id: 웹툰 ID
+
+        Returns:
+            {컬럼: 값} 딕셔너리 (없으면 None, 반환값을 수정하지 말고 upsert 사용)
+        """
+        return self._rows.get(str(webtoon_id))
+
+    def ids(self) -> Set[str]:
+        """
+        store에 있는 webtoon_id 집합을 반환합니다.
+
+        Returns:
+            webtoon_id 집합 (Foreign Key 검증용)
+        """
+        return set(self._rows)
+
+    @property
+    def dirty_ids(self) -> Set[str]:
+        """마지막 flush 이후 추가/변경된 webtoon_id"""
+        return set(self._dirty)
+
+    @property
+    def unuploaded_ids(self) -> Set[str]:
+        """마지막 업로드 이후 추가/변경된 webtoon_id (store를 만든 뒤 바뀐 행부터 기록)"""
+        return set(self._unuploaded)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def upsert(self, records: Iterable[Mapping[str, Any]]) -> int:
+        """
+        레코드를 webtoon_id 기준으로 추가하거나 교체합니다 (레코드 수 k에 비례, O(k)).
+
+        기존 행과 값이 같은 레코드는 건너뛰고 (updated_at도 그대로),
+        바뀐 행은 created_at을 기존 값으로 유지한 채 교체합니다.
+        genre/tags가 비어 있는 레코드는 기존 행의 genre/tags를 유지합니다 (차트 레코드가 보강을 지우지 않도록).
+        같은 webtoon_id가 여러 번 오면 updated_at이 더 최근인 레코드가 남습니다.
+
+        Args:
+            records: dim_webtoon 레코드 (DimWebtoonRecord 또는 딕셔너리)
+
+        Returns:
+            추가/변경된 행 수
+        """
+        changed = 0
+        for record in records:
+            webtoon_id = str(record['webtoon_id'])
+            row = {column: record.get(column) for column in DIM_WEBTOON_COLUMNS}
+            row['webtoon_id'] = webtoon_id
+            existing = self._rows.get(webtoon_id)
+
+            if existing is not None:
+                for column in _ENRICHED_COLUMNS:
+                    if _is_missing(row[column]) or (isinstance(row[column], (list, tuple)) and not row[column]):
+                        row[column] = existing.get(column)
+                if all(
+                    _same_value(existing.get(column), row[column])
+                    for column in DIM_WEBTOON_COLUMNS if column not in _TIMESTAMP_COLUMNS
+                ):
+                    continue
+                if self._is_older(row.get('updated_at'), existing.get('updated_at')):
+                    continue
+                if not _is_missing(existing.get('created_at')):
+                    row['created_at'] = existing['created_at']
+
+            if _is_missing(row.get('created_at')) or _is_missing(row.get('updated_at')):
+                now = datetime.now()
+                row['created_at'] = now if _is_missing(row.get('created_at')) else row['created_at']
+                row['updated_at'] = now if _is_missing(row.get('updated_at')) else row['updated_at']
+
+            self._rows[webtoon_id] = row
+            self._dirty.add(webtoon_id)
+            self._change_seq += 1
+            self._unuploaded[webtoon_id] = self._change_seq
+            changed += 1
+        return changed
+
+    def enrichment_records(
+        self,
+        detail_data_list: Iterable[Mapping[str, Any]],
+        merge_tags: bool = True
+    ) -> List[DimWebtoonRecord]:
+        """
+        상세 정보 배치를 webtoon_id로 기존 행과 조인해 genre/tags를 채운 레코드를 만듭니다.
+        행마다 DataFrame 전체를 검색하지 않고 색인으로 찾으므로 배치 크기 k에 비례합니다.
+
+        genre나 tags가 없는 상세 정보와 store에 없는 webtoon_id는 건너뜁니다.
+        title/author와 created_at은 기존 행 값을 유지합니다.
+
+        Args:
+            detail_data_list: 웹툰 상세 정보 리스트 (webtoon_id, genre, tags)
+            merge_tags: True면 기존 tags에 새 tags를 합치고 (순서 유지, 중복 제거),
+                False면 새 tags가 있을 때 교체
+
+        Returns:
+            upsert할 DimWebtoonRecord 리스트
+        """
+        records = []
+        missing_ids = []
+        for detail_data in detail_data_list:
+            webtoon_id = detail_data.get('webtoon_id')
+            genre = detail_data.get('genre')
+            tags = detail_data.get('tags')
+            if not webtoon_id or not (genre or tags):
+                continue
+
+            existing = self._rows.get(str(webtoon_id))
+            if existing is None:
+                missing_ids.append(str(webtoon_id))
+                continue
+
+            existing_tags = _as_tag_list(existing.get('tags'))
+            new_tags = tags if isinstance(tags, list) else []
+            if merge_tags:
+                combined_tags = list(dict.fromkeys(existing_tags + new_tags))
+            else:
+                combined_tags = new_tags or existing_tags
+
+            try:
+                records.append(DimWebtoonRecord(
+                    webtoon_id=existing['webtoon_id'],
+                    title=existing.get('title'),
+                    author=None if _is_missing(existing.get('author')) else existing.get('author'),
+                    genre=genre if genre else (None if _is_missing(existing.get('genre')) else existing.get('genre')),
+                    tags=combined_tags or None,
+                    created_at=None if _is_missing(existing.get('created_at')) else existing.get('created_at'),
+                ))
+            except ValueError as e:
+                logger.warning(f"dim_webtoon 업데이트 레코드 검증 실패: webtoon_id={webtoon_id}, 오류: {e}")
+
+        if missing_ids:
+            logger.warning(f"dim_webtoon에 없는 webtoon_id {len(missing_ids)}개는 건너뜀: {missing_ids[:10]}")
+        return records
+
+    def enrich(self, detail_data_list: Iterable[Mapping[str, Any]], merge_tags: bool = True) -> int:
+        """
+        상세 정보 배치의 genre/tags를 store에 반영합니다 (enrichment_records + upsert).
+
+        Args:
+            detail_data_list: 웹툰 상세 정보 리스트
+            merge_tags: enrichment_records 참고
+
+        Returns:
+            실제로 값이 바뀐 행 수
+        """
+        return self.upsert(self.enrichment_records(detail_data_list, merge_tags=merge_tags))
+
+    @staticmethod
+    def _is_older(new_value: Any, existing_value: Any) -> bool:
+        """새 레코드의 updated_at이 기존 행보다 이전인지 (비교할 수 없으면 False)"""
+        if _is_missing(new_value) or _is_missing(existing_value):
+            return False
+        try:
+            return pd.Timestamp(new_value) < pd.Timestamp(existing_value)
+        except (TypeError, ValueError):
+            return False
+
+    # ------------------------------------------------------------------
+    # 변환 / 저장
+    # ------------------------------------------------------------------
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        전체 행을 DataFrame으로 반환합니다 (기존 행 순서 유지, 새 행은 뒤에 추가).
+
+        Returns:
+            dim_webtoon DataFrame (DIM_WEBTOON_COLUMNS 순서)
+        """
+        if len(self._rows) == 0:
+            return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
+        return pd.DataFrame.from_records(
+            [tuple(row.get(column) for column in DIM_WEBTOON_COLUMNS) for row in self._rows.values()],
+            columns=DIM_WEBTOON_COLUMNS,
+        )
+
+    def upload_records(self) -> Tuple[List[Dict[str, Any]], Callable[[], None]]:
+        """
+        마지막 업로드 이후 바뀐 행과, 업로드가 성공한 뒤 호출할 기록 함수를 반환합니다.
+        (전체 테이블이 아니라 바뀐 k개 행만 업로드, 업로드가 실패하면 다음 업로드에 다시 포함)
+
+        Returns:
+            (dim_webtoon 레코드 리스트, 업로드 완료 기록 함수) 튜플
+        """
+        snapshot = dict(self._unuploaded)
+        records = [dict(self._rows[webtoon_id]) for webtoon_id in snapshot]
+
+        def mark_uploaded() -> None:
+            for webtoon_id, seq in snapshot.items():
+                if self._unuploaded.get(webtoon_id) == seq:
+                    del self._unuploaded[webtoon_id]
+
+        return records, mark_uploaded
+
+    def flush(self, force: bool = False) -> bool:
+        """
+        dirty 행이 있으면 dim_webtoon 파일을 저장하고 dirty 집합을 비웁니다.
+
+        Args:
+            force: True면 바뀐 행이 없어도 저장
+
+        Returns:
+            파일을 저장했으면 True, 바뀐 행이 없어 건너뛰었으면 False
+        """
+        if not self._dirty and not force:
+            logger.info("dim_webtoon 변경 없음, 저장 생략")
+            return False
+        save_dim_webtoon(self.to_dataframe())
+        logger.info(f"dim_webtoon 저장: 전체 {len(self._rows)}개 중 {len(self._dirty)}개 행 변경")
+        self._dirty.clear()
+        return True
+
+
+def upsert_dim_webtoon(existing_df: pd.DataFrame, new_records: List[Mapping[str, Any]]) -> pd.DataFrame:
+    """
+    기존 DataFrame에 레코드를 upsert한 결과를 DataFrame으로 반환합니다 (merge_dim_webtoon 구현).
+
+    Args:
+        existing_df: 기존 dim_webtoon DataFrame
+        new_records: 새로운 레코드 리스트
+
+    Returns:
+        병합된 DataFrame
+    """
+    store = DimWebtoonStore(existing_df)
+    store.upsert(new_records)
+    return store.to_dataframe()
@@ -11,22 +11,34 @@ Extract 모듈: 네이버 웹툰 페이지 HTML 수집
 """
 
 import logging
-import time
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from src.http_cache import CachingHTTPAdapter, decode_response, get_http_cache
+from src.json_codec import dumps, dumps_bytes, loads
+from src.rate_control import naver_get
+from src.raw_archive import archive_raw_bytes
 from src.utils import get_raw_html_dir, setup_logging
 
 logger = logging.getLogger(__name__)
 
+# 네이버 웹툰 기본 URL (환경 변수로 변경 가능)
+# - 부하 테스트 시 scripts/test/fake_naver_server.py 주소로 바꾸면 전체 파이프라인을 오프라인으로 실행
+NAVER_COMIC_BASE_URL = os.getenv('NAVER_COMIC_BASE_URL', 'https://comic.naver.com').rstrip('/')
+NAVER_COMIC_MOBILE_BASE_URL = os.getenv('NAVER_COMIC_MOBILE_BASE_URL', 'https://m.comic.naver.com').rstrip('/')
+
 # 네이버 웹툰 주간 차트 URL
-NAVER_WEBTOON_CHART_URL = "https://comic.naver.com/webtoon"
-NAVER_WEBTOON_MOBILE_URL = "https://m.comic.naver.com/webtoon/weekday"
+NAVER_WEBTOON_CHART_URL = f"{NAVER_COMIC_BASE_URL}/webtoon"
+NAVER_WEBTOON_MOBILE_URL = f"{NAVER_COMIC_MOBILE_BASE_URL}/webtoon/weekday"
 
 # 정렬 방식
 SORT_POPULAR = "user"     # 인기순 (API에서는 "user" 사용)
@@ -36,22 +48,54 @@ SORT_VIEW = "view"        # 조회순
 # 실제 API: https://comic.naver.com/api/webtoon/titlelist/weekday?order={view|user}
 WEBTOON_API_ENDPOINTS = [
     {
-        "url": "https://comic.naver.com/api/webtoon/titlelist/weekday",
+        "url": f"{NAVER_COMIC_BASE_URL}/api/webtoon/titlelist/weekday",
         "params": {"order": "view"},
         "sort_type": "view"
     },
     {
-        "url": "https://comic.naver.com/api/webtoon/titlelist/weekday",
+        "url": f"{NAVER_COMIC_BASE_URL}/api/webtoon/titlelist/weekday",
         "params": {"order": "user"},
         "sort_type": "popular"  # 사용자에게는 "popular"로 표시
     },
 ]
 
 
-def create_session() -> requests.Session:
+# 연결 풀 설정 (환경 변수로 조정 가능)
+# - HTTP_POOL_CONNECTIONS: 호스트별 연결 풀을 몇 개까지 유지할지
+# - HTTP_POOL_MAXSIZE: 호스트 하나에 유지하는 keep-alive 연결 수 (동시 요청 수 상한 이상 권장)
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '4'))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '32'))
+
+# 모바일 HTML 수집용 User-Agent
+MOBILE_USER_AGENT = 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
+
+
+@dataclass
+class ChartPayload:
+    """
+    주간 차트 수집 결과 하나 (Extract → Parse 단계 사이에 메모리로 전달).
+
+    API 응답이면 디코딩한 dict를, API를 쓸 수 없어 페이지를 수집했으면 HTML 문자열을 담습니다.
+    파싱은 src.parse.parse_chart_payload로 합니다.
+    """
+    sort_type: Optional[str]
+    api_data: Optional[dict] = None
+    html: Optional[str] = None
+
+    @property
+    def source(self) -> str:
+        """수집 방식 ('api' 또는 'html')"""
+        return 'api' if self.api_data is not None else 'html'
+
+
+def create_session(use_cache: bool = True) -> requests.Session:
     """
     재시도 로직이 포함된 requests 세션을 생성합니다.
     브라우저 동작을 흉내내기 위해 필요한 헤더를 설정합니다.
+    보통은 새로 만들지 않고 get_shared_session()으로 공용 세션을 사용합니다.
+    
+    Args:
+        use_cache: True이면 ETag/Last-Modified 재검증 디스크 캐시 사용 (HTTP_CACHE_ENABLED=false면 무시)
     
     Returns:
         설정된 requests.Session 객체
@@ -64,7 +108,7 @@ def create_session() -> requests.Session:
         'Accept': 'application/json, text/plain, */*',  # API 요청이므로 JSON Accept
         'Accept-Language': 'ko,en-US;q=0.9,en;q=0.8',
         'Accept-Encoding': 'gzip, deflate, br, zstd',
-        'Referer': 'https://comic.naver.com/webtoon',  # API 요청 시 필수
+        'Referer': NAVER_WEBTOON_CHART_URL,  # API 요청 시 필수
         'Sec-Fetch-Dest': 'empty',
         'Sec-Fetch-Mode': 'cors',
         'Sec-Fetch-Site': 'same-origin',
@@ -79,19 +123,90 @@ def create_session() -> requests.Session:
         allowed_methods=["GET"]
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    pool_options = {
+        'max_retries': retry_strategy,
+        'pool_connections': HTTP_POOL_CONNECTIONS,
+        'pool_maxsize': HTTP_POOL_MAXSIZE,
+    }
+    cache = get_http_cache() if use_cache else None
+    if cache is not None:
+        adapter = CachingHTTPAdapter(cache, **pool_options)
+    else:
+        adapter = HTTPAdapter(**pool_options)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
     return session
 
 
-def try_api_endpoints(sort_type: Optional[str] = None) -> Optional[dict]:
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    차트, 상세 정보, 에피소드 수, HTML fallback 요청이 함께 쓰는 공용 세션을 반환합니다.
+    모듈 수준에서 유지되므로 keep-alive 연결을 요청 간, 그리고 Cloud Functions의
+    warm 인스턴스 호출 간에도 재사용합니다 (매번 TCP/TLS handshake를 하지 않음).
+    
+    요청별로 다른 헤더가 필요하면 세션 헤더를 바꾸지 말고 요청 headers 인자로 넘깁니다.
+    
+    Returns:
+        공용 requests.Session 객체
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = create_session()
+    return _shared_session
+
+
+def get_connection_stats() -> Dict[str, Dict[str, int]]:
+    """
+    공용 세션의 호스트별 연결 재사용 통계를 반환합니다.
+    
+    Returns:
+        {호스트: {'connections': 새로 연결한 수, 'requests': 요청 수, 'reused': 기존 연결 재사용 수}}
+    """
+    stats = {}
+    if _shared_session is None:
+        return stats
+    
+    for adapter in {id(a): a for a in _shared_session.adapters.values()}.values():
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}"
+            counters = stats.setdefault(host, {'connections': 0, 'requests': 0, 'reused': 0})
+            counters['connections'] += pool.num_connections
+            counters['requests'] += pool.num_requests
+            counters['reused'] += max(0, pool.num_requests - pool.num_connections)
+    return stats
+
+
+def try_api_endpoints(
+    sort_type: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    chart_date: Optional[date] = None,
+    archive_target: Optional[str] = None
+) -> Optional[dict]:
     """
     알려진 API 엔드포인트를 시도하여 데이터를 가져옵니다.
     
+    archive_target을 주면 응답 본문을 받은 바이트 그대로 압축해 보관합니다
+    (src/raw_archive.py, 파일명 webtoon_chart_{정렬}.json). 디코딩한 dict를 다시 직렬화하지 않으므로
+    보관본에는 아래 _sort_type / _api_* 필드가 없습니다 (정렬은 보관 경로로 구분).
+    이전 실행과 같은 응답(304 또는 본문 해시 동일)은 이미 보관돼 있으므로 다시 보관하지 않고,
+    같은 프로세스에서 디코딩한 적이 있으면 JSON 파싱도 생략합니다 (src/http_cache.py).
+    
     Args:
         sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 모든 정렬 시도
+        session: requests 세션 (None이면 공용 세션)
+        chart_date: 보관 경로의 날짜 (None이면 오늘 날짜 사용)
+        archive_target: 원본 보관 위치 ('gcs', 'local', 'none', None이면 보관하지 않음)
     
     Returns:
         JSON 데이터 (실패 시 None)
@@ -100,7 +215,8 @@ def try_api_endpoints(sort_type: Optional[str] = None) -> Optional[dict]:
         logger.info("API 엔드포인트가 설정되지 않았습니다.")
         return None
     
-    session = create_session()
+    if session is None:
+        session = get_shared_session()
     
     # 정렬 타입 필터링
     # sort_type이 "popular"면 "user"로 매핑 (API에서는 "user" 사용)
@@ -120,19 +236,24 @@ def try_api_endpoints(sort_type: Optional[str] = None) -> Optional[dict]:
             
             logger.info(f"API 엔드포인트 시도: {url} (정렬: {sort_type_name}, order={params.get('order')})")
             
-            # 요청 전 딜레이 (과도한 요청 방지)
-            time.sleep(1)
-            
-            response = session.get(url, params=params, timeout=30)
+            # 공용 요청 예산 + 적응형 제어기를 거쳐 요청 (예산이 남아 있으면 대기 없음)
+            response = naver_get(session, url, params=params, timeout=30)
             response.raise_for_status()
             
             # JSON 응답 확인
             try:
-                data = response.json()
-                logger.info(f"✅ API에서 데이터 수집 성공: {len(str(data))} bytes (정렬: {sort_type_name})")
+                body = response.content
+                data = decode_response(response, loads)
+                unchanged = getattr(response, 'unchanged', False)
+                logger.info(f"✅ API에서 데이터 수집 성공: {len(body)} bytes (정렬: {sort_type_name}{', 이전 응답과 같음' if unchanged else ''})")
                 
-                # 정렬 타입 정보 추가
+                if archive_target and not unchanged:
+                    archive_name = f"webtoon_chart_{sort_type}.json" if sort_type else "webtoon_chart.json"
+                    archive_raw_bytes(chart_date or date.today(), archive_name, body, target=archive_target)
+                
+                # 정렬 타입 정보 추가 (디코딩 결과는 캐시와 공유하므로 복사본에 추가)
                 if isinstance(data, dict):
+                    data = dict(data)
                     data["_sort_type"] = sort_type_name
                     data["_api_url"] = url
                     data["_api_params"] = params
@@ -153,7 +274,51 @@ def try_api_endpoints(sort_type: Optional[str] = None) -> Optional[dict]:
     return None
 
 
-def fetch_webtoon_chart_html(url: Optional[str] = None, use_mobile: bool = True, sort_type: Optional[str] = None, chart_date: Optional[date] = None) -> Optional[str]:
+def iter_api_chart_data(
+    sort_types: List[Optional[str]],
+    session: Optional[requests.Session] = None,
+    chart_date: Optional[date] = None,
+    archive_target: Optional[str] = None
+) -> Iterator[Tuple[Optional[str], Optional[dict]]]:
+    """
+    여러 정렬 방식의 차트 API를 하나의 세션으로 동시에 요청하고, 도착한 순서대로 돌려줍니다.
+    정렬 방식마다 순서대로 요청하던 것과 달리 차트 단계 소요 시간이 가장 느린 정렬 하나의 응답 시간 수준이 됩니다.
+    
+    Args:
+        sort_types: 정렬 방식 리스트 (["popular", "view"] 등)
+        session: requests 세션 (None이면 공용 세션)
+        chart_date: 원본 보관 경로의 날짜 (try_api_endpoints 참고)
+        archive_target: 원본 보관 위치 (try_api_endpoints 참고, 요청 스레드에서 응답마다 보관)
+    
+    Yields:
+        (sort_type, JSON 데이터) 튜플 (실패한 정렬은 JSON 데이터가 None)
+    """
+    if not sort_types:
+        return
+    if session is None:
+        session = get_shared_session()
+    
+    with ThreadPoolExecutor(max_workers=len(sort_types)) as executor:
+        futures = {
+            executor.submit(
+                try_api_endpoints,
+                sort_type=sort_type,
+                session=session,
+                chart_date=chart_date,
+                archive_target=archive_target
+            ): sort_type
+            for sort_type in sort_types
+        }
+        for future in as_completed(futures):
+            sort_type = futures[future]
+            try:
+                yield sort_type, future.result()
+            except Exception as e:
+                logger.error(f"차트 API 요청 중 오류 발생 (정렬: {sort_type}): {e}")
+                yield sort_type, None
+
+
+def fetch_webtoon_chart_html(url: Optional[str] = None, use_mobile: bool = True, sort_type: Optional[str] = None, chart_date: Optional[date] = None, session: Optional[requests.Session] = None) -> Optional[str]:
     """
     네이버 웹툰 주간 차트 페이지의 HTML을 수집합니다.
     
@@ -166,23 +331,58 @@ def fetch_webtoon_chart_html(url: Optional[str] = None, use_mobile: bool = True,
         url: 웹툰 차트 URL (None이면 기본 URL 사용)
         use_mobile: 모바일 버전 사용 여부
         sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
+        chart_date: 수집 날짜 (None이면 오늘 날짜 사용, 원본 보관 경로에 사용)
+        session: requests 세션 (None이면 공용 세션)
     
     Returns:
         HTML 문자열 (실패 시 None)
     """
+    payload = fetch_chart_payload(url, use_mobile=use_mobile, sort_type=sort_type, chart_date=chart_date, session=session)
+    if payload is None:
+        return None
+    if payload.api_data is None:
+        return payload.html
+    
+    # API 응답은 HTML 형식으로 감싸서 반환 (HTML 파일로 저장하는 extract_webtoon_chart용)
+    api_data = payload.api_data
+    sort_info = f"<!-- Sort Type: {api_data.get('_sort_type', 'unknown')} -->\n"
+    return f"{sort_info}<!-- API Response -->\n<script type='application/json' id='webtoon-data'>{dumps(api_data)}</script>"
+
+
+def fetch_chart_payload(
+    url: Optional[str] = None,
+    use_mobile: bool = True,
+    sort_type: Optional[str] = None,
+    chart_date: Optional[date] = None,
+    session: Optional[requests.Session] = None,
+    archive_target: Optional[str] = 'local'
+) -> Optional[ChartPayload]:
+    """
+    주간 차트를 수집해 메모리의 ChartPayload로 반환합니다 (파일을 거치지 않음).
+    
+    우선순위는 fetch_webtoon_chart_html과 같습니다 (API → 모바일/데스크톱 HTML).
+    응답 원본 보관은 부수 작업으로, archive_target에 따라 받은 바이트 그대로 압축해 저장합니다
+    (API 응답은 webtoon_chart_{정렬}.json, 페이지는 webtoon_chart_{정렬}.html, src/raw_archive.py).
+    이전 실행과 같은 응답은 다시 보관하지 않습니다.
+    
+    Args:
+        url: 웹툰 차트 페이지 URL (None이면 기본 URL 사용)
+        use_mobile: 모바일 버전 사용 여부
+        sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
+        chart_date: 수집 날짜 (None이면 오늘 날짜 사용, 보관 경로에 사용)
+        session: requests 세션 (None이면 공용 세션)
+        archive_target: 원본 보관 위치 ('gcs', 'local', 'none', None이면 보관하지 않음)
+    
+    Returns:
+        ChartPayload (실패 시 None)
+    """
+    if chart_date is None:
+        chart_date = date.today()
+    
     # 1. API 엔드포인트 시도 (정렬 파라미터 포함)
-    api_data = try_api_endpoints(sort_type=sort_type)
+    api_data = try_api_endpoints(sort_type=sort_type, session=session, chart_date=chart_date, archive_target=archive_target)
     if api_data:
-        # API 데이터를 JSON 파일로 저장 (GCS 업로드용)
-        import json
-        if chart_date is None:
-            chart_date = date.today()
-        json_path = save_json_to_file(api_data, chart_date, sort_type=sort_type)
-        
-        # HTML 형식으로도 저장 (파싱용, 기존 로직 유지)
-        sort_info = f"<!-- Sort Type: {api_data.get('_sort_type', 'unknown')} -->\n"
-        html = f"{sort_info}<!-- API Response -->\n<script type='application/json' id='webtoon-data'>{json.dumps(api_data, ensure_ascii=False)}</script>"
-        return html
+        return ChartPayload(sort_type=sort_type, api_data=api_data)
     
     # 2. HTML 수집
     if url is None:
@@ -191,28 +391,27 @@ def fetch_webtoon_chart_html(url: Optional[str] = None, use_mobile: bool = True,
     logger.info(f"웹툰 차트 페이지 수집 시작: {url}")
     
     try:
-        session = create_session()
+        if session is None:
+            session = get_shared_session()
         
-        # 모바일 버전인 경우 User-Agent 변경
-        if use_mobile:
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
-            })
+        # 모바일 버전인 경우 User-Agent 변경 (공용 세션 헤더는 바꾸지 않고 요청에만 적용)
+        headers = {'User-Agent': MOBILE_USER_AGENT} if use_mobile else None
         
         # 정렬 파라미터 추가 (URL에 쿼리 파라미터로)
         params = {}
         if sort_type:
             params['sort'] = sort_type
         
-        # 요청 전 딜레이 (과도한 요청 방지)
-        time.sleep(1)
-        
-        response = session.get(url, params=params, timeout=30)
+        # 공용 요청 예산 + 적응형 제어기를 거쳐 요청 (예산이 남아 있으면 대기 없음)
+        response = naver_get(session, url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
         html = response.text
         logger.info(f"HTML 수집 성공: {len(html)} bytes")
-        return html
+        if archive_target and not getattr(response, 'unchanged', False):
+            archive_name = f"webtoon_chart_{sort_type}.html" if sort_type else "webtoon_chart.html"
+            archive_raw_bytes(chart_date, archive_name, response.content, target=archive_target)
+        return ChartPayload(sort_type=sort_type, html=html)
         
     except Exception as e:
         logger.error(f"HTML 수집 실패: {e}")
@@ -244,8 +443,7 @@ def save_json_to_file(json_data: dict, chart_date: date, filename: Optional[str]
     file_path = save_dir / filename
     
     try:
-        import json
-        file_path.write_text(json.dumps(json_data, ensure_ascii=False, indent=2), encoding='utf-8')
+        file_path.write_bytes(dumps_bytes(json_data, indent=True))
         logger.info(f"JSON 저장 완료: {file_path}")
         return file_path
     except Exception as e:
@@ -286,7 +484,7 @@ def save_html_to_file(html: str, chart_date: date, filename: Optional[str] = Non
         raise
 
 
-def extract_webtoon_chart(chart_date: Optional[date] = None, url: Optional[str] = None, use_mobile: bool = True, sort_type: Optional[str] = None) -> Optional[Path]:
+def extract_webtoon_chart(chart_date: Optional[date] = None, url: Optional[str] = None, use_mobile: bool = True, sort_type: Optional[str] = None, session: Optional[requests.Session] = None) -> Optional[Path]:
     """
     네이버 웹툰 주간 차트를 수집하여 로컬에 저장합니다.
     
@@ -295,6 +493,7 @@ def extract_webtoon_chart(chart_date: Optional[date] = None, url: Optional[str]
         url: 웹툰 차트 URL (None이면 기본 URL 사용)
         use_mobile: 모바일 버전 사용 여부
         sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
+        session: requests 세션 (None이면 공용 세션)
     
     Returns:
         저장된 HTML 파일의 Path 객체 (실패 시 None)
@@ -304,7 +503,7 @@ def extract_webtoon_chart(chart_date: Optional[date] = None, url: Optional[str]
     
     try:
         # HTML 수집 (모바일 버전 우선 시도, 정렬 파라미터 포함)
-        html = fetch_webtoon_chart_html(url, use_mobile=use_mobile, sort_type=sort_type, chart_date=chart_date)
+        html = fetch_webtoon_chart_html(url, use_mobile=use_mobile, sort_type=sort_type, chart_date=chart_date, session=session)
         
         if html is None:
             logger.error("HTML 수집 실패")
@@ -321,6 +520,44 @@ def extract_webtoon_chart(chart_date: Optional[date] = None, url: Optional[str]
         return None
 
 
+def iter_chart_payloads(
+    chart_date: Optional[date] = None,
+    sort_types: Optional[List[Optional[str]]] = None,
+    archive_target: Optional[str] = 'local'
+) -> Iterator[Tuple[Optional[str], Optional[ChartPayload]]]:
+    """
+    여러 정렬 방식의 주간 차트를 하나의 세션으로 동시에 수집하고, 끝난 순서대로 돌려줍니다.
+    (fetch_chart_payload의 다중 정렬 버전, 수집 결과는 파일을 거치지 않고 메모리로 전달)
+    
+    Args:
+        chart_date: 수집 날짜 (None이면 오늘 날짜 사용)
+        sort_types: 정렬 방식 리스트 (None이면 기본값만)
+        archive_target: 원본 보관 위치 (fetch_chart_payload 참고)
+    
+    Yields:
+        (sort_type, ChartPayload) 튜플 (실패한 정렬은 ChartPayload가 None)
+    """
+    if sort_types is None:
+        sort_types = [None]
+    if chart_date is None:
+        chart_date = date.today()
+    session = get_shared_session()
+    
+    with ThreadPoolExecutor(max_workers=len(sort_types)) as executor:
+        futures = {
+            executor.submit(
+                fetch_chart_payload,
+                sort_type=sort_type,
+                chart_date=chart_date,
+                session=session,
+                archive_target=archive_target
+            ): sort_type
+            for sort_type in sort_types
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 if __name__ == "__main__":
     # 테스트 실행
     setup_logging()
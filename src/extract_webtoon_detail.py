@@ -4,44 +4,42 @@ Extract Webtoon Detail 모듈: 웹툰 상세 정보 수집
 이 모듈은 웹툰 상세 정보를 수집합니다.
 - API 우선 시도 (/api/article/list/info)
 - API 실패 시 HTML 파싱 시도
-- Rate limiting 적용
+- Rate limiting 적용 (공용 토큰 버킷 + 적응형 제어, src/rate_control.py)
 """
 
 import logging
-import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 import requests
 from bs4 import BeautifulSoup
 
-from src.extract import create_session
+from src.extract import NAVER_COMIC_BASE_URL, NAVER_WEBTOON_CHART_URL, get_shared_session
+from src.http_cache import decode_response
+from src.json_codec import loads
+from src.rate_control import naver_get
 
 logger = logging.getLogger(__name__)
 
 # 웹툰 상세 정보 API 엔드포인트
-WEBTOON_DETAIL_API_URL = "https://comic.naver.com/api/article/list/info"
-WEBTOON_EPISODE_API_URL = "https://comic.naver.com/api/article/list"
-WEBTOON_DETAIL_PAGE_URL = "https://comic.naver.com/webtoon/list"
+# (NAVER_COMIC_BASE_URL 환경 변수로 가짜 서버 등 다른 주소를 사용할 수 있음)
+WEBTOON_DETAIL_API_URL = f"{NAVER_COMIC_BASE_URL}/api/article/list/info"
+WEBTOON_EPISODE_API_URL = f"{NAVER_COMIC_BASE_URL}/api/article/list"
+WEBTOON_DETAIL_PAGE_URL = f"{NAVER_COMIC_BASE_URL}/webtoon/list"
 
 
-def fetch_webtoon_detail_api(webtoon_id: str, session: Optional[requests.Session] = None) -> Optional[Dict[str, Any]]:
+def build_api_headers(webtoon_id: str) -> Dict[str, str]:
     """
-    API를 통해 웹툰 상세 정보를 수집합니다.
+    상세 정보/에피소드 API 요청용 헤더를 생성합니다.
+    동기(requests) 수집기와 비동기(aiohttp) 수집기가 같은 헤더를 사용합니다.
     
     Args:
-        webtoon_id: 웹툰 ID
-        session: requests Session 객체 (없으면 새로 생성)
+        webtoon_id: 웹툰 ID (Referer에 사용)
     
     Returns:
-        API 응답 데이터 (딕셔너리), 실패 시 None
+        요청 헤더 딕셔너리
     """
-    if session is None:
-        session = create_session()
-    
-    url = f"{WEBTOON_DETAIL_API_URL}?titleId={webtoon_id}"
-    
-    headers = {
+    return {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
         'Accept': 'application/json, text/plain, */*',
         'Accept-Language': 'ko,en-US;q=0.9,en;q=0.8',
@@ -53,12 +51,68 @@ def fetch_webtoon_detail_api(webtoon_id: str, session: Optional[requests.Session
         'sec-fetch-mode': 'cors',
         'sec-fetch-site': 'same-origin',
     }
+
+
+def build_html_headers() -> Dict[str, str]:
+    """
+    상세 페이지 HTML 요청용 헤더를 생성합니다.
+    
+    Returns:
+        요청 헤더 딕셔너리
+    """
+    return {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'ko,en-US;q=0.9,en;q=0.8',
+        'Referer': NAVER_WEBTOON_CHART_URL,
+    }
+
+
+def new_detail_result(webtoon_id: str) -> Dict[str, Any]:
+    """
+    상세 정보 수집 결과의 기본 딕셔너리를 생성합니다.
+    
+    Args:
+        webtoon_id: 웹툰 ID
+    
+    Returns:
+        모든 필드가 None으로 초기화된 결과 딕셔너리
+    """
+    return {
+        'webtoon_id': webtoon_id,
+        'favorite_count': None,
+        'favorite_count_source': None,
+        'finished': None,
+        'rest': None,
+        'total_episode_count': None,
+        'genre': None,
+        'tags': None,
+    }
+
+
+def fetch_webtoon_detail_api(webtoon_id: str, session: Optional[requests.Session] = None) -> Optional[Dict[str, Any]]:
+    """
+    API를 통해 웹툰 상세 정보를 수집합니다.
+    
+    Args:
+        webtoon_id: 웹툰 ID
+        session: requests Session 객체 (없으면 공용 세션)
+    
+    Returns:
+        API 응답 데이터 (딕셔너리), 실패 시 None
+    """
+    if session is None:
+        session = get_shared_session()
+    
+    url = f"{WEBTOON_DETAIL_API_URL}?titleId={webtoon_id}"
+    
+    headers = build_api_headers(webtoon_id)
     
     try:
-        response = session.get(url, headers=headers, timeout=10)
+        response = naver_get(session, url, headers=headers, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = decode_response(response, loads)  # 같은 본문은 이전 파싱 결과 재사용
             logger.debug(f"API 응답 성공: webtoon_id={webtoon_id}")
             return data
         else:
@@ -76,25 +130,20 @@ def fetch_webtoon_detail_html(webtoon_id: str, session: Optional[requests.Sessio
     
     Args:
         webtoon_id: 웹툰 ID
-        session: requests Session 객체 (없으면 새로 생성)
+        session: requests Session 객체 (없으면 공용 세션)
     
     Returns:
         HTML 문자열, 실패 시 None
     """
     if session is None:
-        session = create_session()
+        session = get_shared_session()
     
     url = f"{WEBTOON_DETAIL_PAGE_URL}?titleId={webtoon_id}"
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'ko,en-US;q=0.9,en;q=0.8',
-        'Referer': 'https://comic.naver.com/webtoon',
-    }
+    headers = build_html_headers()
     
     try:
-        response = session.get(url, headers=headers, timeout=10)
+        response = naver_get(session, url, headers=headers, timeout=10)
         
         if response.status_code == 200:
             logger.debug(f"HTML 수집 성공: webtoon_id={webtoon_id}")
@@ -114,34 +163,23 @@ def fetch_webtoon_episode_count(webtoon_id: str, session: Optional[requests.Sess
     
     Args:
         webtoon_id: 웹툰 ID
-        session: requests Session 객체 (없으면 새로 생성)
+        session: requests Session 객체 (없으면 공용 세션)
     
     Returns:
         전체 에피소드 수, 실패 시 None
     """
     if session is None:
-        session = create_session()
+        session = get_shared_session()
     
     url = f"{WEBTOON_EPISODE_API_URL}?titleId={webtoon_id}&page=1"
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'ko,en-US;q=0.9,en;q=0.8',
-        'Referer': f'{WEBTOON_DETAIL_PAGE_URL}?titleId={webtoon_id}',
-        'sec-ch-ua': '"Google Chrome";v="143", "Chromium";v="143", "Not A(Brand";v="24"',
-        'sec-ch-ua-mobile': '?0',
-        'sec-ch-ua-platform': '"macOS"',
-        'sec-fetch-dest': 'empty',
-        'sec-fetch-mode': 'cors',
-        'sec-fetch-site': 'same-origin',
-    }
+    headers = build_api_headers(webtoon_id)
     
     try:
-        response = session.get(url, headers=headers, timeout=10)
+        response = naver_get(session, url, headers=headers, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = decode_response(response, loads)  # 같은 본문은 이전 파싱 결과 재사용
             total_count = data.get('totalCount')
             if total_count is not None:
                 logger.debug(f"에피소드 수 조회 성공: webtoon_id={webtoon_id}, count={total_count}")
@@ -177,17 +215,8 @@ def extract_webtoon_detail(webtoon_id: str, use_html_fallback: bool = True) -> O
             ...
         }
     """
-    session = create_session()
-    result = {
-        'webtoon_id': webtoon_id,
-        'favorite_count': None,
-        'favorite_count_source': None,
-        'finished': None,
-        'rest': None,
-        'total_episode_count': None,
-        'genre': None,
-        'tags': None,
-    }
+    session = get_shared_session()
+    result = new_detail_result(webtoon_id)
     
     # 1. API 호출 시도
     api_data = fetch_webtoon_detail_api(webtoon_id, session)
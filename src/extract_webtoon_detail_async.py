@@ -0,0 +1,395 @@
+"""
+Extract Webtoon Detail Async 모듈: 웹툰 상세 정보 비동기 수집
+
+extract_webtoon_detail를 웹툰마다 순서대로 호출하던 직렬 루프를 대체합니다.
+- asyncio + aiohttp로 상세 정보 API(/api/article/list/info)와
+  에피소드 수 API(/api/article/list)를 동시에 요청
+- 동시 요청 수와 초당 요청 수는 공용 적응형 제어기(src/rate_control.py)가 관리하여
+  전체 소요 시간이 응답 시간이 아니라 요청 예산에 의해 결정되도록 함
+- API 실패 시 HTML 파싱 시도 (extract_webtoon_detail과 동일한 우선순위)
+- 응답은 디스크 캐시(src/http_cache.py)로 ETag/Last-Modified 재검증,
+  이전과 같은 본문은 같은 프로세스의 이전 파싱 결과를 재사용 (JSON 디코딩/파싱 생략)
+- aiohttp 세션과 이벤트 루프는 모듈 수준에서 유지하여 keep-alive 연결을
+  배치 간, Cloud Functions warm 인스턴스 호출 간에도 재사용
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from yarl import URL
+
+from src.extract import HTTP_POOL_MAXSIZE
+from src.http_cache import CacheEntry, HTTPCache, get_http_cache
+from src.json_codec import loads
+from src.rate_control import AdaptiveRateController, get_naver_rate_controller
+from src.rate_limiter import configure_naver_rate_limiter
+from src.extract_webtoon_detail import (
+    WEBTOON_DETAIL_API_URL,
+    WEBTOON_EPISODE_API_URL,
+    WEBTOON_DETAIL_PAGE_URL,
+    build_api_headers,
+    build_html_headers,
+    new_detail_result,
+)
+from src.parse_webtoon_detail import parse_favorite_count_from_html, parse_webtoon_detail
+
+logger = logging.getLogger(__name__)
+
+# 재시도 설정 (create_session의 Retry와 동일한 기준)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 1.0
+REQUEST_TIMEOUT_SECONDS = 10
+
+# keep-alive 연결 유지 시간 (초)
+KEEPALIVE_TIMEOUT_SECONDS = 30
+
+# 공용 이벤트 루프 / aiohttp 세션 (collect_webtoon_details에서 사용)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_shared_session: Optional[aiohttp.ClientSession] = None
+_connection_stats = {'connections': 0, 'reused': 0}
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """공용 이벤트 루프를 반환합니다. 처음 호출 시 백그라운드 스레드에서 실행을 시작합니다."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='webtoon-detail-loop', daemon=True)
+                thread.start()
+                _loop = loop
+                atexit.register(_close_shared_session)
+    return _loop
+
+
+def _close_shared_session() -> None:
+    """프로세스 종료 시 공용 aiohttp 세션을 닫습니다."""
+    if _loop is None or _shared_session is None or _shared_session.closed:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_shared_session.close(), _loop).result(timeout=5)
+    except Exception as e:
+        logger.debug(f"공용 aiohttp 세션 종료 실패: {e}")
+
+
+async def _on_connection_create_end(session, context, params) -> None:
+    _connection_stats['connections'] += 1
+
+
+async def _on_connection_reuseconn(session, context, params) -> None:
+    _connection_stats['reused'] += 1
+
+
+def _create_client_session() -> aiohttp.ClientSession:
+    """연결 재사용 통계를 기록하는 aiohttp 세션을 생성합니다. (이벤트 루프 안에서 호출)"""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    connector = aiohttp.TCPConnector(limit=HTTP_POOL_MAXSIZE, keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS)
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+        connector=connector,
+        trace_configs=[trace_config],
+    )
+
+
+async def _get_shared_session() -> aiohttp.ClientSession:
+    """공용 aiohttp 세션을 반환합니다. (공용 이벤트 루프 안에서 호출)"""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = _create_client_session()
+    return _shared_session
+
+
+def get_aiohttp_connection_stats() -> Dict[str, int]:
+    """
+    aiohttp 연결 재사용 통계를 반환합니다.
+
+    Returns:
+        {'connections': 새로 연결한 수, 'reused': 기존 연결 재사용 수}
+    """
+    return dict(_connection_stats)
+
+
+def _decode_detail(raw: bytes) -> Optional[Dict[str, Any]]:
+    """상세 정보 API 본문을 파싱합니다. (빈 응답이면 None)"""
+    api_data = loads(raw)
+    return parse_webtoon_detail(api_data=api_data) if api_data else None
+
+
+def _decode_episode_count(raw: bytes) -> Optional[int]:
+    """에피소드 목록 API 본문에서 전체 에피소드 수를 꺼냅니다."""
+    episode_data = loads(raw)
+    if isinstance(episode_data, dict) and episode_data.get('totalCount') is not None:
+        try:
+            return int(episode_data['totalCount'])
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
+def _decode_favorite_count(raw: bytes) -> Optional[int]:
+    """상세 페이지 HTML에서 관심 수를 파싱합니다."""
+    return parse_favorite_count_from_html(raw.decode('utf-8', errors='replace'))
+
+
+async def _read_cached_response(
+    response: aiohttp.ClientResponse,
+    cache: Optional[HTTPCache],
+    cache_url: Optional[str],
+    entry: Optional[CacheEntry],
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    응답 본문을 읽습니다. 304면 캐시된 본문을, 200이면 받은 본문을 캐시에 저장한 뒤 반환합니다.
+    캐시 파일 I/O(본문 읽기, 저장, 정리)는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+
+    Returns:
+        (응답 본문, 본문 해시) 튜플
+        (304인데 캐시 본문이 없거나 그 밖의 상태 코드면 본문이 None, 캐시를 쓰지 않으면 해시가 None)
+    """
+    if response.status == 304 and entry is not None:
+        raw = await asyncio.to_thread(cache.read_body, entry)
+        if raw is not None:
+            cache.record_not_modified(cache_url)
+        return raw, entry.content_hash
+    if response.status == 200:
+        raw = await response.read()
+        content_hash = None
+        if cache is not None:
+            _, content_hash = await asyncio.to_thread(cache.store_entry, cache_url, raw, response.headers)
+        return raw, content_hash
+    return None, None
+
+
+async def _request(
+    session: aiohttp.ClientSession,
+    controller: AdaptiveRateController,
+    url: str,
+    params: Dict[str, Any],
+    headers: Dict[str, str],
+    decode: Callable[[bytes], Any] = loads,
+) -> Tuple[Optional[int], Any]:
+    """
+    요청 예산과 동시 요청 수 제한을 지키면서 GET 요청을 보냅니다.
+    429/5xx, 네트워크 오류는 exponential backoff로 재시도합니다.
+
+    Args:
+        session: aiohttp ClientSession
+        controller: 공용 적응형 제어기 (동시 요청 수 + 토큰 버킷)
+        url: 요청 URL
+        params: 쿼리 파라미터
+        headers: 요청 헤더
+        decode: 응답 본문을 디코딩/파싱하는 함수 (이전과 같은 본문이면 이전 결과를 재사용)
+
+    Returns:
+        (status_code, decode 결과) 튜플. 요청 자체가 실패하면 (None, None)
+    """
+    # 디스크 캐시: 이전 응답의 검증자로 조건부 요청을 보내고 304면 저장된 본문 사용
+    # (캐시 파일 I/O는 스레드에서 실행해 공용 이벤트 루프를 막지 않음)
+    cache = get_http_cache()
+    cache_url = str(URL(url).update_query(params)) if cache is not None else None
+    entry = await asyncio.to_thread(cache.lookup, cache_url) if cache is not None else None
+    request_headers = {**headers, **HTTPCache.conditional_headers(entry)}
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with controller.slot_async():
+                await controller.limiter.acquire_async()
+                started = time.monotonic()
+                try:
+                    async with session.get(url, params=params, headers=request_headers) as response:
+                        status = response.status
+                        raw, content_hash = await _read_cached_response(response, cache, cache_url, entry)
+                    if status == 304 and raw is None:
+                        # 캐시 본문이 그 사이 정리된 304: 검증자 없이 한 번 다시 요청
+                        logger.debug(f"캐시 본문 없는 304, 검증자 없이 재요청: {url} {params}")
+                        entry = None
+                        request_headers = headers
+                        await controller.limiter.acquire_async()
+                        async with session.get(url, params=params, headers=request_headers) as response:
+                            status = response.status
+                            raw, content_hash = await _read_cached_response(response, cache, cache_url, entry)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    controller.record(None, time.monotonic() - started)
+                    raise
+                controller.record(status, time.monotonic() - started)
+                if raw is not None:
+                    if cache is not None:
+                        return 200, cache.decode(cache_url, raw, content_hash, decode)
+                    return 200, decode(raw)
+
+            if status not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                return status, None
+            logger.debug(f"재시도 대상 응답: {url} {params}, status={status} (시도 {attempt + 1})")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            if attempt == MAX_RETRIES:
+                logger.debug(f"요청 실패: {url} {params}, 오류: {e}")
+                return None, None
+            logger.debug(f"요청 오류, 재시도: {url} {params}, 오류: {e} (시도 {attempt + 1})")
+
+        await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+
+    return None, None
+
+
+async def extract_webtoon_detail_async(
+    session: aiohttp.ClientSession,
+    controller: AdaptiveRateController,
+    webtoon_id: str,
+    use_html_fallback: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    웹툰 상세 정보를 비동기로 수집합니다. (extract_webtoon_detail의 비동기 버전)
+
+    Args:
+        session: aiohttp ClientSession
+        controller: 공용 적응형 제어기 (동시 요청 수 + 토큰 버킷)
+        webtoon_id: 웹툰 ID
+        use_html_fallback: API 실패 시 HTML 파싱 시도 여부
+
+    Returns:
+        웹툰 상세 정보 딕셔너리, 실패 시 None
+    """
+    result = new_detail_result(webtoon_id)
+    api_headers = build_api_headers(webtoon_id)
+
+    # 1. API 호출 시도 (이전과 같은 응답이면 이전 파싱 결과 재사용)
+    status, parsed = await _request(
+        session, controller,
+        WEBTOON_DETAIL_API_URL, {'titleId': webtoon_id}, api_headers,
+        decode=_decode_detail,
+    )
+
+    if parsed:
+        result.update(parsed)
+
+        # 에피소드 수는 별도 API 호출
+        _, total_episode_count = await _request(
+            session, controller,
+            WEBTOON_EPISODE_API_URL, {'titleId': webtoon_id, 'page': 1}, api_headers,
+            decode=_decode_episode_count,
+        )
+        if total_episode_count is not None:
+            result['total_episode_count'] = total_episode_count
+
+        logger.debug(f"웹툰 상세 정보 수집 성공 (API): webtoon_id={webtoon_id}, favorite_count={result['favorite_count']}")
+        return result
+
+    logger.warning(f"API 응답 실패: webtoon_id={webtoon_id}, status={status}")
+
+    # 2. HTML 파싱 시도 (API 실패 시)
+    if use_html_fallback:
+        _, favorite_count = await _request(
+            session, controller,
+            WEBTOON_DETAIL_PAGE_URL, {'titleId': webtoon_id}, build_html_headers(),
+            decode=_decode_favorite_count,
+        )
+        if favorite_count is not None:
+            result['favorite_count'] = favorite_count
+            result['favorite_count_source'] = 'html'
+            logger.info(f"웹툰 상세 정보 수집 성공 (HTML): webtoon_id={webtoon_id}, favorite_count={favorite_count}")
+            return result
+
+    logger.warning(f"웹툰 상세 정보 수집 실패: webtoon_id={webtoon_id}")
+    return None
+
+
+async def collect_webtoon_details_async(
+    webtoon_ids: List[str],
+    use_html_fallback: bool = True,
+    max_concurrency: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> List[Dict[str, Any]]:
+    """
+    여러 웹툰의 상세 정보를 동시에 수집합니다.
+
+    Args:
+        webtoon_ids: 수집할 웹툰 ID 리스트
+        use_html_fallback: API 실패 시 HTML 파싱 시도 여부
+        max_concurrency: 동시 요청 수 상한 (None이면 제어기 설정 유지, 실제 값은 응답 상태에 따라 조정됨)
+        requests_per_second: 초당 요청 수 예산 (지정 시 공용 토큰 버킷의 속도를 변경, None이면 유지)
+        session: 사용할 aiohttp 세션 (None이면 이번 호출용 세션을 만들고 끝나면 닫음)
+
+    Returns:
+        수집에 성공한 상세 정보 리스트 (입력 순서 유지)
+    """
+    if not webtoon_ids:
+        return []
+
+    configure_naver_rate_limiter(rate=requests_per_second)
+    controller = get_naver_rate_controller()
+    controller.configure(max_concurrency=max_concurrency, max_rate=requests_per_second)
+
+    owns_session = session is None
+    if owns_session:
+        session = _create_client_session()
+
+    total = len(webtoon_ids)
+    completed = 0
+
+    async def run_one(webtoon_id: str) -> Optional[Dict[str, Any]]:
+        nonlocal completed
+        try:
+            return await extract_webtoon_detail_async(
+                session, controller, webtoon_id, use_html_fallback=use_html_fallback
+            )
+        except Exception as e:
+            logger.error(f"웹툰 상세 정보 수집 실패 (webtoon_id={webtoon_id}): {e}")
+            return None
+        finally:
+            completed += 1
+            if completed % 10 == 0 or completed == total:
+                logger.info(f"[{completed}/{total}] 웹툰 상세 정보 수집 진행 중...")
+
+    try:
+        results = await asyncio.gather(*(run_one(str(webtoon_id)) for webtoon_id in webtoon_ids))
+    finally:
+        if owns_session:
+            await session.close()
+
+    detail_data_list = [result for result in results if result]
+    metrics = controller.get_metrics()
+    logger.info(f"웹툰 상세 정보 비동기 수집 완료: {len(detail_data_list)}/{total}개 성공 (동시 요청 {metrics['concurrency_limit']}, 초당 {metrics['rate']}건, 감속 {metrics['throttle_events']})")
+    return detail_data_list
+
+
+def collect_webtoon_details(
+    webtoon_ids: List[str],
+    use_html_fallback: bool = True,
+    max_concurrency: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    동기 코드(run_pipeline, Cloud Functions)에서 호출하는 진입점입니다.
+    collect_webtoon_details_async를 공용 이벤트 루프에서 공용 aiohttp 세션으로 실행합니다.
+    (여러 스레드에서 동시에 호출해도 같은 루프와 연결 풀을 사용)
+
+    Args:
+        webtoon_ids: 수집할 웹툰 ID 리스트
+        use_html_fallback: API 실패 시 HTML 파싱 시도 여부
+        max_concurrency: 동시 요청 수 상한
+        requests_per_second: 초당 요청 수 예산 (지정 시 공용 토큰 버킷의 속도를 변경)
+
+    Returns:
+        수집에 성공한 상세 정보 리스트
+    """
+    async def run() -> List[Dict[str, Any]]:
+        return await collect_webtoon_details_async(
+            webtoon_ids,
+            use_html_fallback=use_html_fallback,
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second,
+            session=await _get_shared_session(),
+        )
+
+    return asyncio.run_coroutine_threadsafe(run(), _get_event_loop()).result()
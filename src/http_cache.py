@@ -0,0 +1,445 @@
+"""
+HTTP Cache 모듈: ETag/Last-Modified 재검증을 지원하는 디스크 응답 캐시
+
+매 실행마다 titlelist/weekday(정렬 2종)와 모든 /api/article/list/info 응답을
+다시 내려받는 대신, 이전 응답 본문과 검증자(ETag, Last-Modified)를 디스크에 저장해두고
+조건부 요청(If-None-Match, If-Modified-Since)을 보냅니다.
+- 304 Not Modified: 저장된 본문을 그대로 사용 (본문 전송 없음)
+- 검증자가 없는 응답: 본문 해시(SHA-256)를 비교하여 변경 여부 판단
+- 캐시 크기 제한: 최근에 사용하지 않은 항목부터 삭제 (LRU)
+- 변경되지 않은 본문은 디코딩/파싱 결과도 재사용 (프로세스 메모리, 본문 해시로 확인)
+- 엔드포인트(URL 경로)별 hit/miss 카운터 제공
+
+requests는 CachingHTTPAdapter(create_session에서 mount), aiohttp 수집기는
+HTTPCache의 lookup/conditional_headers/store를 직접 사용합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+# 캐시 설정 (환경 변수로 조정 가능)
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+HTTP_CACHE_MAX_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))  # 기본 200MB
+HTTP_CACHE_MAX_DECODED = int(os.getenv('HTTP_CACHE_MAX_DECODED', '10000'))  # 메모리에 둘 디코딩 결과 수
+
+
+@dataclass
+class CacheEntry:
+    """캐시에 저장된 응답 하나의 메타데이터"""
+    key: str
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    content_type: Optional[str]
+    size: int
+    stored_at: float
+
+
+def normalize_url(url: str) -> str:
+    """
+    캐시 키용 URL 정규화: 쿼리 파라미터를 정렬합니다.
+    (같은 params를 다른 순서로 넘겨도 같은 캐시 항목을 사용)
+
+    Args:
+        url: 요청 URL (쿼리 문자열 포함)
+
+    Returns:
+        정규화된 URL
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+
+
+class HTTPCache:
+    """
+    디스크 기반 HTTP 응답 캐시.
+
+    항목마다 <key>.json(메타데이터)과 <key>.body(응답 본문) 두 파일로 저장합니다.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = HTTP_CACHE_MAX_BYTES, max_decoded: int = HTTP_CACHE_MAX_DECODED):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_decoded = max_decoded
+        # 캐시 키 → (본문 해시, 디코딩 결과) (오래 사용하지 않은 항목부터 삭제)
+        self._decoded: 'OrderedDict[str, Tuple[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._total_bytes = self._scan_total_bytes()
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(url: str, method: str = 'GET') -> str:
+        """URL(+메서드)로 캐시 키를 만듭니다."""
+        return hashlib.sha256(f"{method.upper()} {normalize_url(url)}".encode('utf-8')).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _scan_total_bytes(self) -> int:
+        """저장된 본문 크기의 합 (메타데이터 파일은 제외)"""
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.body'):
+                total += entry.stat().st_size
+        return total
+
+    def _count(self, url: str, event: str) -> None:
+        """엔드포인트(URL 경로)별 카운터를 올립니다."""
+        endpoint = urlsplit(url).path or '/'
+        with self._lock:
+            counters = self._stats.setdefault(endpoint, {'hit': 0, 'unchanged': 0, 'miss': 0, 'decode_reused': 0})
+            counters[event] += 1
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """
+        저장된 캐시 항목을 조회합니다.
+
+        Args:
+            url: 요청 URL (쿼리 문자열 포함)
+
+        Returns:
+            CacheEntry 객체 (없거나 손상된 경우 None)
+        """
+        key = self.make_key(url)
+        meta_path = self._meta_path(key)
+        if not meta_path.exists() or not self._body_path(key).exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            return CacheEntry(key=key, **meta)
+        except Exception as e:
+            logger.debug(f"캐시 메타데이터 읽기 실패: {url}, 오류: {e}")
+            return None
+
+    def read_body(self, entry: CacheEntry) -> Optional[bytes]:
+        """
+        캐시 항목의 본문을 읽고 최근 사용 시각을 갱신합니다.
+
+        Args:
+            entry: CacheEntry 객체
+
+        Returns:
+            응답 본문 (읽기 실패 시 None)
+        """
+        body_path = self._body_path(entry.key)
+        try:
+            body = body_path.read_bytes()
+            os.utime(body_path, None)  # LRU 기준 시각 갱신
+            return body
+        except Exception as e:
+            logger.debug(f"캐시 본문 읽기 실패: {entry.url}, 오류: {e}")
+            return None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """
+        캐시 항목의 검증자로 조건부 요청 헤더를 만듭니다.
+
+        Args:
+            entry: CacheEntry 객체 (None이면 빈 딕셔너리)
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더 딕셔너리
+        """
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def record_not_modified(self, url: str) -> None:
+        """304 응답(재검증 성공)을 기록합니다."""
+        self._count(url, 'hit')
+
+    def store(self, url: str, body: bytes, headers: Dict[str, Any]) -> bool:
+        """
+        200 응답을 저장하고, 이전 본문과 같은지 여부를 반환합니다. (store_entry 참고)
+
+        Args:
+            url: 요청 URL (쿼리 문자열 포함)
+            body: 응답 본문 (디코딩된 bytes)
+            headers: 응답 헤더
+
+        Returns:
+            이전에 저장된 본문과 같으면 True, 새로 저장했으면 False
+        """
+        return self.store_entry(url, body, headers)[0]
+
+    def store_entry(self, url: str, body: bytes, headers: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        200 응답을 저장하고, 이전 본문과 같은지 여부와 본문 해시를 반환합니다.
+
+        검증자가 없는 응답도 본문 해시를 비교하여 변경되지 않았으면
+        'unchanged'로 집계하고 파일을 다시 쓰지 않습니다.
+
+        Args:
+            url: 요청 URL (쿼리 문자열 포함)
+            body: 응답 본문 (디코딩된 bytes)
+            headers: 응답 헤더
+
+        Returns:
+            (이전에 저장된 본문과 같은지 여부, 본문 해시) 튜플
+        """
+        key = self.make_key(url)
+        content_hash = hashlib.sha256(body).hexdigest()
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        previous = self.lookup(url)
+        if previous is not None and previous.content_hash == content_hash:
+            self._count(url, 'unchanged')
+            # 검증자만 바뀐 경우 메타데이터 갱신
+            if previous.etag != etag or previous.last_modified != last_modified:
+                previous.etag = etag
+                previous.last_modified = last_modified
+                self._write_meta(previous)
+            os.utime(self._body_path(key), None)
+            return True, content_hash
+
+        self._count(url, 'miss')
+        entry = CacheEntry(
+            key=key,
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            content_hash=content_hash,
+            content_type=headers.get('Content-Type'),
+            size=len(body),
+            stored_at=time.time(),
+        )
+        try:
+            old_size = previous.size if previous is not None else 0
+            self._write_atomic(self._body_path(key), body)
+            self._write_meta(entry)
+            with self._lock:
+                self._total_bytes += len(body) - old_size
+            self._evict_if_needed()
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 실패: {url}, 오류: {e}")
+        return False, content_hash
+
+    def decode(self, url: str, body: bytes, content_hash: Optional[str], decode: Callable[[bytes], Any]) -> Any:
+        """
+        응답 본문을 디코딩합니다. 이 프로세스에서 같은 URL의 같은 본문(content_hash)을
+        디코딩한 적이 있으면 decode를 다시 실행하지 않고 이전 결과를 반환합니다.
+        (304/본문 해시 동일 응답의 JSON 파싱 생략, 결과는 공유되므로 호출하는 쪽에서 수정하지 않음)
+
+        Args:
+            url: 요청 URL (쿼리 문자열 포함)
+            body: 응답 본문
+            content_hash: 본문 해시 (None이면 항상 디코딩)
+            decode: 본문을 디코딩/파싱하는 함수
+
+        Returns:
+            decode(body) 결과
+        """
+        if content_hash is None or self.max_decoded <= 0:
+            return decode(body)
+        key = self.make_key(url)
+        with self._lock:
+            cached = self._decoded.get(key)
+            if cached is not None and cached[0] == content_hash:
+                self._decoded.move_to_end(key)
+                value = cached[1]
+            else:
+                cached = None
+        if cached is not None:
+            self._count(url, 'decode_reused')
+            return value
+
+        value = decode(body)
+        with self._lock:
+            self._decoded[key] = (content_hash, value)
+            self._decoded.move_to_end(key)
+            while len(self._decoded) > self.max_decoded:
+                self._decoded.popitem(last=False)
+        return value
+
+    def _write_meta(self, entry: CacheEntry) -> None:
+        meta = {
+            'url': entry.url,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+            'content_hash': entry.content_hash,
+            'content_type': entry.content_type,
+            'size': entry.size,
+            'stored_at': entry.stored_at,
+        }
+        self._write_atomic(self._meta_path(entry.key), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def _evict_if_needed(self) -> None:
+        """캐시 크기가 max_bytes를 넘으면 오래 사용하지 않은 항목부터 삭제합니다."""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            bodies = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.body'):
+                    stat = entry.stat()
+                    bodies.append((stat.st_mtime, stat.st_size, entry.name[:-len('.body')]))
+            bodies.sort()
+
+            removed = 0
+            for _, size, key in bodies:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                for path in (self._body_path(key), self._meta_path(key)):
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+                self._total_bytes -= size
+                removed += 1
+
+            if removed:
+                logger.info(f"응답 캐시 정리: {removed}개 항목 삭제 (현재 {self._total_bytes:,} bytes)")
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        엔드포인트별 캐시 통계를 반환합니다.
+
+        Returns:
+            {endpoint: {'hit': 304 재검증 수, 'unchanged': 본문 해시 동일 수, 'miss': 새로 저장한 수,
+                        'decode_reused': 디코딩/파싱 결과를 재사용한 수}}
+        """
+        with self._lock:
+            return {endpoint: dict(counters) for endpoint, counters in self._stats.items()}
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    GET 요청에 조건부 헤더를 붙이고 304 응답을 캐시된 본문으로 바꿔주는 HTTPAdapter.
+
+    반환되는 Response에는 다음 속성이 추가됩니다.
+    - from_cache: 304 재검증으로 캐시 본문을 사용했으면 True
+    - unchanged: 이전 실행과 본문이 같으면 True (304 또는 본문 해시 동일)
+    - content_hash: 본문 해시 (decode_response가 디코딩 결과 재사용 여부 확인에 사용, 캐시하지 않은 응답은 None)
+    """
+
+    def __init__(self, cache: 'HTTPCache', *args, **kwargs):
+        self.cache = cache
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        entry = self.cache.lookup(request.url)
+        validators = self.cache.conditional_headers(entry)
+        request.headers.update(validators)
+
+        response = super().send(request, **kwargs)
+
+        body = None
+        if response.status_code == 304 and entry is not None:
+            body = self.cache.read_body(entry)
+        if response.status_code == 304 and body is None and validators:
+            # 캐시 본문이 그 사이 정리된 304: 검증자 없이 한 번 다시 요청
+            logger.debug(f"캐시 본문 없는 304, 검증자 없이 재요청: {request.url}")
+            response.close()
+            for header in validators:
+                request.headers.pop(header, None)
+            response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and body is not None:
+            self.cache.record_not_modified(request.url)
+            response.status_code = 200
+            response.reason = 'OK (cached)'
+            response._content = body
+            response._content_consumed = True
+            response.headers.pop('Content-Encoding', None)
+            response.headers['Content-Length'] = str(len(body))
+            if entry.content_type:
+                response.headers['Content-Type'] = entry.content_type
+            response.from_cache = True
+            response.unchanged = True
+            response.content_hash = entry.content_hash
+            return response
+
+        response.from_cache = False
+        response.unchanged = False
+        response.content_hash = None
+        if response.status_code == 200 and not kwargs.get('stream'):
+            response.unchanged, response.content_hash = self.cache.store_entry(request.url, response.content, response.headers)
+        return response
+
+
+def decode_response(response: requests.Response, decode: Callable[[bytes], Any]) -> Any:
+    """
+    requests 응답 본문을 디코딩합니다. CachingHTTPAdapter를 거친 응답이면
+    같은 본문의 이전 디코딩 결과를 재사용합니다. (HTTPCache.decode 참고)
+
+    Args:
+        response: requests Response 객체
+        decode: 본문을 디코딩/파싱하는 함수 (예: json_codec.loads)
+
+    Returns:
+        decode(response.content) 결과
+    """
+    cache = get_http_cache()
+    content_hash = getattr(response, 'content_hash', None)
+    if cache is None or content_hash is None:
+        return decode(response.content)
+    return cache.decode(response.request.url, response.content, content_hash, decode)
+
+
+_http_cache: Optional[HTTPCache] = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """
+    프로세스 공용 HTTP 캐시를 반환합니다. HTTP_CACHE_ENABLED=false이면 None.
+    캐시 디렉토리: {DATA_DIR}/cache/http (처음 호출할 때 고정되므로 DATA_DIR은 첫 요청 전에 설정)
+
+    Returns:
+        HTTPCache 객체 또는 None
+    """
+    global _http_cache
+    if not HTTP_CACHE_ENABLED:
+        return None
+    if _http_cache is None:
+        with _http_cache_lock:
+            if _http_cache is None:
+                _http_cache = HTTPCache(get_data_dir() / 'cache' / 'http')
+    return _http_cache
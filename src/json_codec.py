@@ -0,0 +1,157 @@
+"""
+JSON Codec 모듈: JSON 인코딩/디코딩 공용 경로
+
+JSONL 로더/저장, BigQuery 업로드용 JSONL 읽기, 원본(raw) 응답 저장에서 사용합니다.
+- orjson 또는 msgspec이 설치되어 있으면 사용하고, 없으면 표준 json으로 동작
+- date / datetime / pd.Timestamp / numpy 값을 직렬화 (serialize_for_json 불필요)
+- 한글은 이스케이프하지 않고 UTF-8 그대로 저장 (ensure_ascii=False와 동일)
+
+JSON_CODEC 환경 변수로 고정할 수 있습니다: auto (기본값), orjson, msgspec, json
+주의: orjson/msgspec은 공백 없는 형식({"a":1})으로 출력합니다. JSON 값은 같습니다.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 사용할 JSON 라이브러리 (auto면 orjson -> msgspec -> json 순서로 사용 가능한 것)
+JSON_CODEC = os.getenv('JSON_CODEC', 'auto').lower()
+
+# 디코딩 실패 시 발생하는 예외 (json / orjson / msgspec 모두 ValueError의 하위 클래스)
+JSONDecodeError = ValueError
+
+
+def _default(obj: Any) -> Any:
+    """라이브러리가 기본으로 처리하지 못하는 값을 JSON 값으로 변환합니다."""
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, (datetime, date)):
+        # pd.Timestamp도 datetime의 하위 클래스
+        return obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Mapping):
+        # models.TableRecord 등 dict가 아닌 Mapping
+        return dict(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def load_codec(name: str):
+    """
+    JSON 라이브러리를 골라 인코딩/디코딩 함수를 만듭니다.
+    요청한 라이브러리가 없으면 다음 순서(orjson -> msgspec -> json)로 대체합니다.
+
+    Args:
+        name: 'auto', 'orjson', 'msgspec' 또는 'json'
+
+    Returns:
+        (실제 라이브러리 이름, dumps, dumps_indent, loads) 튜플 (dumps 계열은 bytes 반환)
+    """
+    if name in ('auto', 'orjson'):
+        try:
+            import orjson
+
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            return (
+                'orjson',
+                lambda obj: orjson.dumps(obj, default=_default, option=option),
+                lambda obj: orjson.dumps(obj, default=_default, option=option | orjson.OPT_INDENT_2),
+                orjson.loads,
+            )
+        except ImportError:
+            if name == 'orjson':
+                logger.warning("orjson이 설치되어 있지 않아 다른 JSON 라이브러리를 사용합니다.")
+
+    if name in ('auto', 'orjson', 'msgspec'):
+        try:
+            import msgspec
+
+            encoder = msgspec.json.Encoder(enc_hook=_default)
+            return (
+                'msgspec',
+                encoder.encode,
+                lambda obj: msgspec.json.format(encoder.encode(obj), indent=2),
+                msgspec.json.decode,
+            )
+        except ImportError:
+            if name == 'msgspec':
+                logger.warning("msgspec이 설치되어 있지 않아 표준 json을 사용합니다.")
+
+    if name not in ('auto', 'orjson', 'msgspec', 'json'):
+        logger.warning(f"알 수 없는 JSON_CODEC={name}, 표준 json을 사용합니다.")
+
+    encoder = json.JSONEncoder(ensure_ascii=False, default=_default)
+    indent_encoder = json.JSONEncoder(ensure_ascii=False, default=_default, indent=2)
+    return (
+        'json',
+        lambda obj: encoder.encode(obj).encode('utf-8'),
+        lambda obj: indent_encoder.encode(obj).encode('utf-8'),
+        json.loads,
+    )
+
+
+CODEC_NAME, _dumps_bytes, _dumps_indent_bytes, _loads = load_codec(JSON_CODEC)
+
+
+def get_codec_name() -> str:
+    """
+    실제로 사용 중인 JSON 라이브러리 이름을 반환합니다.
+
+    Returns:
+        'orjson', 'msgspec' 또는 'json'
+    """
+    return CODEC_NAME
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    객체를 UTF-8 JSON bytes로 인코딩합니다.
+
+    Args:
+        obj: 인코딩할 객체
+        indent: True면 2칸 들여쓰기
+
+    Returns:
+        JSON bytes
+    """
+    if indent:
+        return _dumps_indent_bytes(obj)
+    return _dumps_bytes(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    객체를 JSON 문자열로 인코딩합니다.
+
+    Args:
+        obj: 인코딩할 객체
+        indent: True면 2칸 들여쓰기
+
+    Returns:
+        JSON 문자열
+    """
+    return dumps_bytes(obj, indent=indent).decode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    JSON 문자열 또는 bytes를 디코딩합니다.
+
+    Args:
+        data: JSON 문자열/bytes
+
+    Returns:
+        디코딩된 객체 (실패 시 JSONDecodeError(ValueError) 발생)
+    """
+    return _loads(data)
+
@@ -0,0 +1,161 @@
+"""
+JSONL Writer 모듈: DataFrame을 JSONL로 저장하는 공용 직렬화 경로
+
+dim_webtoon / fact_weekly_chart / fact_webtoon_stats JSONL 저장에서 함께 사용합니다.
+- 행마다 iterrows / to_dict / pd.isna를 부르지 않고 컬럼 단위로 변환
+  (timestamp -> ISO 문자열, NaN/NaT -> null, 스키마상 정수 컬럼의 float -> int)
+- tags 같은 list 값은 그대로 JSON 배열로 저장
+- JSONL_WRITE_CHUNK_ROWS 행씩 모아 한 번에 파일에 씀
+- 한 줄 인코딩은 공용 JSON codec (src/json_codec.py, orjson 등이 있으면 사용)
+"""
+
+import logging
+import os
+import typing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.json_codec import dumps_bytes
+from src.models import TABLE_SCHEMAS
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 파일에 쓰는 행 수
+JSONL_WRITE_CHUNK_ROWS = int(os.getenv('JSONL_WRITE_CHUNK_ROWS', '10000'))
+
+
+def _integer_columns(table_name: Optional[str]) -> List[str]:
+    """models.py 스키마에서 int (또는 Optional[int]) 컬럼 목록을 구합니다."""
+    if table_name is None:
+        return []
+    schema, _ = TABLE_SCHEMAS[table_name]
+    columns = []
+    for column, python_type in schema.items():
+        if typing.get_origin(python_type) is typing.Union:
+            python_type = next(arg for arg in typing.get_args(python_type) if arg is not type(None))
+        if python_type is int:
+            columns.append(column)
+    return columns
+
+
+def _format_datetime_column(series: pd.Series) -> List[Optional[str]]:
+    """datetime64 컬럼을 Timestamp.isoformat()과 같은 문자열 리스트로 변환합니다."""
+    if series.dt.tz is not None:
+        # timezone이 있는 컬럼은 드물어 isoformat으로 처리 (+09:00 형식 유지)
+        return [None if pd.isna(value) else value.isoformat() for value in series]
+
+    values = series.to_numpy(dtype='datetime64[us]')
+    formatted = pd.Series(np.datetime_as_string(values, unit='us'), index=series.index)
+    # 마이크로초가 0이면 isoformat처럼 초 단위까지만
+    whole_seconds = (series.dt.microsecond == 0).to_numpy()
+    formatted = formatted.where(~whole_seconds, formatted.str.slice(0, 19))
+    return formatted.where(series.notna().to_numpy(), None).tolist()
+
+
+def _convert_object_value(value):
+    """object 컬럼의 값 하나를 JSON 값으로 변환합니다 (날짜/배열이 섞인 컬럼에만 사용)."""
+    if isinstance(value, (list, dict, str)):
+        return value
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def to_json_columns(df: pd.DataFrame, table_name: Optional[str] = None) -> Dict[str, list]:
+    """
+    DataFrame을 컬럼별 JSON 값 리스트로 변환합니다 (행 단위 반복 없이 컬럼 단위로).
+
+    Args:
+        df: 변환할 DataFrame
+        table_name: 테이블 이름 (지정하면 스키마상 정수 컬럼의 float 값을 int로 저장)
+
+    Returns:
+        {컬럼명: JSON으로 바로 쓸 수 있는 파이썬 값 리스트}
+    """
+    integer_columns = set(_integer_columns(table_name))
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            columns[column] = _format_datetime_column(series)
+            continue
+
+        if column in integer_columns and pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            # 1.0 -> 1, NaN -> null (BigQuery INTEGER)
+            series = series.round().astype('Int64')
+        elif column in integer_columns and series.dtype == object:
+            series = pd.to_numeric(series, errors='coerce').round().astype('Int64')
+
+        mask = series.notna().to_numpy()
+        values = series.astype(object)
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'integer', 'floating', 'boolean', 'empty'):
+            # 날짜 객체, list/ndarray, numpy 스칼라가 섞인 컬럼
+            values = values.map(_convert_object_value)
+        columns[column] = values.where(mask, None).tolist()
+    return columns
+
+
+def iter_jsonl_chunks(
+    df: pd.DataFrame,
+    table_name: Optional[str] = None,
+    chunk_rows: int = JSONL_WRITE_CHUNK_ROWS
+) -> Iterator[bytes]:
+    """
+    DataFrame을 JSONL 문자열 덩어리로 나누어 반환합니다 (덩어리마다 chunk_rows 행).
+
+    Args:
+        df: 변환할 DataFrame
+        table_name: 테이블 이름 (to_json_columns 참고)
+        chunk_rows: 덩어리당 행 수
+
+    Yields:
+        줄바꿈으로 끝나는 UTF-8 JSONL bytes
+    """
+    if len(df) == 0:
+        return
+    columns = to_json_columns(df, table_name)
+    names = list(columns)
+    rows = zip(*columns.values())
+    dumps = dumps_bytes
+
+    lines = []
+    for values in rows:
+        lines.append(dumps(dict(zip(names, values))))
+        if len(lines) >= chunk_rows:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def write_jsonl(
+    file_path: Path,
+    df: pd.DataFrame,
+    table_name: Optional[str] = None,
+    mode: str = 'w'
+) -> int:
+    """
+    DataFrame을 JSONL 파일로 씁니다.
+
+    Args:
+        file_path: 저장할 파일 경로
+        df: 저장할 DataFrame (컬럼 순서 그대로 저장)
+        table_name: 테이블 이름 (to_json_columns 참고)
+        mode: 'w' (덮어쓰기) 또는 'a' (파일 끝에 추가)
+
+    Returns:
+        쓴 레코드 수
+    """
+    with open(file_path, mode + 'b') as f:
+        for chunk in iter_jsonl_chunks(df, table_name):
+            f.write(chunk)
+    return len(df)
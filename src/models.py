@@ -7,17 +7,138 @@
 - fact_webtoon_stats: 웹툰 상세 정보 히스토리 테이블 스키마
 """
 
+from collections.abc import Mapping
 from datetime import date, datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence
 import logging
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# 레코드 공통
+# ============================================================================
+
+class TableRecord(Mapping):
+    """
+    테이블 레코드 공통 클래스 (__slots__ 기반, 생성 시 검증).
+    
+    딕셔너리보다 메모리를 적게 쓰고, 읽기 전용 Mapping이라 기존 코드의
+    record['webtoon_id'], record.get(...), dict(record)를 그대로 사용할 수 있습니다.
+    DataFrame 변환은 records_to_dataframe()으로 (딕셔너리를 거치지 않음).
+    """
+    
+    __slots__ = ()
+    COLUMNS: Sequence[str] = ()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.COLUMNS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.COLUMNS)
+    
+    def __len__(self) -> int:
+        return len(self.COLUMNS)
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{column}={getattr(self, column)!r}" for column in self.COLUMNS)
+        return f"{type(self).__name__}({fields})"
+    
+    def as_tuple(self) -> tuple:
+        """컬럼 순서대로 값 튜플을 반환합니다."""
+        return tuple(getattr(self, column) for column in self.COLUMNS)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환합니다."""
+        return {column: getattr(self, column) for column in self.COLUMNS}
+
+
+def _check_date_parts(table_name: str, year: int, month: int, week: int) -> None:
+    """year, month, week 범위를 검증합니다."""
+    if year < 2000 or year > 2100:
+        raise ValueError(f"{table_name}: year는 2000-2100 사이의 정수여야 합니다 (현재: {year})")
+    if month < 1 or month > 12:
+        raise ValueError(f"{table_name}: month는 1-12 사이의 정수여야 합니다 (현재: {month})")
+    if week < 1 or week > 6:
+        raise ValueError(f"{table_name}: week는 1-6 사이의 정수여야 합니다 (현재: {week})")
+
+
+def _week_of_month(value: datetime) -> int:
+    """해당 월의 몇 번째 주인지 계산합니다 (1일~7일 = 1주차, 8일~14일 = 2주차, ...)."""
+    return ((value.day - 1) // 7) + 1
+
+
+def records_to_dataframe(records: List[Any], columns: Sequence[str]) -> pd.DataFrame:
+    """
+    레코드 리스트를 DataFrame으로 변환합니다.
+    TableRecord는 딕셔너리를 만들지 않고 값 튜플로 바로 변환하고, 딕셔너리도 그대로 받습니다.
+    
+    Args:
+        records: TableRecord 또는 딕셔너리 리스트
+        columns: 컬럼 순서
+    
+    Returns:
+        DataFrame
+    """
+    if len(records) == 0:
+        return pd.DataFrame(columns=list(columns))
+    if all(isinstance(record, TableRecord) for record in records):
+        return pd.DataFrame.from_records([record.as_tuple() for record in records], columns=list(columns))
+    return pd.DataFrame([dict(record) for record in records])
+
+
 # ============================================================================
 # dim_webtoon (마스터 테이블) 스키마
 # ============================================================================
 
+class DimWebtoonRecord(TableRecord):
+    """dim_webtoon 레코드 (생성 시 필수 필드 검증)"""
+    
+    __slots__ = ('webtoon_id', 'title', 'author', 'genre', 'tags', 'created_at', 'updated_at')
+    COLUMNS = __slots__
+    
+    def __init__(
+        self,
+        webtoon_id: str,
+        title: str,
+        author: Optional[str] = None,
+        genre: Optional[str] = None,
+        tags: Optional[list] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ):
+        if not webtoon_id:
+            raise ValueError("webtoon_id는 필수 필드입니다.")
+        if not title:
+            raise ValueError("title은 필수 필드입니다.")
+        
+        now = datetime.now()
+        
+        # tags는 리스트로 저장 (BigQuery에서는 REPEATED STRING으로 사용)
+        # CSV 저장 시에는 transform.py에서 파이프로 구분된 문자열로 변환
+        tags_list = None
+        if tags:
+            if isinstance(tags, list):
+                tags_list = [str(tag) for tag in tags if tag]  # 빈 문자열 제거
+            elif isinstance(tags, str):
+                # 이미 문자열인 경우 (CSV에서 로드한 경우) 리스트로 변환
+                tags_list = [t.strip() for t in tags.split('|') if t.strip()]
+            else:
+                tags_list = [str(tags)]
+        
+        self.webtoon_id = str(webtoon_id)
+        self.title = str(title)
+        self.author = str(author) if author else None
+        self.genre = str(genre) if genre else None
+        self.tags = tags_list
+        self.created_at = created_at if created_at else now
+        self.updated_at = updated_at if updated_at else now
+
+
 def create_dim_webtoon_record(
     webtoon_id: str,
     title: str,
@@ -26,7 +147,7 @@ def create_dim_webtoon_record(
     tags: Optional[list] = None,
     created_at: Optional[datetime] = None,
     updated_at: Optional[datetime] = None
-) -> Dict[str, Any]:
+) -> DimWebtoonRecord:
     """
     dim_webtoon 레코드를 생성합니다.
     
@@ -40,39 +161,20 @@ def create_dim_webtoon_record(
         updated_at: 레코드 수정 시각 (선택, 없으면 현재 시각)
     
     Returns:
-        dim_webtoon 레코드 딕셔너리
+        dim_webtoon 레코드 (DimWebtoonRecord, 딕셔너리처럼 읽기 가능)
     
     Raises:
         ValueError: 필수 필드가 누락된 경우
     """
-    if not webtoon_id:
-        raise ValueError("webtoon_id는 필수 필드입니다.")
-    if not title:
-        raise ValueError("title은 필수 필드입니다.")
-    
-    now = datetime.now()
-    
-    # tags는 리스트로 저장 (BigQuery에서는 REPEATED STRING으로 사용)
-    # CSV 저장 시에는 transform.py에서 파이프로 구분된 문자열로 변환
-    tags_list = None
-    if tags:
-        if isinstance(tags, list):
-            tags_list = [str(tag) for tag in tags if tag]  # 빈 문자열 제거
-        elif isinstance(tags, str):
-            # 이미 문자열인 경우 (CSV에서 로드한 경우) 리스트로 변환
-            tags_list = [t.strip() for t in tags.split('|') if t.strip()]
-        else:
-            tags_list = [str(tags)]
-    
-    return {
-        'webtoon_id': str(webtoon_id),
-        'title': str(title),
-        'author': str(author) if author else None,
-        'genre': str(genre) if genre else None,
-        'tags': tags_list,  # 리스트로 저장 (BigQuery REPEATED STRING용), CSV 저장 시 변환
-        'created_at': created_at if created_at else now,
-        'updated_at': updated_at if updated_at else now
-    }
+    return DimWebtoonRecord(
+        webtoon_id=webtoon_id,
+        title=title,
+        author=author,
+        genre=genre,
+        tags=tags,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
 
 
 def validate_dim_webtoon_record(record: Dict[str, Any]) -> bool:
@@ -104,6 +206,49 @@ def validate_dim_webtoon_record(record: Dict[str, Any]) -> bool:
 # fact_weekly_chart (히스토리 테이블) 스키마
 # ============================================================================
 
+class FactWeeklyChartRecord(TableRecord):
+    """fact_weekly_chart 레코드 (생성 시 필수 필드, rank, year/month/week 범위 검증)"""
+    
+    __slots__ = ('chart_date', 'webtoon_id', 'rank', 'collected_at', 'weekday', 'year', 'month', 'week', 'view_count')
+    COLUMNS = __slots__
+    
+    def __init__(
+        self,
+        chart_date: date,
+        webtoon_id: str,
+        rank: int,
+        collected_at: Optional[datetime] = None,
+        weekday: Optional[str] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        week: Optional[int] = None,
+        view_count: Optional[int] = None
+    ):
+        if not chart_date:
+            raise ValueError("chart_date는 필수 필드입니다.")
+        if not isinstance(chart_date, (date, str)):
+            raise ValueError("chart_date는 date 타입이어야 합니다.")
+        if not webtoon_id:
+            raise ValueError("webtoon_id는 필수 필드입니다.")
+        if not isinstance(rank, int) or rank < 1:
+            raise ValueError("rank는 1 이상의 정수여야 합니다.")
+        
+        now = collected_at if collected_at else datetime.now()
+        
+        # collected_at에서 year, month, week 추출 (없으면 현재 시각에서)
+        self.year = int(year if year is not None else now.year)
+        self.month = int(month if month is not None else now.month)
+        self.week = int(week if week is not None else _week_of_month(now))
+        _check_date_parts('fact_weekly_chart', self.year, self.month, self.week)
+        
+        self.chart_date = chart_date
+        self.webtoon_id = str(webtoon_id)
+        self.rank = int(rank)
+        self.collected_at = now
+        self.weekday = weekday  # 요일 정보 (예: "MONDAY", "FRIDAY")
+        self.view_count = int(view_count) if view_count is not None else None
+
+
 def create_fact_weekly_chart_record(
     chart_date: date,
     webtoon_id: str,
@@ -114,7 +259,7 @@ def create_fact_weekly_chart_record(
     month: Optional[int] = None,
     week: Optional[int] = None,
     view_count: Optional[int] = None
-) -> Dict[str, Any]:
+) -> FactWeeklyChartRecord:
     """
     fact_weekly_chart 레코드를 생성합니다.
     
@@ -130,45 +275,22 @@ def create_fact_weekly_chart_record(
         view_count: 조회수 (선택, API에서 제공하는 경우)
     
     Returns:
-        fact_weekly_chart 레코드 딕셔너리
+        fact_weekly_chart 레코드 (FactWeeklyChartRecord, 딕셔너리처럼 읽기 가능)
     
     Raises:
         ValueError: 필수 필드가 누락되었거나 유효하지 않은 경우
     """
-    if not chart_date:
-        raise ValueError("chart_date는 필수 필드입니다.")
-    if not webtoon_id:
-        raise ValueError("webtoon_id는 필수 필드입니다.")
-    if not isinstance(rank, int) or rank < 1:
-        raise ValueError("rank는 1 이상의 정수여야 합니다.")
-    
-    now = datetime.now() if not collected_at else collected_at
-    
-    # collected_at에서 year, month 추출 (없으면 현재 시각에서)
-    if year is None:
-        year = now.year
-    if month is None:
-        month = now.month
-    
-    # week 계산 (해당 월의 몇 번째 주인지)
-    # 1일이 속한 주를 1주차로 계산
-    if week is None:
-        day_of_month = now.day
-        # 해당 날짜가 속한 주 계산: (day - 1) // 7 + 1
-        # 예: 1일~7일 = 1주차, 8일~14일 = 2주차, ...
-        week = ((day_of_month - 1) // 7) + 1
-    
-    return {
-        'chart_date': chart_date if isinstance(chart_date, date) else chart_date,
-        'webtoon_id': str(webtoon_id),
-        'rank': int(rank),
-        'collected_at': now,
-        'weekday': weekday,  # 요일 정보 (예: "MONDAY", "FRIDAY")
-        'year': int(year),
-        'month': int(month),
-        'week': int(week),
-        'view_count': int(view_count) if view_count is not None else None
-    }
+    return FactWeeklyChartRecord(
+        chart_date=chart_date,
+        webtoon_id=webtoon_id,
+        rank=rank,
+        collected_at=collected_at,
+        weekday=weekday,
+        year=year,
+        month=month,
+        week=week,
+        view_count=view_count,
+    )
 
 
 def validate_fact_weekly_chart_record(record: Dict[str, Any]) -> bool:
@@ -226,6 +348,48 @@ def validate_fact_weekly_chart_record(record: Dict[str, Any]) -> bool:
 # fact_webtoon_stats (웹툰 상세 정보 히스토리 테이블) 스키마
 # ============================================================================
 
+class FactWebtoonStatsRecord(TableRecord):
+    """fact_webtoon_stats 레코드 (생성 시 필수 필드, 수집 소스, year/month/week 범위 검증)"""
+    
+    __slots__ = ('webtoon_id', 'collected_at', 'favorite_count', 'favorite_count_source', 'finished', 'rest',
+                 'total_episode_count', 'year', 'month', 'week')
+    COLUMNS = __slots__
+    
+    def __init__(
+        self,
+        webtoon_id: str,
+        collected_at: Optional[datetime] = None,
+        favorite_count: Optional[int] = None,
+        favorite_count_source: Optional[str] = None,
+        finished: Optional[bool] = None,
+        rest: Optional[bool] = None,
+        total_episode_count: Optional[int] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        week: Optional[int] = None
+    ):
+        if not webtoon_id:
+            raise ValueError("webtoon_id는 필수 필드입니다.")
+        if favorite_count_source and favorite_count_source not in ('api', 'html'):
+            raise ValueError("favorite_count_source는 'api' 또는 'html'이어야 합니다.")
+        
+        now = collected_at if collected_at else datetime.now()
+        
+        # collected_at에서 year, month, week 추출 (없으면 현재 시각에서)
+        self.year = int(year if year is not None else now.year)
+        self.month = int(month if month is not None else now.month)
+        self.week = int(week if week is not None else _week_of_month(now))
+        _check_date_parts('fact_webtoon_stats', self.year, self.month, self.week)
+        
+        self.webtoon_id = str(webtoon_id)
+        self.collected_at = now
+        self.favorite_count = int(favorite_count) if favorite_count is not None else None
+        self.favorite_count_source = favorite_count_source  # "api" 또는 "html"
+        self.finished = bool(finished) if finished is not None else None
+        self.rest = bool(rest) if rest is not None else None
+        self.total_episode_count = int(total_episode_count) if total_episode_count is not None else None
+
+
 def create_fact_webtoon_stats_record(
     webtoon_id: str,
     collected_at: Optional[datetime] = None,
@@ -237,7 +401,7 @@ def create_fact_webtoon_stats_record(
     year: Optional[int] = None,
     month: Optional[int] = None,
     week: Optional[int] = None
-) -> Dict[str, Any]:
+) -> FactWebtoonStatsRecord:
     """
     fact_webtoon_stats 레코드를 생성합니다.
     
@@ -254,39 +418,23 @@ def create_fact_webtoon_stats_record(
         week: 해당 월의 몇 번째 주인지 (collected_at에서 추출)
     
     Returns:
-        fact_webtoon_stats 레코드 딕셔너리
+        fact_webtoon_stats 레코드 (FactWebtoonStatsRecord, 딕셔너리처럼 읽기 가능)
     
     Raises:
         ValueError: 필수 필드가 누락되었거나 유효하지 않은 경우
     """
-    if not webtoon_id:
-        raise ValueError("webtoon_id는 필수 필드입니다.")
-    
-    now = datetime.now() if not collected_at else collected_at
-    
-    # collected_at에서 year, month 추출 (없으면 현재 시각에서)
-    if year is None:
-        year = now.year
-    if month is None:
-        month = now.month
-    
-    # week 계산 (해당 월의 몇 번째 주인지)
-    if week is None:
-        day_of_month = now.day
-        week = ((day_of_month - 1) // 7) + 1
-    
-    return {
-        'webtoon_id': str(webtoon_id),
-        'collected_at': now,
-        'favorite_count': int(favorite_count) if favorite_count is not None else None,
-        'favorite_count_source': favorite_count_source,  # "api" 또는 "html"
-        'finished': bool(finished) if finished is not None else None,
-        'rest': bool(rest) if rest is not None else None,
-        'total_episode_count': int(total_episode_count) if total_episode_count is not None else None,
-        'year': int(year),
-        'month': int(month),
-        'week': int(week)
-    }
+    return FactWebtoonStatsRecord(
+        webtoon_id=webtoon_id,
+        collected_at=collected_at,
+        favorite_count=favorite_count,
+        favorite_count_source=favorite_count_source,
+        finished=finished,
+        rest=rest,
+        total_episode_count=total_episode_count,
+        year=year,
+        month=month,
+        week=week,
+    )
 
 
 def validate_fact_webtoon_stats_record(record: Dict[str, Any]) -> bool:
@@ -414,6 +562,13 @@ FACT_WEBTOON_STATS_COLUMNS = [
     'week'
 ]
 
+# 테이블별 (스키마, 컬럼 순서) - Parquet 스키마 / JSONL 직렬화에서 사용
+TABLE_SCHEMAS = {
+    'dim_webtoon': (DIM_WEBTOON_SCHEMA, DIM_WEBTOON_COLUMNS),
+    'fact_weekly_chart': (FACT_WEEKLY_CHART_SCHEMA, FACT_WEEKLY_CHART_COLUMNS),
+    'fact_webtoon_stats': (FACT_WEBTOON_STATS_SCHEMA, FACT_WEBTOON_STATS_COLUMNS),
+}
+
 
 # ============================================================================
 # Foreign Key 관계 검증
@@ -0,0 +1,161 @@
+"""
+Parquet 저장 모듈: dim_webtoon / fact_weekly_chart / fact_webtoon_stats의 Parquet 읽기/쓰기
+
+DATA_FORMAT=parquet일 때 transform 모듈들이 사용합니다.
+- 스키마는 models.py의 *_SCHEMA에서 Arrow 타입으로 만듦 (str -> string, int -> int64,
+  bool -> bool, datetime -> timestamp[us], date -> date32, list -> list<string>)
+- 컬럼 단위 압축 (PARQUET_COMPRESSION, 기본값 zstd)
+- 읽을 때 필요한 컬럼만 읽기 (columns 인자)
+- 결과 파일은 BigQuery에 Parquet으로 바로 적재 가능 (tags는 REPEATED STRING)
+
+pyarrow는 선택 의존성입니다. DATA_FORMAT=parquet을 쓸 때만 필요합니다.
+"""
+
+import logging
+import os
+import typing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.models import TABLE_SCHEMAS
+
+logger = logging.getLogger(__name__)
+
+# 컬럼 압축 코덱 (zstd, snappy, gzip, none)
+PARQUET_COMPRESSION = os.getenv('PARQUET_COMPRESSION', 'zstd').lower()
+
+_arrow_schemas: Dict[str, object] = {}
+
+
+def _import_pyarrow():
+    """pyarrow를 가져옵니다. 설치되어 있지 않으면 설치 방법을 담은 ImportError를 냅니다."""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "DATA_FORMAT=parquet을 사용하려면 pyarrow가 필요합니다: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def _python_type_to_arrow(pa, python_type):
+    """models.py 스키마의 파이썬 타입을 Arrow 타입으로 변환합니다. (Optional[X]는 X로)"""
+    if typing.get_origin(python_type) is typing.Union:
+        python_type = next(arg for arg in typing.get_args(python_type) if arg is not type(None))
+    if python_type is str:
+        return pa.string()
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is datetime:
+        return pa.timestamp('us')
+    if python_type is date:
+        return pa.date32()
+    if python_type is list:
+        return pa.list_(pa.string())
+    raise TypeError(f"Parquet 타입으로 변환할 수 없는 스키마 타입: {python_type}")
+
+
+def get_arrow_schema(table_name: str):
+    """
+    테이블의 Arrow 스키마를 반환합니다 (models.py 스키마 기반).
+
+    Args:
+        table_name: 'dim_webtoon', 'fact_weekly_chart' 또는 'fact_webtoon_stats'
+
+    Returns:
+        pyarrow.Schema
+    """
+    if table_name not in _arrow_schemas:
+        pa = _import_pyarrow()
+        schema, columns = TABLE_SCHEMAS[table_name]
+        _arrow_schemas[table_name] = pa.schema(
+            [pa.field(column, _python_type_to_arrow(pa, schema[column])) for column in columns]
+        )
+    return _arrow_schemas[table_name]
+
+
+def _coerce_column(series: pd.Series, arrow_type, pa) -> pd.Series:
+    """DataFrame 컬럼을 Arrow 타입으로 변환할 수 있는 형태로 맞춥니다."""
+    if pa.types.is_timestamp(arrow_type):
+        series = pd.to_datetime(series)
+        # timezone이 있으면 벽시계 시각 그대로 사용 (파티션 날짜와 같은 기준)
+        if series.dt.tz is not None:
+            series = series.dt.tz_localize(None)
+        return series
+    if pa.types.is_date32(arrow_type):
+        return pd.to_datetime(series).dt.date.astype(object).where(series.notna(), None)
+    if pa.types.is_integer(arrow_type):
+        return pd.to_numeric(series, errors='coerce').round().astype('Int64')
+    if pa.types.is_boolean(arrow_type):
+        return series.astype(object).where(series.notna(), None)
+    if pa.types.is_string(arrow_type):
+        return series.astype(object).where(series.notna(), None).map(lambda v: v if v is None else str(v))
+    if pa.types.is_list(arrow_type):
+        return series.map(lambda v: list(v) if isinstance(v, (list, tuple)) else None)
+    return series
+
+
+def write_parquet(file_path: Path, df: pd.DataFrame, table_name: str) -> None:
+    """
+    DataFrame을 테이블 스키마에 맞춰 Parquet 파일로 씁니다.
+    임시 파일에 쓴 뒤 교체합니다 (쓰는 도중 중단되어도 기존 파일 유지).
+
+    Args:
+        file_path: 저장할 파일 경로
+        df: 저장할 DataFrame (스키마에 없는 컬럼은 버리고, 없는 컬럼은 null로 채움)
+        table_name: 테이블 이름
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    schema = get_arrow_schema(table_name)
+    data = {}
+    for field in schema:
+        if field.name in df.columns:
+            data[field.name] = _coerce_column(df[field.name], field.type, pa)
+        else:
+            data[field.name] = pd.Series([None] * len(df), index=df.index, dtype=object)
+    table = pa.Table.from_pandas(pd.DataFrame(data, index=df.index), schema=schema, preserve_index=False)
+
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    compression = None if PARQUET_COMPRESSION == 'none' else PARQUET_COMPRESSION
+    pq.write_table(table, tmp_path, compression=compression)
+    os.replace(tmp_path, file_path)
+
+
+def read_parquet(file_path: Path, table_name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Parquet 파일을 읽어 DataFrame으로 반환합니다.
+    columns를 지정하면 해당 컬럼만 디스크에서 읽습니다.
+
+    JSONL 로더와 같은 형태로 반환합니다 (tags는 list, 정수 컬럼의 null은 None,
+    chart_date는 date, timestamp는 datetime64).
+
+    Args:
+        file_path: Parquet 파일 경로
+        table_name: 테이블 이름
+        columns: 읽을 컬럼 리스트 (None이면 전체)
+
+    Returns:
+        DataFrame
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    schema = get_arrow_schema(table_name)
+    if columns is not None:
+        columns = [column for column in columns if column in schema.names]
+    table = pq.read_table(file_path, columns=columns)
+
+    df = table.to_pandas(integer_object_nulls=True, date_as_object=True)
+    # list 컬럼은 numpy 배열 대신 파이썬 list로 (다른 형식의 로더와 동일하게)
+    for field in table.schema:
+        if pa.types.is_list(field.type):
+            df[field.name] = table.column(field.name).to_pylist()
+    return df
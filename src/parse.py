@@ -13,10 +13,13 @@ Parse 모듈: HTML에서 차트 데이터 파싱
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from bs4 import BeautifulSoup
 
+if TYPE_CHECKING:
+    from src.extract import ChartPayload
+
 logger = logging.getLogger(__name__)
 
 
@@ -203,19 +206,52 @@ def parse_html_file(file_path: Path) -> List[Dict[str, any]]:
     html = load_html_from_file(file_path)
     if html is None:
         return []
+    return parse_html(html)
+
+
+def parse_chart_payload(payload: 'ChartPayload') -> List[Dict[str, any]]:
+    """
+    메모리로 전달받은 차트 수집 결과를 파싱합니다 (src.extract.ChartPayload).
+    API 응답은 디코딩된 dict를 그대로 API 파서에 넘기므로 HTML 직렬화 / 파일 / 재파싱을 거치지 않습니다.
+    
+    Args:
+        payload: 차트 수집 결과
     
+    Returns:
+        웹툰 차트 데이터 리스트
+    """
+    if payload.api_data is not None:
+        from src.parse_api import parse_api_response
+        
+        return parse_api_response(payload.api_data)
+    if payload.html:
+        return parse_html(payload.html)
+    return []
+
+
+def parse_html(html: str) -> List[Dict[str, any]]:
+    """
+    HTML 문자열을 파싱합니다.
+    API 응답이 포함된 경우 (extract_webtoon_chart가 저장한 HTML) API 파서를 사용합니다.
+    
+    Args:
+        html: HTML 문자열
+    
+    Returns:
+        웹툰 차트 데이터 리스트
+    """
     # API 응답이 포함된 경우 (JSON 데이터가 script 태그에 있음)
     if 'application/json' in html and 'webtoon-data' in html:
         try:
-            import json
             import re
+            from src.json_codec import loads
             from src.parse_api import parse_api_response
             
             # script 태그에서 JSON 데이터 추출
             json_match = re.search(r'<script[^>]*id=[\'"]webtoon-data[\'"][^>]*>(.*?)</script>', html, re.DOTALL)
             if json_match:
                 json_str = json_match.group(1)
-                api_data = json.loads(json_str)
+                api_data = loads(json_str)
                 logger.info("API 응답 데이터 발견, API 파서 사용")
                 return parse_api_response(api_data)
         except Exception as e:
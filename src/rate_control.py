@@ -0,0 +1,317 @@
+"""
+Rate Control 모듈: 응답 상태/지연 시간 기반 적응형 요청 제어 (AIMD)
+
+create_session의 Retry는 실패한 뒤에만 물러나고, 고정 예산은 네이버가 여유로울 때도
+속도를 올리지 않습니다. 이 모듈은 응답을 관찰하여 공용 토큰 버킷의 속도와
+동시 요청 수를 조정합니다.
+- 정상 응답이 이어지고 p95 지연 시간이 안정적이면 속도/동시 요청 수를 조금씩 증가 (additive increase,
+  속도는 운영자가 정한 예산(configure_naver_rate_limiter의 rate)을 넘지 않음)
+- 429, 5xx, 네트워크 오류, p95 지연 시간 급증 시 절반으로 감소 (multiplicative decrease)
+- 현재 속도, 진행 중인 요청 수, 감속(throttle) 이벤트를 metrics로 제공
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Optional
+
+import requests
+
+from src.rate_limiter import TokenBucket, get_naver_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# 적응형 제어 기본값 (환경 변수로 조정 가능)
+DEFAULT_MIN_REQUESTS_PER_SECOND = float(os.getenv('NAVER_MIN_REQUESTS_PER_SECOND', '0.5'))
+DEFAULT_INITIAL_CONCURRENCY = int(os.getenv('NAVER_INITIAL_CONCURRENCY', '4'))
+DEFAULT_MAX_CONCURRENCY = int(os.getenv('NAVER_MAX_CONCURRENCY', '16'))
+DEFAULT_LATENCY_P95_THRESHOLD = float(os.getenv('NAVER_LATENCY_P95_THRESHOLD', '2.0'))  # 초
+
+# AIMD 파라미터
+RATE_INCREASE_STEP = 0.5          # 증가 시 초당 요청 수 증가량
+DECREASE_FACTOR = 0.5             # 감소 시 곱하는 비율
+INCREASE_EVERY = 10               # 정상 응답 몇 건마다 증가를 시도할지
+DECREASE_COOLDOWN_SECONDS = 2.0   # 연속 감소 방지 (이미 보낸 요청들의 실패로 여러 번 깎이지 않도록)
+LATENCY_WINDOW_SIZE = 50          # p95 계산에 쓰는 최근 응답 수
+LATENCY_RISE_FACTOR = 2.0         # 기준 p95 대비 이 배수 이상이면 지연 증가로 판단
+
+
+class AdaptiveRateController:
+    """
+    AIMD 방식으로 토큰 버킷 속도와 동시 요청 수를 조정하는 제어기.
+
+    동기(requests) 코드는 slot(), 비동기(aiohttp) 코드는 slot_async()로 요청 슬롯을 받고,
+    응답마다 record()로 상태 코드와 지연 시간을 알려줍니다.
+    속도는 min_rate와 max_rate(요청 예산) 사이에서만 움직입니다.
+    """
+
+    def __init__(
+        self,
+        limiter: TokenBucket,
+        min_rate: float = DEFAULT_MIN_REQUESTS_PER_SECOND,
+        max_rate: Optional[float] = None,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        latency_p95_threshold: float = DEFAULT_LATENCY_P95_THRESHOLD,
+    ):
+        self.limiter = limiter
+        self.min_rate = min_rate
+        # 속도 상한은 요청 예산 (지정하지 않으면 토큰 버킷의 현재 속도)
+        self.max_rate = max(max_rate if max_rate is not None else limiter.rate, min_rate)
+        self.max_concurrency = max(1, max_concurrency)
+        self.latency_p95_threshold = latency_p95_threshold
+
+        self._concurrency_limit = max(1, min(initial_concurrency, self.max_concurrency))
+        self._in_flight = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW_SIZE)
+        self._baseline_p95: Optional[float] = None
+        self._healthy_since_change = 0
+        self._last_decrease = 0.0
+        self._requests = 0
+        self._throttle_events: Dict[str, int] = {'429': 0, '5xx': 0, 'error': 0, 'latency': 0}
+        self._lock = threading.Lock()
+        self._slot_available = threading.Condition(self._lock)
+        # 비동기 대기자: (이벤트 루프, future) (공용 제어기를 여러 스레드의 이벤트 루프가 함께 사용)
+        self._async_waiters: deque = deque()
+
+    # ------------------------------------------------------------------
+    # 요청 슬롯 (동시 요청 수 제한)
+    # ------------------------------------------------------------------
+
+    def _try_acquire_slot(self) -> bool:
+        """동시 요청 수 여유가 있으면 슬롯을 잡습니다. (lock 안에서 호출)"""
+        if self._in_flight < self._concurrency_limit:
+            self._in_flight += 1
+            return True
+        return False
+
+    def _notify_slot_available(self) -> None:
+        """슬롯을 기다리는 동기 대기자와 비동기 대기자를 하나씩 깨웁니다. (lock 안에서 호출)"""
+        self._slot_available.notify()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+                return
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘 → 다음 대기자
+                continue
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._notify_slot_available()
+
+    @contextmanager
+    def slot(self):
+        """동시 요청 수 제한 안에서 요청 하나를 실행합니다. (동기 코드용)"""
+        with self._lock:
+            while not self._try_acquire_slot():
+                self._slot_available.wait()
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    @asynccontextmanager
+    async def slot_async(self):
+        """동시 요청 수 제한 안에서 요청 하나를 실행합니다. (asyncio 코드용)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._try_acquire_slot():
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # 이미 깨워진 뒤 취소됨 → 받은 알림을 다음 대기자에게 넘김
+                        self._notify_slot_available()
+                raise
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    # ------------------------------------------------------------------
+    # 피드백
+    # ------------------------------------------------------------------
+
+    def record(self, status_code: Optional[int], latency: float) -> None:
+        """
+        응답 결과를 반영하여 속도와 동시 요청 수를 조정합니다.
+
+        Args:
+            status_code: HTTP 상태 코드 (네트워크 오류/타임아웃이면 None)
+            latency: 요청 소요 시간(초)
+        """
+        with self._lock:
+            self._requests += 1
+
+            if status_code is None:
+                self._decrease('error')
+                return
+            if status_code == 429:
+                self._decrease('429')
+                return
+            if status_code >= 500:
+                self._decrease('5xx')
+                return
+
+            self._latencies.append(latency)
+            self._healthy_since_change += 1
+            if self._healthy_since_change < INCREASE_EVERY:
+                return
+
+            p95 = self._p95()
+            if p95 is not None:
+                if self._baseline_p95 is None or p95 < self._baseline_p95:
+                    self._baseline_p95 = p95
+                if p95 > self.latency_p95_threshold or p95 > self._baseline_p95 * LATENCY_RISE_FACTOR:
+                    self._decrease('latency')
+                    return
+
+            self._increase()
+
+    def _p95(self) -> Optional[float]:
+        """최근 응답들의 p95 지연 시간 (표본이 부족하면 None)"""
+        if len(self._latencies) < INCREASE_EVERY:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def _increase(self) -> None:
+        """속도/동시 요청 수를 조금 올립니다. (lock 안에서 호출)"""
+        self._healthy_since_change = 0
+        new_rate = min(self.max_rate, self.limiter.rate + RATE_INCREASE_STEP)
+        new_concurrency = min(self.max_concurrency, self._concurrency_limit + 1)
+        if new_rate != self.limiter.rate:
+            self.limiter.set_rate(new_rate)
+        if new_concurrency != self._concurrency_limit:
+            self._concurrency_limit = new_concurrency
+            self._notify_slot_available()
+        logger.debug(f"요청 속도 증가: 초당 {self.limiter.rate:.2f}건, 동시 요청 {self._concurrency_limit}")
+
+    def _decrease(self, reason: str) -> None:
+        """속도/동시 요청 수를 크게 줄입니다. (lock 안에서 호출)"""
+        self._healthy_since_change = 0
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self._throttle_events[reason] += 1
+        # 지연 기준은 감속 후 새로 측정
+        self._latencies.clear()
+
+        self.limiter.set_rate(max(self.min_rate, self.limiter.rate * DECREASE_FACTOR))
+        self._concurrency_limit = max(1, int(self._concurrency_limit * DECREASE_FACTOR))
+        logger.warning(f"요청 속도 감소 ({reason}): 초당 {self.limiter.rate:.2f}건, 동시 요청 {self._concurrency_limit}")
+
+    # ------------------------------------------------------------------
+    # 설정 / metrics
+    # ------------------------------------------------------------------
+
+    def configure(self, max_concurrency: Optional[int] = None, max_rate: Optional[float] = None) -> None:
+        """
+        동시 요청 수 / 속도 상한을 변경합니다. None인 값은 유지됩니다.
+
+        Args:
+            max_concurrency: 동시 요청 수 상한
+            max_rate: 초당 요청 수 상한 (요청 예산, AIMD 증가는 이 값을 넘지 않음)
+        """
+        with self._lock:
+            if max_concurrency is not None:
+                self.max_concurrency = max(1, int(max_concurrency))
+                self._concurrency_limit = min(self._concurrency_limit, self.max_concurrency)
+            if max_rate is not None:
+                self.max_rate = max(float(max_rate), self.min_rate)
+                if self.limiter.rate > self.max_rate:
+                    self.limiter.set_rate(self.max_rate)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        현재 제어 상태를 반환합니다.
+
+        Returns:
+            {
+                'rate': 현재 초당 요청 수,
+                'concurrency_limit': 현재 동시 요청 수 제한,
+                'in_flight': 진행 중인 요청 수,
+                'requests': 관찰한 응답 수,
+                'p95_latency': 최근 p95 지연 시간(초),
+                'throttle_events': 감속 사유별 횟수,
+            }
+        """
+        with self._lock:
+            p95 = self._p95()
+            return {
+                'rate': round(self.limiter.rate, 3),
+                'concurrency_limit': self._concurrency_limit,
+                'in_flight': self._in_flight,
+                'requests': self._requests,
+                'p95_latency': round(p95, 3) if p95 is not None else None,
+                'throttle_events': dict(self._throttle_events),
+            }
+
+
+def _wake_waiter(waiter: asyncio.Future) -> None:
+    """슬롯 대기 future를 완료합니다. (대기자의 이벤트 루프에서 실행)"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_naver_rate_controller: Optional[AdaptiveRateController] = None
+_naver_rate_controller_lock = threading.Lock()
+
+
+def get_naver_rate_controller() -> AdaptiveRateController:
+    """
+    모든 네이버 HTTP 요청이 공유하는 적응형 제어기를 반환합니다.
+    공용 토큰 버킷(get_naver_rate_limiter)의 속도를 처음 속도(요청 예산) 이하에서 조정합니다.
+
+    Returns:
+        공용 AdaptiveRateController 객체
+    """
+    global _naver_rate_controller
+    if _naver_rate_controller is None:
+        with _naver_rate_controller_lock:
+            if _naver_rate_controller is None:
+                _naver_rate_controller = AdaptiveRateController(get_naver_rate_limiter())
+    return _naver_rate_controller
+
+
+def naver_get(session: requests.Session, url: str, **kwargs) -> requests.Response:
+    """
+    공용 제어기(동시 요청 수 + 토큰 버킷)를 거쳐 GET 요청을 보내고 결과를 피드백합니다.
+
+    Args:
+        session: requests Session 객체
+        url: 요청 URL
+        **kwargs: session.get에 전달할 인자 (params, headers, timeout 등)
+
+    Returns:
+        requests.Response 객체
+
+    Raises:
+        requests.RequestException: 요청 실패 시 (제어기에 오류로 기록한 뒤 다시 발생)
+    """
+    controller = get_naver_rate_controller()
+    with controller.slot():
+        controller.limiter.acquire()
+        started = time.monotonic()
+        try:
+            response = session.get(url, **kwargs)
+        except requests.RequestException:
+            controller.record(None, time.monotonic() - started)
+            raise
+        controller.record(response.status_code, time.monotonic() - started)
+        return response
@@ -0,0 +1,169 @@
+"""
+Rate Limiter 모듈: 네이버 HTTP 요청 공용 토큰 버킷
+
+고정 time.sleep 대신 모든 네이버 요청(차트 API, 상세 정보 API, 에피소드 수 API,
+HTML fallback)이 하나의 토큰 버킷에서 토큰을 받아 요청합니다.
+- rate: 초당 토큰 보충 속도 (= 평균 초당 요청 수)
+- burst: 버킷 최대 크기 (쉬고 있던 뒤 한 번에 보낼 수 있는 요청 수)
+
+예산이 남아 있으면 바로 요청하고, 예산을 다 썼을 때만 대기합니다.
+동기 코드(requests)는 acquire(), 비동기 코드(aiohttp)는 acquire_async()를 사용합니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 공용 리미터 기본값 (환경 변수로 조정 가능)
+DEFAULT_REQUESTS_PER_SECOND = float(os.getenv('NAVER_REQUESTS_PER_SECOND', '4'))
+DEFAULT_BURST = int(os.getenv('NAVER_RATE_BURST', '4'))
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷.
+
+    토큰이 부족하면 미래의 토큰을 예약하고(잔량이 음수가 됨) 그만큼 대기 시간을 돌려줍니다.
+    예약 방식이므로 여러 스레드/코루틴이 동시에 요청해도 순서대로 시간 슬롯을 받습니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        if burst < 1:
+            raise ValueError("burst는 1 이상이어야 합니다.")
+        self._rate = float(rate)
+        self._burst = int(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """현재 초당 토큰 보충 속도"""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """버킷 최대 크기"""
+        return self._burst
+
+    def set_rate(self, rate: float, burst: Optional[int] = None) -> None:
+        """
+        보충 속도(와 버킷 크기)를 변경합니다. 이미 쌓인 토큰은 유지됩니다.
+
+        Args:
+            rate: 새 초당 토큰 보충 속도
+            burst: 새 버킷 최대 크기 (None이면 유지)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = float(rate)
+            if burst is not None:
+                self._burst = max(1, int(burst))
+                self._tokens = min(self._tokens, float(self._burst))
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰을 보충합니다. (lock 안에서 호출)"""
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+            self._last = now
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        토큰을 예약하고 사용 가능해질 때까지의 대기 시간을 반환합니다.
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            대기해야 하는 시간(초), 바로 사용 가능하면 0
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        토큰을 받을 때까지 대기합니다. (동기 코드용)
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            실제로 대기한 시간(초)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.debug(f"요청 예산 소진, {wait:.2f}초 대기")
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """
+        토큰을 받을 때까지 대기합니다. (asyncio 코드용)
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            실제로 대기한 시간(초)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_naver_rate_limiter: Optional[TokenBucket] = None
+_naver_rate_limiter_lock = threading.Lock()
+
+
+def get_naver_rate_limiter() -> TokenBucket:
+    """
+    모든 네이버 HTTP 요청이 공유하는 토큰 버킷을 반환합니다.
+    처음 호출 시 NAVER_REQUESTS_PER_SECOND / NAVER_RATE_BURST 환경 변수로 생성합니다.
+
+    Returns:
+        공용 TokenBucket 객체
+    """
+    global _naver_rate_limiter
+    if _naver_rate_limiter is None:
+        with _naver_rate_limiter_lock:
+            if _naver_rate_limiter is None:
+                _naver_rate_limiter = TokenBucket(DEFAULT_REQUESTS_PER_SECOND, DEFAULT_BURST)
+    return _naver_rate_limiter
+
+
+def configure_naver_rate_limiter(rate: Optional[float] = None, burst: Optional[int] = None) -> TokenBucket:
+    """
+    공용 토큰 버킷의 속도/버킷 크기를 변경합니다. None인 값은 유지됩니다.
+    rate는 요청 예산이므로 적응형 제어기의 속도 상한(max_rate)도 같은 값으로 맞춥니다.
+
+    Args:
+        rate: 초당 요청 수 (요청 예산)
+        burst: 버킷 최대 크기
+
+    Returns:
+        공용 TokenBucket 객체
+    """
+    limiter = get_naver_rate_limiter()
+    if rate is not None or burst is not None:
+        limiter.set_rate(rate if rate is not None else limiter.rate, burst)
+        if rate is not None:
+            # rate_control이 이 모듈을 import하므로 함수 안에서 import
+            from src.rate_control import get_naver_rate_controller
+            get_naver_rate_controller().configure(max_rate=rate)
+        logger.info(f"네이버 요청 예산 설정: 초당 {limiter.rate}건, burst {limiter.burst}")
+    return limiter
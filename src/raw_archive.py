@@ -0,0 +1,194 @@
+"""
+Raw Archive 모듈: API 응답 원본 보관
+
+응답 본문을 받은 바이트 그대로 (dict로 디코딩한 뒤 다시 직렬화하지 않고) 압축하면서 보관합니다.
+- gcs: 압축된 바이트만 메모리에 두었다가 gs://{GCS_BUCKET_NAME}/raw_html/...에 한 번에 업로드
+  (Content-Encoding: gzip, /tmp 임시 파일 없음)
+- local: {DATA_DIR}/raw/{날짜}/ 아래에 .gz 파일로 저장 (.part 이름으로 쓰고 완료 시 교체)
+- none: 보관하지 않음
+
+압축 여부는 GCS_UPLOAD_GZIP을 따릅니다 (false면 압축 없이 원래 이름으로 저장).
+보관은 부수 작업이므로 실패해도 예외를 발생시키지 않고 경고만 남깁니다.
+"""
+
+import gzip
+import io
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from src.utils import get_raw_html_dir
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_TARGETS = ('gcs', 'local', 'none')
+
+# write에 큰 bytes를 한 번에 넘겨도 이 크기씩 나눠 압축 (압축기 내부 버퍼를 작게 유지)
+_CHUNK_BYTES = 256 * 1024
+
+
+class RawArchiveWriter:
+    """
+    원본 응답 하나를 압축하며 보관하는 writer.
+
+    with 문으로 사용하면 정상 종료 시 close(), 예외 시 abort()를 호출합니다.
+    """
+
+    def __init__(self, chart_date: date, relative_path: str, target: str = 'local', compress: Optional[bool] = None):
+        from src.upload_gcs import GCS_UPLOAD_GZIP
+
+        if target not in ARCHIVE_TARGETS:
+            raise ValueError(f"알 수 없는 보관 위치: {target} (가능: {', '.join(ARCHIVE_TARGETS)})")
+        self.chart_date = chart_date
+        self.relative_path = relative_path
+        self.target = target
+        self.compress = GCS_UPLOAD_GZIP if compress is None else compress
+        self.raw_bytes = 0
+        self._failed = False
+        self._closed = target == 'none'
+        self._sink = None
+        self._stream = None
+        if not self._closed:
+            try:
+                self._open()
+            except Exception as e:
+                self._fail(e)
+
+    def _open(self) -> None:
+        if self.target == 'gcs':
+            self._sink = io.BytesIO()
+        else:
+            path = self.local_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._sink = open(self._part_path, 'wb')
+        if self.compress:
+            # 헤더 시각을 0으로 고정해 같은 응답은 같은 바이트가 되도록 함 (GCS MD5 비교로 재업로드 생략 가능)
+            self._stream = gzip.GzipFile(fileobj=self._sink, mode='wb', compresslevel=6, mtime=0)
+        else:
+            self._stream = self._sink
+
+    @property
+    def local_path(self) -> Path:
+        """local 보관 시 최종 파일 경로 (압축하면 .gz 추가)"""
+        path = get_raw_html_dir(self.chart_date) / self.relative_path
+        return path.with_name(path.name + '.gz') if self.compress else path
+
+    @property
+    def _part_path(self) -> Path:
+        return self.local_path.with_name(self.local_path.name + '.part')
+
+    def _fail(self, error: Exception) -> None:
+        logger.warning(f"원본 보관 실패 ({self.target}): {self.relative_path}, 오류: {error}")
+        self._failed = True
+        self.abort()
+
+    def write(self, chunk: Union[bytes, memoryview]) -> None:
+        """
+        응답 본문 조각을 압축해 씁니다 (실패한 뒤에는 무시).
+
+        Args:
+            chunk: 응답 본문 바이트
+        """
+        if self._closed or self._failed:
+            return
+        try:
+            view = memoryview(chunk)
+            for start in range(0, len(view), _CHUNK_BYTES):
+                self._stream.write(view[start:start + _CHUNK_BYTES])
+            self.raw_bytes += len(view)
+        except Exception as e:
+            self._fail(e)
+
+    def close(self) -> Optional[str]:
+        """
+        보관을 마칩니다 (gcs는 이때 업로드, local은 .part 파일을 최종 이름으로 교체).
+
+        Returns:
+            보관 위치 (gs://... 또는 로컬 경로, 보관하지 않았거나 실패하면 None)
+        """
+        if self._closed or self._failed:
+            return None
+        try:
+            if self._stream is not self._sink:
+                self._stream.close()
+            if self.target == 'gcs':
+                from src.upload_gcs import GCS_BUCKET_NAME, get_raw_gcs_path, upload_bytes_to_gcs
+
+                data = self._sink.getvalue()
+                gcs_path = get_raw_gcs_path(self.chart_date, self.relative_path)
+                if not upload_bytes_to_gcs(data, gcs_path, content_encoding='gzip' if self.compress else None):
+                    self._failed = True
+                    return None
+                location = f"gs://{GCS_BUCKET_NAME}/{gcs_path}"
+                stored_bytes = len(data)
+            else:
+                self._sink.close()
+                self._part_path.replace(self.local_path)
+                # 압축 여부가 바뀌었으면 이전 형식의 파일 삭제 (같은 GCS 경로로 두 번 올라가지 않도록)
+                other = self.local_path.with_suffix('') if self.compress else self.local_path.with_name(self.local_path.name + '.gz')
+                other.unlink(missing_ok=True)
+                location = str(self.local_path)
+                stored_bytes = self.local_path.stat().st_size
+        except Exception as e:
+            self._fail(e)
+            return None
+        finally:
+            self._closed = True
+            self._sink = None
+        logger.info(f"원본 보관 완료: {location} ({self.raw_bytes / 1024:.1f}KB → {stored_bytes / 1024:.1f}KB)")
+        return location
+
+    def abort(self) -> None:
+        """보관을 취소합니다 (local은 쓰던 .part 파일 삭제, gcs는 업로드하지 않음)."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._sink is not None:
+                self._sink.close()
+            if self.target == 'local':
+                self._part_path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"원본 보관 취소 중 오류: {self.relative_path}, 오류: {e}")
+        self._sink = None
+
+    def __enter__(self) -> 'RawArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def archive_raw_bytes(
+    chart_date: date,
+    relative_path: str,
+    chunks: Union[bytes, Iterable[bytes]],
+    target: str = 'local'
+) -> Optional[str]:
+    """
+    응답 본문을 보관합니다 (RawArchiveWriter 한 번 사용).
+
+    Args:
+        chart_date: 수집 날짜
+        relative_path: 날짜별 원본 디렉토리 기준 상대 경로 (예: "webtoon_chart_popular.json")
+        chunks: 응답 본문 bytes 또는 bytes 조각 iterable (response.iter_content 등)
+        target: 'gcs', 'local' 또는 'none'
+
+    Returns:
+        보관 위치 (보관하지 않았거나 실패하면 None)
+    """
+    writer = RawArchiveWriter(chart_date, relative_path, target=target)
+    try:
+        if isinstance(chunks, (bytes, bytearray, memoryview)):
+            writer.write(chunks)
+        else:
+            for chunk in chunks:
+                writer.write(chunk)
+    except Exception:
+        writer.abort()
+        raise
+    return writer.close()
@@ -0,0 +1,331 @@
+"""
+Refresh Planner 모듈: 웹툰 상세 정보 증분 갱신 계획
+
+매 실행마다 dim_webtoon의 모든 웹툰 상세 정보를 다시 수집하는 대신,
+fact_webtoon_stats의 최근 레코드(웹툰별 마지막 2개)와 완결/휴재 여부, 관심 수 변화율,
+차트 순위 상승 여부로 이번 실행에서 갱신할 웹툰만 고릅니다.
+
+갱신 주기 (등급별, 환경 변수로 조정 가능)
+- new: 수집 이력 없음 → 항상 갱신
+- climbing: 차트 순위 상승 / 신규 진입 → 항상 갱신
+- hot: 관심 수 변화율이 높거나 에피소드 수 증가 → REFRESH_INTERVAL_HOT_DAYS (기본 1일)
+- active: 연재 중 → REFRESH_INTERVAL_ACTIVE_DAYS (기본 2일)
+- stable: 관심 수 변화가 거의 없음 → REFRESH_INTERVAL_STABLE_DAYS (기본 7일)
+- rest: 휴재 중 → REFRESH_INTERVAL_REST_DAYS (기본 7일)
+- finished: 완결 → REFRESH_INTERVAL_FINISHED_DAYS (기본 14일)
+"""
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from src.transform import load_fact_weekly_chart
+from src.transform_webtoon_stats import load_fact_webtoon_stats
+from src.utils import get_data_format, get_processed_dir
+
+logger = logging.getLogger(__name__)
+
+# 등급별 갱신 주기 (일)
+REFRESH_INTERVAL_HOT_DAYS = float(os.getenv('REFRESH_INTERVAL_HOT_DAYS', '1'))
+REFRESH_INTERVAL_ACTIVE_DAYS = float(os.getenv('REFRESH_INTERVAL_ACTIVE_DAYS', '2'))
+REFRESH_INTERVAL_STABLE_DAYS = float(os.getenv('REFRESH_INTERVAL_STABLE_DAYS', '7'))
+REFRESH_INTERVAL_REST_DAYS = float(os.getenv('REFRESH_INTERVAL_REST_DAYS', '7'))
+REFRESH_INTERVAL_FINISHED_DAYS = float(os.getenv('REFRESH_INTERVAL_FINISHED_DAYS', '14'))
+
+# 관심 수 일일 변화율 기준 (예: 0.002 = 하루 0.2%)
+REFRESH_HOT_CHANGE_RATE = float(os.getenv('REFRESH_HOT_CHANGE_RATE', '0.002'))
+REFRESH_STABLE_CHANGE_RATE = float(os.getenv('REFRESH_STABLE_CHANGE_RATE', '0.0002'))
+
+# 요일 내 순위가 이만큼 이상 오르면 순위 상승으로 판단
+REFRESH_CLIMB_MIN_RANK_GAIN = int(os.getenv('REFRESH_CLIMB_MIN_RANK_GAIN', '3'))
+
+# 스케줄 실행 시각이 조금씩 달라도 주기가 하루씩 밀리지 않도록 두는 여유
+REFRESH_SLACK = timedelta(hours=2)
+
+REFRESH_INTERVALS = {
+    'new': 0.0,
+    'climbing': 0.0,
+    'hot': REFRESH_INTERVAL_HOT_DAYS,
+    'active': REFRESH_INTERVAL_ACTIVE_DAYS,
+    'stable': REFRESH_INTERVAL_STABLE_DAYS,
+    'rest': REFRESH_INTERVAL_REST_DAYS,
+    'finished': REFRESH_INTERVAL_FINISHED_DAYS,
+}
+
+# 갱신 계획에 읽는 fact_webtoon_stats 기간 (가장 긴 주기의 2배, 이보다 오래된 웹툰은 'new'로 보고 갱신)
+REFRESH_STATS_LOOKBACK = timedelta(days=2 * max(REFRESH_INTERVALS.values()))
+
+# 갱신 계획에 필요한 컬럼 (Parquet 형식이면 이 컬럼만 디스크에서 읽음)
+REFRESH_STATS_COLUMNS = ['webtoon_id', 'collected_at', 'favorite_count', 'finished', 'rest', 'total_episode_count']
+REFRESH_CHART_COLUMNS = ['webtoon_id', 'rank', 'weekday']
+
+
+def _to_naive_datetime(values: pd.Series) -> pd.Series:
+    """
+    collected_at 컬럼을 timezone 없는 datetime으로 변환합니다.
+    (로컬 파일은 naive, BigQuery 조회 결과는 UTC aware이므로 벽시계 값 기준으로 통일)
+    """
+    converted = pd.to_datetime(values, errors='coerce', utc=True)
+    return converted.dt.tz_localize(None)
+
+
+def summarize_webtoon_stats(stats_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    fact_webtoon_stats에서 웹툰별 마지막 레코드와 직전 레코드 대비 변화를 요약합니다.
+
+    Args:
+        stats_df: fact_webtoon_stats DataFrame (전체 또는 웹툰별 최근 레코드)
+
+    Returns:
+        webtoon_id를 index로 하는 DataFrame
+        (last_collected_at, finished, rest, favorite_count, change_rate, episode_increased, has_previous)
+    """
+    columns = ['last_collected_at', 'finished', 'rest', 'favorite_count',
+               'change_rate', 'episode_increased', 'has_previous']
+    if stats_df is None or len(stats_df) == 0:
+        return pd.DataFrame(columns=columns)
+
+    df = stats_df[REFRESH_STATS_COLUMNS].copy()
+    df['webtoon_id'] = df['webtoon_id'].astype(str)
+    df['collected_at'] = _to_naive_datetime(df['collected_at'])
+    df = df.dropna(subset=['collected_at']).sort_values(['webtoon_id', 'collected_at'])
+
+    # 웹툰별 마지막 레코드와 그 직전 레코드
+    last = df.drop_duplicates('webtoon_id', keep='last').set_index('webtoon_id')
+    earlier = df[df.duplicated('webtoon_id', keep='last')]
+    previous = earlier.drop_duplicates('webtoon_id', keep='last').set_index('webtoon_id').reindex(last.index)
+
+    favorite_now = pd.to_numeric(last['favorite_count'], errors='coerce')
+    favorite_before = pd.to_numeric(previous['favorite_count'], errors='coerce')
+    elapsed_days = (last['collected_at'] - previous['collected_at']).dt.total_seconds() / 86400
+    elapsed_days = elapsed_days.where(elapsed_days > 0)
+
+    change_rate = (favorite_now - favorite_before).abs() / favorite_before.clip(lower=1) / elapsed_days
+
+    episodes_now = pd.to_numeric(last['total_episode_count'], errors='coerce')
+    episodes_before = pd.to_numeric(previous['total_episode_count'], errors='coerce')
+
+    summary = pd.DataFrame({
+        'last_collected_at': last['collected_at'],
+        'finished': last['finished'].fillna(False).astype(bool),
+        'rest': last['rest'].fillna(False).astype(bool),
+        'favorite_count': favorite_now,
+        'change_rate': change_rate,
+        'episode_increased': (episodes_now > episodes_before).fillna(False),
+        'has_previous': previous['collected_at'].notna(),
+    }, index=last.index)
+    return summary
+
+
+def classify_webtoon(summary_row: Optional[pd.Series], climbing: bool = False) -> str:
+    """
+    웹툰 하나의 갱신 등급을 결정합니다.
+
+    Args:
+        summary_row: summarize_webtoon_stats 결과의 한 행 (수집 이력이 없으면 None)
+        climbing: 차트 순위 상승 여부
+
+    Returns:
+        등급 ('new', 'climbing', 'hot', 'active', 'stable', 'rest', 'finished')
+    """
+    if summary_row is None:
+        return 'new'
+    if climbing:
+        return 'climbing'
+    if summary_row['finished']:
+        return 'finished'
+    if summary_row['rest']:
+        return 'rest'
+
+    change_rate = summary_row['change_rate']
+    if summary_row['episode_increased'] or (pd.notna(change_rate) and change_rate >= REFRESH_HOT_CHANGE_RATE):
+        return 'hot'
+    if summary_row['has_previous'] and pd.notna(change_rate) and change_rate < REFRESH_STABLE_CHANGE_RATE:
+        return 'stable'
+    return 'active'
+
+
+def plan_detail_refresh(
+    webtoon_ids: Iterable[str],
+    stats_df: pd.DataFrame,
+    climbing_ids: Optional[set] = None,
+    now: Optional[datetime] = None,
+) -> Tuple[List[str], Dict[str, Dict[str, int]]]:
+    """
+    이번 실행에서 상세 정보를 갱신할 웹툰을 고릅니다.
+
+    Args:
+        webtoon_ids: 후보 웹툰 ID (dim_webtoon 전체)
+        stats_df: fact_webtoon_stats DataFrame
+        climbing_ids: 차트 순위가 오른 웹툰 ID 집합
+        now: 기준 시각 (None이면 현재 시각)
+
+    Returns:
+        (갱신할 웹툰 ID 리스트(입력 순서 유지), 등급별 {'refresh': n, 'skip': n} 통계)
+    """
+    if now is None:
+        now = datetime.now()
+    climbing_ids = climbing_ids or set()
+
+    summary = summarize_webtoon_stats(stats_df)
+    refresh_ids = []
+    plan_stats: Dict[str, Dict[str, int]] = {}
+
+    for webtoon_id in webtoon_ids:
+        webtoon_id = str(webtoon_id)
+        summary_row = summary.loc[webtoon_id] if webtoon_id in summary.index else None
+        tier = classify_webtoon(summary_row, climbing=webtoon_id in climbing_ids)
+
+        if summary_row is None:
+            due = True
+        else:
+            interval = timedelta(days=REFRESH_INTERVALS[tier])
+            due = now - summary_row['last_collected_at'] >= interval - REFRESH_SLACK
+
+        counters = plan_stats.setdefault(tier, {'refresh': 0, 'skip': 0})
+        if due:
+            refresh_ids.append(webtoon_id)
+            counters['refresh'] += 1
+        else:
+            counters['skip'] += 1
+
+    return refresh_ids, plan_stats
+
+
+def find_climbing_webtoon_ids(
+    current_chart: pd.DataFrame,
+    previous_chart: pd.DataFrame,
+    min_rank_gain: int = REFRESH_CLIMB_MIN_RANK_GAIN,
+) -> set:
+    """
+    이전 차트 대비 요일 내 순위가 오르거나 새로 진입한 웹툰을 찾습니다.
+
+    fact_weekly_chart의 rank는 요일을 이어 붙인 전체 순위이므로,
+    요일별 최소 rank를 빼서 요일 내 순위로 바꾼 뒤 비교합니다.
+
+    Args:
+        current_chart: 이번 fact_weekly_chart DataFrame (webtoon_id, rank, weekday)
+        previous_chart: 이전 fact_weekly_chart DataFrame
+        min_rank_gain: 순위 상승으로 판단할 최소 상승 폭
+
+    Returns:
+        순위가 오른 웹툰 ID 집합 (이전 차트가 없으면 빈 집합)
+    """
+    if current_chart is None or previous_chart is None or len(current_chart) == 0 or len(previous_chart) == 0:
+        return set()
+
+    def best_rank_in_weekday(chart: pd.DataFrame) -> pd.Series:
+        df = chart[['webtoon_id', 'rank']].copy()
+        df['webtoon_id'] = df['webtoon_id'].astype(str)
+        df['rank'] = pd.to_numeric(df['rank'], errors='coerce')
+        weekday = chart['weekday'].fillna('') if 'weekday' in chart.columns else ''
+        df['weekday'] = weekday
+        df['weekday_rank'] = df['rank'] - df.groupby('weekday')['rank'].transform('min') + 1
+        return df.groupby('webtoon_id')['weekday_rank'].min()
+
+    current_rank = best_rank_in_weekday(current_chart)
+    previous_rank = best_rank_in_weekday(previous_chart).reindex(current_rank.index)
+
+    climbed = (previous_rank - current_rank) >= min_rank_gain
+    entered = previous_rank.isna()
+    return set(current_rank.index[climbed | entered])
+
+
+def find_previous_chart_date(chart_date: date, sort_types: Optional[List[Optional[str]]] = None) -> Optional[date]:
+    """
+    로컬에 저장된 fact_weekly_chart 중 chart_date 이전의 가장 최근 날짜를 찾습니다.
+
+    Args:
+        chart_date: 기준 날짜
+        sort_types: 정렬 방식 리스트 (None이면 기본값)
+
+    Returns:
+        이전 차트 날짜 (없으면 None)
+    """
+    chart_dir = get_processed_dir() / 'fact_weekly_chart'
+    if not chart_dir.exists():
+        return None
+
+    suffix = f".{get_data_format()}"
+    sort_suffixes = {f"_{sort_type}" if sort_type else '' for sort_type in (sort_types or [None])}
+    previous_dates = []
+    for path in chart_dir.glob(f"*{suffix}"):
+        stem = path.stem
+        date_part, rest = stem[:10], stem[10:]
+        if rest not in sort_suffixes:
+            continue
+        try:
+            file_date = date.fromisoformat(date_part)
+        except ValueError:
+            continue
+        if file_date < chart_date:
+            previous_dates.append(file_date)
+
+    return max(previous_dates) if previous_dates else None
+
+
+def load_chart(chart_date: date, sort_types: Optional[List[Optional[str]]] = None) -> pd.DataFrame:
+    """
+    정렬 방식별 fact_weekly_chart를 로드하여 합칩니다.
+
+    Args:
+        chart_date: 차트 날짜
+        sort_types: 정렬 방식 리스트 (None이면 기본값)
+
+    Returns:
+        fact_weekly_chart DataFrame
+    """
+    frames = [
+        load_fact_weekly_chart(chart_date, sort_type=sort_type, columns=REFRESH_CHART_COLUMNS)
+        for sort_type in (sort_types or [None])
+    ]
+    frames = [frame for frame in frames if len(frame) > 0]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def select_webtoons_to_refresh(
+    webtoon_ids: List[str],
+    chart_date: date,
+    sort_types: Optional[List[Optional[str]]] = None,
+    use_bigquery: bool = False,
+) -> List[str]:
+    """
+    파이프라인에서 호출하는 진입점: 갱신 계획을 세우고 결과를 로그로 남깁니다.
+
+    로컬 fact_webtoon_stats / 이전 차트가 없고 use_bigquery=True이면
+    BigQuery에서 웹툰별 최근 레코드와 이전 차트를 조회합니다.
+    (Cloud Functions의 /tmp는 인스턴스가 바뀌면 비어 있음)
+
+    Args:
+        webtoon_ids: 후보 웹툰 ID (dim_webtoon 전체)
+        chart_date: 이번 차트 날짜
+        sort_types: 이번 실행에서 수집한 정렬 방식 리스트
+        use_bigquery: 로컬 데이터가 없을 때 BigQuery 조회 여부
+
+    Returns:
+        갱신할 웹툰 ID 리스트
+    """
+    stats_df = load_fact_webtoon_stats(start_date=chart_date - REFRESH_STATS_LOOKBACK, columns=REFRESH_STATS_COLUMNS)
+    current_chart = load_chart(chart_date, sort_types)
+
+    previous_date = find_previous_chart_date(chart_date, sort_types)
+    previous_chart = load_chart(previous_date, sort_types) if previous_date else pd.DataFrame()
+
+    if use_bigquery and (len(stats_df) == 0 or len(previous_chart) == 0):
+        from src.upload_bigquery import fetch_recent_webtoon_stats, fetch_previous_chart
+        if len(stats_df) == 0:
+            stats_df = fetch_recent_webtoon_stats()
+        if len(previous_chart) == 0:
+            previous_chart = fetch_previous_chart(chart_date)
+
+    climbing_ids = find_climbing_webtoon_ids(current_chart, previous_chart)
+    refresh_ids, plan_stats = plan_detail_refresh(webtoon_ids, stats_df, climbing_ids=climbing_ids)
+
+    skipped = len(webtoon_ids) - len(refresh_ids)
+    logger.info(f"상세 정보 갱신 계획: {len(refresh_ids)}/{len(webtoon_ids)}개 갱신, {skipped}개 건너뜀 (등급별: {plan_stats})")
+    return refresh_ids
@@ -6,6 +6,7 @@ Extract → Parse → Transform 전체 플로우를 실행합니다.
 
 import argparse
 import logging
+import os
 import sys
 from datetime import date
 from pathlib import Path
@@ -15,17 +16,28 @@ from typing import Optional
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.extract import extract_webtoon_chart
-from src.parse import parse_html_file
+from src.extract import ChartPayload, get_connection_stats, iter_chart_payloads
+from src.parse import load_html_from_file, parse_chart_payload
 from src.transform import transform_and_save, load_dim_webtoon
-from src.extract_webtoon_detail import extract_webtoon_detail
-from src.transform_webtoon_stats import transform_and_save_webtoon_stats
+from src.extract_webtoon_detail_async import collect_webtoon_details, get_aiohttp_connection_stats
+from src.http_cache import get_http_cache
+from src.rate_control import get_naver_rate_controller
+from src.refresh_planner import select_webtoons_to_refresh
+from src.transform_webtoon_stats import compact_fact_webtoon_stats, transform_and_save_webtoon_stats
 from src.utils import setup_logging, get_log_file_path
 
 logger = None
 
 
-def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: list = None, limit: Optional[int] = None) -> bool:
+def run_pipeline(
+    chart_date: date = None,
+    html_file: Path = None,
+    sort_types: list = None,
+    limit: Optional[int] = None,
+    detail_concurrency: Optional[int] = None,
+    detail_rps: Optional[float] = None,
+    full_refresh: bool = False,
+) -> bool:
     """
     전체 파이프라인을 실행합니다.
     
@@ -34,6 +46,9 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
         html_file: 이미 수집된 HTML 파일 경로 (None이면 새로 수집)
         sort_types: 정렬 방식 리스트 (["popular", "view"] 등), None이면 기본값만
         limit: 테스트용 웹툰 수 제한 (None이면 전체 수집)
+        detail_concurrency: 상세 정보 수집 동시 요청 수 상한 (None이면 기본값)
+        detail_rps: 네이버 요청 공용 시작 초당 요청 수 (None이면 기본값)
+        full_refresh: True이면 갱신 계획 없이 모든 웹툰의 상세 정보 수집
     
     Returns:
         성공 여부
@@ -54,29 +69,40 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
     try:
         all_success = True
         
-        # 각 정렬 타입별로 수집
-        for sort_type in sort_types:
+        # Step 1: Extract (차트 수집)
+        # 모든 정렬 타입을 하나의 세션으로 동시에 수집하고, 끝난 순서대로 파싱/저장
+        # 수집 결과(ChartPayload)는 메모리로 바로 파싱 단계에 전달하고,
+        # 응답 원본은 RAW_ARCHIVE_TARGET에 따라 부수적으로 보관 (기본값: local, none이면 보관하지 않음)
+        if html_file:
+            logger.info(f"기존 HTML 파일 사용: {html_file}")
+            html = load_html_from_file(html_file)
+            chart_results = (
+                (sort_type, ChartPayload(sort_type=sort_type, html=html) if html is not None else None)
+                for sort_type in sort_types
+            )
+        else:
+            logger.info(f"차트 수집 시작... (정렬: {', '.join(s if s else 'default' for s in sort_types)})")
+            chart_results = iter_chart_payloads(
+                chart_date,
+                sort_types=sort_types,
+                archive_target=os.getenv('RAW_ARCHIVE_TARGET', 'local')
+            )
+        
+        for sort_type, payload in chart_results:
             sort_name = sort_type if sort_type else "default"
             logger.info(f"\n{'='*60}")
             logger.info(f"정렬 타입: {sort_name}")
             logger.info(f"{'='*60}")
             
             try:
-                # Step 1: Extract (HTML 수집)
-                if html_file:
-                    logger.info(f"기존 HTML 파일 사용: {html_file}")
-                    html_path = html_file
-                else:
-                    logger.info(f"HTML 수집 시작... (정렬: {sort_name})")
-                    html_path = extract_webtoon_chart(chart_date, sort_type=sort_type)
-                    if html_path is None:
-                        logger.error(f"HTML 수집 실패 (정렬: {sort_name})")
-                        all_success = False
-                        continue
+                if payload is None:
+                    logger.error(f"차트 수집 실패 (정렬: {sort_name})")
+                    all_success = False
+                    continue
                 
-                # Step 2: Parse (HTML 파싱)
-                logger.info("HTML 파싱 시작...")
-                parsed_data = parse_html_file(html_path)
+                # Step 2: Parse (API 응답은 dict 그대로, 페이지는 HTML 파싱)
+                logger.info(f"차트 파싱 시작... ({payload.source})")
+                parsed_data = parse_chart_payload(payload)
                 if len(parsed_data) == 0:
                     logger.error("파싱된 데이터가 없습니다. HTML 구조를 확인하세요.")
                     all_success = False
@@ -91,16 +117,6 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
                 
                 if success:
                     logger.info(f"✅ 정렬 타입 '{sort_name}' 수집 완료!")
-                    
-                    # Step 4: GCS 업로드 (선택적, 환경 변수로 제어)
-                    if os.getenv('UPLOAD_TO_GCS', 'false').lower() == 'true':
-                        logger.info("GCS 업로드 시작...")
-                        from src.upload_gcs import upload_chart_data_to_gcs
-                        gcs_success = upload_chart_data_to_gcs(chart_date, sort_type=sort_type)
-                        if gcs_success:
-                            logger.info(f"✅ GCS 업로드 완료 (정렬: {sort_name})")
-                        else:
-                            logger.warning(f"⚠️ GCS 업로드 실패 (정렬: {sort_name}), 계속 진행...")
                 else:
                     logger.error(f"❌ 정렬 타입 '{sort_name}' 데이터 변환 및 저장 실패")
                     all_success = False
@@ -111,6 +127,16 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
                 traceback.print_exc()
                 all_success = False
         
+        # GCS 업로드 (선택적, 환경 변수로 제어): 이 날짜의 원본 파일을 한 번에 동시 업로드
+        # (gzip 압축, 이미 같은 내용이 있으면 건너뜀)
+        if os.getenv('UPLOAD_TO_GCS', 'false').lower() == 'true':
+            logger.info("GCS 업로드 시작...")
+            from src.upload_gcs import upload_raw_data_for_date
+            if upload_raw_data_for_date(chart_date):
+                logger.info("✅ GCS 업로드 완료")
+            else:
+                logger.warning("⚠️ GCS 업로드 실패, 계속 진행...")
+        
         # Step 4: 웹툰 상세 정보 수집 (모든 정렬 타입 수집 완료 후)
         logger.info("\n" + "="*60)
         logger.info("웹툰 상세 정보 수집 시작...")
@@ -124,6 +150,12 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
             else:
                 webtoon_ids = dim_df['webtoon_id'].astype(str).unique().tolist()
                 
+                # 증분 갱신: 변화가 적은 웹툰은 갱신 주기가 돌아온 경우에만 수집
+                if full_refresh:
+                    logger.info("전체 갱신 모드: 모든 웹툰의 상세 정보를 수집합니다.")
+                else:
+                    webtoon_ids = select_webtoons_to_refresh(webtoon_ids, chart_date, sort_types=sort_types)
+                
                 # 테스트용 제한
                 if limit is not None and limit > 0:
                     webtoon_ids = webtoon_ids[:limit]
@@ -131,33 +163,13 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
                 
                 logger.info(f"총 {len(webtoon_ids)}개 웹툰의 상세 정보 수집 시작...")
                 
-                detail_data_list = []
-                batch_size = 10
-                batch_delay = 10  # 배치 간 대기 시간 (초)
-                
-                for i, webtoon_id in enumerate(webtoon_ids, 1):
-                    try:
-                        # 웹툰 상세 정보 수집
-                        detail_data = extract_webtoon_detail(webtoon_id, use_html_fallback=True)
-                        
-                        if detail_data:
-                            detail_data_list.append(detail_data)
-                            logger.debug(f"[{i}/{len(webtoon_ids)}] 웹툰 상세 정보 수집: {webtoon_id}")
-                        else:
-                            logger.warning(f"[{i}/{len(webtoon_ids)}] 웹툰 상세 정보 수집 실패: {webtoon_id}")
-                        
-                        # Rate limiting: 각 요청 간 1-2초 대기
-                        import time
-                        time.sleep(1.5)
-                        
-                        # 배치 처리: 10개마다 긴 대기
-                        if i % batch_size == 0:
-                            logger.info(f"배치 완료: {i}/{len(webtoon_ids)}개 처리됨. {batch_delay}초 대기...")
-                            time.sleep(batch_delay)
-                            
-                    except Exception as e:
-                        logger.error(f"웹툰 상세 정보 수집 실패 (webtoon_id={webtoon_id}): {e}")
-                        continue
+                # 비동기 수집 (동시 요청 수 제한 + 초당 요청 수 예산)
+                detail_data_list = collect_webtoon_details(
+                    webtoon_ids,
+                    use_html_fallback=True,
+                    max_concurrency=detail_concurrency,
+                    requests_per_second=detail_rps,
+                )
                 
                 # 수집된 데이터 저장
                 if len(detail_data_list) > 0:
@@ -165,60 +177,23 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
                     
                     # fact_webtoon_stats 저장
                     success = transform_and_save_webtoon_stats(detail_data_list, dim_webtoon_ids)
+                    compact_fact_webtoon_stats()
                     
                     if success:
                         logger.info(f"✅ 웹툰 상세 정보 수집 완료: {len(detail_data_list)}개")
                         
                         # dim_webtoon 업데이트 (genre, tags 정보 추가)
                         logger.info("dim_webtoon 업데이트 중 (genre, tags 정보 추가)...")
-                        from src.transform import merge_dim_webtoon, save_dim_webtoon
-                        from src.models import create_dim_webtoon_record, validate_dim_webtoon_record
+                        from src.dim_webtoon_store import DimWebtoonStore
                         
-                        dim_df = load_dim_webtoon()
-                        # webtoon_id를 문자열로 변환하여 비교
-                        dim_df['webtoon_id'] = dim_df['webtoon_id'].astype(str)
-                        update_records = []
-                        
-                        for detail_data in detail_data_list:
-                            webtoon_id = str(detail_data.get('webtoon_id')) if detail_data.get('webtoon_id') else None
-                            genre = detail_data.get('genre')
-                            tags = detail_data.get('tags')
-                            
-                            logger.debug(f"업데이트 체크: webtoon_id={webtoon_id}, genre={genre}, tags={tags}")
-                            
-                            if webtoon_id and webtoon_id in dim_webtoon_ids:
-                                # 기존 레코드 찾기
-                                existing = dim_df[dim_df['webtoon_id'] == webtoon_id]
-                                if len(existing) > 0:
-                                    # genre나 tags가 있으면 업데이트
-                                    if genre or tags:
-                                        # 기존 정보 유지하면서 genre, tags만 업데이트
-                                        existing_record = existing.iloc[0].to_dict()
-                                        
-                                        # 기존 tags는 이미 리스트로 변환되어 있음 (load_dim_webtoon_csv에서 처리)
-                                        existing_tags = existing_record.get('tags')
-                                        
-                                        update_record = create_dim_webtoon_record(
-                                            webtoon_id=existing_record['webtoon_id'],
-                                            title=existing_record['title'],
-                                            author=existing_record.get('author'),
-                                            genre=genre if genre else existing_record.get('genre'),
-                                            tags=tags if tags else existing_tags,
-                                        )
-                                        if validate_dim_webtoon_record(update_record):
-                                            update_records.append(update_record)
-                                            logger.debug(f"업데이트 레코드 추가: webtoon_id={webtoon_id}, genre={genre}, tags={len(tags) if tags else 0}개")
-                                        else:
-                                            logger.warning(f"업데이트 레코드 검증 실패: webtoon_id={webtoon_id}")
-                                else:
-                                    logger.warning(f"기존 레코드를 찾을 수 없음: webtoon_id={webtoon_id}")
-                            else:
-                                logger.warning(f"webtoon_id가 dim_webtoon_ids에 없음: webtoon_id={webtoon_id}, dim_webtoon_ids에 있음: {webtoon_id in dim_webtoon_ids if webtoon_id else False}")
+                        # webtoon_id로 색인해 상세 정보와 조인 (새 tags가 있으면 교체)
+                        dim_store = DimWebtoonStore.load()
+                        update_records = dim_store.enrichment_records(detail_data_list, merge_tags=False)
                         
                         if len(update_records) > 0:
-                            updated_df = merge_dim_webtoon(dim_df, update_records)
-                            save_dim_webtoon(updated_df)
-                            logger.info(f"dim_webtoon 업데이트 완료: {len(update_records)}개 레코드 업데이트됨")
+                            changed_count = dim_store.upsert(update_records)
+                            dim_store.flush()
+                            logger.info(f"dim_webtoon 업데이트 완료: {changed_count}개 레코드 업데이트됨 (요청 {len(update_records)}개)")
                         else:
                             logger.warning(f"dim_webtoon 업데이트할 레코드가 없습니다. (genre/tags가 있는 detail_data: {sum(1 for d in detail_data_list if d.get('genre') or d.get('tags'))}개)")
                     else:
@@ -233,6 +208,12 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, sort_types: li
             traceback.print_exc()
             all_success = False
         
+        logger.info(f"네이버 요청 제어 metrics: {get_naver_rate_controller().get_metrics()}")
+        http_cache = get_http_cache()
+        if http_cache is not None:
+            logger.info(f"HTTP 캐시 통계: {http_cache.get_stats()}")
+        logger.info(f"HTTP 연결 재사용 통계: requests={get_connection_stats()}, aiohttp={get_aiohttp_connection_stats()}")
+        
         if all_success:
             logger.info("\n🎉 모든 정렬 타입 수집 완료!")
             return True
@@ -271,6 +252,21 @@ if __name__ == "__main__":
         type=int,
         help='테스트용 웹툰 수 제한 (상세 정보 수집 시에만 적용, None이면 전체 수집)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        help='상세 정보 수집 동시 요청 수 상한 (기본값: NAVER_MAX_CONCURRENCY 환경 변수 또는 16)'
+    )
+    parser.add_argument(
+        '--rps',
+        type=float,
+        help='네이버 요청 공용 초당 요청 수 (기본값: NAVER_REQUESTS_PER_SECOND 환경 변수 또는 4)'
+    )
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='갱신 계획 없이 모든 웹툰의 상세 정보 수집 (기본값: 변화가 적은 웹툰은 주기에 따라 건너뜀)'
+    )
     
     args = parser.parse_args()
     
@@ -299,7 +295,10 @@ if __name__ == "__main__":
         chart_date=chart_date,
         html_file=html_file,
         sort_types=sort_types,
-        limit=args.limit
+        limit=args.limit,
+        detail_concurrency=args.concurrency,
+        detail_rps=args.rps,
+        full_refresh=args.full_refresh
     )
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,303 @@
+"""
+Shard Queue 모듈: 상세 정보 수집 샤딩 (coordinator / worker)
+
+Cloud Function 인스턴스 하나의 실행 시간 제한 안에서 전체 웹툰 상세 정보를 수집하는 대신,
+coordinator가 webtoon_id 리스트를 N개 샤드로 나누어 worker 호출에 분배하고,
+worker가 돌려준 결과를 샤드가 끝나는 순서대로 받아 fact_webtoon_stats에 병합합니다.
+(coordinator가 시간 초과로 중단돼도 먼저 끝난 샤드는 저장/체크포인트까지 끝남)
+
+큐 구현 (SHARD_QUEUE 환경 변수 또는 요청 파라미터 shard_queue)
+- inprocess: 같은 프로세스의 스레드에서 worker 실행 (로컬 테스트용, 요청 예산 공유)
+- http: SHARD_WORKER_URL로 worker 요청을 동시에 보냄
+  (배포 환경: worker용 Cloud Function에 mode=worker로 호출하면 샤드마다 별도 인스턴스에서 실행,
+   coordinator 함수가 max-instances=1이면 자기 호출은 coordinator 뒤에 대기하므로 deploy.sh의 DEPLOY_SHARD_WORKER 사용,
+   로컬 테스트: scripts/test/local_shard_worker.py 또는 functions-framework)
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from src.extract_webtoon_detail_async import collect_webtoon_details
+
+logger = logging.getLogger(__name__)
+
+SHARD_QUEUE = os.getenv('SHARD_QUEUE', 'inprocess').lower()
+SHARD_WORKER_URL = os.getenv('SHARD_WORKER_URL')
+SHARD_WORKER_TIMEOUT_SECONDS = int(os.getenv('SHARD_WORKER_TIMEOUT_SECONDS', '540'))
+SHARD_WORKER_USE_ID_TOKEN = os.getenv('SHARD_WORKER_USE_ID_TOKEN', 'false').lower() == 'true'
+
+
+def split_into_shards(webtoon_ids: List[str], num_shards: int) -> List[List[str]]:
+    """
+    webtoon_id 리스트를 num_shards개의 비슷한 크기 샤드로 나눕니다. (순서 유지, 연속 구간)
+
+    Args:
+        webtoon_ids: 전체 웹툰 ID 리스트
+        num_shards: 샤드 수
+
+    Returns:
+        샤드 리스트 (빈 샤드는 제외)
+    """
+    num_shards = max(1, min(int(num_shards), len(webtoon_ids)))
+    shard_size, remainder = divmod(len(webtoon_ids), num_shards)
+    shards = []
+    start = 0
+    for index in range(num_shards):
+        end = start + shard_size + (1 if index < remainder else 0)
+        if end > start:
+            shards.append(webtoon_ids[start:end])
+        start = end
+    return shards
+
+
+def run_detail_worker(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    worker: 샤드 하나의 상세 정보를 수집하여 결과를 반환합니다.
+    (저장/업로드는 coordinator가 담당)
+
+    Args:
+        payload: {
+            'shard_index': 샤드 번호,
+            'webtoon_ids': 수집할 웹툰 ID 리스트,
+            'detail_concurrency': 동시 요청 수 상한 (선택),
+            'requests_per_second': 이 worker의 초당 요청 수 예산 (선택),
+        }
+
+    Returns:
+        {'status', 'shard_index', 'requested', 'collected', 'details'}
+    """
+    shard_index = payload.get('shard_index')
+    webtoon_ids = [str(webtoon_id) for webtoon_id in payload.get('webtoon_ids', [])]
+    logger.info(f"샤드 {shard_index} 상세 정보 수집 시작: {len(webtoon_ids)}개")
+
+    details = collect_webtoon_details(
+        webtoon_ids,
+        use_html_fallback=True,
+        max_concurrency=payload.get('detail_concurrency'),
+        requests_per_second=payload.get('requests_per_second'),
+    )
+
+    logger.info(f"✅ 샤드 {shard_index} 상세 정보 수집 완료: {len(details)}/{len(webtoon_ids)}개")
+    return {
+        'status': 'success',
+        'shard_index': shard_index,
+        'requested': len(webtoon_ids),
+        'collected': len(details),
+        'details': details,
+    }
+
+
+class InProcessShardQueue:
+    """같은 프로세스의 스레드에서 worker를 실행하는 큐 (로컬 테스트용)"""
+
+    def __init__(self, worker: Callable[[Dict[str, Any]], Dict[str, Any]] = run_detail_worker, max_workers: int = 4):
+        self.worker = worker
+        self.max_workers = max_workers
+
+    def run(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        모든 샤드를 실행하고 결과를 반환합니다.
+
+        Args:
+            payloads: 샤드별 worker 요청
+
+        Returns:
+            샤드별 결과 (샤드 순서, 실패한 샤드는 status='error')
+        """
+        return _in_shard_order(self.iter_results(payloads))
+
+    def iter_results(self, payloads: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        모든 샤드를 실행하고 끝나는 순서대로 결과를 돌려줍니다.
+
+        Args:
+            payloads: 샤드별 worker 요청
+
+        Returns:
+            샤드별 결과 iterator (실패한 샤드는 status='error')
+        """
+        def run_one(payload: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return self.worker(payload)
+            except Exception as e:
+                logger.error(f"❌ 샤드 {payload.get('shard_index')} 실행 실패: {e}")
+                return {'status': 'error', 'shard_index': payload.get('shard_index'), 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(payloads)))) as executor:
+            futures = [executor.submit(run_one, payload) for payload in payloads]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+class HttpShardQueue:
+    """worker URL로 샤드 요청을 동시에 보내는 큐 (Cloud Function 자기 호출 또는 로컬 HTTP worker)"""
+
+    def __init__(self, worker_url: str, timeout: int = SHARD_WORKER_TIMEOUT_SECONDS, use_id_token: bool = SHARD_WORKER_USE_ID_TOKEN):
+        if not worker_url:
+            raise ValueError("HTTP 샤드 큐에는 worker URL이 필요합니다. (SHARD_WORKER_URL)")
+        self.worker_url = worker_url
+        self.timeout = timeout
+        self.use_id_token = use_id_token
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """인증이 필요한 Cloud Function 호출용 ID 토큰 헤더"""
+        if not self.use_id_token:
+            return {}
+        from google.auth.transport.requests import Request
+        from google.oauth2 import id_token
+        token = id_token.fetch_id_token(Request(), self.worker_url)
+        return {'Authorization': f"Bearer {token}"}
+
+    def run(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        모든 샤드 요청을 동시에 보내고 응답을 기다립니다.
+
+        Args:
+            payloads: 샤드별 worker 요청
+
+        Returns:
+            샤드별 결과 (샤드 순서, 실패한 샤드는 status='error')
+        """
+        return _in_shard_order(self.iter_results(payloads))
+
+    def iter_results(self, payloads: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        모든 샤드 요청을 동시에 보내고 응답이 도착하는 순서대로 돌려줍니다.
+
+        Args:
+            payloads: 샤드별 worker 요청
+
+        Returns:
+            샤드별 결과 iterator (실패한 샤드는 status='error')
+        """
+        headers = self._auth_headers()
+
+        def run_one(payload: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                response = requests.post(self.worker_url, json=payload, headers=headers, timeout=self.timeout)
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                logger.error(f"❌ 샤드 {payload.get('shard_index')} worker 호출 실패: {e}")
+                return {'status': 'error', 'shard_index': payload.get('shard_index'), 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=len(payloads) or 1) as executor:
+            futures = [executor.submit(run_one, payload) for payload in payloads]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def _in_shard_order(results: Iterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """끝나는 순서대로 받은 샤드 결과를 샤드 번호 순서로 정렬합니다."""
+    return sorted(results, key=lambda result: result.get('shard_index') or 0)
+
+
+def get_shard_queue(queue_type: Optional[str] = None, worker_url: Optional[str] = None):
+    """
+    설정에 맞는 샤드 큐를 생성합니다.
+
+    Args:
+        queue_type: 'inprocess' 또는 'http' (None이면 SHARD_QUEUE 환경 변수)
+        worker_url: HTTP worker URL (None이면 SHARD_WORKER_URL 환경 변수)
+
+    Returns:
+        InProcessShardQueue 또는 HttpShardQueue
+    """
+    queue_type = (queue_type or SHARD_QUEUE).lower()
+    if queue_type == 'http':
+        return HttpShardQueue(worker_url or SHARD_WORKER_URL)
+    if queue_type == 'inprocess':
+        return InProcessShardQueue()
+    raise ValueError(f"지원하지 않는 샤드 큐: {queue_type} (inprocess 또는 http)")
+
+
+def iter_webtoon_details_sharded(
+    webtoon_ids: List[str],
+    num_shards: int,
+    queue=None,
+    detail_concurrency: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+    """
+    coordinator: 샤드를 worker에 분배하고 샤드가 끝나는 순서대로 결과를 돌려줍니다.
+
+    HTTP worker는 인스턴스마다 요청 예산이 따로 있으므로,
+    requests_per_second를 샤드 수로 나누어 전체 예산을 유지합니다.
+
+    Args:
+        webtoon_ids: 수집할 웹툰 ID 리스트
+        num_shards: 샤드 수
+        queue: 샤드 큐 (None이면 get_shard_queue())
+        detail_concurrency: worker별 동시 요청 수 상한
+        requests_per_second: 전체 초당 요청 수 예산 (None이면 worker 기본값)
+
+    Returns:
+        (샤드의 webtoon_id 리스트, 상세 정보 리스트) iterator (실패한 샤드는 상세 정보가 빈 리스트)
+    """
+    if queue is None:
+        queue = get_shard_queue()
+
+    shards = split_into_shards(webtoon_ids, num_shards)
+    worker_rps = None
+    if requests_per_second is not None and isinstance(queue, HttpShardQueue):
+        worker_rps = requests_per_second / len(shards)
+
+    payloads = [
+        {
+            'mode': 'worker',
+            'shard_index': index,
+            'num_shards': len(shards),
+            'webtoon_ids': shard,
+            'detail_concurrency': detail_concurrency,
+            'requests_per_second': worker_rps,
+        }
+        for index, shard in enumerate(shards)
+    ]
+    logger.info(f"상세 정보 샤드 분배: {len(webtoon_ids)}개 → {len(shards)}개 샤드 ({type(queue).__name__})")
+
+    for result in queue.iter_results(payloads):
+        shard_index = result.get('shard_index')
+        shard_ids = shards[shard_index] if isinstance(shard_index, int) and 0 <= shard_index < len(shards) else []
+        if result.get('status') != 'success':
+            logger.warning(f"실패한 샤드: {shard_index} (해당 웹툰은 체크포인트에 남아 재실행 시 다시 수집)")
+            yield shard_ids, []
+            continue
+        logger.info(f"샤드 {shard_index} 결과 도착: {result.get('collected', 0)}/{len(shard_ids)}개 수집")
+        yield shard_ids, result.get('details', [])
+
+
+def collect_webtoon_details_sharded(
+    webtoon_ids: List[str],
+    num_shards: int,
+    queue=None,
+    detail_concurrency: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    coordinator: 모든 샤드가 끝날 때까지 기다려 결과를 webtoon_id 기준으로 합칩니다.
+    (샤드마다 바로 저장하려면 iter_webtoon_details_sharded 사용)
+
+    Args:
+        webtoon_ids: 수집할 웹툰 ID 리스트
+        num_shards: 샤드 수
+        queue: 샤드 큐 (None이면 get_shard_queue())
+        detail_concurrency: worker별 동시 요청 수 상한
+        requests_per_second: 전체 초당 요청 수 예산 (None이면 worker 기본값)
+
+    Returns:
+        {webtoon_id: 상세 정보} 딕셔너리 (실패한 샤드의 웹툰은 빠짐)
+    """
+    details_by_id: Dict[str, Dict[str, Any]] = {}
+    for _, details in iter_webtoon_details_sharded(
+        webtoon_ids, num_shards, queue=queue,
+        detail_concurrency=detail_concurrency, requests_per_second=requests_per_second,
+    ):
+        for detail in details:
+            details_by_id[str(detail['webtoon_id'])] = detail
+
+    logger.info(f"샤드 결과 병합 완료: {len(details_by_id)}/{len(webtoon_ids)}개 수집")
+    return details_by_id
@@ -1,7 +1,7 @@
 """
 Transform 모듈: 데이터 변환 및 정규화
 
-이 모듈은 파싱된 데이터를 스키마에 맞게 변환하고 CSV로 저장합니다.
+이 모듈은 파싱된 데이터를 스키마에 맞게 변환하고 JSONL/CSV/Parquet으로 저장합니다.
 - dim_webtoon (마스터 테이블) 데이터 생성 및 저장
 - fact_weekly_chart (히스토리 테이블) 데이터 생성 및 저장
 - 멱등성 보장 (중복 체크)
@@ -10,28 +10,31 @@ Transform 모듈: 데이터 변환 및 정규화
 """
 
 import csv
-import json
 import logging
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from src.models import (
-    create_dim_webtoon_record,
-    create_fact_weekly_chart_record,
-    validate_dim_webtoon_record,
-    validate_fact_weekly_chart_record,
+    DimWebtoonRecord,
+    FactWeeklyChartRecord,
+    records_to_dataframe,
     validate_foreign_key,
     DIM_WEBTOON_COLUMNS,
     FACT_WEEKLY_CHART_COLUMNS,
 )
+from src.json_codec import loads
+from src.jsonl_writer import write_jsonl
+from src.parquet_io import read_parquet, write_parquet
 from src.utils import (
     get_chart_csv_path,
     get_chart_jsonl_path,
+    get_chart_parquet_path,
     get_dim_webtoon_csv_path,
     get_dim_webtoon_jsonl_path,
+    get_dim_webtoon_parquet_path,
     get_data_format,
     format_date,
     format_datetime,
@@ -44,18 +47,11 @@ from src.utils import (
 logger = logging.getLogger(__name__)
 
 
-def serialize_for_json(obj):
-    """
-    JSON 직렬화를 위한 헬퍼 함수.
-    datetime, date 객체를 문자열로 변환합니다.
-    """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, date):
-        return obj.isoformat()
-    elif isinstance(obj, pd.Timestamp):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+def _project_columns(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    """JSONL/CSV 로더 결과에서 요청한 컬럼만 남깁니다 (Parquet 로더의 columns와 같은 결과)."""
+    if columns is None:
+        return df
+    return df[[column for column in columns if column in df.columns]]
 
 
 def load_dim_webtoon_jsonl() -> pd.DataFrame:
@@ -73,10 +69,10 @@ def load_dim_webtoon_jsonl() -> pd.DataFrame:
     
     try:
         records = []
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             for line in f:
                 if line.strip():
-                    record = json.loads(line)
+                    record = loads(line)
                     # datetime 문자열을 datetime 객체로 변환
                     if 'created_at' in record and record['created_at']:
                         record['created_at'] = datetime.fromisoformat(record['created_at'].replace('Z', '+00:00'))
@@ -95,19 +91,52 @@ def load_dim_webtoon_jsonl() -> pd.DataFrame:
         return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
 
 
-def load_dim_webtoon() -> pd.DataFrame:
+def load_dim_webtoon(columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
-    dim_webtoon 파일을 로드합니다 (JSONL 또는 CSV).
+    dim_webtoon 파일을 로드합니다 (JSONL, CSV 또는 Parquet).
     DATA_FORMAT 환경 변수에 따라 형식을 결정합니다.
     
+    Args:
+        columns: 필요한 컬럼 리스트 (None이면 전체, Parquet은 해당 컬럼만 디스크에서 읽음)
+    
     Returns:
         dim_webtoon DataFrame
     """
     data_format = get_data_format()
-    if data_format == 'jsonl':
-        return load_dim_webtoon_jsonl()
+    if data_format == 'parquet':
+        return load_dim_webtoon_parquet(columns=columns)
+    elif data_format == 'jsonl':
+        return _project_columns(load_dim_webtoon_jsonl(), columns)
     else:
-        return load_dim_webtoon_csv()
+        return _project_columns(load_dim_webtoon_csv(), columns)
+
+
+def load_dim_webtoon_parquet(columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    dim_webtoon Parquet 파일을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    
+    Args:
+        columns: 읽을 컬럼 리스트 (None이면 전체)
+    
+    Returns:
+        dim_webtoon DataFrame
+    """
+    file_path = get_dim_webtoon_parquet_path()
+    empty_columns = columns if columns is not None else DIM_WEBTOON_COLUMNS
+    
+    if not file_path.exists():
+        logger.info("dim_webtoon.parquet 파일이 없습니다. 새로 생성합니다.")
+        return pd.DataFrame(columns=empty_columns)
+    
+    try:
+        df = read_parquet(file_path, 'dim_webtoon', columns=columns)
+        logger.info(f"dim_webtoon.parquet 로드 완료: {len(df)}개 레코드")
+        return df
+    except ImportError:
+        raise
+    except Exception as e:
+        logger.error(f"dim_webtoon.parquet 로드 실패: {e}")
+        return pd.DataFrame(columns=empty_columns)
 
 
 def load_dim_webtoon_csv() -> pd.DataFrame:
@@ -177,10 +206,10 @@ def load_fact_weekly_chart_jsonl(chart_date: date, sort_type: Optional[str] = No
     
     try:
         records = []
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             for line in f:
                 if line.strip():
-                    record = json.loads(line)
+                    record = loads(line)
                     # date, datetime 문자열을 객체로 변환
                     if 'chart_date' in record and record['chart_date']:
                         record['chart_date'] = date.fromisoformat(record['chart_date'])
@@ -199,23 +228,65 @@ def load_fact_weekly_chart_jsonl(chart_date: date, sort_type: Optional[str] = No
         return pd.DataFrame(columns=FACT_WEEKLY_CHART_COLUMNS)
 
 
-def load_fact_weekly_chart(chart_date: date, sort_type: Optional[str] = None) -> pd.DataFrame:
+def load_fact_weekly_chart(
+    chart_date: date,
+    sort_type: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
-    fact_weekly_chart 파일을 로드합니다 (JSONL 또는 CSV).
+    fact_weekly_chart 파일을 로드합니다 (JSONL, CSV 또는 Parquet).
     DATA_FORMAT 환경 변수에 따라 형식을 결정합니다.
     
     Args:
         chart_date: 수집 날짜
         sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
+        columns: 필요한 컬럼 리스트 (None이면 전체, Parquet은 해당 컬럼만 디스크에서 읽음)
     
     Returns:
         fact_weekly_chart DataFrame
     """
     data_format = get_data_format()
-    if data_format == 'jsonl':
-        return load_fact_weekly_chart_jsonl(chart_date, sort_type=sort_type)
+    if data_format == 'parquet':
+        return load_fact_weekly_chart_parquet(chart_date, sort_type=sort_type, columns=columns)
+    elif data_format == 'jsonl':
+        return _project_columns(load_fact_weekly_chart_jsonl(chart_date, sort_type=sort_type), columns)
     else:
-        return load_fact_weekly_chart_csv(chart_date, sort_type=sort_type)
+        return _project_columns(load_fact_weekly_chart_csv(chart_date, sort_type=sort_type), columns)
+
+
+def load_fact_weekly_chart_parquet(
+    chart_date: date,
+    sort_type: Optional[str] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    fact_weekly_chart Parquet 파일을 로드합니다 (날짜별 파일).
+    파일이 없으면 빈 DataFrame 반환.
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
+        columns: 읽을 컬럼 리스트 (None이면 전체)
+    
+    Returns:
+        fact_weekly_chart DataFrame
+    """
+    file_path = get_chart_parquet_path(chart_date, sort_type=sort_type)
+    empty_columns = columns if columns is not None else FACT_WEEKLY_CHART_COLUMNS
+    
+    if not file_path.exists():
+        logger.info(f"fact_weekly_chart {format_date(chart_date)}.parquet 파일이 없습니다.")
+        return pd.DataFrame(columns=empty_columns)
+    
+    try:
+        df = read_parquet(file_path, 'fact_weekly_chart', columns=columns)
+        logger.info(f"fact_weekly_chart {format_date(chart_date)}.parquet 로드 완료: {len(df)}개 레코드")
+        return df
+    except ImportError:
+        raise
+    except Exception as e:
+        logger.error(f"fact_weekly_chart Parquet 로드 실패: {e}")
+        return pd.DataFrame(columns=empty_columns)
 
 
 def load_fact_weekly_chart_csv(chart_date: date, sort_type: Optional[str] = None) -> pd.DataFrame:
@@ -292,25 +363,8 @@ def save_dim_webtoon_jsonl(df: pd.DataFrame) -> None:
         # 컬럼 순서 보장
         df = df[DIM_WEBTOON_COLUMNS].copy() if all(col in df.columns for col in DIM_WEBTOON_COLUMNS) else df.copy()
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            for _, row in df.iterrows():
-                record = row.to_dict()
-                # datetime을 ISO 형식 문자열로 변환
-                if 'created_at' in record and pd.notna(record['created_at']):
-                    if isinstance(record['created_at'], pd.Timestamp):
-                        record['created_at'] = record['created_at'].isoformat()
-                if 'updated_at' in record and pd.notna(record['updated_at']):
-                    if isinstance(record['updated_at'], pd.Timestamp):
-                        record['updated_at'] = record['updated_at'].isoformat()
-                # None을 null로 변환 (리스트는 그대로 유지)
-                def convert_value(val):
-                    if isinstance(val, list):
-                        return val  # 리스트는 그대로
-                    if pd.isna(val):
-                        return None
-                    return val
-                record = {k: convert_value(v) for k, v in record.items()}
-                f.write(json.dumps(record, ensure_ascii=False, default=serialize_for_json) + '\n')
+        # datetime -> ISO 문자열, NaN -> null 변환은 컬럼 단위로 (src/jsonl_writer.py)
+        write_jsonl(file_path, df, 'dim_webtoon')
         
         logger.info(f"dim_webtoon.jsonl 저장 완료: {len(df)}개 레코드")
     except Exception as e:
@@ -352,16 +406,37 @@ def save_dim_webtoon_csv(df: pd.DataFrame) -> None:
         raise
 
 
+def save_dim_webtoon_parquet(df: pd.DataFrame) -> None:
+    """
+    dim_webtoon DataFrame을 Parquet 파일로 저장합니다.
+    
+    tags는 list<string>으로 저장됩니다 (BigQuery REPEATED STRING용).
+    
+    Args:
+        df: 저장할 DataFrame
+    """
+    file_path = get_dim_webtoon_parquet_path()
+    
+    try:
+        write_parquet(file_path, df, 'dim_webtoon')
+        logger.info(f"dim_webtoon.parquet 저장 완료: {len(df)}개 레코드")
+    except Exception as e:
+        logger.error(f"dim_webtoon.parquet 저장 실패: {e}")
+        raise
+
+
 def save_dim_webtoon(df: pd.DataFrame) -> None:
     """
-    dim_webtoon DataFrame을 저장합니다 (JSONL 또는 CSV).
+    dim_webtoon DataFrame을 저장합니다 (JSONL, CSV 또는 Parquet).
     DATA_FORMAT 환경 변수에 따라 형식을 결정합니다.
     
     Args:
         df: 저장할 DataFrame
     """
     data_format = get_data_format()
-    if data_format == 'jsonl':
+    if data_format == 'parquet':
+        save_dim_webtoon_parquet(df)
+    elif data_format == 'jsonl':
         save_dim_webtoon_jsonl(df)
     else:
         save_dim_webtoon_csv(df)
@@ -379,20 +454,7 @@ def save_fact_weekly_chart_jsonl(df: pd.DataFrame, chart_date: date, sort_type:
     file_path = get_chart_jsonl_path(chart_date, sort_type=sort_type)
     ensure_dir(file_path.parent)
     
-    # datetime 객체를 문자열로 변환하는 헬퍼 함수
-    def serialize_for_json(obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, pd.Timestamp):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
-
-    records = df.to_dict(orient='records')
-    with open(file_path, 'w', encoding='utf-8') as f:
-        for record in records:
-            # NaN 값을 None으로 변환 (JSON null)
-            record = {k: (None if (isinstance(v, float) and pd.isna(v)) else v) for k, v in record.items()}
-            f.write(json.dumps(record, ensure_ascii=False, default=serialize_for_json) + '\n')
+    write_jsonl(file_path, df, 'fact_weekly_chart')
     
     sort_info = f", sort={sort_type}" if sort_type else ""
     logger.info(f"fact_weekly_chart {format_date(chart_date)}{sort_info}.jsonl 저장 완료: {len(df)}개 레코드")
@@ -419,9 +481,29 @@ def save_fact_weekly_chart_csv(df: pd.DataFrame, chart_date: date, sort_type: Op
         raise
 
 
+def save_fact_weekly_chart_parquet(df: pd.DataFrame, chart_date: date, sort_type: Optional[str] = None) -> None:
+    """
+    fact_weekly_chart DataFrame을 Parquet 파일로 저장합니다 (날짜별 파일).
+    
+    Args:
+        df: 저장할 DataFrame
+        chart_date: 수집 날짜
+        sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
+    """
+    file_path = get_chart_parquet_path(chart_date, sort_type=sort_type)
+    
+    try:
+        write_parquet(file_path, df, 'fact_weekly_chart')
+        sort_info = f", sort={sort_type}" if sort_type else ""
+        logger.info(f"fact_weekly_chart {format_date(chart_date)}{sort_info}.parquet 저장 완료: {len(df)}개 레코드")
+    except Exception as e:
+        logger.error(f"fact_weekly_chart Parquet 저장 실패: {e}")
+        raise
+
+
 def save_fact_weekly_chart(df: pd.DataFrame, chart_date: date, sort_type: Optional[str] = None) -> None:
     """
-    fact_weekly_chart DataFrame을 저장합니다 (JSONL 또는 CSV).
+    fact_weekly_chart DataFrame을 저장합니다 (JSONL, CSV 또는 Parquet).
     DATA_FORMAT 환경 변수에 따라 형식을 결정합니다.
     
     Args:
@@ -430,7 +512,9 @@ def save_fact_weekly_chart(df: pd.DataFrame, chart_date: date, sort_type: Option
         sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
     """
     data_format = get_data_format()
-    if data_format == 'jsonl':
+    if data_format == 'parquet':
+        save_fact_weekly_chart_parquet(df, chart_date, sort_type=sort_type)
+    elif data_format == 'jsonl':
         save_fact_weekly_chart_jsonl(df, chart_date, sort_type=sort_type)
     else:
         save_fact_weekly_chart_csv(df, chart_date, sort_type=sort_type)
@@ -439,9 +523,10 @@ def save_fact_weekly_chart(df: pd.DataFrame, chart_date: date, sort_type: Option
 def transform_parsed_data_to_models(
     parsed_data: List[Dict[str, any]],
     chart_date: date
-) -> tuple[List[Dict], List[Dict]]:
+) -> Tuple[List[DimWebtoonRecord], List[FactWeeklyChartRecord]]:
     """
     파싱된 데이터를 모델 스키마에 맞게 변환합니다.
+    레코드는 생성 시 검증되므로 검증에 실패한 항목은 건너뜁니다.
     
     실제 수집되는 필드에 따라 이 함수를 수정해야 할 수 있습니다.
     
@@ -459,23 +544,18 @@ def transform_parsed_data_to_models(
         try:
             # dim_webtoon 레코드 생성
             # 실제 수집되는 필드에 따라 매핑 수정 필요
-            dim_record = create_dim_webtoon_record(
+            dim_record = DimWebtoonRecord(
                 webtoon_id=item.get('webtoon_id', ''),
                 title=item.get('title', ''),
                 author=item.get('author'),  # 선택적 필드 (차트 API에서 수집)
                 genre=item.get('genre'),    # 선택적 필드 (상세 정보 API에서 수집)
                 tags=item.get('tags'),      # 선택적 필드 (상세 정보 API에서 수집)
             )
-            
-            if validate_dim_webtoon_record(dim_record):
-                dim_records.append(dim_record)
-            else:
-                logger.warning(f"dim_webtoon 레코드 검증 실패: {item}")
-                continue
+            dim_records.append(dim_record)
             
             # fact_weekly_chart 레코드 생성
             # collected_at은 자동으로 현재 시각이 설정됨
-            fact_record = create_fact_weekly_chart_record(
+            fact_record = FactWeeklyChartRecord(
                 chart_date=chart_date,
                 webtoon_id=item.get('webtoon_id', ''),
                 rank=item.get('rank', 0),
@@ -483,13 +563,11 @@ def transform_parsed_data_to_models(
                 view_count=item.get('view_count'),  # 조회수 (있는 경우)
                 # year, month, week는 collected_at에서 자동 계산됨
             )
-            
-            if validate_fact_weekly_chart_record(fact_record):
-                fact_records.append(fact_record)
-            else:
-                logger.warning(f"fact_weekly_chart 레코드 검증 실패: {item}")
-                continue
-                
+            fact_records.append(fact_record)
+        
+        except ValueError as e:
+            logger.warning(f"레코드 검증 실패: {item}, 오류: {e}")
+            continue
         except Exception as e:
             logger.error(f"데이터 변환 실패: {item}, 오류: {e}")
             continue
@@ -506,6 +584,9 @@ def merge_dim_webtoon(
     새로운 dim_webtoon 레코드를 기존 데이터와 병합합니다.
     중복된 webtoon_id는 업데이트합니다.
     
+    webtoon_id 색인으로 바뀐 행만 교체합니다 (src/dim_webtoon_store.py).
+    같은 테이블을 여러 번 갱신할 때는 DimWebtoonStore를 직접 사용하세요.
+    
     Args:
         existing_df: 기존 dim_webtoon DataFrame
         new_records: 새로운 레코드 리스트
@@ -516,29 +597,11 @@ def merge_dim_webtoon(
     if len(new_records) == 0:
         return existing_df
     
-    new_df = pd.DataFrame(new_records)
-    
     if len(existing_df) == 0:
-        return new_df
-    
-    # 모든 레코드를 합치고, webtoon_id 기준으로 중복 제거 (최신 것만 유지)
-    # updated_at이 최신인 것을 유지하도록 정렬
-    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-    
-    # updated_at을 datetime으로 변환
-    combined_df['updated_at'] = pd.to_datetime(combined_df['updated_at'])
-    
-    # webtoon_id 기준으로 정렬 (updated_at 최신순)
-    combined_df = combined_df.sort_values('updated_at', ascending=False)
-    
-    # webtoon_id 기준으로 중복 제거 (첫 번째 것만 유지 = 최신 것)
-    combined_df = combined_df.drop_duplicates(subset=['webtoon_id'], keep='first')
-    
-    # updated_at을 다시 문자열로 변환
-    combined_df['updated_at'] = combined_df['updated_at'].dt.strftime('%Y-%m-%d %H:%M:%S.%f')
-    combined_df['created_at'] = pd.to_datetime(combined_df['created_at']).dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+        return records_to_dataframe(new_records, DIM_WEBTOON_COLUMNS)
     
-    return combined_df.reset_index(drop=True)
+    from src.dim_webtoon_store import upsert_dim_webtoon
+    return upsert_dim_webtoon(existing_df, new_records)
 
 
 def merge_fact_weekly_chart(
@@ -565,7 +628,7 @@ def merge_fact_weekly_chart(
     if len(new_records) == 0:
         return existing_df
     
-    new_df = pd.DataFrame(new_records)
+    new_df = records_to_dataframe(new_records, FACT_WEEKLY_CHART_COLUMNS)
     
     # 기존 레코드가 있으면 중복 체크
     if len(existing_df) > 0:
@@ -634,12 +697,13 @@ def transform_and_save(
             logger.warning("변환된 레코드가 없습니다.")
             return False
         
-        # 2. 기존 데이터 로드
-        existing_dim_df = load_dim_webtoon()
+        # 2. 기존 데이터 로드 (dim_webtoon은 webtoon_id로 색인)
+        from src.dim_webtoon_store import DimWebtoonStore
+        dim_store = DimWebtoonStore.load()
         existing_fact_df = load_fact_weekly_chart(chart_date, sort_type=sort_type)
         
         # 3. Foreign Key 검증
-        existing_webtoon_ids = set(existing_dim_df['webtoon_id'].astype(str)) if len(existing_dim_df) > 0 else set()
+        existing_webtoon_ids = dim_store.ids()
         new_webtoon_ids = {r['webtoon_id'] for r in dim_records}
         all_webtoon_ids = existing_webtoon_ids | new_webtoon_ids
         
@@ -653,11 +717,11 @@ def transform_and_save(
             # 일단 경고만 하고 진행 (dim_webtoon에 추가될 예정)
         
         # 4. 데이터 병합 (멱등성 보장)
-        merged_dim_df = merge_dim_webtoon(existing_dim_df, dim_records)
+        dim_store.upsert(dim_records)
         merged_fact_df = merge_fact_weekly_chart(existing_fact_df, fact_records, chart_date)
         
         # 5. CSV 저장
-        save_dim_webtoon(merged_dim_df)
+        dim_store.flush()
         save_fact_weekly_chart(merged_fact_df, chart_date, sort_type=sort_type)
         
         sort_info = f", sort={sort_type}" if sort_type else ""
@@ -4,207 +4,534 @@ Transform Webtoon Stats 모듈: 웹툰 상세 정보 변환 및 저장
 이 모듈은 웹툰 상세 정보를 스키마에 맞게 변환하고 CSV로 저장합니다.
 - fact_webtoon_stats (히스토리 테이블) 데이터 생성 및 저장
 - 멱등성 보장 (중복 체크)
+
+저장 구조는 수집 날짜별 Hive 형식 파티션입니다.
+    fact_webtoon_stats/collected_date=YYYY-MM-DD/part.jsonl (또는 part.csv, part.parquet)
+    fact_webtoon_stats/collected_date=YYYY-MM-DD/part.keys (키 인덱스)
+- 읽기는 필요한 날짜 파티션만 (load_fact_webtoon_stats(start_date, end_date))
+- 배치마다 새 레코드만 해당 파티션 끝에 추가하고, 중복 체크는 파티션의
+  (webtoon_id, collected_at) 키 인덱스 파일로 함
+  (Parquet은 파일 끝에 추가할 수 없어 해당 날짜 파티션 하나만 다시 씀)
+- 혹시 남은 중복은 실행 끝의 compact_fact_webtoon_stats()가 정리
+- 파티션 도입 전 단일 파일(fact_webtoon_stats.jsonl)도 읽으며, 압축 단계에서 파티션으로 이전
 """
 
-import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
 
 import pandas as pd
 
 from src.models import (
-    create_fact_webtoon_stats_record,
-    validate_fact_webtoon_stats_record,
+    FactWebtoonStatsRecord,
+    records_to_dataframe,
     validate_foreign_key,
     FACT_WEBTOON_STATS_COLUMNS,
 )
+from src.json_codec import loads
+from src.jsonl_writer import write_jsonl
+from src.parquet_io import read_parquet, write_parquet
 from src.utils import (
     get_webtoon_stats_csv_path,
     get_webtoon_stats_jsonl_path,
+    get_webtoon_stats_key_index_path,
+    get_webtoon_stats_partition_path,
     get_data_format,
+    list_webtoon_stats_partitions,
     format_datetime,
     parse_datetime,
 )
 
 logger = logging.getLogger(__name__)
 
+# 파티션별 키 인덱스 캐시 (프로세스 안에서 배치마다 인덱스 파일을 다시 읽지 않도록)
+_key_indexes: Dict[Path, Set[str]] = {}
 
-def serialize_for_json(obj):
-    """
-    JSON 직렬화를 위한 헬퍼 함수.
-    datetime, date 객체를 문자열로 변환합니다.
-    """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, pd.Timestamp):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+# 이 프로세스에서 추가 저장한 파티션 (compact_fact_webtoon_stats 기본 대상)
+_touched_dates: Set[date] = set()
 
 
-def load_fact_webtoon_stats_jsonl() -> pd.DataFrame:
+def make_stats_key(webtoon_id, collected_at) -> str:
     """
-    fact_webtoon_stats JSONL 파일을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    fact_webtoon_stats 멱등성 키를 만듭니다.
+    
+    Args:
+        webtoon_id: 웹툰 ID
+        collected_at: 수집 시각 (datetime, Timestamp 또는 ISO 문자열)
     
     Returns:
-        fact_webtoon_stats DataFrame
+        "webtoon_id<탭>collected_at(ISO)" 형식의 문자열
     """
-    file_path = get_webtoon_stats_jsonl_path()
+    return f"{webtoon_id}\t{pd.Timestamp(collected_at).isoformat()}"
+
+
+def _read_stats_jsonl_file(file_path: Path) -> List[Dict]:
+    """JSONL 파일 하나를 읽어 레코드 리스트로 반환합니다. (collected_at은 datetime으로 변환)"""
+    records = []
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                record = loads(line)
+                # datetime 문자열을 datetime 객체로 변환
+                if 'collected_at' in record and record['collected_at']:
+                    record['collected_at'] = datetime.fromisoformat(record['collected_at'].replace('Z', '+00:00'))
+                records.append(record)
+    return records
+
+
+def _read_stats_file(file_path: Path, data_format: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    fact_webtoon_stats 파일(파티션 또는 단일 파일) 하나를 DataFrame으로 읽습니다.
+    columns를 지정하면 해당 컬럼만 남깁니다 (Parquet은 해당 컬럼만 디스크에서 읽음).
+    """
+    if data_format == 'parquet':
+        return read_parquet(file_path, 'fact_webtoon_stats', columns=columns)
+    if data_format == 'jsonl':
+        df = pd.DataFrame(_read_stats_jsonl_file(file_path))
+    else:
+        df = pd.read_csv(file_path)
+        # collected_at을 datetime 타입으로 변환
+        if 'collected_at' in df.columns:
+            df['collected_at'] = pd.to_datetime(df['collected_at'])
+    if columns is not None:
+        df = df[[column for column in columns if column in df.columns]]
+    return df
+
+
+def _get_legacy_stats_path(data_format: str) -> Optional[Path]:
+    """날짜 파티션 도입 전의 단일 파일 경로 (Parquet은 처음부터 파티션이라 없음)"""
+    if data_format == 'jsonl':
+        return get_webtoon_stats_jsonl_path()
+    if data_format == 'csv':
+        return get_webtoon_stats_csv_path()
+    return None
+
+
+def _collected_dates(df: pd.DataFrame) -> pd.Series:
+    """collected_at 컬럼의 날짜 (timezone은 그대로 두고 벽시계 날짜 사용)"""
+    return df['collected_at'].map(lambda value: pd.Timestamp(value).date())
+
+
+def _load_fact_webtoon_stats(
+    data_format: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """기간에 해당하는 파티션과 (남아 있으면) 단일 파일을 읽어 합칩니다."""
+    partitions = list_webtoon_stats_partitions(start_date, end_date, data_format=data_format)
+    legacy_path = _get_legacy_stats_path(data_format)
+    has_legacy = legacy_path is not None and legacy_path.exists()
+    empty_columns = columns if columns is not None else FACT_WEBTOON_STATS_COLUMNS
     
-    if not file_path.exists():
-        logger.info("fact_webtoon_stats.jsonl 파일이 없습니다. 새로 생성합니다.")
-        return pd.DataFrame(columns=FACT_WEBTOON_STATS_COLUMNS)
+    if not partitions and not has_legacy:
+        logger.info(f"fact_webtoon_stats {data_format.upper()} 파일이 없습니다. 새로 생성합니다.")
+        return pd.DataFrame(columns=empty_columns)
     
     try:
-        records = []
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    record = json.loads(line)
-                    # datetime 문자열을 datetime 객체로 변환
-                    if 'collected_at' in record and record['collected_at']:
-                        record['collected_at'] = datetime.fromisoformat(record['collected_at'].replace('Z', '+00:00'))
-                    records.append(record)
+        frames = [_read_stats_file(partition_path, data_format, columns) for _, partition_path in partitions]
         
-        if len(records) == 0:
-            return pd.DataFrame(columns=FACT_WEBTOON_STATS_COLUMNS)
+        if has_legacy:
+            legacy_df = _read_stats_file(legacy_path, data_format)
+            if len(legacy_df) > 0 and (start_date is not None or end_date is not None):
+                legacy_dates = _collected_dates(legacy_df)
+                mask = pd.Series(True, index=legacy_df.index)
+                if start_date is not None:
+                    mask &= legacy_dates >= start_date
+                if end_date is not None:
+                    mask &= legacy_dates <= end_date
+                legacy_df = legacy_df[mask]
+            if columns is not None:
+                legacy_df = legacy_df[[column for column in columns if column in legacy_df.columns]]
+            frames.append(legacy_df)
+        
+        frames = [frame for frame in frames if len(frame) > 0]
+        if len(frames) == 0:
+            return pd.DataFrame(columns=empty_columns)
         
-        df = pd.DataFrame(records)
-        logger.info(f"fact_webtoon_stats.jsonl 로드 완료: {len(df)}개 레코드")
+        df = pd.concat(frames, ignore_index=True)
+        logger.info(f"fact_webtoon_stats {data_format.upper()} 로드 완료: {len(df)}개 레코드 (파티션 {len(partitions)}개)")
         return df
+    except ImportError:
+        raise
     except Exception as e:
-        logger.error(f"fact_webtoon_stats.jsonl 로드 실패: {e}")
-        return pd.DataFrame(columns=FACT_WEBTOON_STATS_COLUMNS)
+        logger.error(f"fact_webtoon_stats {data_format.upper()} 로드 실패: {e}")
+        return pd.DataFrame(columns=empty_columns)
+
+
+def load_fact_webtoon_stats_jsonl(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    fact_webtoon_stats JSONL 파티션을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    기간을 지정하면 해당 collected_date 파티션만 읽습니다 (파티션 프루닝).
+    
+    Args:
+        start_date: 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 수집 날짜 (포함, None이면 제한 없음)
+        columns: 필요한 컬럼 리스트 (None이면 전체)
+    
+    Returns:
+        fact_webtoon_stats DataFrame
+    """
+    return _load_fact_webtoon_stats('jsonl', start_date, end_date, columns)
 
 
-def load_fact_webtoon_stats() -> pd.DataFrame:
+def load_fact_webtoon_stats(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
-    fact_webtoon_stats 파일을 로드합니다 (JSONL 또는 CSV).
+    fact_webtoon_stats 파일을 로드합니다 (JSONL, CSV 또는 Parquet).
     DATA_FORMAT 환경 변수에 따라 형식을 결정합니다.
     
+    Args:
+        start_date: 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 수집 날짜 (포함, None이면 제한 없음)
+        columns: 필요한 컬럼 리스트 (None이면 전체, Parquet은 해당 컬럼만 디스크에서 읽음)
+    
     Returns:
         fact_webtoon_stats DataFrame
     """
     data_format = get_data_format()
-    if data_format == 'jsonl':
-        return load_fact_webtoon_stats_jsonl()
+    if data_format == 'parquet':
+        return load_fact_webtoon_stats_parquet(start_date, end_date, columns=columns)
+    elif data_format == 'jsonl':
+        return load_fact_webtoon_stats_jsonl(start_date, end_date, columns=columns)
     else:
-        return load_fact_webtoon_stats_csv()
+        return load_fact_webtoon_stats_csv(start_date, end_date, columns=columns)
 
 
-def load_fact_webtoon_stats_csv() -> pd.DataFrame:
+def load_fact_webtoon_stats_csv(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
-    fact_webtoon_stats CSV 파일을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    fact_webtoon_stats CSV 파티션을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    기간을 지정하면 해당 collected_date 파티션만 읽습니다 (파티션 프루닝).
+    
+    Args:
+        start_date: 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 수집 날짜 (포함, None이면 제한 없음)
+        columns: 필요한 컬럼 리스트 (None이면 전체)
     
     Returns:
         fact_webtoon_stats DataFrame
     """
-    file_path = get_webtoon_stats_csv_path()
+    return _load_fact_webtoon_stats('csv', start_date, end_date, columns)
+
+
+def load_fact_webtoon_stats_parquet(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    fact_webtoon_stats Parquet 파티션을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    기간을 지정하면 해당 collected_date 파티션만, columns를 지정하면 해당 컬럼만 읽습니다.
     
-    if not file_path.exists():
-        logger.info("fact_webtoon_stats.csv 파일이 없습니다. 새로 생성합니다.")
-        return pd.DataFrame(columns=FACT_WEBTOON_STATS_COLUMNS)
+    Args:
+        start_date: 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 수집 날짜 (포함, None이면 제한 없음)
+        columns: 읽을 컬럼 리스트 (None이면 전체)
     
-    try:
-        df = pd.read_csv(file_path)
-        # collected_at을 datetime 타입으로 변환
-        if 'collected_at' in df.columns:
-            df['collected_at'] = pd.to_datetime(df['collected_at'])
-        logger.info(f"fact_webtoon_stats.csv 로드 완료: {len(df)}개 레코드")
-        return df
-    except Exception as e:
-        logger.error(f"fact_webtoon_stats.csv 로드 실패: {e}")
-        return pd.DataFrame(columns=FACT_WEBTOON_STATS_COLUMNS)
+    Returns:
+        fact_webtoon_stats DataFrame
+    """
+    return _load_fact_webtoon_stats('parquet', start_date, end_date, columns)
+
+
+def _write_stats_file(file_path: Path, df: pd.DataFrame, data_format: str) -> None:
+    """파일 하나를 임시 파일에 쓴 뒤 교체합니다 (쓰는 도중 중단되어도 기존 파일 유지)."""
+    # 컬럼 순서 보장
+    df = df[FACT_WEBTOON_STATS_COLUMNS] if all(col in df.columns for col in FACT_WEBTOON_STATS_COLUMNS) else df
+    if data_format == 'parquet':
+        write_parquet(file_path, df, 'fact_webtoon_stats')
+        return
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    if data_format == 'jsonl':
+        write_jsonl(tmp_path, df, 'fact_webtoon_stats')
+    else:
+        df.to_csv(tmp_path, index=False, encoding='utf-8')
+    os.replace(tmp_path, file_path)
+
+
+def _save_partitions(df: pd.DataFrame, data_format: str) -> None:
+    """df를 collected_date별로 나누어 해당 파티션을 덮어씁니다."""
+    if len(df) == 0:
+        return
+    for collected_date, partition_df in df.groupby(_collected_dates(df), sort=True):
+        _write_stats_file(get_webtoon_stats_partition_path(collected_date, data_format), partition_df, data_format)
+        _write_key_index(collected_date, _keys_of(partition_df))
 
 
 def save_fact_webtoon_stats_jsonl(df: pd.DataFrame) -> None:
     """
-    fact_webtoon_stats DataFrame을 JSONL 파일로 저장합니다.
+    fact_webtoon_stats DataFrame을 JSONL 파티션으로 저장합니다.
+    df에 포함된 collected_date 파티션만 df 내용으로 덮어쓰고, 다른 날짜 파티션은 그대로 둡니다.
     
     Args:
         df: 저장할 DataFrame
     """
-    file_path = get_webtoon_stats_jsonl_path()
-    
     try:
-        # 컬럼 순서 보장
-        df = df[FACT_WEBTOON_STATS_COLUMNS].copy() if all(col in df.columns for col in FACT_WEBTOON_STATS_COLUMNS) else df.copy()
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            for _, row in df.iterrows():
-                record = row.to_dict()
-                # datetime을 ISO 형식 문자열로 변환
-                if 'collected_at' in record and pd.notna(record['collected_at']):
-                    if isinstance(record['collected_at'], pd.Timestamp):
-                        record['collected_at'] = record['collected_at'].isoformat()
-                # None을 null로 변환 및 total_episode_count를 정수로 변환
-                def convert_value(key, val):
-                    if isinstance(val, list):
-                        return val  # 리스트는 그대로
-                    if pd.isna(val):
-                        return None
-                    # total_episode_count는 정수로 변환 (float -> int)
-                    if key == 'total_episode_count' and val is not None:
-                        try:
-                            if isinstance(val, float):
-                                return int(val)
-                            elif isinstance(val, str):
-                                return int(float(val)) if val.strip() not in ('', 'None', 'null') else None
-                            elif isinstance(val, int):
-                                return val
-                            else:
-                                return int(val)
-                        except (ValueError, TypeError):
-                            return None
-                    return val
-                record = {k: convert_value(k, v) for k, v in record.items()}
-                f.write(json.dumps(record, ensure_ascii=False, default=serialize_for_json) + '\n')
-        
-        logger.info(f"fact_webtoon_stats.jsonl 저장 완료: {len(df)}개 레코드")
+        _save_partitions(df, 'jsonl')
+        logger.info(f"fact_webtoon_stats JSONL 저장 완료: {len(df)}개 레코드")
     except Exception as e:
-        logger.error(f"fact_webtoon_stats.jsonl 저장 실패: {e}")
+        logger.error(f"fact_webtoon_stats JSONL 저장 실패: {e}")
         raise
 
 
 def save_fact_webtoon_stats_csv(df: pd.DataFrame) -> None:
     """
-    fact_webtoon_stats DataFrame을 CSV 파일로 저장합니다.
+    fact_webtoon_stats DataFrame을 CSV 파티션으로 저장합니다.
+    df에 포함된 collected_date 파티션만 df 내용으로 덮어쓰고, 다른 날짜 파티션은 그대로 둡니다.
     
     Args:
         df: 저장할 DataFrame
     """
-    file_path = get_webtoon_stats_csv_path()
+    try:
+        _save_partitions(df, 'csv')
+        logger.info(f"fact_webtoon_stats CSV 저장 완료: {len(df)}개 레코드")
+    except Exception as e:
+        logger.error(f"fact_webtoon_stats CSV 저장 실패: {e}")
+        raise
+
+
+def save_fact_webtoon_stats_parquet(df: pd.DataFrame) -> None:
+    """
+    fact_webtoon_stats DataFrame을 Parquet 파티션으로 저장합니다.
+    df에 포함된 collected_date 파티션만 df 내용으로 덮어쓰고, 다른 날짜 파티션은 그대로 둡니다.
     
+    Args:
+        df: 저장할 DataFrame
+    """
     try:
-        # 컬럼 순서 보장
-        df = df[FACT_WEBTOON_STATS_COLUMNS] if all(col in df.columns for col in FACT_WEBTOON_STATS_COLUMNS) else df
-        df.to_csv(file_path, index=False, encoding='utf-8')
-        logger.info(f"fact_webtoon_stats.csv 저장 완료: {len(df)}개 레코드")
+        _save_partitions(df, 'parquet')
+        logger.info(f"fact_webtoon_stats Parquet 저장 완료: {len(df)}개 레코드")
     except Exception as e:
-        logger.error(f"fact_webtoon_stats.csv 저장 실패: {e}")
+        logger.error(f"fact_webtoon_stats Parquet 저장 실패: {e}")
         raise
 
 
 def save_fact_webtoon_stats(df: pd.DataFrame) -> None:
     """
-    fact_webtoon_stats DataFrame을 저장합니다 (JSONL 또는 CSV).
+    fact_webtoon_stats DataFrame을 저장합니다 (JSONL, CSV 또는 Parquet).
     DATA_FORMAT 환경 변수에 따라 형식을 결정합니다.
     
     Args:
         df: 저장할 DataFrame
     """
     data_format = get_data_format()
-    if data_format == 'jsonl':
+    if data_format == 'parquet':
+        save_fact_webtoon_stats_parquet(df)
+    elif data_format == 'jsonl':
         save_fact_webtoon_stats_jsonl(df)
     else:
         save_fact_webtoon_stats_csv(df)
 
 
+def _load_partition(collected_date: date) -> pd.DataFrame:
+    """파티션 파일 하나만 읽습니다 (단일 파일은 읽지 않음)."""
+    data_format = get_data_format()
+    partition_path = get_webtoon_stats_partition_path(collected_date, data_format)
+    if not partition_path.exists():
+        return pd.DataFrame(columns=FACT_WEBTOON_STATS_COLUMNS)
+    return _read_stats_file(partition_path, data_format)
+
+
+def _keys_of(df: pd.DataFrame) -> List[str]:
+    if len(df) == 0:
+        return []
+    return [make_stats_key(w, c) for w, c in zip(df['webtoon_id'].astype(str), df['collected_at'])]
+
+
+def _write_key_index(collected_date: date, keys: Iterable[str]) -> None:
+    """파티션의 키 인덱스 파일을 새로 씁니다."""
+    index_path = get_webtoon_stats_key_index_path(collected_date)
+    keys = set(keys)
+    tmp_path = index_path.with_name(index_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for key in sorted(keys):
+            f.write(key + '\n')
+    os.replace(tmp_path, index_path)
+    _key_indexes[index_path] = keys
+
+
+def load_fact_webtoon_stats_keys(collected_date: date) -> Set[str]:
+    """
+    collected_date 파티션에 이미 저장된 fact_webtoon_stats 키 집합을 반환합니다.
+    인덱스 파일이 없으면 파티션 파일에서 한 번 만들어 둡니다.
+    
+    Args:
+        collected_date: 수집 날짜
+    
+    Returns:
+        make_stats_key() 형식의 키 집합
+    """
+    index_path = get_webtoon_stats_key_index_path(collected_date)
+    data_path = get_webtoon_stats_partition_path(collected_date)
+    
+    # 데이터 파일이 없으면 인덱스도 의미 없음 (삭제 후 새로 시작한 경우)
+    if not data_path.exists():
+        index_path.unlink(missing_ok=True)
+        _key_indexes[index_path] = set()
+        return _key_indexes[index_path]
+    
+    if index_path in _key_indexes:
+        return _key_indexes[index_path]
+    
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            _key_indexes[index_path] = set(line.rstrip('\n') for line in f if line.strip())
+        return _key_indexes[index_path]
+    
+    # 인덱스가 없는 기존 파티션: 한 번만 파티션을 읽어 인덱스 생성
+    _write_key_index(collected_date, _keys_of(_load_partition(collected_date)))
+    logger.info(f"fact_webtoon_stats 키 인덱스 생성 (collected_date={collected_date}): {len(_key_indexes[index_path])}개")
+    return _key_indexes[index_path]
+
+
+def append_fact_webtoon_stats(records: List[Dict]) -> int:
+    """
+    새 fact_webtoon_stats 레코드를 collected_date 파티션 파일 끝에 추가합니다 (JSONL 또는 CSV).
+    Parquet은 파일 끝에 추가할 수 없어 해당 날짜 파티션만 다시 씁니다.
+    이미 저장된 (webtoon_id, collected_at) 레코드는 건너뜁니다 (멱등성 보장).
+    비용은 전체 히스토리가 아니라 추가하는 레코드 수에 비례합니다.
+    
+    Args:
+        records: 추가할 레코드 리스트
+    
+    Returns:
+        실제로 추가한 레코드 수
+    """
+    data_format = get_data_format()
+    
+    records_by_date: Dict[date, List[Dict]] = {}
+    for record in records:
+        records_by_date.setdefault(pd.Timestamp(record['collected_at']).date(), []).append(record)
+    
+    appended = 0
+    for collected_date, date_records in sorted(records_by_date.items()):
+        existing_keys = load_fact_webtoon_stats_keys(collected_date)
+        
+        new_records = []
+        new_keys = []
+        for record in date_records:
+            key = make_stats_key(record['webtoon_id'], record['collected_at'])
+            if key in existing_keys or key in new_keys:
+                continue
+            new_records.append(record)
+            new_keys.append(key)
+        
+        if not new_records:
+            continue
+        
+        partition_path = get_webtoon_stats_partition_path(collected_date, data_format)
+        new_df = records_to_dataframe(new_records, FACT_WEBTOON_STATS_COLUMNS)
+        if data_format == 'parquet':
+            existing_df = _load_partition(collected_date)
+            frames = [frame for frame in (existing_df, new_df) if len(frame) > 0]
+            _write_stats_file(partition_path, pd.concat(frames, ignore_index=True), data_format)
+        elif data_format == 'jsonl':
+            write_jsonl(partition_path, new_df, 'fact_webtoon_stats', mode='a')
+        else:
+            write_header = not partition_path.exists() or partition_path.stat().st_size == 0
+            new_df.to_csv(partition_path, mode='a', header=write_header, index=False, encoding='utf-8')
+        
+        # 데이터를 먼저 쓰고 인덱스에 추가 (중간에 중단되면 남는 중복은 압축 단계에서 정리)
+        with open(get_webtoon_stats_key_index_path(collected_date), 'a', encoding='utf-8') as f:
+            for key in new_keys:
+                f.write(key + '\n')
+        existing_keys.update(new_keys)
+        _touched_dates.add(collected_date)
+        appended += len(new_records)
+    
+    if appended < len(records):
+        logger.info(f"중복 제거: {len(records) - appended}개 중복 레코드 제거됨")
+    if appended == 0:
+        logger.info("모든 레코드가 중복입니다. 데이터 변경 없음.")
+        return 0
+    
+    logger.info(f"fact_webtoon_stats 파티션 추가 저장 완료: {appended}개 레코드 ({', '.join(str(d) for d in sorted(records_by_date))})")
+    return appended
+
+
+def _migrate_legacy_stats() -> int:
+    """
+    날짜 파티션 도입 전의 단일 파일이 남아 있으면 collected_date 파티션으로 옮기고 삭제합니다.
+    
+    Returns:
+        옮긴 레코드 수
+    """
+    data_format = get_data_format()
+    legacy_path = _get_legacy_stats_path(data_format)
+    if legacy_path is None or not legacy_path.exists():
+        return 0
+    
+    legacy_df = _read_stats_file(legacy_path, data_format)
+    if len(legacy_df) > 0:
+        for collected_date, legacy_partition in legacy_df.groupby(_collected_dates(legacy_df), sort=True):
+            existing_df = _load_partition(collected_date)
+            frames = [frame for frame in (legacy_partition, existing_df) if len(frame) > 0]
+            merged_df = pd.concat(frames, ignore_index=True)
+            merged_df = merged_df[~pd.Series(_keys_of(merged_df)).duplicated(keep='last').to_numpy()]
+            _write_stats_file(get_webtoon_stats_partition_path(collected_date, data_format), merged_df, data_format)
+            _write_key_index(collected_date, _keys_of(merged_df))
+    
+    legacy_path.unlink()
+    # 단일 파일용 키 인덱스 (파티션 도입 전)
+    (legacy_path.parent / 'fact_webtoon_stats.keys').unlink(missing_ok=True)
+    logger.info(f"fact_webtoon_stats 단일 파일을 날짜 파티션으로 이전: {len(legacy_df)}개 레코드")
+    return len(legacy_df)
+
+
+def compact_fact_webtoon_stats(collected_dates: Optional[Iterable[date]] = None) -> int:
+    """
+    fact_webtoon_stats 파티션의 중복 (webtoon_id, collected_at) 레코드를 정리하고
+    키 인덱스를 데이터와 다시 맞춥니다. 배치마다가 아니라 실행 끝에 한 번 호출합니다.
+    단일 파일(파티션 도입 전)이 남아 있으면 먼저 파티션으로 옮깁니다.
+    
+    Args:
+        collected_dates: 정리할 수집 날짜 (None이면 이 프로세스에서 추가 저장한 파티션)
+    
+    Returns:
+        제거한 중복 레코드 수 (실패 시 -1)
+    """
+    try:
+        _migrate_legacy_stats()
+        
+        dates = set(collected_dates) if collected_dates is not None else set(_touched_dates)
+        removed = 0
+        for collected_date in sorted(dates):
+            df = _load_partition(collected_date)
+            if len(df) == 0:
+                continue
+            keys = _keys_of(df)
+            duplicated = pd.Series(keys).duplicated(keep='last').to_numpy()
+            if duplicated.any():
+                removed += int(duplicated.sum())
+                _write_stats_file(get_webtoon_stats_partition_path(collected_date), df[~duplicated], get_data_format())
+            _write_key_index(collected_date, keys)
+        _touched_dates.difference_update(dates)
+        
+        logger.info(f"fact_webtoon_stats 압축 완료: 파티션 {len(dates)}개 (중복 {removed}개 제거)")
+        return removed
+    except Exception as e:
+        logger.error(f"❌ fact_webtoon_stats 압축 실패: {e}")
+        return -1
+
+
 def transform_detail_data_to_model(
     detail_data: Dict[str, any]
-) -> Optional[Dict]:
+) -> Optional[FactWebtoonStatsRecord]:
     """
-    웹툰 상세 정보를 모델 스키마에 맞게 변환합니다.
+    웹툰 상세 정보를 모델 스키마에 맞게 변환합니다. (레코드는 생성 시 검증)
     
     Args:
         detail_data: 웹툰 상세 정보 딕셔너리
@@ -232,7 +559,7 @@ def transform_detail_data_to_model(
             except (ValueError, TypeError):
                 total_episode_count = None
         
-        record = create_fact_webtoon_stats_record(
+        return FactWebtoonStatsRecord(
             webtoon_id=webtoon_id,
             favorite_count=detail_data.get('favorite_count'),
             favorite_count_source=detail_data.get('favorite_count_source'),
@@ -240,13 +567,10 @@ def transform_detail_data_to_model(
             rest=detail_data.get('rest'),
             total_episode_count=total_episode_count,
         )
-        
-        if validate_fact_webtoon_stats_record(record):
-            return record
-        else:
-            logger.warning(f"fact_webtoon_stats 레코드 검증 실패: {detail_data}")
-            return None
-            
+    
+    except ValueError as e:
+        logger.warning(f"fact_webtoon_stats 레코드 검증 실패: {detail_data}, 오류: {e}")
+        return None
     except Exception as e:
         logger.error(f"데이터 변환 실패: {detail_data}, 오류: {e}")
         return None
@@ -270,7 +594,7 @@ def merge_fact_webtoon_stats(
     if len(new_records) == 0:
         return existing_df
     
-    new_df = pd.DataFrame(new_records)
+    new_df = records_to_dataframe(new_records, FACT_WEBTOON_STATS_COLUMNS)
     
     # collected_at을 datetime으로 변환
     if 'collected_at' in new_df.columns:
@@ -336,16 +660,10 @@ def transform_and_save_webtoon_stats(
             logger.warning("변환된 레코드가 없습니다.")
             return False
         
-        # 2. 기존 데이터 로드
-        existing_df = load_fact_webtoon_stats()
-        
-        # 3. 병합
-        merged_df = merge_fact_webtoon_stats(existing_df, records)
-        
-        # 4. 저장
-        save_fact_webtoon_stats(merged_df)
+        # 2. 새 레코드만 추가 저장 (키 인덱스로 중복 체크)
+        appended = append_fact_webtoon_stats(records)
         
-        logger.info(f"웹툰 상세 정보 저장 완료: {len(records)}개 레코드 추가됨")
+        logger.info(f"웹툰 상세 정보 저장 완료: {appended}개 레코드 추가됨")
         return True
         
     except Exception as e:
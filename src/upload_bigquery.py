@@ -4,25 +4,45 @@ BigQuery 업로드 모듈
 JSONL 파일을 BigQuery에 적재하는 기능을 제공합니다.
 - dim_webtoon 업로드 (MERGE로 멱등성 보장)
 - fact_weekly_chart 업로드 (MERGE로 멱등성 보장)
-- fact_webtoon_stats 업로드 (MERGE로 멱등성 보장)
+- fact_webtoon_stats 업로드 (MERGE로 멱등성 보장, 파티션별 업로드 위치 이후에 추가된 행만 전송)
+- 상세 정보 갱신 계획용 최근 레코드 조회
+
+임시 테이블 적재는 테이블마다 load job 한 번입니다.
+레코드를 컬럼 단위로 타입을 맞춘 뒤 적재 파일 하나(JSONL 또는 Parquet)로 쓰고,
+파일(또는 GCS URI)에서 바로 적재합니다.
+
+MERGE 문은 테이블별 규칙(MERGE_SPECS)과 스키마로 만듭니다.
+BIGQUERY_STAGING_MODE=session이면 실행 하나의 업로드를 BigQuery 세션 임시 테이블에 모아
+MERGE 트랜잭션 스크립트 한 번으로 반영합니다 (StagingSession).
 """
 
+import hashlib
 import json
 import logging
 import os
+import tempfile
+import time
+import typing
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
+import pandas as pd
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 from google.auth import default as default_auth
 import subprocess
 
+from src.json_codec import JSONDecodeError, loads
+from src.jsonl_writer import write_jsonl
+from src.models import TABLE_SCHEMAS
+from src.parquet_io import write_parquet
 from src.utils import (
     get_dim_webtoon_jsonl_path,
     get_webtoon_stats_jsonl_path,
+    get_webtoon_stats_upload_mark_path,
     get_chart_jsonl_path,
+    list_webtoon_stats_partitions,
     setup_logging,
 )
 
@@ -33,6 +53,46 @@ logger = logging.getLogger(__name__)
 BIGQUERY_PROJECT_ID = os.getenv('BIGQUERY_PROJECT_ID', 'naver-webtoon-collector')
 BIGQUERY_DATASET_ID = os.getenv('BIGQUERY_DATASET_ID', 'naver_webtoon')
 
+# 임시 테이블 적재 파일 형식: jsonl (기본값) 또는 parquet (pyarrow 필요)
+BIGQUERY_LOAD_FORMAT = os.getenv('BIGQUERY_LOAD_FORMAT', 'jsonl').lower()
+# 설정하면 적재 파일을 gs://{GCS_BUCKET_NAME}/{prefix}/에 올린 뒤 URI로 적재 (비우면 파일에서 바로 적재)
+BIGQUERY_LOAD_GCS_PREFIX = os.getenv('BIGQUERY_LOAD_GCS_PREFIX', '').strip('/')
+# 여러 테이블을 함께 업로드할 때 작업 상태 확인 간격 (초)
+BIGQUERY_JOB_POLL_SECONDS = float(os.getenv('BIGQUERY_JOB_POLL_SECONDS', '0.5'))
+# 임시 테이블 방식: table (기본값, 업로드마다 데이터셋에 임시 테이블 생성/삭제) 또는
+# session (실행 하나의 업로드를 세션 임시 테이블에 모아 commit 때 MERGE 트랜잭션 한 번)
+BIGQUERY_STAGING_MODE = os.getenv('BIGQUERY_STAGING_MODE', 'table').lower()
+
+# 테이블별 MERGE 규칙
+# - keys: 같은 행을 판단하는 컬럼 (임시 테이블 안의 중복은 order_by가 가장 최근인 행만 사용)
+# - update: 이미 있는 행에서 갱신할 컬럼 (비어 있으면 새 행만 추가)
+# - keep: update 중 새 값이 NULL(배열은 빈 배열)이면 기존 값을 유지할 컬럼
+# - prune: 적재한 값의 범위로 대상 테이블을 좁힐 파티션 컬럼 (None이면 전체)
+MERGE_SPECS = {
+    'dim_webtoon': {
+        'keys': ('webtoon_id',),
+        'order_by': 'updated_at',
+        'update': ('title', 'author', 'genre', 'tags', 'updated_at'),
+        # 상세 정보로만 채워지는 컬럼 (보강 전 차트 레코드가 기존 값을 지우지 않도록)
+        'keep': ('genre', 'tags'),
+        'prune': None,
+    },
+    'fact_weekly_chart': {
+        'keys': ('chart_date', 'webtoon_id', 'weekday'),
+        'order_by': 'collected_at',
+        'update': (),
+        'keep': (),
+        'prune': 'chart_date',
+    },
+    'fact_webtoon_stats': {
+        'keys': ('webtoon_id', 'collected_at'),
+        'order_by': 'collected_at',
+        'update': (),
+        'keep': (),
+        'prune': 'collected_at',
+    },
+}
+
 
 def get_bigquery_client() -> bigquery.Client:
     """
@@ -101,13 +161,13 @@ def load_jsonl_file(file_path: Path) -> List[Dict]:
     
     records = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 if line.strip():
                     try:
-                        record = json.loads(line)
+                        record = loads(line)
                         records.append(record)
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         logger.error(f"JSON 파싱 오류 (라인 {line_num}): {e}")
                         continue
     except Exception as e:
@@ -118,145 +178,675 @@ def load_jsonl_file(file_path: Path) -> List[Dict]:
     return records
 
 
-def upload_dim_webtoon(jsonl_path: Optional[Path] = None, dry_run: bool = False) -> bool:
+def _bigquery_field(column: str, python_type) -> bigquery.SchemaField:
+    """models.py 스키마의 파이썬 타입을 BigQuery 필드로 변환합니다. (Optional[X]는 NULLABLE)"""
+    mode = 'REQUIRED'
+    if typing.get_origin(python_type) is typing.Union:
+        python_type = next(arg for arg in typing.get_args(python_type) if arg is not type(None))
+        mode = 'NULLABLE'
+    if python_type is list:
+        return bigquery.SchemaField(column, 'STRING', mode='REPEATED')
+    field_types = {str: 'STRING', int: 'INTEGER', bool: 'BOOLEAN', datetime: 'TIMESTAMP', date: 'DATE'}
+    return bigquery.SchemaField(column, field_types[python_type], mode=mode)
+
+
+def get_bigquery_schema(table_name: str) -> List[bigquery.SchemaField]:
     """
-    dim_webtoon JSONL 파일을 BigQuery에 업로드합니다.
+    테이블의 BigQuery 스키마를 반환합니다 (models.py 스키마 기반).
     
     Args:
-        jsonl_path: JSONL 파일 경로 (None이면 기본 경로 사용)
-        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        table_name: 'dim_webtoon', 'fact_weekly_chart' 또는 'fact_webtoon_stats'
     
     Returns:
-        성공 여부
+        SchemaField 리스트 (tags는 REPEATED STRING)
     """
-    if jsonl_path is None:
-        jsonl_path = get_dim_webtoon_jsonl_path()
+    schema, columns = TABLE_SCHEMAS[table_name]
+    return [_bigquery_field(column, schema[column]) for column in columns]
+
+
+def _normalize_tags(tags) -> Optional[List[str]]:
+    """tags 값을 리스트로 변환합니다 (파이프로 구분된 문자열 포함, 비어 있으면 None)."""
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split('|') if t.strip()]
+    elif not isinstance(tags, list):
+        return None
+    return tags or None
+
+
+def prepare_load_frame(records: List[Dict], table_name: str) -> pd.DataFrame:
+    """
+    레코드를 BigQuery 스키마에 맞춘 DataFrame으로 변환합니다 (컬럼 단위 변환).
     
-    records = load_jsonl_file(jsonl_path)
-    if len(records) == 0:
-        logger.warning("업로드할 레코드가 없습니다.")
-        return True
+    - 스키마 컬럼만 스키마 순서대로 (없는 컬럼은 null)
+    - webtoon_id는 문자열
+    - 정수 컬럼은 Int64 (JSON에서 float로 읽힌 값, 숫자 문자열 포함, 변환할 수 없으면 null)
+    - TIMESTAMP / DATE 컬럼은 ISO 문자열을 datetime으로
+    - tags는 리스트 (파이프로 구분된 문자열도 변환)
     
-    if dry_run:
-        logger.info(f"[DRY RUN] dim_webtoon 업로드 예정: {len(records)}개 레코드")
-        return True
+    Args:
+        records: JSONL에서 읽은 레코드 리스트
+        table_name: 테이블 이름
     
-    try:
-        client = get_bigquery_client()
-        table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.dim_webtoon"
-        
-        # 데이터 변환 및 정규화
-        for record in records:
-            # webtoon_id를 문자열로 보장
-            if 'webtoon_id' in record:
-                record['webtoon_id'] = str(record['webtoon_id'])
-            
-            # tags를 ARRAY로 변환 (이미 리스트면 그대로 사용)
-            if 'tags' in record and record['tags']:
-                if isinstance(record['tags'], str):
-                    # 파이프로 구분된 문자열을 리스트로 변환
-                    record['tags'] = [t.strip() for t in record['tags'].split('|') if t.strip()]
-                elif not isinstance(record['tags'], list):
-                    record['tags'] = []
-            else:
-                record['tags'] = None
-            
-            # datetime 객체를 ISO 형식 문자열로 변환 (BigQuery load_table_from_json은 문자열을 받음)
-            if 'created_at' in record and record['created_at']:
-                if isinstance(record['created_at'], datetime):
-                    record['created_at'] = record['created_at'].isoformat()
-                elif isinstance(record['created_at'], str):
-                    # 이미 문자열이면 그대로 사용
-                    pass
-            if 'updated_at' in record and record['updated_at']:
-                if isinstance(record['updated_at'], datetime):
-                    record['updated_at'] = record['updated_at'].isoformat()
-                elif isinstance(record['updated_at'], str):
-                    # 이미 문자열이면 그대로 사용
-                    pass
-        
-        # 임시 테이블에 먼저 업로드
-        temp_table_id = f"{table_id}_temp_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        # 스키마 정의 (tags를 REPEATED STRING으로 명시)
-        schema = [
-            bigquery.SchemaField("webtoon_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("title", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("author", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("genre", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("tags", "STRING", mode="REPEATED"),  # REPEATED STRING
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-            bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
-        
-        # 배치로 업로드 (한 번에 최대 1000개씩)
-        batch_size = 1000
-        total_uploaded = 0
+    Returns:
+        DataFrame
+    """
+    df = pd.DataFrame.from_records(records)
+    frame = {}
+    for field in get_bigquery_schema(table_name):
+        column = field.name
+        if column not in df.columns:
+            frame[column] = pd.Series([None] * len(df), index=df.index, dtype=object)
+            continue
+        series = df[column]
+        if field.mode == 'REPEATED':
+            series = series.map(_normalize_tags)
+        elif column == 'webtoon_id':
+            series = series.astype(object).where(series.isna(), series.astype(str))
+        elif field.field_type == 'INTEGER':
+            series = pd.to_numeric(series, errors='coerce').round().astype('Int64')
+        elif field.field_type in ('TIMESTAMP', 'DATE') and series.dtype == object:
+            try:
+                series = pd.to_datetime(series, format='ISO8601')
+            except (TypeError, ValueError):
+                # timezone이 섞인 값 등은 문자열 그대로 (BigQuery가 변환)
+                pass
+            if field.field_type == 'DATE' and pd.api.types.is_datetime64_any_dtype(series):
+                series = series.dt.strftime('%Y-%m-%d').where(series.notna(), None)
+        frame[column] = series
+    return pd.DataFrame(frame, index=df.index)
+
+
+def submit_staging_load(
+    client: bigquery.Client,
+    temp_table_id: str,
+    df: pd.DataFrame,
+    table_name: str,
+    session_id: Optional[str] = None,
+    create_session: bool = False
+):
+    """
+    DataFrame을 적재 파일 하나로 써서 임시 테이블 load job을 제출합니다 (완료를 기다리지 않음).
+    BIGQUERY_LOAD_FORMAT에 따라 JSONL 또는 Parquet으로 쓰고,
+    BIGQUERY_LOAD_GCS_PREFIX가 있으면 GCS에 올린 뒤 URI로 적재합니다.
+    
+    Args:
+        client: BigQuery 클라이언트
+        temp_table_id: 임시 테이블 ID (있으면 덮어씀, 세션 임시 테이블은 _SESSION.이름)
+        df: prepare_load_frame으로 변환한 DataFrame
+        table_name: 테이블 이름 (스키마 결정)
+        session_id: 이 세션 안에서 적재 (세션 임시 테이블용)
+        create_session: True면 새 세션을 만들며 적재 (job.session_info.session_id로 확인)
+    
+    Returns:
+        (load job, 작업이 끝난 뒤 호출할 정리 함수) 튜플
+    """
+    job_config = bigquery.LoadJobConfig(
+        schema=get_bigquery_schema(table_name),
+        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+        create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
+        ignore_unknown_values=False,
+    )
+    if create_session:
+        job_config.create_session = True
+    elif session_id:
+        job_config.connection_properties = _session_properties(session_id)
+    
+    # load_table_from_file은 파일 전송을 마친 뒤 반환하므로 임시 파일은 제출 후 바로 삭제
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if BIGQUERY_LOAD_FORMAT == 'parquet':
+            load_path = Path(tmp_dir) / f"{table_name}.parquet"
+            write_parquet(load_path, df, table_name)
+            job_config.source_format = bigquery.SourceFormat.PARQUET
+            # list<string>을 REPEATED STRING으로 적재
+            parquet_options = bigquery.ParquetOptions()
+            parquet_options.enable_list_inference = True
+            job_config.parquet_options = parquet_options
+        else:
+            load_path = Path(tmp_dir) / f"{table_name}.jsonl"
+            write_jsonl(load_path, df, table_name)
+            job_config.source_format = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
         
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            
-            job = client.load_table_from_json(
-                batch,
-                temp_table_id,
-                job_config=bigquery.LoadJobConfig(
-                    schema=schema,
-                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND if i > 0 else bigquery.WriteDisposition.WRITE_TRUNCATE,
-                    create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-                    ignore_unknown_values=False,
-                )
-            )
-            
-            job.result()  # 작업 완료 대기
-            total_uploaded += len(batch)
-            logger.info(f"dim_webtoon 임시 테이블 업로드 진행: {total_uploaded}/{len(records)}")
+        if BIGQUERY_LOAD_GCS_PREFIX:
+            from src.upload_gcs import GCS_BUCKET_NAME, get_gcs_client
+            blob_name = f"{BIGQUERY_LOAD_GCS_PREFIX}/{temp_table_id.split('.')[-1]}{load_path.suffix}"
+            blob = get_gcs_client().bucket(GCS_BUCKET_NAME).blob(blob_name)
+            blob.upload_from_filename(str(load_path))
+            try:
+                job = client.load_table_from_uri(f"gs://{GCS_BUCKET_NAME}/{blob_name}", temp_table_id, job_config=job_config)
+            except Exception:
+                blob.delete()
+                raise
+            return job, blob.delete
         
-        # MERGE 문으로 중복 제거 및 업데이트 (tags는 이미 ARRAY<STRING>으로 로드됨)
-        # 임시 테이블에서 중복 제거 (webtoon_id 기준으로 최신 레코드만 선택)
-        merge_query = f"""
+        with open(load_path, 'rb') as f:
+            job = client.load_table_from_file(f, temp_table_id, job_config=job_config)
+        return job, lambda: None
+
+
+def load_staging_table(
+    client: bigquery.Client,
+    temp_table_id: str,
+    df: pd.DataFrame,
+    table_name: str
+) -> int:
+    """
+    DataFrame을 임시 테이블에 load job 한 번으로 적재하고 완료를 기다립니다 (submit_staging_load 참고).
+    
+    Args:
+        client: BigQuery 클라이언트
+        temp_table_id: 임시 테이블 ID (있으면 덮어씀)
+        df: prepare_load_frame으로 변환한 DataFrame
+        table_name: 테이블 이름 (스키마 결정)
+    
+    Returns:
+        적재한 행 수
+    """
+    job, cleanup = submit_staging_load(client, temp_table_id, df, table_name)
+    try:
+        job.result()  # 작업 완료 대기
+    finally:
+        cleanup()
+    logger.info(f"{table_name} 임시 테이블 적재 완료: {len(df)}개 레코드 (load job 1개, {BIGQUERY_LOAD_FORMAT})")
+    return len(df)
+
+
+def _session_properties(session_id: str) -> List[bigquery.ConnectionProperty]:
+    """세션 안에서 작업을 실행하기 위한 connection_properties"""
+    return [bigquery.ConnectionProperty('session_id', session_id)]
+
+
+def _table_ref(table_id: str) -> str:
+    """SQL에서 참조할 테이블 이름 (세션 임시 테이블은 _SESSION.이름 그대로)"""
+    if table_id.startswith('_SESSION.'):
+        return table_id
+    return f"`{table_id}`"
+
+
+def _partition_range_condition(load_df: pd.DataFrame, column: str, field_type: str) -> str:
+    """MERGE ON 절에 추가할 target 파티션 컬럼의 범위 조건 (범위를 구할 수 없으면 빈 문자열)"""
+    try:
+        values = pd.to_datetime(load_df[column], format='ISO8601')
+    except (KeyError, TypeError, ValueError):
+        return ''
+    if values.isna().all() or values.dt.tz is not None:
+        return ''
+    if field_type == 'DATE':
+        return f"target.{column} BETWEEN DATE('{values.min().date()}') AND DATE('{values.max().date()}')"
+    return (
+        f"target.{column} BETWEEN TIMESTAMP('{values.min().isoformat()}') "
+        f"AND TIMESTAMP('{values.max().isoformat()}')"
+    )
+
+
+def build_merge_statement(
+    table_name: str,
+    table_id: str,
+    source_table_id: str,
+    load_df: Optional[pd.DataFrame] = None
+) -> str:
+    """
+    임시 테이블의 행을 대상 테이블에 반영하는 MERGE 문을 만듭니다 (MERGE_SPECS와 스키마 기반).
+    
+    - 임시 테이블 안에서 keys가 같은 행은 order_by가 가장 최근인 행만 사용
+    - NULLABLE 키 컬럼은 IS NOT DISTINCT FROM으로 비교 (NULL끼리 같은 값)
+    - load_df가 있으면 prune 컬럼의 범위 조건을 ON 절에 추가 (대상 테이블 파티션 프루닝)
+    - keep 컬럼은 새 값이 NULL(REPEATED는 빈 배열)이면 기존 값 유지
+    
+    Args:
+        table_name: 테이블 이름
+        table_id: 대상 테이블 ID
+        source_table_id: 임시 테이블 ID (데이터셋 테이블 또는 _SESSION.이름)
+        load_df: 임시 테이블에 적재한 DataFrame (범위 조건 계산용)
+    
+    Returns:
+        MERGE 문
+    """
+    spec = MERGE_SPECS[table_name]
+    fields = {field.name: field for field in get_bigquery_schema(table_name)}
+    columns = list(fields)
+    
+    conditions = [
+        f"target.{key} IS NOT DISTINCT FROM source.{key}" if fields[key].mode == 'NULLABLE'
+        else f"target.{key} = source.{key}"
+        for key in spec['keys']
+    ]
+    if spec['prune'] and load_df is not None:
+        prune = spec['prune']
+        range_condition = _partition_range_condition(load_df, prune, fields[prune].field_type)
+        if range_condition:
+            conditions.append(range_condition)
+    
+    statement = f"""
         MERGE `{table_id}` AS target
         USING (
-            SELECT 
-                CAST(webtoon_id AS STRING) AS webtoon_id,
-                title,
-                author,
-                genre,
-                tags,
-                CAST(created_at AS TIMESTAMP) AS created_at,
-                CAST(updated_at AS TIMESTAMP) AS updated_at
+            SELECT * EXCEPT (rn)
             FROM (
-                SELECT 
+                SELECT
                     *,
-                    ROW_NUMBER() OVER (PARTITION BY CAST(webtoon_id AS STRING) ORDER BY CAST(updated_at AS TIMESTAMP) DESC) AS rn
-                FROM `{temp_table_id}`
+                    ROW_NUMBER() OVER (PARTITION BY {', '.join(spec['keys'])} ORDER BY {spec['order_by']} DESC) AS rn
+                FROM {_table_ref(source_table_id)}
             )
             WHERE rn = 1
         ) AS source
-        ON target.webtoon_id = source.webtoon_id
+        ON {' AND '.join(conditions)}"""
+    if spec['update']:
+        assignments = []
+        for column in spec['update']:
+            if column not in spec['keep']:
+                assignments.append(f"{column} = source.{column}")
+            elif fields[column].mode == 'REPEATED':
+                assignments.append(f"{column} = IF(ARRAY_LENGTH(source.{column}) > 0, source.{column}, target.{column})")
+            else:
+                assignments.append(f"{column} = COALESCE(source.{column}, target.{column})")
+        statement += f"""
         WHEN MATCHED THEN
-            UPDATE SET
-                title = source.title,
-                author = source.author,
-                genre = source.genre,
-                tags = source.tags,
-                updated_at = source.updated_at
+            UPDATE SET {', '.join(assignments)}"""
+    statement += f"""
         WHEN NOT MATCHED THEN
-            INSERT (webtoon_id, title, author, genre, tags, created_at, updated_at)
-            VALUES (source.webtoon_id, source.title, source.author, source.genre, source.tags, source.created_at, source.updated_at)
+            INSERT ({', '.join(columns)})
+            VALUES ({', '.join(f'source.{column}' for column in columns)})
         """
+    return statement
+
+
+class TableUpload:
+    """
+    테이블 하나의 업로드 작업: 임시 테이블 적재 → MERGE → 임시 테이블 삭제 → on_success.
+    
+    run_table_uploads가 여러 테이블의 작업을 함께 진행하고,
+    StagingSession은 세션 임시 테이블에 모아 한 번에 반영합니다.
+    """
+    
+    def __init__(
+        self,
+        table_name: str,
+        load_df: pd.DataFrame,
+        on_success: Optional[Callable[[], None]] = None
+    ):
+        self.table_name = table_name
+        self.load_df = load_df
+        self.on_success = on_success
+        self.table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.{table_name}"
+        self.temp_table_id = f"{self.table_id}_temp_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    
+    @property
+    def rows(self) -> int:
+        return len(self.load_df)
+    
+    def merge_statement(self, source_table_id: Optional[str] = None) -> str:
+        """source_table_id(기본값: temp_table_id)의 행을 대상 테이블에 반영하는 MERGE 문"""
+        return build_merge_statement(self.table_name, self.table_id, source_table_id or self.temp_table_id, self.load_df)
+
+
+def _combine_uploads(uploads: List[TableUpload]) -> TableUpload:
+    """같은 테이블의 업로드 작업을 적재 파일 하나로 합칩니다 (on_success는 순서대로 모두 호출)."""
+    if len(uploads) == 1:
+        return uploads[0]
+    callbacks = [upload.on_success for upload in uploads if upload.on_success is not None]
+    
+    def on_success() -> None:
+        for callback in callbacks:
+            callback()
+    
+    load_df = pd.concat([upload.load_df for upload in uploads], ignore_index=True)
+    return TableUpload(uploads[0].table_name, load_df, on_success=on_success)
+
+
+def _delete_temp_table(client: bigquery.Client, temp_table_id: str) -> None:
+    """임시 테이블을 삭제합니다 (실패해도 업로드 결과에는 영향 없음)."""
+    try:
+        client.delete_table(temp_table_id, not_found_ok=True)
+    except Exception as e:
+        logger.warning(f"임시 테이블 삭제 실패: {temp_table_id}, 오류: {e}")
+
+
+def run_table_uploads(uploads: List[TableUpload], client: Optional[bigquery.Client] = None) -> Dict[str, Dict]:
+    """
+    여러 테이블의 업로드를 함께 진행합니다.
+    
+    - 모든 테이블의 임시 테이블 load job을 먼저 제출하고 함께 polling
+    - load가 끝난 테이블은 바로 MERGE 제출 (각 테이블의 MERGE는 자기 load 완료 후에만 실행)
+    - 한 테이블이 실패해도 다른 테이블은 계속 진행
+    
+    Args:
+        uploads: 테이블 업로드 작업 리스트 (같은 테이블은 하나만)
+        client: BigQuery 클라이언트 (None이면 새로 생성)
+    
+    Returns:
+        {테이블 이름: {'success', 'rows', 'load_seconds', 'merge_seconds', 'total_seconds', 'error'}}
+    """
+    if not uploads:
+        return {}
+    
+    started_at = time.monotonic()
+    report = {
+        upload.table_name: {'success': False, 'rows': upload.rows, 'load_seconds': None,
+                            'merge_seconds': None, 'total_seconds': None, 'error': None}
+        for upload in uploads
+    }
+    
+    def fail(upload: TableUpload, stage: str, error: Exception) -> None:
+        report[upload.table_name]['error'] = f"{stage}: {error}"
+        report[upload.table_name]['total_seconds'] = round(time.monotonic() - started_at, 3)
+        logger.error(f"❌ {upload.table_name} {stage} 실패: {error}")
+    
+    try:
+        client = client or get_bigquery_client()
+    except Exception as e:
+        for upload in uploads:
+            fail(upload, '클라이언트 생성', e)
+        return report
+    
+    # 1. 모든 load job 제출
+    pending = {}  # table_name -> (upload, 단계, job, 정리 함수, 단계 시작 시각)
+    for upload in uploads:
+        try:
+            job, cleanup = submit_staging_load(client, upload.temp_table_id, upload.load_df, upload.table_name)
+            pending[upload.table_name] = (upload, 'load', job, cleanup, time.monotonic())
+        except Exception as e:
+            fail(upload, '임시 테이블 적재', e)
+    logger.info(f"BigQuery load job {len(pending)}개 제출: {', '.join(pending)}")
+    
+    # 2. 함께 polling: load가 끝나면 MERGE 제출, MERGE가 끝나면 정리
+    while pending:
+        progressed = False
+        for table_name, (upload, stage, job, cleanup, stage_started) in list(pending.items()):
+            if not job.done():
+                continue
+            progressed = True
+            elapsed = round(time.monotonic() - stage_started, 3)
+            try:
+                job.result()
+            except Exception as e:
+                del pending[table_name]
+                cleanup()
+                fail(upload, '임시 테이블 적재' if stage == 'load' else 'MERGE', e)
+                _delete_temp_table(client, upload.temp_table_id)
+                continue
+            
+            if stage == 'load':
+                cleanup()
+                report[table_name]['load_seconds'] = elapsed
+                logger.info(f"{table_name} 임시 테이블 적재 완료: {upload.rows}개 레코드 ({elapsed:.1f}초)")
+                try:
+                    merge_job = client.query(upload.merge_statement())
+                    pending[table_name] = (upload, 'merge', merge_job, lambda: None, time.monotonic())
+                except Exception as e:
+                    del pending[table_name]
+                    fail(upload, 'MERGE', e)
+                    # 적재까지 끝난 임시 테이블이 데이터셋에 남지 않도록 삭제
+                    _delete_temp_table(client, upload.temp_table_id)
+                continue
+            
+            del pending[table_name]
+            report[table_name]['merge_seconds'] = elapsed
+            report[table_name]['total_seconds'] = round(time.monotonic() - started_at, 3)
+            _delete_temp_table(client, upload.temp_table_id)
+            try:
+                if upload.on_success is not None:
+                    upload.on_success()
+                report[table_name]['success'] = True
+                logger.info(f"✅ {table_name} 업로드 완료: {upload.rows}개 레코드 (적재 {report[table_name]['load_seconds']:.1f}초, MERGE {elapsed:.1f}초)")
+            except Exception as e:
+                fail(upload, '업로드 위치 기록', e)
         
-        client.query(merge_query).result()
-        logger.info(f"✅ dim_webtoon MERGE 완료")
+        # 이번 순회에서 끝난 작업이 없을 때만 대기 (방금 제출한 MERGE는 바로 다시 확인)
+        if pending and not progressed:
+            time.sleep(BIGQUERY_JOB_POLL_SECONDS)
+    
+    summary = ', '.join(
+        f"{name}={'성공' if result['success'] else '실패'}({result['total_seconds']}초)"
+        for name, result in report.items()
+    )
+    logger.info(f"BigQuery 업로드 {len(uploads)}개 테이블 완료: {time.monotonic() - started_at:.1f}초 [{summary}]")
+    return report
+
+
+def build_transaction_script(statements: List[str]) -> str:
+    """
+    MERGE 문들을 트랜잭션 하나로 실행하는 멀티 스테이트먼트 스크립트를 만듭니다.
+    하나라도 실패하면 전체를 롤백하고 오류를 다시 발생시킵니다.
+    
+    Args:
+        statements: MERGE 문 리스트
+    
+    Returns:
+        스크립트 SQL
+    """
+    body = ''.join(f"{statement.rstrip()};\n" for statement in statements)
+    return f"""
+BEGIN
+    BEGIN TRANSACTION;
+{body}    COMMIT TRANSACTION;
+EXCEPTION WHEN ERROR THEN
+    ROLLBACK TRANSACTION;
+    RAISE USING MESSAGE = @@error.message;
+END;
+"""
+
+
+class StagingSession:
+    """
+    실행 하나의 업로드를 모았다가 BigQuery 세션에서 한 번에 반영합니다 (BIGQUERY_STAGING_MODE=session).
+    
+    - add(): 업로드 작업을 만드는 함수를 키별로 등록 (같은 키는 마지막 것만 남고, 파일은 commit 때 읽음)
+    - commit(): 테이블마다 세션 임시 테이블(_SESSION)에 load job 한 번,
+      모든 MERGE를 트랜잭션 스크립트 하나로 실행한 뒤 세션 종료
+    
+    세션 임시 테이블은 세션이 끝나면 사라지므로 데이터셋에 임시 테이블이 남지 않습니다.
+    """
+    
+    def __init__(self):
+        self._planners: Dict[str, Callable[[], Optional[TableUpload]]] = {}
+        self._suffix = datetime.now().strftime('%Y%m%d%H%M%S')
+    
+    def add(self, key: str, planner: Callable[[], Optional[TableUpload]]) -> None:
+        """
+        commit 때 실행할 업로드 작업을 등록합니다.
         
-        # 임시 테이블 삭제
-        client.delete_table(temp_table_id, not_found_ok=True)
+        Args:
+            key: 작업 키 (테이블 이름 등, 같은 키로 다시 등록하면 교체)
+            planner: TableUpload를 만드는 함수 (plan_*_upload, 레코드가 없으면 None 반환)
+        """
+        self._planners[key] = planner
+    
+    @property
+    def pending(self) -> int:
+        """commit 대기 중인 작업 수"""
+        return len(self._planners)
+    
+    def staging_table_id(self, table_name: str) -> str:
+        return f"_SESSION.{table_name}_staging_{self._suffix}"
+    
+    def commit(self, client: Optional[bigquery.Client] = None) -> Dict[str, Dict]:
+        """
+        등록된 작업을 세션 하나에서 반영합니다 (load job은 테이블 수만큼, MERGE 스크립트 1개).
+        MERGE는 트랜잭션 하나로 실행되어 모두 반영되거나 모두 취소됩니다.
         
-        logger.info(f"✅ dim_webtoon 업로드 완료: {total_uploaded}개 레코드")
-        return True
+        Args:
+            client: BigQuery 클라이언트 (None이면 새로 생성)
+        
+        Returns:
+            {테이블 이름: {'success', 'rows', 'load_seconds', 'merge_seconds', 'total_seconds', 'error'}}
+            (작업을 만들지 못한 경우 키는 등록한 작업 키)
+        """
+        planners, self._planners = self._planners, {}
+        started_at = time.monotonic()
+        report = {}
+        grouped: Dict[str, List[TableUpload]] = {}
+        for key, planner in planners.items():
+            try:
+                upload = planner()
+            except Exception as e:
+                logger.error(f"❌ {key} 업로드 준비 실패: {e}")
+                report[key] = {'success': False, 'rows': 0, 'load_seconds': None,
+                               'merge_seconds': None, 'total_seconds': None, 'error': f"업로드 준비: {e}"}
+                continue
+            if upload is not None:
+                grouped.setdefault(upload.table_name, []).append(upload)
+        
+        uploads = {table_name: _combine_uploads(group) for table_name, group in grouped.items()}
+        if not uploads:
+            return report
+        for table_name, upload in uploads.items():
+            report[table_name] = {'success': False, 'rows': upload.rows, 'load_seconds': None,
+                                  'merge_seconds': None, 'total_seconds': None, 'error': None}
+        
+        session_id = None
+        stage = '세션 적재'
+        try:
+            client = client or get_bigquery_client()
+            # 1. 테이블마다 세션 임시 테이블에 적재 (첫 load job이 세션 생성)
+            for table_name, upload in uploads.items():
+                stage_started = time.monotonic()
+                job, cleanup = submit_staging_load(
+                    client, self.staging_table_id(table_name), upload.load_df, table_name,
+                    session_id=session_id, create_session=session_id is None
+                )
+                try:
+                    job.result()
+                finally:
+                    cleanup()
+                if session_id is None:
+                    session_id = job.session_info.session_id
+                report[table_name]['load_seconds'] = round(time.monotonic() - stage_started, 3)
+            
+            # 2. MERGE 전체를 트랜잭션 스크립트 하나로 실행
+            stage = 'MERGE 트랜잭션'
+            stage_started = time.monotonic()
+            script = build_transaction_script([
+                upload.merge_statement(self.staging_table_id(table_name)) for table_name, upload in uploads.items()
+            ])
+            client.query(script, job_config=bigquery.QueryJobConfig(
+                connection_properties=_session_properties(session_id)
+            )).result()
+            merge_seconds = round(time.monotonic() - stage_started, 3)
+        except Exception as e:
+            for table_name in uploads:
+                report[table_name]['error'] = f"{stage}: {e}"
+                report[table_name]['total_seconds'] = round(time.monotonic() - started_at, 3)
+            logger.error(f"❌ BigQuery 세션 업로드 {stage} 실패 ({', '.join(uploads)}): {e}")
+            return report
+        finally:
+            if session_id is not None:
+                self._abort_session(client, session_id)
+        
+        for table_name, upload in uploads.items():
+            report[table_name]['merge_seconds'] = merge_seconds
+            report[table_name]['total_seconds'] = round(time.monotonic() - started_at, 3)
+            try:
+                if upload.on_success is not None:
+                    upload.on_success()
+                report[table_name]['success'] = True
+            except Exception as e:
+                report[table_name]['error'] = f"업로드 위치 기록: {e}"
+                logger.error(f"❌ {table_name} 업로드 위치 기록 실패: {e}")
         
+        summary = ', '.join(f"{table_name}={upload.rows}개" for table_name, upload in uploads.items())
+        logger.info(
+            f"✅ BigQuery 세션 업로드 완료: load job {len(uploads)}개 + MERGE 스크립트 1개, "
+            f"{time.monotonic() - started_at:.1f}초 [{summary}]"
+        )
+        return report
+    
+    @staticmethod
+    def _abort_session(client: bigquery.Client, session_id: str) -> None:
+        """세션을 종료해 세션 임시 테이블을 바로 정리합니다 (완료를 기다리지 않고, 실패해도 세션은 만료 시 정리됨)."""
+        try:
+            client.query("CALL BQ.ABORT_SESSION();", job_config=bigquery.QueryJobConfig(
+                connection_properties=_session_properties(session_id)
+            ))
+        except Exception as e:
+            logger.warning(f"BigQuery 세션 종료 실패: {session_id}, 오류: {e}")
+
+
+def plan_dim_webtoon_upload(
+    jsonl_path: Optional[Path] = None,
+    records: Optional[List[Dict]] = None,
+    on_success: Optional[Callable[[], None]] = None
+) -> Optional[TableUpload]:
+    """
+    dim_webtoon 업로드 작업을 만듭니다 (JSONL 읽기, 컬럼 단위 타입 변환).
+    
+    Args:
+        jsonl_path: JSONL 파일 경로 (None이면 기본 경로 사용)
+        records: 파일 대신 업로드할 레코드 (DimWebtoonStore.upload_records의 바뀐 행,
+            MERGE가 webtoon_id 기준이라 일부 행만 올려도 됨)
+        on_success: 업로드 성공 후 호출할 함수
+    
+    Returns:
+        TableUpload (업로드할 레코드가 없으면 None)
+    """
+    if records is None:
+        if jsonl_path is None:
+            jsonl_path = get_dim_webtoon_jsonl_path()
+        records = load_jsonl_file(jsonl_path)
+        if len(records) == 0:
+            logger.warning("업로드할 레코드가 없습니다.")
+            return None
+    elif len(records) == 0:
+        return None
+    
+    # tags는 REPEATED STRING
+    return TableUpload('dim_webtoon', prepare_load_frame(records, 'dim_webtoon'), on_success=on_success)
+
+
+def upload_dim_webtoon(jsonl_path: Optional[Path] = None, dry_run: bool = False) -> bool:
+    """
+    dim_webtoon JSONL 파일을 BigQuery에 업로드합니다.
+    
+    Args:
+        jsonl_path: JSONL 파일 경로 (None이면 기본 경로 사용)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+    
+    Returns:
+        성공 여부
+    """
+    return _run_single_upload('dim_webtoon', lambda: plan_dim_webtoon_upload(jsonl_path), dry_run)
+
+
+def _run_single_upload(table_name: str, plan: Callable[[], Optional[TableUpload]], dry_run: bool) -> bool:
+    """테이블 하나의 업로드 작업을 만들어 실행합니다 (레코드가 없으면 성공)."""
+    try:
+        upload = plan()
     except Exception as e:
-        logger.error(f"❌ dim_webtoon 업로드 실패: {e}")
+        logger.error(f"❌ {table_name} 업로드 실패: {e}")
         return False
+    if upload is None:
+        return True
+    
+    if dry_run:
+        logger.info(f"[DRY RUN] {table_name} 업로드 예정: {upload.rows}개 레코드")
+        return True
+    
+    return run_table_uploads([upload])[table_name]['success']
+
+
+def plan_fact_weekly_chart_upload(
+    chart_date: date,
+    sort_type: Optional[str] = None,
+    jsonl_path: Optional[Path] = None
+) -> Optional[TableUpload]:
+    """
+    fact_weekly_chart 업로드 작업을 만듭니다 (JSONL 읽기, 컬럼 단위 타입 변환).
+    
+    Args:
+        chart_date: 차트 날짜
+        sort_type: 정렬 방식 (None이면 기본값)
+        jsonl_path: JSONL 파일 경로 (None이면 기본 경로 사용)
+    
+    Returns:
+        TableUpload (업로드할 레코드가 없으면 None)
+    """
+    if jsonl_path is None:
+        jsonl_path = get_chart_jsonl_path(chart_date, sort_type)
+    
+    records = load_jsonl_file(jsonl_path)
+    if len(records) == 0:
+        logger.warning(f"업로드할 레코드가 없습니다: {jsonl_path}")
+        return None
+    
+    return TableUpload('fact_weekly_chart', prepare_load_frame(records, 'fact_weekly_chart'))
 
 
 def upload_fact_weekly_chart(
@@ -277,251 +867,296 @@ def upload_fact_weekly_chart(
     Returns:
         성공 여부
     """
-    if jsonl_path is None:
-        jsonl_path = get_chart_jsonl_path(chart_date, sort_type)
+    return _run_single_upload(
+        'fact_weekly_chart',
+        lambda: plan_fact_weekly_chart_upload(chart_date, sort_type=sort_type, jsonl_path=jsonl_path),
+        dry_run
+    )
+
+
+def load_webtoon_stats_records(start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Dict]:
+    """
+    기간에 해당하는 fact_webtoon_stats JSONL 파티션만 읽어 레코드 리스트로 반환합니다.
+    파티션 도입 전 단일 파일이 남아 있으면 같은 기간의 레코드만 함께 읽습니다.
     
-    records = load_jsonl_file(jsonl_path)
-    if len(records) == 0:
-        logger.warning(f"업로드할 레코드가 없습니다: {jsonl_path}")
-        return True
+    Args:
+        start_date: 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 수집 날짜 (포함, None이면 제한 없음)
     
-    if dry_run:
-        logger.info(f"[DRY RUN] fact_weekly_chart 업로드 예정: {len(records)}개 레코드")
-        return True
+    Returns:
+        레코드 리스트
+    """
+    records = []
+    for _, partition_path in list_webtoon_stats_partitions(start_date, end_date, data_format='jsonl'):
+        records.extend(load_jsonl_file(partition_path))
     
+    legacy_path = get_webtoon_stats_jsonl_path()
+    if legacy_path.exists():
+        records.extend(_filter_by_collected_date(load_jsonl_file(legacy_path), start_date, end_date))
+    return records
+
+
+def _filter_by_collected_date(records: List[Dict], start_date: Optional[date], end_date: Optional[date]) -> List[Dict]:
+    """collected_at의 날짜가 기간에 해당하는 레코드만 남깁니다."""
+    filtered = []
+    for record in records:
+        collected_date = str(record.get('collected_at', ''))[:10]
+        if start_date is not None and collected_date < start_date.isoformat():
+            continue
+        if end_date is not None and collected_date > end_date.isoformat():
+            continue
+        filtered.append(record)
+    return filtered
+
+
+# 업로드 위치 확인용으로 해시하는 위치 바로 앞 바이트 수 (파티션 파일이 다시 쓰였는지 확인)
+_UPLOAD_MARK_FINGERPRINT_BYTES = 256
+
+
+def _fingerprint(file_path: Path, offset: int) -> str:
+    """offset 바로 앞 바이트의 해시 (압축 등으로 파일이 다시 쓰이면 달라짐)"""
+    with open(file_path, 'rb') as f:
+        start = max(0, offset - _UPLOAD_MARK_FINGERPRINT_BYTES)
+        f.seek(start)
+        return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def get_stats_upload_offset(collected_date: date, partition_path: Path) -> int:
+    """
+    fact_webtoon_stats 파티션에서 이미 BigQuery에 업로드한 바이트 위치를 반환합니다.
+    기록이 없거나, 파일이 기록 이후 다시 쓰였으면 (압축, 이전 등) 0 (처음부터 업로드).
+    
+    Args:
+        collected_date: 수집 날짜
+        partition_path: 파티션 JSONL 파일 경로
+    
+    Returns:
+        업로드 위치 (바이트)
+    """
+    mark_path = get_webtoon_stats_upload_mark_path(collected_date)
+    if not mark_path.exists():
+        return 0
     try:
-        client = get_bigquery_client()
-        table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_weekly_chart"
-        
-        # 데이터 변환 및 정규화
-        for record in records:
-            # webtoon_id를 문자열로 보장
-            if 'webtoon_id' in record:
-                record['webtoon_id'] = str(record['webtoon_id'])
-            
-            # datetime 객체를 문자열로 변환 (BigQuery는 문자열을 받아서 자동 변환)
-            if 'chart_date' in record and record['chart_date']:
-                if isinstance(record['chart_date'], date):
-                    record['chart_date'] = record['chart_date'].isoformat()
-                elif isinstance(record['chart_date'], datetime):
-                    record['chart_date'] = record['chart_date'].date().isoformat()
-                # 문자열이면 그대로 사용
-            if 'collected_at' in record and record['collected_at']:
-                if isinstance(record['collected_at'], datetime):
-                    record['collected_at'] = record['collected_at'].isoformat()
-                # 문자열이면 그대로 사용
-        
-        # 임시 테이블에 먼저 업로드
-        temp_table_id = f"{table_id}_temp_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        batch_size = 1000
-        total_uploaded = 0
-        
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            
-            job = client.load_table_from_json(
-                batch,
-                temp_table_id,
-                job_config=bigquery.LoadJobConfig(
-                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND if i > 0 else bigquery.WriteDisposition.WRITE_TRUNCATE,
-                    create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-                    ignore_unknown_values=False,
-                )
-            )
-            
-            job.result()
-            total_uploaded += len(batch)
-            logger.info(f"fact_weekly_chart 임시 테이블 업로드 진행: {total_uploaded}/{len(records)}")
-        
-        # MERGE 실행 (webtoon_id를 STRING으로 명시적 변환)
-        merge_query = f"""
-        MERGE `{table_id}` AS target
-        USING (
-            SELECT 
-                CAST(chart_date AS DATE) AS chart_date,
-                CAST(webtoon_id AS STRING) AS webtoon_id,
-                rank,
-                CAST(collected_at AS TIMESTAMP) AS collected_at,
-                weekday,
-                year,
-                month,
-                week,
-                view_count
-            FROM `{temp_table_id}`
-        ) AS source
-        ON target.chart_date = source.chart_date 
-            AND target.webtoon_id = source.webtoon_id 
-            AND COALESCE(target.weekday, '') = COALESCE(source.weekday, '')
-        WHEN NOT MATCHED THEN
-            INSERT (chart_date, webtoon_id, rank, collected_at, weekday, year, month, week, view_count)
-            VALUES (source.chart_date, source.webtoon_id, source.rank, source.collected_at, source.weekday, source.year, source.month, source.week, source.view_count)
-        """
-        
-        client.query(merge_query).result()
-        client.delete_table(temp_table_id, not_found_ok=True)
-        
-        logger.info(f"✅ fact_weekly_chart 업로드 완료: {total_uploaded}개 레코드")
-        return True
-        
-    except Exception as e:
-        logger.error(f"❌ fact_weekly_chart 업로드 실패: {e}")
-        return False
+        with open(mark_path, 'r', encoding='utf-8') as f:
+            mark = json.load(f)
+        offset = int(mark['offset'])
+        if offset > partition_path.stat().st_size or _fingerprint(partition_path, offset) != mark['fingerprint']:
+            logger.info(f"fact_webtoon_stats 파티션이 다시 쓰여 처음부터 업로드합니다: {partition_path}")
+            return 0
+        return offset
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"업로드 위치를 읽지 못해 처음부터 업로드합니다: {mark_path}, 오류: {e}")
+        return 0
+
+
+def save_stats_upload_offset(collected_date: date, partition_path: Path, offset: int) -> None:
+    """
+    fact_webtoon_stats 파티션의 업로드 위치를 기록합니다 (BigQuery MERGE 성공 후 호출).
+    
+    Args:
+        collected_date: 수집 날짜
+        partition_path: 파티션 JSONL 파일 경로
+        offset: 업로드를 마친 바이트 위치
+    """
+    mark_path = get_webtoon_stats_upload_mark_path(collected_date)
+    mark = {
+        'offset': offset,
+        'fingerprint': _fingerprint(partition_path, offset),
+        'uploaded_at': datetime.now().isoformat(),
+    }
+    tmp_path = mark_path.with_name(mark_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(mark, f)
+    os.replace(tmp_path, mark_path)
+
+
+def read_jsonl_from_offset(file_path: Path, offset: int):
+    """
+    JSONL 파일을 offset부터 읽습니다. 줄바꿈으로 끝나는 완전한 줄만 읽습니다
+    (쓰는 중인 마지막 줄은 다음 업로드에서 읽음).
+    
+    Args:
+        file_path: JSONL 파일 경로
+        offset: 시작 바이트 위치
+    
+    Returns:
+        (레코드 리스트, 읽은 마지막 줄 다음 바이트 위치) 튜플
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b'\n') + 1
+    records = []
+    for line_num, line in enumerate(data[:end].splitlines(), 1):
+        if line.strip():
+            try:
+                records.append(loads(line))
+            except JSONDecodeError as e:
+                logger.error(f"JSON 파싱 오류 ({file_path}, offset {offset} 이후 라인 {line_num}): {e}")
+    return records, offset + end
+
+
+def load_webtoon_stats_delta(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+):
+    """
+    기간에 해당하는 fact_webtoon_stats JSONL 파티션에서 마지막 업로드 이후 추가된 레코드만 읽습니다.
+    파티션 도입 전 단일 파일이 남아 있으면 같은 기간의 레코드를 모두 함께 읽습니다.
+    
+    Args:
+        start_date: 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 수집 날짜 (포함, None이면 제한 없음)
+    
+    Returns:
+        (레코드 리스트, 업로드 성공 후 기록할 [(수집 날짜, 파티션 경로, 새 위치)]) 튜플
+    """
+    records = []
+    new_offsets = []
+    for collected_date, partition_path in list_webtoon_stats_partitions(start_date, end_date, data_format='jsonl'):
+        offset = get_stats_upload_offset(collected_date, partition_path)
+        partition_records, new_offset = read_jsonl_from_offset(partition_path, offset)
+        if new_offset != offset:
+            records.extend(partition_records)
+            new_offsets.append((collected_date, partition_path, new_offset))
+    
+    legacy_path = get_webtoon_stats_jsonl_path()
+    if legacy_path.exists():
+        records.extend(_filter_by_collected_date(load_jsonl_file(legacy_path), start_date, end_date))
+    
+    logger.info(f"fact_webtoon_stats 업로드 대상: 마지막 업로드 이후 {len(records)}개 레코드 (파티션 {len(new_offsets)}개)")
+    return records, new_offsets
+
+
+def plan_fact_webtoon_stats_upload(
+    jsonl_path: Optional[Path] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    incremental: bool = True,
+) -> Optional[TableUpload]:
+    """
+    fact_webtoon_stats 업로드 작업을 만듭니다.
+    
+    파티션을 업로드할 때는 파티션별 업로드 위치(high-water mark) 이후에 추가된 행만 담고,
+    MERGE 성공 후(on_success) 위치를 기록합니다.
+    
+    Args:
+        jsonl_path: JSONL 파일 경로 (None이면 기간에 해당하는 collected_date 파티션)
+        start_date: 업로드할 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 업로드할 종료 수집 날짜 (포함, None이면 제한 없음)
+        incremental: False이면 업로드 위치를 무시하고 기간의 파티션 전체를 업로드
+    
+    Returns:
+        TableUpload (업로드할 레코드가 없으면 None)
+    """
+    new_offsets = []
+    if jsonl_path is not None:
+        records = load_jsonl_file(jsonl_path)
+    elif incremental:
+        records, new_offsets = load_webtoon_stats_delta(start_date, end_date)
+    else:
+        records = load_webtoon_stats_records(start_date, end_date)
+    if len(records) == 0:
+        logger.warning("업로드할 레코드가 없습니다.")
+        return None
+    
+    # total_episode_count 등 정수 컬럼은 INT64
+    # (MERGE ON 절에는 이번에 보내는 행의 collected_at 범위 조건이 붙어 대상 파티션만 읽음)
+    load_df = prepare_load_frame(records, 'fact_webtoon_stats')
+    
+    def save_offsets() -> None:
+        # MERGE까지 성공한 뒤에만 업로드 위치 기록 (실패하면 다음 호출에서 다시 전송)
+        for collected_date, partition_path, new_offset in new_offsets:
+            save_stats_upload_offset(collected_date, partition_path, new_offset)
+    
+    return TableUpload('fact_webtoon_stats', load_df, on_success=save_offsets)
 
 
 def upload_fact_webtoon_stats(
     jsonl_path: Optional[Path] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    incremental: bool = True,
 ) -> bool:
     """
     fact_webtoon_stats JSONL 파일을 BigQuery에 업로드합니다.
     
+    파티션을 업로드할 때는 파티션별 업로드 위치(high-water mark) 이후에 추가된 행만 보내고,
+    MERGE 성공 후 위치를 기록합니다. 배치마다 호출해도 같은 행을 다시 보내지 않습니다.
+    
     Args:
-        jsonl_path: JSONL 파일 경로 (None이면 기본 경로 사용)
+        jsonl_path: JSONL 파일 경로 (None이면 기간에 해당하는 collected_date 파티션)
         dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        start_date: 업로드할 시작 수집 날짜 (포함, None이면 제한 없음)
+        end_date: 업로드할 종료 수집 날짜 (포함, None이면 제한 없음)
+        incremental: False이면 업로드 위치를 무시하고 기간의 파티션 전체를 업로드
     
     Returns:
         성공 여부
     """
-    if jsonl_path is None:
-        jsonl_path = get_webtoon_stats_jsonl_path()
+    return _run_single_upload(
+        'fact_webtoon_stats',
+        lambda: plan_fact_webtoon_stats_upload(jsonl_path, start_date, end_date, incremental=incremental),
+        dry_run
+    )
+
+
+def fetch_recent_webtoon_stats(history: int = 2) -> pd.DataFrame:
+    """
+    BigQuery fact_webtoon_stats에서 웹툰별 최근 레코드를 조회합니다.
+    (상세 정보 갱신 계획용, 로컬 파일이 없는 Cloud Functions 인스턴스에서 사용)
     
-    records = load_jsonl_file(jsonl_path)
-    if len(records) == 0:
-        logger.warning("업로드할 레코드가 없습니다.")
-        return True
+    Args:
+        history: 웹툰별로 가져올 최근 레코드 수
     
-    if dry_run:
-        logger.info(f"[DRY RUN] fact_webtoon_stats 업로드 예정: {len(records)}개 레코드")
-        return True
+    Returns:
+        fact_webtoon_stats DataFrame (실패 시 빈 DataFrame)
+    """
+    table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_webtoon_stats"
+    query = f"""
+    SELECT webtoon_id, collected_at, favorite_count, finished, rest, total_episode_count
+    FROM `{table_id}`
+    WHERE collected_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 60 DAY)
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY webtoon_id ORDER BY collected_at DESC) <= {int(history)}
+    """
     
     try:
         client = get_bigquery_client()
-        table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_webtoon_stats"
-        
-        # 데이터 변환 및 정규화
-        for record in records:
-            # webtoon_id를 문자열로 보장
-            if 'webtoon_id' in record:
-                record['webtoon_id'] = str(record['webtoon_id'])
-            
-            # datetime 객체를 문자열로 변환
-            if 'collected_at' in record and record['collected_at']:
-                if isinstance(record['collected_at'], datetime):
-                    record['collected_at'] = record['collected_at'].isoformat()
-                # 문자열이면 그대로 사용
-            
-            # total_episode_count를 정수로 변환 (FLOAT64 -> INT64)
-            # JSON에서 로드할 때 float로 읽힐 수 있으므로 명시적으로 변환
-            if 'total_episode_count' in record:
-                if record['total_episode_count'] is not None:
-                    try:
-                        # float, int, str 모두 처리
-                        if isinstance(record['total_episode_count'], float):
-                            record['total_episode_count'] = int(record['total_episode_count'])
-                        elif isinstance(record['total_episode_count'], str):
-                            # 빈 문자열이나 "None" 문자열 처리
-                            if record['total_episode_count'].strip() in ('', 'None', 'null'):
-                                record['total_episode_count'] = None
-                            else:
-                                record['total_episode_count'] = int(float(record['total_episode_count']))
-                        elif isinstance(record['total_episode_count'], int):
-                            # 이미 int면 그대로 사용
-                            pass
-                        else:
-                            # 다른 타입이면 int로 변환 시도
-                            record['total_episode_count'] = int(record['total_episode_count'])
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"total_episode_count 변환 실패: {record.get('total_episode_count')}, 오류: {e}")
-                        record['total_episode_count'] = None
-                else:
-                    # None이면 그대로 유지
-                    record['total_episode_count'] = None
-        
-        # 임시 테이블에 먼저 업로드 (스키마 명시)
-        temp_table_id = f"{table_id}_temp_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        batch_size = 1000
-        total_uploaded = 0
-        
-        # 스키마 정의 (total_episode_count를 INT64로 명시)
-        schema = [
-            bigquery.SchemaField("webtoon_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("collected_at", "TIMESTAMP", mode="REQUIRED"),
-            bigquery.SchemaField("favorite_count", "INTEGER", mode="NULLABLE"),
-            bigquery.SchemaField("favorite_count_source", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("finished", "BOOLEAN", mode="NULLABLE"),
-            bigquery.SchemaField("rest", "BOOLEAN", mode="NULLABLE"),
-            bigquery.SchemaField("total_episode_count", "INTEGER", mode="NULLABLE"),  # INT64로 명시
-            bigquery.SchemaField("year", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("month", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("week", "INTEGER", mode="REQUIRED"),
-        ]
-        
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            
-            # 배치 데이터에서 total_episode_count를 다시 한 번 확인 및 변환
-            for record in batch:
-                if 'total_episode_count' in record and record['total_episode_count'] is not None:
-                    try:
-                        if isinstance(record['total_episode_count'], float):
-                            record['total_episode_count'] = int(record['total_episode_count'])
-                        elif isinstance(record['total_episode_count'], str):
-                            if record['total_episode_count'].strip() not in ('', 'None', 'null'):
-                                record['total_episode_count'] = int(float(record['total_episode_count']))
-                            else:
-                                record['total_episode_count'] = None
-                    except (ValueError, TypeError):
-                        record['total_episode_count'] = None
-            
-            job = client.load_table_from_json(
-                batch,
-                temp_table_id,
-                job_config=bigquery.LoadJobConfig(
-                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND if i > 0 else bigquery.WriteDisposition.WRITE_TRUNCATE,
-                    create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-                    ignore_unknown_values=False,
-                    schema=schema,  # 스키마 명시
-                    source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-                )
-            )
-            
-            job.result()
-            total_uploaded += len(batch)
-            logger.info(f"fact_webtoon_stats 임시 테이블 업로드 진행: {total_uploaded}/{len(records)}")
-        
-        # MERGE 실행 (webtoon_id를 STRING으로, total_episode_count를 INT64로 명시적 변환)
-        # SAFE_CAST를 사용하여 FLOAT64 -> INT64 변환 시도
-        merge_query = f"""
-        MERGE `{table_id}` AS target
-        USING (
-            SELECT 
-                CAST(webtoon_id AS STRING) AS webtoon_id,
-                CAST(collected_at AS TIMESTAMP) AS collected_at,
-                favorite_count,
-                favorite_count_source,
-                finished,
-                rest,
-                SAFE_CAST(total_episode_count AS INT64) AS total_episode_count,
-                year,
-                month,
-                week
-            FROM `{temp_table_id}`
-            WHERE SAFE_CAST(total_episode_count AS INT64) IS NOT NULL OR total_episode_count IS NULL
-        ) AS source
-        ON target.webtoon_id = source.webtoon_id 
-            AND target.collected_at = source.collected_at
-        WHEN NOT MATCHED THEN
-            INSERT (webtoon_id, collected_at, favorite_count, favorite_count_source, finished, rest, total_episode_count, year, month, week)
-            VALUES (source.webtoon_id, source.collected_at, source.favorite_count, source.favorite_count_source, source.finished, source.rest, source.total_episode_count, source.year, source.month, source.week)
-        """
-        
-        client.query(merge_query).result()
-        client.delete_table(temp_table_id, not_found_ok=True)
-        
-        logger.info(f"✅ fact_webtoon_stats 업로드 완료: {total_uploaded}개 레코드")
-        return True
-        
+        rows = [dict(row.items()) for row in client.query(query).result()]
+        logger.info(f"BigQuery fact_webtoon_stats 최근 레코드 조회 완료: {len(rows)}개")
+        return pd.DataFrame(rows, columns=['webtoon_id', 'collected_at', 'favorite_count', 'finished', 'rest', 'total_episode_count'])
     except Exception as e:
-        logger.error(f"❌ fact_webtoon_stats 업로드 실패: {e}")
-        return False
+        logger.error(f"❌ fact_webtoon_stats 최근 레코드 조회 실패: {e}")
+        return pd.DataFrame()
 
+
+def fetch_previous_chart(chart_date: date) -> pd.DataFrame:
+    """
+    BigQuery fact_weekly_chart에서 chart_date 이전의 가장 최근 차트를 조회합니다.
+    
+    Args:
+        chart_date: 기준 날짜
+    
+    Returns:
+        fact_weekly_chart DataFrame (webtoon_id, rank, weekday), 실패 시 빈 DataFrame
+    """
+    table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_weekly_chart"
+    query = f"""
+    SELECT webtoon_id, rank, weekday
+    FROM `{table_id}`
+    WHERE chart_date = (
+        SELECT MAX(chart_date) FROM `{table_id}`
+        WHERE chart_date < DATE('{chart_date.isoformat()}')
+            AND chart_date >= DATE_SUB(DATE('{chart_date.isoformat()}'), INTERVAL 14 DAY)
+    )
+    """
+    
+    try:
+        client = get_bigquery_client()
+        rows = [dict(row.items()) for row in client.query(query).result()]
+        logger.info(f"BigQuery 이전 fact_weekly_chart 조회 완료: {len(rows)}개")
+        return pd.DataFrame(rows, columns=['webtoon_id', 'rank', 'weekday'])
+    except Exception as e:
+        logger.error(f"❌ 이전 fact_weekly_chart 조회 실패: {e}")
+        return pd.DataFrame()
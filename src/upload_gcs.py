@@ -4,14 +4,27 @@ GCS 업로드 모듈
 로컬에 저장된 HTML/JSON 원본 파일을 GCS에 업로드하는 기능을 제공합니다.
 - 차트 데이터 업로드 (API 응답 JSON)
 - 웹툰 상세 정보 업로드 (API 응답 JSON)
+- 날짜별 원본 파일 일괄 업로드 (upload_raw_data_for_date)
+
+업로드는 upload_files_to_gcs 한 곳을 거칩니다.
+- 텍스트 원본(JSON/HTML)은 gzip으로 압축해 Content-Encoding: gzip으로 저장
+  (객체 이름은 그대로, 내려받을 때 GCS가 압축을 풀어 줌)
+- 여러 파일은 스레드 풀로 동시에 업로드
+- GCS 객체의 MD5(없으면 CRC32C)가 올릴 내용과 같으면 건너뜀 (같은 날짜 재실행 시 전송 없음)
+- 이미 gzip으로 저장된 원본(.json.gz 등, src/raw_archive.py)은 다시 압축하지 않고 .gz를 뺀 이름으로 업로드
 """
 
+import base64
+import gzip
+import hashlib
 import json
 import logging
 import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
@@ -24,6 +37,17 @@ logger = logging.getLogger(__name__)
 # GCS 설정 (환경 변수 또는 기본값)
 GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'naver-webtoon-raw')
 GCS_PROJECT_ID = os.getenv('GCS_PROJECT_ID', 'naver-webtoon-collector')
+# 동시에 업로드할 파일 수
+GCS_UPLOAD_WORKERS = int(os.getenv('GCS_UPLOAD_WORKERS', '8'))
+# 텍스트 원본(JSON/HTML)을 gzip으로 압축해 업로드할지 여부
+GCS_UPLOAD_GZIP = os.getenv('GCS_UPLOAD_GZIP', 'true').lower() == 'true'
+
+# 확장자별 Content-Type (gzip 압축 대상은 텍스트 형식만)
+_CONTENT_TYPES = {
+    '.json': 'application/json',
+    '.jsonl': 'application/x-ndjson',
+    '.html': 'text/html',
+}
 
 
 def get_gcs_client() -> storage.Client:
@@ -36,6 +60,190 @@ def get_gcs_client() -> storage.Client:
     return storage.Client(project=GCS_PROJECT_ID)
 
 
+def _raw_suffix(path: Path) -> str:
+    """gzip으로 저장된 원본(.json.gz 등)이면 .gz 앞의 확장자, 아니면 파일 확장자를 반환합니다."""
+    return Path(path.stem).suffix if path.suffix == '.gz' else path.suffix
+
+
+def _guess_content_type(path: Path) -> str:
+    """파일 확장자로 Content-Type을 정합니다 (.gz 원본은 압축 전 형식 기준)."""
+    return _CONTENT_TYPES.get(_raw_suffix(path), 'application/octet-stream')
+
+
+def _find_raw_file(path: Path) -> Path:
+    """원본 파일이 없고 gzip으로 저장된 파일(.gz)이 있으면 그 경로를 반환합니다."""
+    if not path.exists():
+        gz_path = path.with_name(path.name + '.gz')
+        if gz_path.exists():
+            return gz_path
+    return path
+
+
+def _checksums(data: bytes) -> Tuple[str, Optional[str]]:
+    """
+    GCS 객체 메타데이터와 같은 형식(base64)의 MD5 / CRC32C를 계산합니다.
+    
+    Returns:
+        (md5, crc32c) 튜플 (google-crc32c가 없으면 crc32c는 None)
+    """
+    md5 = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+    try:
+        import google_crc32c
+    except ImportError:
+        return md5, None
+    crc32c = base64.b64encode(google_crc32c.value(data).to_bytes(4, 'big')).decode('ascii')
+    return md5, crc32c
+
+
+def _encode_for_upload(local_file_path: Path, content_type: str, compress: bool) -> Tuple[bytes, Optional[str]]:
+    """
+    업로드할 바이트를 만듭니다. 텍스트 형식이면 gzip으로 압축합니다.
+    
+    gzip 헤더의 시각을 0으로 고정해 같은 파일은 항상 같은 바이트(같은 MD5)가 되도록 합니다.
+    이미 gzip으로 저장된 .gz 파일은 그대로 올립니다.
+    
+    Returns:
+        (업로드할 바이트, Content-Encoding) 튜플
+    """
+    data = local_file_path.read_bytes()
+    if local_file_path.suffix == '.gz':
+        return data, 'gzip'
+    if compress and content_type in _CONTENT_TYPES.values():
+        return gzip.compress(data, compresslevel=6, mtime=0), 'gzip'
+    return data, None
+
+
+def _remote_checksums(bucket, gcs_paths: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    업로드 대상 GCS 객체의 (md5, crc32c)를 조회합니다.
+    공통 디렉토리를 한 번 나열해 조회하므로 객체 수와 관계없이 목록 요청 한 번입니다.
+    
+    Returns:
+        {GCS 경로: (md5, crc32c)} (없는 객체는 포함하지 않음)
+    """
+    targets = set(gcs_paths)
+    prefix = posixpath.commonprefix(gcs_paths)
+    prefix = prefix[:prefix.rfind('/') + 1] if len(gcs_paths) > 1 else gcs_paths[0]
+    return {
+        blob.name: (blob.md5_hash, blob.crc32c)
+        for blob in bucket.list_blobs(prefix=prefix)
+        if blob.name in targets
+    }
+
+
+def upload_files_to_gcs(
+    files: List[Tuple[Path, str]],
+    content_type: Optional[str] = None,
+    compress: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+    dry_run: bool = False
+) -> Dict[str, str]:
+    """
+    여러 로컬 파일을 GCS에 동시에 업로드합니다.
+    
+    - 텍스트 원본은 gzip으로 압축 (Content-Encoding: gzip, 객체 이름은 그대로)
+    - GCS 객체의 MD5(없으면 CRC32C)가 올릴 내용과 같으면 건너뜀
+    - 업로드 시 MD5를 함께 보내 GCS가 전송된 내용을 검증
+    
+    Args:
+        files: (로컬 파일 경로, GCS 경로) 리스트
+        content_type: Content-Type (None이면 파일 확장자로 자동 판단)
+        compress: gzip 압축 여부 (None이면 GCS_UPLOAD_GZIP)
+        max_workers: 동시 업로드 수 (None이면 GCS_UPLOAD_WORKERS)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+    
+    Returns:
+        {GCS 경로: 'uploaded' / 'skipped' / 'failed'}
+    """
+    results = {}
+    pending = []
+    for local_file_path, gcs_path in files:
+        if not local_file_path.exists():
+            logger.warning(f"파일이 존재하지 않습니다: {local_file_path}")
+            results[gcs_path] = 'failed'
+        else:
+            pending.append((local_file_path, gcs_path))
+    if not pending:
+        return results
+    
+    if dry_run:
+        for local_file_path, gcs_path in pending:
+            logger.info(f"[DRY RUN] GCS 업로드 예정: {local_file_path} -> gs://{GCS_BUCKET_NAME}/{gcs_path}")
+            results[gcs_path] = 'uploaded'
+        return results
+    
+    compress = GCS_UPLOAD_GZIP if compress is None else compress
+    try:
+        bucket = get_gcs_client().bucket(GCS_BUCKET_NAME)
+        remote = _remote_checksums(bucket, [gcs_path for _, gcs_path in pending])
+    except Exception as e:
+        logger.error(f"❌ GCS 업로드 실패: gs://{GCS_BUCKET_NAME}, 오류: {e}")
+        results.update({gcs_path: 'failed' for _, gcs_path in pending})
+        return results
+    
+    def upload_one(item: Tuple[Path, str]) -> Tuple[str, int, int]:
+        local_file_path, gcs_path = item
+        try:
+            file_content_type = content_type or _guess_content_type(local_file_path)
+            data, content_encoding = _encode_for_upload(local_file_path, file_content_type, compress)
+            md5, crc32c = _checksums(data)
+            remote_md5, remote_crc32c = remote.get(gcs_path, (None, None))
+            if (remote_md5 and remote_md5 == md5) or (not remote_md5 and crc32c and remote_crc32c == crc32c):
+                return 'skipped', 0, 0
+            
+            blob = bucket.blob(gcs_path)
+            blob.content_encoding = content_encoding
+            blob.upload_from_string(data, content_type=file_content_type, checksum='md5')
+            return 'uploaded', local_file_path.stat().st_size, len(data)
+        except Exception as e:
+            logger.error(f"❌ GCS 업로드 실패: {local_file_path} -> gs://{GCS_BUCKET_NAME}/{gcs_path}, 오류: {e}")
+            return 'failed', 0, 0
+    
+    sizes = {'raw': 0, 'sent': 0}
+    workers = max(1, min(max_workers or GCS_UPLOAD_WORKERS, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for (_, gcs_path), (status, raw_size, sent_size) in zip(pending, executor.map(upload_one, pending)):
+            results[gcs_path] = status
+            sizes['raw'] += raw_size
+            sizes['sent'] += sent_size
+    
+    counts = {status: sum(1 for value in results.values() if value == status) for status in ('uploaded', 'skipped', 'failed')}
+    logger.info(
+        f"✅ GCS 업로드 완료: gs://{GCS_BUCKET_NAME} 업로드 {counts['uploaded']}개, "
+        f"변경 없음 {counts['skipped']}개, 실패 {counts['failed']}개 "
+        f"(전송 {sizes['sent'] / 1024:.1f}KB / 원본 {sizes['raw'] / 1024:.1f}KB)"
+    )
+    return results
+
+
+def upload_bytes_to_gcs(
+    data: bytes,
+    gcs_path: str,
+    content_type: Optional[str] = None,
+    content_encoding: Optional[str] = None
+) -> bool:
+    """
+    메모리의 바이트를 GCS 객체 하나로 업로드합니다 (임시 파일 없이, 요청 한 번).
+    
+    Args:
+        data: 업로드할 바이트 (content_encoding이 'gzip'이면 압축된 바이트)
+        gcs_path: GCS 경로
+        content_type: Content-Type (None이면 GCS 경로의 확장자로 자동 판단)
+        content_encoding: Content-Encoding (예: 'gzip')
+    
+    Returns:
+        성공 여부
+    """
+    try:
+        blob = get_gcs_client().bucket(GCS_BUCKET_NAME).blob(gcs_path)
+        blob.content_encoding = content_encoding
+        blob.upload_from_string(data, content_type=content_type or _guess_content_type(Path(gcs_path)), checksum='md5')
+        return True
+    except Exception as e:
+        logger.error(f"❌ GCS 업로드 실패: gs://{GCS_BUCKET_NAME}/{gcs_path}, 오류: {e}")
+        return False
+
+
 def upload_file_to_gcs(
     local_file_path: Path,
     gcs_path: str,
@@ -43,7 +251,7 @@ def upload_file_to_gcs(
     dry_run: bool = False
 ) -> bool:
     """
-    로컬 파일을 GCS에 업로드합니다.
+    로컬 파일을 GCS에 업로드합니다 (upload_files_to_gcs 참고, 내용이 같으면 건너뜀).
     
     Args:
         local_file_path: 로컬 파일 경로
@@ -54,37 +262,33 @@ def upload_file_to_gcs(
     Returns:
         성공 여부
     """
-    if not local_file_path.exists():
-        logger.warning(f"파일이 존재하지 않습니다: {local_file_path}")
-        return False
+    results = upload_files_to_gcs([(local_file_path, gcs_path)], content_type=content_type, dry_run=dry_run)
+    return results[gcs_path] != 'failed'
+
+
+def get_raw_gcs_path(chart_date: date, relative_path: str) -> str:
+    """
+    날짜별 원본 디렉토리 안의 파일 경로를 GCS 경로로 바꿉니다.
     
-    if dry_run:
-        logger.info(f"[DRY RUN] GCS 업로드 예정: {local_file_path} -> gs://{GCS_BUCKET_NAME}/{gcs_path}")
-        return True
+    - webtoon_chart_{정렬}.json / .html → raw_html/{날짜}/sort_{정렬}/webtoon_chart.json / .html
+    - 그 밖의 파일 (webtoon_chart.json, webtoon_detail/{id}.json 등) → raw_html/{날짜}/{상대 경로}
+    - gzip으로 저장된 원본은 .gz를 뺀 이름 (Content-Encoding: gzip으로 구분)
     
-    try:
-        client = get_gcs_client()
-        bucket = client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(gcs_path)
-        
-        # Content-Type 자동 판단
-        if content_type is None:
-            if local_file_path.suffix == '.json':
-                content_type = 'application/json'
-            elif local_file_path.suffix == '.html':
-                content_type = 'text/html'
-            else:
-                content_type = 'application/octet-stream'
-        
-        # 파일 업로드
-        blob.upload_from_filename(str(local_file_path), content_type=content_type)
-        
-        logger.info(f"✅ GCS 업로드 완료: gs://{GCS_BUCKET_NAME}/{gcs_path}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"❌ GCS 업로드 실패: {local_file_path} -> gs://{GCS_BUCKET_NAME}/{gcs_path}, 오류: {e}")
-        return False
+    Args:
+        chart_date: 수집 날짜
+        relative_path: get_raw_html_dir(chart_date) 기준 상대 경로 ('/' 구분)
+    
+    Returns:
+        GCS 경로
+    """
+    date_str = chart_date.strftime('%Y-%m-%d')
+    if relative_path.endswith('.gz'):
+        relative_path = relative_path[:-len('.gz')]
+    name, suffix = posixpath.splitext(relative_path)
+    if '/' not in relative_path and name.startswith('webtoon_chart_'):
+        sort_type = name[len('webtoon_chart_'):]
+        return f"raw_html/{date_str}/sort_{sort_type}/webtoon_chart{suffix}"
+    return f"raw_html/{date_str}/{relative_path}"
 
 
 def upload_chart_data_to_gcs(
@@ -99,7 +303,7 @@ def upload_chart_data_to_gcs(
     Args:
         chart_date: 차트 날짜
         sort_type: 정렬 방식 ("popular" 또는 "view")
-        json_file_path: JSON 파일 경로 (None이면 기본 경로에서 찾기)
+        json_file_path: JSON 파일 경로 (None이면 기본 경로에서 찾기, .json.gz도 확인)
         dry_run: True이면 실제 업로드하지 않고 검증만 수행
     
     Returns:
@@ -109,20 +313,16 @@ def upload_chart_data_to_gcs(
     if json_file_path is None:
         raw_dir = get_raw_html_dir(chart_date)
         if sort_type:
-            json_file_path = raw_dir / f"webtoon_chart_{sort_type}.json"
+            json_file_path = _find_raw_file(raw_dir / f"webtoon_chart_{sort_type}.json")
         else:
-            json_file_path = raw_dir / "webtoon_chart.json"
+            json_file_path = _find_raw_file(raw_dir / "webtoon_chart.json")
     
     if not json_file_path.exists():
         logger.warning(f"차트 데이터 파일이 없습니다: {json_file_path}")
         return False
     
     # GCS 경로 생성
-    date_str = chart_date.strftime('%Y-%m-%d')
-    if sort_type:
-        gcs_path = f"raw_html/{date_str}/sort_{sort_type}/webtoon_chart.json"
-    else:
-        gcs_path = f"raw_html/{date_str}/webtoon_chart.json"
+    gcs_path = get_raw_gcs_path(chart_date, f"webtoon_chart_{sort_type}.json" if sort_type else "webtoon_chart.json")
     
     return upload_file_to_gcs(json_file_path, gcs_path, content_type='application/json', dry_run=dry_run)
 
@@ -156,8 +356,7 @@ def upload_webtoon_detail_to_gcs(
         return False
     
     # GCS 경로 생성
-    date_str = chart_date.strftime('%Y-%m-%d')
-    gcs_path = f"raw_html/{date_str}/webtoon_detail/{webtoon_id}.json"
+    gcs_path = get_raw_gcs_path(chart_date, f"webtoon_detail/{webtoon_id}.json")
     
     return upload_file_to_gcs(json_file_path, gcs_path, content_type='application/json', dry_run=dry_run)
 
@@ -181,11 +380,40 @@ def upload_all_chart_data_for_date(
     if sort_types is None:
         sort_types = ["popular", "view"]
     
-    all_success = True
-    for sort_type in sort_types:
-        success = upload_chart_data_to_gcs(chart_date, sort_type=sort_type, dry_run=dry_run)
-        if not success:
-            all_success = False
-    
+    # 정렬 타입별 파일을 한 번에 동시 업로드 (없는 파일은 실패로 처리)
+    raw_dir = get_raw_html_dir(chart_date)
+    files = [
+        (_find_raw_file(raw_dir / f"webtoon_chart_{sort_type}.json"), get_raw_gcs_path(chart_date, f"webtoon_chart_{sort_type}.json"))
+        for sort_type in sort_types
+    ]
+    results = upload_files_to_gcs(files, content_type='application/json', dry_run=dry_run)
+    all_success = all(status != 'failed' for status in results.values())
     return all_success
 
+
+def upload_raw_data_for_date(chart_date: date, dry_run: bool = False) -> bool:
+    """
+    특정 날짜의 원본 파일(차트 JSON/HTML, 웹툰 상세 정보 JSON)을 모두 GCS에 업로드합니다.
+    이미 같은 내용이 올라가 있는 파일은 건너뛰므로 같은 날짜를 다시 실행해도 전송이 거의 없습니다.
+    
+    Args:
+        chart_date: 수집 날짜
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+    
+    Returns:
+        성공 여부 (모든 파일 업로드 또는 건너뜀 시 True, 파일이 없으면 False)
+    """
+    raw_dir = get_raw_html_dir(chart_date)
+    # 같은 파일이 원본과 .gz 보관본으로 모두 있으면 보관본만 (같은 GCS 경로)
+    files = [
+        (path, get_raw_gcs_path(chart_date, path.relative_to(raw_dir).as_posix()))
+        for path in sorted(raw_dir.rglob('*'))
+        if path.is_file() and _raw_suffix(path) in _CONTENT_TYPES
+        and not (path.suffix != '.gz' and path.with_name(path.name + '.gz').exists())
+    ]
+    if not files:
+        logger.warning(f"업로드할 원본 파일이 없습니다: {raw_dir}")
+        return False
+    
+    results = upload_files_to_gcs(files, dry_run=dry_run)
+    return all(status != 'failed' for status in results.values())
@@ -12,7 +12,7 @@ import logging
 import os
 from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 def setup_logging(level: int = logging.INFO, log_file: Optional[Path] = None) -> None:
@@ -142,7 +142,8 @@ def get_dim_webtoon_csv_path() -> Path:
 
 def get_webtoon_stats_csv_path() -> Path:
     """
-    fact_webtoon_stats CSV 파일 경로를 반환합니다.
+    fact_webtoon_stats 단일 CSV 파일 경로를 반환합니다.
+    (날짜 파티션 도입 전 형식, 읽기와 파티션 이전에만 사용)
     
     Returns:
         CSV 파일 Path 객체
@@ -160,7 +161,7 @@ def get_data_format() -> str:
     없으면 기본값 'jsonl'을 반환합니다 (로컬 테스트용).
     
     Returns:
-        'jsonl' 또는 'csv'
+        'jsonl', 'csv' 또는 'parquet'
     """
     return os.getenv('DATA_FORMAT', 'jsonl').lower()
 
@@ -199,9 +200,35 @@ def get_dim_webtoon_jsonl_path() -> Path:
     return processed_dir / 'dim_webtoon.jsonl'
 
 
+def get_chart_parquet_path(chart_date: date, sort_type: Optional[str] = None) -> Path:
+    """
+    주간 차트 Parquet 파일 경로를 반환합니다 (날짜별 파일).
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_type: 정렬 방식 ("popular" 또는 "view"), None이면 기본값
+    
+    Returns:
+        Parquet 파일 Path 객체
+    """
+    return get_chart_jsonl_path(chart_date, sort_type=sort_type).with_suffix('.parquet')
+
+
+def get_dim_webtoon_parquet_path() -> Path:
+    """
+    dim_webtoon Parquet 파일 경로를 반환합니다.
+    
+    Returns:
+        Parquet 파일 Path 객체
+    """
+    processed_dir = get_processed_dir()
+    return processed_dir / 'dim_webtoon.parquet'
+
+
 def get_webtoon_stats_jsonl_path() -> Path:
     """
-    fact_webtoon_stats JSONL 파일 경로를 반환합니다.
+    fact_webtoon_stats 단일 JSONL 파일 경로를 반환합니다.
+    (날짜 파티션 도입 전 형식, 읽기와 파티션 이전에만 사용)
     
     Returns:
         JSONL 파일 Path 객체
@@ -212,6 +239,95 @@ def get_webtoon_stats_jsonl_path() -> Path:
     return stats_dir / 'fact_webtoon_stats.jsonl'
 
 
+def get_webtoon_stats_dir() -> Path:
+    """
+    fact_webtoon_stats 디렉토리 경로를 반환합니다.
+    
+    Returns:
+        디렉토리 Path 객체
+    """
+    stats_dir = get_processed_dir() / 'fact_webtoon_stats'
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    return stats_dir
+
+
+def get_webtoon_stats_partition_path(collected_date: date, data_format: Optional[str] = None) -> Path:
+    """
+    fact_webtoon_stats 날짜 파티션 파일 경로를 반환합니다. (Hive 형식)
+    예: fact_webtoon_stats/collected_date=2025-01-15/part.jsonl
+    
+    Args:
+        collected_date: 수집 날짜 (collected_at의 날짜)
+        data_format: 'jsonl', 'csv' 또는 'parquet' (None이면 DATA_FORMAT)
+    
+    Returns:
+        파티션 파일 Path 객체
+    """
+    data_format = data_format or get_data_format()
+    partition_dir = get_webtoon_stats_dir() / f"collected_date={collected_date.isoformat()}"
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    return partition_dir / f"part.{data_format}"
+
+
+def get_webtoon_stats_key_index_path(collected_date: date) -> Path:
+    """
+    fact_webtoon_stats 파티션의 키 인덱스 파일 경로를 반환합니다.
+    (파티션에 이미 저장된 (webtoon_id, collected_at) 목록, 추가 저장 시 중복 체크용)
+    
+    Args:
+        collected_date: 수집 날짜
+    
+    Returns:
+        키 인덱스 파일 Path 객체
+    """
+    return get_webtoon_stats_partition_path(collected_date).with_name('part.keys')
+
+
+def get_webtoon_stats_upload_mark_path(collected_date: date) -> Path:
+    """
+    fact_webtoon_stats JSONL 파티션의 BigQuery 업로드 위치(high-water mark) 파일 경로를 반환합니다.
+    (이미 업로드한 바이트 위치, 다음 업로드는 그 뒤에 추가된 줄만 전송)
+    
+    Args:
+        collected_date: 수집 날짜
+    
+    Returns:
+        업로드 위치 파일 Path 객체
+    """
+    return get_webtoon_stats_partition_path(collected_date, 'jsonl').with_name('part.uploaded.json')
+
+
+def list_webtoon_stats_partitions(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    data_format: Optional[str] = None,
+) -> List[Tuple[date, Path]]:
+    """
+    기간에 해당하는 fact_webtoon_stats 파티션만 골라 반환합니다. (파티션 프루닝)
+    
+    Args:
+        start_date: 시작 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 날짜 (포함, None이면 제한 없음)
+        data_format: 'jsonl', 'csv' 또는 'parquet' (None이면 DATA_FORMAT)
+    
+    Returns:
+        (수집 날짜, 파티션 파일 경로) 리스트 (날짜순)
+    """
+    data_format = data_format or get_data_format()
+    partitions = []
+    for partition_path in get_webtoon_stats_dir().glob(f"collected_date=*/part.{data_format}"):
+        try:
+            collected_date = date.fromisoformat(partition_path.parent.name.split('=', 1)[1])
+        except ValueError:
+            continue
+        if start_date is not None and collected_date < start_date:
+            continue
+        if end_date is not None and collected_date > end_date:
+            continue
+        partitions.append((collected_date, partition_path))
+    return sorted(partitions)
+
+
 def get_logs_dir() -> Path:
     """
     로그 파일 저장 디렉토리 경로를 반환합니다.